@@ -8,6 +8,7 @@ from .exceptions import SerialError as _SerialError
 from .serial import Channel as _Channel
 from .serial import IOInterface as _IOInterface
 from .serial import Message as _Message
+from .serial import stream_to_bytes as _stream_to_bytes
 
 
 class BSMP:
@@ -48,7 +49,7 @@ class BSMP:
             _const.CMD_LIST_OF_GROUP_OF_VARIABLES
 
         # build payload
-        payload: typing.List[str] = []
+        payload = b''
 
         # send request package
         try:
@@ -60,8 +61,7 @@ class BSMP:
         # expected response
         if res.cmd == ack:
             groupdata: typing.List[typing.Tuple[bool, int]] = []
-            for groupchar in res.payload:
-                byte = ord(groupchar)
+            for byte in _stream_to_bytes(res.payload):
                 waccess = (byte & 0b10000000) > 0
                 nrvars = (byte & 0b01111111)
                 groupdata.append((waccess, nrvars))
@@ -81,7 +81,7 @@ class BSMP:
             _const.CMD_GROUP_OF_VARIABLES
 
         # build payload
-        payload = [chr(group_id)]
+        payload = bytes((group_id, ))
 
         # send request package
         try:
@@ -92,7 +92,7 @@ class BSMP:
 
         # expected response
         if res.cmd == ack:
-            return _const.ACK_OK, list(map(ord, res.payload))
+            return _const.ACK_OK, list(_stream_to_bytes(res.payload))
 
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
@@ -120,7 +120,7 @@ class BSMP:
         cmd, ack = _const.CMD_READ_VARIABLE, _const.CMD_VARIABLE_VALUE
 
         # build payload
-        payload = [chr(var_id)]
+        payload = bytes((var_id, ))
 
         # send request package
         try:
@@ -150,36 +150,46 @@ class BSMP:
         timeout: float
     ):
         """Read variable group."""
-        # command and expected response
-        cmd, ack = \
-            _const.CMD_READ_GROUP_OF_VARIABLES, \
-            _const.CMD_GROUP_OF_VARIABLES_VALUE
-
-        # build payload
-        payload = [chr(group_id)]
-
         # send request package
         try:
-            msg = _Message.message(cmd, payload=payload)
+            msg = BSMP._read_group_of_variables_message(group_id)
             res = self.channel.request(msg, timeout=timeout)
         except (TimeoutError, ValueError) as err:
             raise _SerialError(err)
 
-        if res.cmd == ack:
-            # expected response
-            group = self.entities.groups[group_id]
-            if len(res.payload) == group.variables_size():
-                return _const.ACK_OK, group.load_to_value(res.payload)
-            # unexpected group variables size
-            return BSMP.anomalous_response(
-                cmd, res.cmd,
-                group_id=group_id,
-                payload_len=len(res.payload),
-                var_size=group.variables_size()
-            )
+        return self._read_group_of_variables_parse(group_id, res)
 
-        # anomalous response
-        return BSMP.anomalous_response(cmd, res.cmd)
+    @staticmethod
+    def read_group_of_variables_batch(
+        bsmps: typing.List['BSMP'],
+        group_id: int,
+        timeout: float
+    ) -> typing.List:
+        """Read variable group of several devices in a single batch.
+
+        All devices must share a same IOInterface. Return a list with,
+        for each device, either the (ack, values) response or the
+        SerialError instance raised for that device.
+        """
+        channels = [bsmp.channel for bsmp in bsmps]
+        try:
+            msgs = [BSMP._read_group_of_variables_message(group_id)] * \
+                len(bsmps)
+            resps = _Channel.request_batch(channels, msgs, timeout=timeout)
+        except (TimeoutError, ValueError) as err:
+            return [_SerialError(err) for _ in bsmps]
+
+        results = []
+        for bsmp, res in zip(bsmps, resps):
+            if isinstance(res, _SerialError):
+                results.append(res)
+                continue
+            try:
+                results.append(
+                    bsmp._read_group_of_variables_parse(group_id, res))
+            except _SerialError as err:
+                results.append(err)
+        return results
 
     # 0x2_
     def write_variable(self, var_id, value):
@@ -219,7 +229,7 @@ class BSMP:
 
         # build payload
         var_ids = sorted(var_ids)
-        payload = [chr(var_id) for var_id in var_ids]
+        payload = bytes(var_ids)
 
         # send request package
         try:
@@ -253,7 +263,7 @@ class BSMP:
             _const.CMD_REMOVE_ALL_GROUPS_OF_VARIABLES, _const.ACK_OK
 
         # build payload
-        payload: typing.List[str] = []
+        payload = b''
 
         # send request package
         try:
@@ -286,7 +296,7 @@ class BSMP:
 
         # build payload
         lsb, hsb = block & 0xff, (block & 0xff00) >> 8
-        payload = [chr(curve_id), chr(hsb), chr(lsb)]
+        payload = bytes((curve_id, hsb, lsb))
 
         # send request package
         try:
@@ -296,7 +306,8 @@ class BSMP:
             raise _SerialError(err)
 
         if res.cmd == ack:
-            data = res.payload[3:]
+            resp = _stream_to_bytes(res.payload)
+            data = resp[3:]
             curve = self.entities.curves[curve_id]
             if len(data) % curve.type.size:
                 # unexpected curve size
@@ -305,8 +316,8 @@ class BSMP:
                         ' curve.type.size: {}')
                 print(fmts.format(len(data), curve.type.size))
                 return None, None
-            cid = ord(res.payload[0])
-            cblock = (ord(res.payload[1]) << 8) + ord(res.payload[2])
+            cid = resp[0]
+            cblock = (resp[1] << 8) + resp[2]
             if cid != curve_id or cblock != block:
                 # unexpected curve id or block number
                 fmts = ('Invalid curve id or block offset in response!\n'
@@ -328,7 +339,7 @@ class BSMP:
             block,
             value,
             timeout: float
-    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+    ) -> typing.Tuple[int, typing.Optional[bytes]]:
         """Write to curve block."""
         # command and expected response
         cmd, ack = _const.CMD_CURVE_BLOCK, _const.ACK_OK
@@ -336,8 +347,8 @@ class BSMP:
         # build payload
         curve = self.entities.curves[curve_id]
         lsb, hsb = block & 0xff, (block & 0xff00) >> 8
-        payload = [chr(curve_id), chr(hsb), chr(lsb)] + \
-            curve.value_to_load(value)
+        payload = bytes((curve_id, hsb, lsb)) + \
+            _stream_to_bytes(curve.value_to_load(value))
 
         # send request package
         try:
@@ -348,7 +359,7 @@ class BSMP:
 
         if res.cmd == ack:
             # expected response
-            return res.cmd, res.payload
+            return res.cmd, bytes(res.payload)
 
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
@@ -357,14 +368,14 @@ class BSMP:
         self,
         curve_id: int,
         timeout: float
-    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+    ) -> typing.Tuple[int, typing.Optional[bytes]]:
         """Recalculate curve checksum."""
         # command and expected response
         cmd, ack = \
             _const.CMD_RECALCULATE_CURVE_CHECKSUM, _const.CMD_CURVE_CHECKSUM
 
         # build payload
-        payload = [chr(curve_id)]
+        payload = bytes((curve_id, ))
 
         # send request package
         try:
@@ -375,7 +386,7 @@ class BSMP:
 
         if res.cmd == ack:
             # expected response
-            return res.cmd, res.payload
+            return res.cmd, bytes(res.payload)
 
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
@@ -399,7 +410,8 @@ class BSMP:
 
         # build payload
         function = self.entities.functions[func_id]
-        payload = [chr(func_id)] + function.value_to_load(input_val)
+        payload = bytes((func_id, )) + \
+            _stream_to_bytes(function.value_to_load(input_val))
 
         # send request package
         try:
@@ -421,12 +433,40 @@ class BSMP:
             # function error
             if len(res.payload) == 1:
                 # return error code
-                return res.cmd, res.payload[0]
+                return res.cmd, chr(_stream_to_bytes(res.payload)[0])
 
         # anomalous response
         return BSMP.anomalous_response(
             cmd, res.cmd, func_id=func_id, print_error=print_error)
 
+    # --- private methods ---
+
+    @staticmethod
+    def _read_group_of_variables_message(group_id: int) -> _Message:
+        cmd = _const.CMD_READ_GROUP_OF_VARIABLES
+        return _Message.message(cmd, payload=bytes((group_id, )))
+
+    def _read_group_of_variables_parse(self, group_id: int, res: _Message):
+        cmd, ack = \
+            _const.CMD_READ_GROUP_OF_VARIABLES, \
+            _const.CMD_GROUP_OF_VARIABLES_VALUE
+
+        if res.cmd == ack:
+            # expected response
+            group = self.entities.groups[group_id]
+            if len(res.payload) == group.variables_size():
+                return _const.ACK_OK, group.load_to_value(res.payload)
+            # unexpected group variables size
+            return BSMP.anomalous_response(
+                cmd, res.cmd,
+                group_id=group_id,
+                payload_len=len(res.payload),
+                var_size=group.variables_size()
+            )
+
+        # anomalous response
+        return BSMP.anomalous_response(cmd, res.cmd)
+
     @staticmethod
     def anomalous_response(cmd, ack: int, **kwargs) -> typing.Tuple[int, None]:
         """Print information about anomalous response."""
@@ -1,11 +1,26 @@
 """BSMP entities."""
 import struct as _struct
 import typing
+from functools import lru_cache as _lru_cache
 
 import numpy as _np
 
+from .serial import bytes_to_stream as _bytes_to_stream, \
+    stream_to_bytes as _stream_to_bytes
 from .types import BSMPType
 
+_NP_FMTS = {'c': 'S1', 'B': 'u1', 'H': '<u2', 'I': '<u4', 'f': '<f4'}
+
+
+@_lru_cache(maxsize=256)
+def _get_struct(fmt: str) -> _struct.Struct:
+    return _struct.Struct(fmt)
+
+
+def _get_types_struct(var_types) -> _struct.Struct:
+    """Return little-endian struct for a sequence of BSMP types."""
+    return _get_struct('<' + ''.join(vtype.fmt[1:] for vtype in var_types))
+
 
 class Entity:
     """BSMP entity."""
@@ -60,17 +75,11 @@ class Entity:
         load: typing.List[str]
     ) -> typing.Union[str, float, int, typing.List[typing.Union[str, float, int]]]:
         """Return a value or a list of values unpacked according to the BMSPType.fmt"""
-        # NOTE: optimize this critical function!
-        _load = list(map(ord, load))
+        values = _get_types_struct(var_types).unpack_from(
+            _stream_to_bytes(load))
         if len(var_types) > 1:
-            values = []
-            offset = 0
-            for var_type in var_types:
-                datum = _load[offset:offset+var_type.size]
-                values.append(_struct.unpack(var_type.fmt, bytes(datum))[0])
-                offset += var_type.size
-            return values
-        return _struct.unpack(var_types[0].fmt, bytes(_load))[0]
+            return list(values)
+        return values[0]
 
 
 class Variable(Entity):
@@ -90,10 +99,14 @@ class Variable(Entity):
         self.type: BSMPType = var_type
 
         self._var_types: typing.List[BSMPType] = [var_type for _ in range(count)]
+        self._struct = _get_types_struct(self._var_types)
 
     def load_to_value(self, load: typing.List[str]):
         """Parse value from load."""
-        return self._conv_load_to_value(self._var_types, load)
+        values = self._struct.unpack_from(_stream_to_bytes(load))
+        if len(self._var_types) > 1:
+            return list(values)
+        return values[0]
 
     def value_to_load(self, value) -> typing.List[str]:
         """Convert value to load."""
@@ -122,14 +135,60 @@ class VariablesGroup(Entity):
         self.size: int = len(variables)
         self.variables: typing.List[Variable] = variables
 
+        # group layout is compiled once and reused for reads and writes.
+        var_types = [vt for var in variables for vt in var._var_types]
+        self._struct = _get_types_struct(var_types)
+        self._slices = []
+        dtype = []
+        offset = 0
+        for var in variables:
+            count = len(var._var_types)
+            self._slices.append(
+                (offset, offset + count) if count > 1 else offset)
+            offset += count
+            field = ('v' + str(var.eid), _NP_FMTS[var.type.fmt[1:]])
+            dtype.append(field + ((count, ) if count > 1 else ()))
+        self._dtype = _np.dtype(dtype)
+
+    def decode(self, buffer, record: bool = False):
+        """Decode group load with a single call.
+
+        Return a flat tuple with the values of all variables or, if
+        record is True, a NumPy structured record with one field per
+        variable, named 'v<eid>'.
+        """
+        buffer = _stream_to_bytes(buffer)
+        if record:
+            return _np.frombuffer(buffer, dtype=self._dtype, count=1)[0]
+        return self._struct.unpack_from(buffer)
+
+    def encode(self, value: typing.List) -> bytes:
+        """Encode variables values into group load."""
+        flat = []
+        for var, val in zip(self.variables, value):
+            count = len(var._var_types)
+            if not isinstance(val, (list, tuple, _np.ndarray, str)):
+                val = [val, ]
+            for datum in val:
+                self._check_type(var.type, datum)
+            if var.type.fmt == '<c':
+                val = ''.join(val).encode('latin-1')
+                flat.extend(_struct.unpack(
+                    str(count) + 'c', val.ljust(count, b'\x00')))
+            else:
+                flat.extend(val)
+                flat.extend([0] * (count - len(val)))
+        return self._struct.pack(*flat)
+
     def load_to_value(self, load: typing.List[str]) -> typing.List[typing.Union[str, float, int]]:
         """Parse value from load."""
+        values = self.decode(load)
         value: typing.List[typing.Union[str, float, int]] = []
-        offset = 0
-        for variable in self.variables:
-            i, j = offset, offset + variable.size
-            value.append(variable.load_to_value(load[i:j]))
-            offset += variable.size
+        for slc in self._slices:
+            if isinstance(slc, int):
+                value.append(values[slc])
+            else:
+                value.append(list(values[slc[0]:slc[1]]))
         return value
 
     def value_to_load(
@@ -140,10 +199,7 @@ class VariablesGroup(Entity):
         if len(value) != self.size:
             # Value list must match the amount of variables
             return []
-        load: typing.List[str] = []
-        for i, variable in enumerate(self.variables):
-            load.extend(variable.value_to_load(value[i]))
-        return load
+        return _bytes_to_stream(self.encode(value))
 
     def variables_size(self) -> int:
         """Return sum of variables size."""
@@ -173,27 +229,27 @@ class Curve(Entity):
         self.nblocks: int = nblocks  # Number of blocks
         self.max_size_t_float: int = self.nblocks * (self.size // self.type.size)
         self._var_types: typing.List[BSMPType] = [var_type for _ in range(count)]
+        self._struct = _get_types_struct(self._var_types)
 
     def load_to_value(self, load: typing.List[str]):
         """Parse value from load."""
-        _load = [ord(c) for c in load]
-        values = []
-        offset = 0
-        for var_type in self._var_types:
-            datum = _load[offset:offset+var_type.size]
-            values.append(_struct.unpack(var_type.fmt, bytes(datum))[0])
-            offset += var_type.size
-            if offset >= len(_load):
-                break
-        return values
+        load = _stream_to_bytes(load)
+        if len(load) >= self.size:
+            return list(self._struct.unpack_from(load))
+        count = -(-len(load) // self.type.size)
+        fmt = '<' + str(count) + self.type.fmt[1:]
+        return list(_get_struct(fmt).unpack_from(load))
 
     def value_to_load(self, value) -> typing.List[str]:
         """Convert curve block number to load."""
-        load: typing.List[str] = []
         for idx, val in enumerate(value):
             self._check_type(self._var_types[idx], val)
-            load += self._conv_value(self._var_types[idx].fmt, val)
-        return load
+        if len(value) == len(self._var_types):
+            load = self._struct.pack(*value)
+        else:
+            fmt = '<' + str(len(value)) + self.type.fmt[1:]
+            load = _get_struct(fmt).pack(*value)
+        return _bytes_to_stream(load)
 
     def get_indices(self, data_length) -> typing.List[typing.Tuple[int, int]]:
         """Return list of indices corresponding to data blocks."""
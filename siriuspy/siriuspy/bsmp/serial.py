@@ -8,10 +8,43 @@ from .exceptions import SerialErrCheckSum as _SerialErrCheckSum
 from .exceptions import SerialErrEmpty as _SerialErrEmpty
 from .exceptions import SerialErrMsgShort as _SerialErrMsgShort
 from .exceptions import SerialErrPckgLen as _SerialErrPckgLen
+from .exceptions import SerialError as _SerialError
+
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+_MSG_HEADER = _struct.Struct('>BH')
+
+
+def stream_to_bytes(stream) -> typing.Union[bytes, memoryview]:
+    """Return bytes-like object from a char stream.
+
+    Bytes-like objects are returned unchanged, so this function can be
+    used to accept both legacy list-of-chars streams and binary ones.
+    """
+    if isinstance(stream, _BYTES_TYPES):
+        return stream
+    return ''.join(stream).encode('latin-1')
+
+
+def bytes_to_stream(data) -> typing.List[str]:
+    """Return list-of-chars stream from a bytes-like object."""
+    if isinstance(data, list):
+        return data
+    return list(bytes(data).decode('latin-1'))
 
 
 class IOInterface(metaclass=abc.ABCMeta):
-    """Base class for I/O"""
+    """Base class for I/O
+
+    Subclasses that accept and return bytes-like streams should set
+    BYTES_STREAM to True. Otherwise streams are converted to lists of
+    chars before being handed to the interface.
+
+    Subclasses able to send several requests in a single transaction
+    should override UART_request_batch and set PIPELINED_BATCH to True.
+    """
+
+    BYTES_STREAM: bool = False
+    PIPELINED_BATCH: bool = False
 
     @abc.abstractmethod
     def open(self) -> None:
@@ -33,6 +66,22 @@ class IOInterface(metaclass=abc.ABCMeta):
     def UART_request(self, stream, timeout: float) -> typing.Optional[typing.List[str]]:
         raise NotImplementedError
 
+    def UART_request_batch(self, streams, timeout: float) -> typing.List:
+        """Write streams and read their responses, in order.
+
+        Each stream is requested with the given timeout. Failures do not
+        abort the batch: the raised exception is returned in place of the
+        corresponding response. This default implementation requests the
+        streams one at a time.
+        """
+        responses = []
+        for stream in streams:
+            try:
+                responses.append(self.UART_request(stream, timeout=timeout))
+            except (OSError, ValueError) as err:
+                responses.append(err)
+        return responses
+
 
 class Message:
     """BSMP Message.
@@ -40,18 +89,23 @@ class Message:
     Command: command id; 1 byte;
     Load Size: payload size in bytes; 2 bytes (big endian);
     Load: 0..65535 bytes.
-    """
 
-    # TODO: indicate somehow that stream is a char stream.
+    The stream may be either a list of chars or a bytes-like object.
+    Bytes-like streams are kept as such and no per-char conversion takes
+    place.
+    """
 
     # Constructors
-    def __init__(self, stream: typing.List[str]):
+    def __init__(self, stream: typing.Union[typing.List[str], bytes]):
         """Build a BSMP message."""
         if len(stream) < 3:
             raise _SerialErrMsgShort(
                 f"BSMP Message too short (stream: {stream}).")
-        self._stream: typing.List[str] = stream
-        self._cmd: int = ord(stream[0])
+        self._stream = stream
+        if isinstance(stream, _BYTES_TYPES):
+            self._cmd: int = stream[0]
+        else:
+            self._cmd: int = ord(stream[0])
 
     def __eq__(self, other) -> bool:
         """Compare messages."""
@@ -64,6 +118,10 @@ class Message:
         payload: typing.Optional[typing.List[str]] = None
     ):
         """Build a Message object from a byte stream."""
+        if isinstance(payload, _BYTES_TYPES):
+            if len(payload) > 65535:
+                raise ValueError("Load must be smaller than 65535.")
+            return cls(_MSG_HEADER.pack(cmd, len(payload)) + payload)
         if payload and not isinstance(payload, list):
             # TODO: should be create serial exceptions here too?
             raise TypeError("Load must be a list.")
@@ -85,7 +143,7 @@ class Message:
 
     # API
     @property
-    def stream(self) -> typing.List[str]:
+    def stream(self) -> typing.Union[typing.List[str], bytes]:
         """Return stream."""
         return self._stream
 
@@ -97,10 +155,10 @@ class Message:
     @property
     def size(self) -> int:
         """Load size."""
-        return _struct.unpack('>H', bytes(map(ord, self._stream[1:3])))[0]
+        return _MSG_HEADER.unpack_from(stream_to_bytes(self._stream[:3]))[1]
 
     @property
-    def payload(self) -> typing.List[str]:
+    def payload(self) -> typing.Union[typing.List[str], bytes]:
         """Message payload."""
         return self._stream[3:]
 
@@ -115,25 +173,39 @@ class Package:
 
     def __init__(
         self,
-        stream: typing.List[str]
+        stream: typing.Union[typing.List[str], bytes]
     ):
         """Build a BSMP package."""
         if len(stream) < 5:
             raise _SerialErrPckgLen(
                 f"BSMP Package too short (stream: {stream}).")
+        if isinstance(stream, (bytearray, memoryview)):
+            # NOTE: take an immutable copy so that the message can be a
+            # zero-copy view of it.
+            stream = bytes(stream)
         if not Package.verify_checksum(stream):
             raise _SerialErrCheckSum(
                 f"Inconsistent message. Checksum does not check (stream: {stream}).")
 
-        self._stream: typing.List[str] = stream
-        self._address: int = ord(stream[0])  # 0 to 31
-        self._message: Message = Message(stream[1:-1])
-        self._checksum: int = ord(stream[-1])
+        self._stream = stream
+        if isinstance(stream, bytes):
+            self._address: int = stream[0]  # 0 to 31
+            self._message: Message = Message(memoryview(stream)[1:-1])
+            self._checksum: int = stream[-1]
+        else:
+            self._address: int = ord(stream[0])  # 0 to 31
+            self._message: Message = Message(stream[1:-1])
+            self._checksum: int = ord(stream[-1])
 
     @classmethod
     def package(cls, address: int, message: Message):
         """Build a Package object from a byte stream."""
         # Return new package
+        if isinstance(message.stream, _BYTES_TYPES):
+            stream = bytearray((address, ))
+            stream += message.stream
+            stream.append(cls.calc_checksum(stream))
+            return cls(bytes(stream))
         stream: typing.List[str] = []
         stream.append(chr(address))
         stream.extend(message.stream)
@@ -143,7 +215,7 @@ class Package:
 
     # API
     @property
-    def stream(self) -> typing.List[str]:
+    def stream(self) -> typing.Union[typing.List[str], bytes]:
         """Stream."""
         return self._stream
 
@@ -165,15 +237,20 @@ class Package:
     @staticmethod
     def calc_checksum(stream) -> int:
         """Return stream checksum."""
-        streambytes = [ord(s) for s in stream]
-        counter = sum(streambytes)
+        if isinstance(stream, _BYTES_TYPES):
+            counter = sum(stream)
+        else:
+            counter = sum([ord(s) for s in stream])
         counter = (counter & 0xFF)
         counter = (256 - counter) & 0xFF
         return counter
 
     @staticmethod
-    def verify_checksum(stream: typing.List[str]) -> bool:
+    def verify_checksum(stream: typing.Union[typing.List[str], bytes]) -> bool:
         """Verify stream checksum."""
+        if isinstance(stream, _BYTES_TYPES):
+            # sum of all bytes, checksum included, is a multiple of 256
+            return not sum(stream) & 0xFF
         streambytes = [ord(s) for s in stream[:-1]]
         counter = sum(streambytes)
         counter = (counter & 0xFF)
@@ -199,6 +276,9 @@ class Channel:
         self._iointerf: IOInterface = iointerf  # IOInterface object to communicate with bsmp device
         self._address: int = address  # address of recipient device.
         self._size_counter: int = 0  # stream size counter [bytes]
+        # whether iointerf handles bytes-like streams.
+        self._bytes_stream: bool = \
+            getattr(iointerf, 'BYTES_STREAM', False) is True
 
     @property
     def iointerf(self) -> IOInterface:
@@ -230,14 +310,14 @@ class Channel:
 
     def write(self, message: Message, timeout: float = 100):
         """Write to serial. :param timeout [ms]"""
-        stream = Package.package(self._address, message).stream
+        stream = self._get_stream(message)
         response = self.iointerf.UART_write(stream, timeout=timeout)
         self._size_counter += len(stream)
         return response
 
     def request_(self, message: Message, timeout: float = 100) -> Message:
         """:param timeout [ms]"""
-        stream = Package.package(self._address, message).stream
+        stream = self._get_stream(message)
 
         if Channel.LOCK is None:
             response = self.iointerf.UART_request(stream, timeout=timeout)
@@ -265,6 +345,70 @@ class Channel:
 
         return response
 
+    @staticmethod
+    def request_batch(
+            channels: typing.List['Channel'],
+            messages: typing.List[Message],
+            timeout: float = 100) -> typing.List:
+        """Request messages of channels sharing a same IOInterface.
+
+        If the IOInterface pipelines batches, all requests are handed to it
+        in a single transaction. Otherwise they are requested one at a time,
+        and Channel.LOCK is released between requests, so that requests of
+        other threads are not delayed by the whole batch.
+        Return a list with the response Message, or with the SerialError
+        instance of a failed request, for each channel. :param timeout [ms]
+        """
+        iointerf = channels[0].iointerf
+        streams = [
+            chan._get_stream(msg) for chan, msg in zip(channels, messages)]
+
+        if iointerf.PIPELINED_BATCH is not True:
+            responses = [
+                Channel._request_stream(iointerf, stream, timeout)
+                for stream in streams]
+        elif Channel.LOCK is None:
+            responses = iointerf.UART_request_batch(streams, timeout=timeout)
+        else:
+            with Channel.LOCK:
+                responses = iointerf.UART_request_batch(
+                    streams, timeout=timeout)
+
+        results = []
+        for chan, stream, response in zip(channels, streams, responses):
+            chan._size_counter += len(stream)
+            if isinstance(response, Exception):
+                results.append(_SerialError(response))
+                continue
+            if not response:
+                results.append(
+                    _SerialErrEmpty("Serial read returned empty!"))
+                continue
+            try:
+                package = Package(response)
+            except _SerialError as err:
+                results.append(err)
+                continue
+            chan._size_counter += len(package.stream)
+            results.append(package.message)
+        return results
+
+    @staticmethod
+    def _request_stream(iointerf, stream, timeout):
+        try:
+            if Channel.LOCK is None:
+                return iointerf.UART_request(stream, timeout=timeout)
+            with Channel.LOCK:
+                return iointerf.UART_request(stream, timeout=timeout)
+        except (OSError, ValueError) as err:
+            return err
+
+    def _get_stream(self, message: Message):
+        stream = Package.package(self._address, message).stream
+        if not self._bytes_stream:
+            stream = bytes_to_stream(stream)
+        return stream
+
     @staticmethod
     def create_lock() -> None:
         """."""
@@ -1,13 +1,47 @@
-"""Subpackage for the Archiver server."""
+"""Subpackage for the Archiver server.
+
+Classes are only imported on first access (PEP 562), so that aiohttp and
+numerical packages are not imported until they are needed.
+"""
+
+import importlib as _importlib
 
 from ..envars import (
     SRVURL_ARCHIVER as SERVER_URL,
     SRVURL_ARCHIVER_OFFLINE_DATA as SERVER_OFFLINE_URL
 )
-from . import exceptions
-from .client import ClientArchiver
-from .devices import Correctors, Orbit, TrimQuads
-from .pvarch import PVData, PVDataSet, PVDetails
-from .time import Time
 
-del client, pvarch, devices
+# submodules and the public names they define
+_MODULE2NAMES = {
+    'exceptions': (),
+    'cache': ('ArchiverCache',),
+    'client': ('ClientArchiver',),
+    'devices': ('Correctors', 'Orbit', 'TrimQuads'),
+    'pvarch': ('PVData', 'PVDataSet', 'PVDetails'),
+    'time': ('Time',),
+}
+_NAME2MODULE = {
+    name: module for module, names in _MODULE2NAMES.items()
+    for name in names}
+
+# submodules, as exceptions, are not listed, since they are not imported
+# until accessed.
+__all__ = ['SERVER_URL', 'SERVER_OFFLINE_URL'] + list(_NAME2MODULE)
+
+
+def __getattr__(name):
+    """Import public names and submodules on first access."""
+    if name in _NAME2MODULE:
+        module = _importlib.import_module(
+            '.' + _NAME2MODULE[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _MODULE2NAMES:
+        return _importlib.import_module('.' + name, __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    """Return names of module, including the ones not imported yet."""
+    return sorted(set(globals()) | set(_NAME2MODULE))
@@ -0,0 +1,341 @@
+"""Persistent on-disk cache of archiver data.
+
+Data of each (server, PV, processing type, processing parameters) key is
+stored as compressed numpy segments, each one holding the samples of a time
+interval already fetched from the archiver. New requests only need to fetch
+the sub-intervals not yet covered by segments.
+"""
+
+import hashlib as _hashlib
+import json as _json
+import math as _math
+import os as _os
+import shutil as _shutil
+import time as _time
+import uuid as _uuid
+from contextlib import contextmanager as _contextmanager
+from threading import RLock as _RLock
+
+import numpy as _np
+
+try:
+    import fcntl as _fcntl
+except ImportError:
+    _fcntl = None
+
+_FIELDS = ('timestamp', 'value', 'status', 'severity')
+
+
+def merge_intervals(intervals):
+    """Return sorted union of (start, stop) intervals."""
+    merged = []
+    for start, stop in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return [tuple(intvl) for intvl in merged]
+
+
+def subtract_intervals(start, stop, intervals):
+    """Return sub-intervals of (start, stop) not covered by intervals."""
+    intervals = merge_intervals(intervals)
+    if start == stop:
+        covered = any(ini <= start <= end for ini, end in intervals)
+        return [] if covered else [(start, stop)]
+    missing = []
+    for ini, end in intervals:
+        if end < start:
+            continue
+        if ini > stop:
+            break
+        if ini > start:
+            missing.append((start, ini))
+        start = max(start, end)
+    if start < stop:
+        missing.append((start, stop))
+    return missing
+
+
+class ArchiverCache:
+    """Persistent on-disk cache of archiver data.
+
+    Each key has a directory with an index file listing its segments. Data
+    more recent than SETTLE_TIME is never cached, since the archiver may
+    not have stored all of it yet. Indices are changed holding a file
+    lock, so that the cache can be shared by several processes. Segments
+    are evicted when older than max_age, or by least recent use when the
+    cache is larger than max_size.
+    """
+
+    DEF_DIRECTORY = _os.path.join(
+        _os.path.expanduser('~'), '.cache', 'siriuspy', 'clientarch')
+    DEF_MAX_SIZE = 2 * 1024**3  # [bytes]
+    DEF_MAX_AGE = 30 * 24 * 60 * 60  # [s]
+    SETTLE_TIME = 10 * 60  # [s]
+    EVICT_INTERVAL = 60  # [s]
+
+    # processing types that can be computed in parts: raw data and
+    # statistics of fixed time bins.
+    CACHEABLE_PROC_TYPES = (
+        '', 'mean', 'median', 'std', 'variance', 'popvariance', 'kurtosis',
+        'skewness', 'mini', 'maxi', 'jitter', 'count', 'firstSample',
+        'lastSample', 'firstFill', 'lastFill', 'linear', 'loess')
+
+    def __init__(self, directory=None, max_size=None, max_age=None):
+        """Init."""
+        self._directory = directory or ArchiverCache.DEF_DIRECTORY
+        self.max_size = max_size or ArchiverCache.DEF_MAX_SIZE
+        self.max_age = max_age or ArchiverCache.DEF_MAX_AGE
+        self._lock = _RLock()
+        self._last_evict = 0.0
+        _os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self):
+        """Return cache directory."""
+        return self._directory
+
+    @property
+    def size(self):
+        """Return total size of cached segments [bytes]."""
+        with self._lock:
+            return sum(
+                seg['size'] for _, index in self._indices()
+                for seg in index['segments'])
+
+    @staticmethod
+    def get_key(
+            server_url, pvname, proc_type='', proc_type_param1=None,
+            proc_type_param2=None):
+        """Return cache key of a query."""
+        if not proc_type:
+            proc_type_param1 = proc_type_param2 = None
+        stg = _json.dumps(
+            [server_url, pvname, proc_type, proc_type_param1,
+             proc_type_param2])
+        return _hashlib.sha1(stg.encode()).hexdigest()
+
+    @staticmethod
+    def is_cacheable(proc_type, proc_type_param1=None):
+        """Return whether data of processing type can be cached.
+
+        Statistics are only cacheable when their bin interval is given.
+        """
+        if not proc_type:
+            return True
+        return proc_type in ArchiverCache.CACHEABLE_PROC_TYPES and \
+            proc_type_param1 is not None
+
+    def get_settled_time(self, bin_interval=None):
+        """Return time up to which data can be cached.
+
+        For statistics, it is the end of the last settled bin, so that
+        bins with partial data are not cached.
+        """
+        settled = _time.time() - ArchiverCache.SETTLE_TIME
+        if bin_interval:
+            settled = _math.floor(settled/bin_interval) * bin_interval
+        return settled
+
+    @staticmethod
+    def get_stored_selection(timestamps, stop, bin_interval=None):
+        """Return boolean array of samples stored in an interval up to stop.
+
+        For statistics, samples are stored only if their bins end up to
+        stop.
+        """
+        tstamps = _np.asarray(timestamps)
+        if bin_interval:
+            tstamps = (_np.floor(tstamps/bin_interval) + 1) * bin_interval
+        return tstamps <= stop
+
+    def get_intervals(self, key):
+        """Return cached time intervals of key."""
+        with self._lock:
+            index = self._read_index(key)
+        return merge_intervals(
+            (seg['start'], seg['stop']) for seg in index['segments'])
+
+    def get_missing_intervals(self, key, start, stop):
+        """Return sub-intervals of (start, stop) not cached yet."""
+        return subtract_intervals(start, stop, self.get_intervals(key))
+
+    def store(self, key, start, stop, data, info=None, bin_interval=None):
+        """Store data of interval (start, stop).
+
+        data is a dictionary with 'timestamp', 'value', 'status' and
+        'severity' arrays, or None values if there are no samples in the
+        interval. Samples after the settled time are not stored and the
+        interval is truncated accordingly. For statistics, bin_interval
+        must be given, so that the interval is truncated to the end of the
+        last settled bin.
+
+        Returns:
+            bool: whether data was stored.
+        """
+        stop = min(stop, self.get_settled_time(bin_interval))
+        if stop <= start:
+            return False
+        arrs = self._get_arrays(data, stop, bin_interval)
+        if arrs is None:
+            return False
+        now = _time.time()
+        fname = f'{start:.6f}_{stop:.6f}_{_uuid.uuid4().hex[:8]}.npz'
+        with self._locked_index(key):
+            index = self._read_index(key)
+            if info is not None:
+                index['info'] = info
+            path = _os.path.join(self._get_keydir(key), fname)
+            _np.savez_compressed(path, **arrs)
+            index['segments'].append(dict(
+                start=start, stop=stop, file=fname,
+                size=_os.path.getsize(path), ctime=now, atime=now))
+            self._write_index(key, index)
+        if now - self._last_evict > ArchiverCache.EVICT_INTERVAL:
+            self.evict()
+        return True
+
+    def load(self, key, start, stop):
+        """Return list of data of cached segments within (start, stop).
+
+        As the archiver does, the last sample before start is also
+        returned, if cached.
+        """
+        with self._locked_index(key):
+            index = self._read_index(key)
+            segs = [
+                seg for seg in index['segments']
+                if seg['start'] <= stop and seg['stop'] >= start]
+            if not segs:
+                return []
+            first = max(
+                (seg for seg in segs if seg['start'] <= start),
+                key=lambda seg: seg['start'], default=None)
+            datas = []
+            now = _time.time()
+            for seg in segs:
+                data = self._load_segment(key, seg)
+                if data is None:
+                    # segment removed by another process
+                    self._remove_segment(key, index, seg)
+                    continue
+                tstamp = data['timestamp']
+                sel = (tstamp >= start) & (tstamp <= stop)
+                if seg is first:
+                    prev = _np.nonzero(tstamp < start)[0]
+                    if prev.size:
+                        sel[prev[-1]] = True
+                datas.append({fld: data[fld][sel] for fld in _FIELDS})
+                seg['atime'] = now
+            self._write_index(key, index)
+        return datas
+
+    def evict(self):
+        """Remove segments older than max_age and least recently used ones.
+
+        Least recently used segments are removed until the cache size is
+        below max_size.
+        """
+        with self._lock:
+            self._last_evict = now = _time.time()
+            segs, remove = [], dict()
+            for key, index in self._indices():
+                for seg in index['segments']:
+                    if now - seg['ctime'] > self.max_age:
+                        remove.setdefault(key, set()).add(seg['file'])
+                    else:
+                        segs.append((seg['atime'], key, seg))
+            size = sum(seg['size'] for _, _, seg in segs)
+            for _, key, seg in sorted(segs, key=lambda item: item[0]):
+                if size <= self.max_size:
+                    break
+                remove.setdefault(key, set()).add(seg['file'])
+                size -= seg['size']
+            for key, files in remove.items():
+                # indices may have been changed by other processes.
+                with self._locked_index(key):
+                    index = self._read_index(key)
+                    for seg in list(index['segments']):
+                        if seg['file'] in files:
+                            self._remove_segment(key, index, seg)
+                    self._write_index(key, index)
+
+    def clear(self, key=None):
+        """Remove all cached data, or only data of key."""
+        with self._lock:
+            if key is None:
+                _shutil.rmtree(self._directory, ignore_errors=True)
+                _os.makedirs(self._directory, exist_ok=True)
+            else:
+                _shutil.rmtree(self._get_keydir(key), ignore_errors=True)
+
+    # --- private methods ---
+
+    @staticmethod
+    def _get_arrays(data, stop, bin_interval):
+        if data is None or data['timestamp'] is None:
+            arrs = {fld: _np.array([]) for fld in _FIELDS}
+            return arrs
+        arrs = {fld: _np.asarray(data[fld]) for fld in _FIELDS}
+        if arrs['value'].dtype == object:
+            # ragged waveforms would need pickling.
+            return None
+        sel = ArchiverCache.get_stored_selection(
+            arrs['timestamp'], stop, bin_interval)
+        if not sel.all():
+            arrs = {fld: arr[sel] for fld, arr in arrs.items()}
+        return arrs
+
+    def _get_keydir(self, key):
+        return _os.path.join(self._directory, key)
+
+    @_contextmanager
+    def _locked_index(self, key):
+        # index of key is locked for other threads and processes. file
+        # locks are not reentrant, so this context must not be nested.
+        keydir = self._get_keydir(key)
+        _os.makedirs(keydir, exist_ok=True)
+        with self._lock, open(_os.path.join(keydir, 'lock'), 'a') as fil:
+            if _fcntl is not None:
+                _fcntl.flock(fil, _fcntl.LOCK_EX)
+            yield
+
+    def _indices(self):
+        for key in _os.listdir(self._directory):
+            if _os.path.isfile(_os.path.join(self._get_keydir(key), 'index')):
+                yield key, self._read_index(key)
+
+    def _read_index(self, key):
+        fname = _os.path.join(self._get_keydir(key), 'index')
+        try:
+            with open(fname, 'r') as fil:
+                return _json.load(fil)
+        except (OSError, ValueError):
+            return dict(info=None, segments=[])
+
+    def _write_index(self, key, index):
+        keydir = self._get_keydir(key)
+        _os.makedirs(keydir, exist_ok=True)
+        fname = _os.path.join(keydir, 'index')
+        # atomic replacement, so that readers never see partial files.
+        tmpname = f'{fname}.{_os.getpid()}.{_uuid.uuid4().hex}.tmp'
+        with open(tmpname, 'w') as fil:
+            _json.dump(index, fil)
+        _os.replace(tmpname, fname)
+
+    def _load_segment(self, key, seg):
+        path = _os.path.join(self._get_keydir(key), seg['file'])
+        try:
+            with _np.load(path) as npz:
+                return {fld: npz[fld] for fld in _FIELDS}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _remove_segment(self, key, index, seg):
+        index['segments'].remove(seg)
+        path = _os.path.join(self._get_keydir(key), seg['file'])
+        try:
+            _os.remove(path)
+        except OSError:
+            pass
@@ -11,7 +11,9 @@ import getpass as _getpass
 import logging as _log
 import math as _math
 import urllib as _urllib
+from collections import deque as _deque
 from datetime import timedelta as _timedelta
+from operator import itemgetter as _itemgetter
 from threading import Thread as _Thread
 from urllib.parse import quote as _quote
 
@@ -31,6 +33,9 @@ except ModuleNotFoundError:
 
 from .. import envars as _envars
 from . import exceptions as _exceptions
+from .cache import ArchiverCache as _ArchiverCache, \
+    merge_intervals as _merge_intervals
+from .rawformat import RawDecoder as _RawDecoder
 from .time import get_time_intervals as _get_time_intervals, Time as _Time
 
 
@@ -40,6 +45,12 @@ class ClientArchiver:
     DEF_QUERY_SPLIT_INTERVAL = 12 * 60 * 60  # 12h
     DEF_QUERY_MAX_CONCURRENCY = 100  # maximum number of concurrent queries
     DEFAULT_QUERY_TIMEOUT = 5.0  # [s]
+    DEF_QUERY_MAX_RETRIES = 2
+    DEF_QUERY_RETRY_BACKOFF = 0.1  # [s]
+    RETRY_STATUS = (502, 503, 504)
+    CONN_DNS_CACHE_TTL = 300  # [s]
+    CONN_KEEPALIVE_TIMEOUT = 30  # [s]
+    RETRIEVAL_FORMATS = ('json', 'raw')
     SERVER_URL = _envars.SRVURL_ARCHIVER
     ENDPOINT = '/mgmt/bpl'
 
@@ -95,16 +106,30 @@ class ClientArchiver:
         self.logout()
         self.shutdown()
 
-    def __init__(self, server_url=None, query_timeout=None):
-        """Initialize."""
+    def __init__(self, server_url=None, query_timeout=None, cache=None):
+        """Initialize.
+
+        Args:
+            server_url (str): URL of the Archiver server.
+            query_timeout (float): request timeout for each query [s].
+            cache (bool|str|ArchiverCache): persistent cache of `get_data`
+                results. See `cache` property. Defaults to None (no cache).
+        """
         query_timeout = query_timeout or ClientArchiver.DEFAULT_QUERY_TIMEOUT
         self.session = None
         self._url = server_url or self.SERVER_URL
         self._request_url = None
         self._thread = self._loop = self._semaphore = None
+        self._semaphore_size = None
+        self._pool_session = None
         self._query_timeout = query_timeout
         self._query_split_interval = self.DEF_QUERY_SPLIT_INTERVAL
         self._query_max_concurrency = self.DEF_QUERY_MAX_CONCURRENCY
+        self._query_max_retries = self.DEF_QUERY_MAX_RETRIES
+        self._query_retry_backoff = self.DEF_QUERY_RETRY_BACKOFF
+        self._retrieval_format = self.RETRIEVAL_FORMATS[0]
+        self._cache = None
+        self.cache = cache
         self.connect()
         _urllib3.disable_warnings(_urllib3.exceptions.InsecureRequestWarning)
 
@@ -187,7 +212,95 @@ class ClientArchiver:
                 'expected argument of type float or int, got '
                 + str(type(new_val))
             )
-        self._query_max_concurrency = int(new_val)
+        new_val = int(new_val)
+        if new_val == self._query_max_concurrency:
+            return
+        self._query_max_concurrency = new_val
+        # connections of the pooled session are limited to the previous
+        # value, so it is closed and created again on next request.
+        if self._loop_alive():
+            self._run_sync_coro(self._close_pool_session())
+
+    @property
+    def query_max_retries(self):
+        """Maximum number of retries of failed queries.
+
+        Queries are retried when the connection fails or the server is
+        temporarily unavailable (status 502, 503 or 504), but not on
+        timeouts.
+        """
+        return self._query_max_retries
+
+    @query_max_retries.setter
+    def query_max_retries(self, new_val):
+        if not isinstance(new_val, (float, int)):
+            raise _exceptions.TypeError(
+                'expected argument of type float or int, got '
+                + str(type(new_val))
+            )
+        self._query_max_retries = max(int(new_val), 0)
+
+    @property
+    def query_retry_backoff(self):
+        """Delay before first retry of a query [s].
+
+        The delay doubles at each new retry.
+        """
+        return self._query_retry_backoff
+
+    @query_retry_backoff.setter
+    def query_retry_backoff(self, new_val):
+        if not isinstance(new_val, (float, int)):
+            raise _exceptions.TypeError(
+                'expected argument of type float or int, got '
+                + str(type(new_val))
+            )
+        self._query_retry_backoff = max(float(new_val), 0)
+
+    @property
+    def retrieval_format(self):
+        """Format used to retrieve data in `get_data`.
+
+        'json' (default) or 'raw'. The raw format is the compact protocol
+        buffer format of the Archiver Appliance. It is decoded while
+        responses are received and is much faster for waveform PVs, whose
+        samples are decoded as whole arrays. For scalar PVs the JSON
+        format is usually faster, since raw samples are decoded in Python.
+        """
+        return self._retrieval_format
+
+    @retrieval_format.setter
+    def retrieval_format(self, value):
+        if value not in self.RETRIEVAL_FORMATS:
+            raise ValueError(
+                'retrieval format must be one of '
+                + str(self.RETRIEVAL_FORMATS))
+        self._retrieval_format = value
+
+    @property
+    def cache(self):
+        """Persistent cache of `get_data` results.
+
+        When set, time intervals already fetched are loaded from the cache
+        and only the missing sub-intervals are requested to the server.
+        It can be set to None or False (no cache), True (cache in default
+        directory), a directory name or an ArchiverCache object.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        if value is None or value is False:
+            value = None
+        elif value is True:
+            value = _ArchiverCache()
+        elif isinstance(value, str):
+            value = _ArchiverCache(directory=value)
+        elif not isinstance(value, _ArchiverCache):
+            raise _exceptions.TypeError(
+                'expected argument of type bool, str or ArchiverCache, got '
+                + str(type(value)))
+        self._cache = value
 
     # ------------- methods to control client behavior --------------
 
@@ -205,6 +318,10 @@ class ClientArchiver:
         if not self._loop_alive():
             return
 
+        # 0. Close pooled connections of anonymous queries
+        self._run_sync_coro(self._close_pool_session())
+        self._semaphore = None
+
         # 1. Cancel all pending tasks in the loop (to avoid ResourceWarnings)
         self._loop.call_soon_threadsafe(self._cancel_all_tasks)
 
@@ -583,6 +700,7 @@ class ClientArchiver:
         proc_type='',
         proc_type_param1=None,
         proc_type_param2=3.0,
+        use_cache=True,
     ):
         """Get archiver data.
 
@@ -654,6 +772,8 @@ class ClientArchiver:
             `proc_type` for more details.
         proc_type_param2 (int): Second parameter for data processing. See
             `proc_type` for more details.
+        use_cache (bool): whether to use `self.cache`, if defined. Set to
+            False to bypass the cache. Defaults to True.
 
         Returns:
             dict: a dictionary with PV names as keys and data as values.
@@ -662,6 +782,32 @@ class ClientArchiver:
         if isinstance(pvnames, str):
             pvnames = [pvnames]
 
+        if self._cache is not None and use_cache:
+            plans = [
+                self.get_request_plan_for_get_data(
+                    pvn,
+                    timestamp_start,
+                    timestamp_stop,
+                    query_split_interval=query_split_interval,
+                    proc_type=proc_type,
+                    proc_type_param1=proc_type_param1,
+                    proc_type_param2=proc_type_param2,
+                )
+                for pvn in pvnames
+            ]
+            urls = [url for plan in plans for url in plan['urls']]
+            resps = self.make_request(urls) if urls else []
+            pvn2resp = dict()
+            ini = 0
+            for pvn, plan in zip(pvnames, plans):  # noqa: B905
+                end = ini + len(plan['urls'])
+                pvn2resp[pvn] = self.process_request_of_get_data_plan(
+                    plan, resps[ini:end])
+                ini = end
+            if len(pvnames) == 1:
+                return pvn2resp[pvnames[0]]
+            return pvn2resp
+
         urls, pvn2idcs = self.get_request_url_for_get_data(
             pvnames,
             timestamp_start,
@@ -680,6 +826,52 @@ class ClientArchiver:
 
         return self.process_resquest_of_get_data(pvnames, resps, pvn2idcs)
 
+    def iter_data(
+        self,
+        pvnames,
+        timestamp_start,
+        timestamp_stop,
+        query_split_interval=None,
+        proc_type='',
+        proc_type_param1=None,
+        proc_type_param2=3.0,
+        max_in_flight=None,
+    ):
+        """Iterate over archiver data, in chunks.
+
+        Same as `get_data`, but data is not accumulated in memory. Chunks
+        are the split queries of each PV, yielded in time order for each
+        PV as their responses arrive. The cache is not used.
+
+        Args:
+        pvnames, timestamp_start, timestamp_stop, query_split_interval,
+        proc_type, proc_type_param1, proc_type_param2: see `get_data`.
+        max_in_flight (int): maximum number of chunks requested but not
+            yet consumed. See `iter_request_of_get_data`.
+
+        Yields:
+            (str, dict): PV name and data of a chunk, with the same fields
+                of the data returned by `get_data`.
+        """
+        if isinstance(pvnames, str):
+            pvnames = [pvnames]
+        urls, pvn2idcs = self.get_request_url_for_get_data(
+            pvnames,
+            timestamp_start,
+            timestamp_stop,
+            query_split_interval=query_split_interval,
+            proc_type=proc_type,
+            proc_type_param1=proc_type_param1,
+            proc_type_param2=proc_type_param2,
+            return_pvn2idcs_dict=True,
+        )
+        urls = [urls] if isinstance(urls, str) else urls
+        pvn2urls = {
+            pvn: [urls[idx] for idx in idcs] for pvn, idcs in pvn2idcs.items()
+        }
+        return self.iter_request_of_get_data(
+            pvn2urls, max_in_flight=max_in_flight)
+
     def get_request_url_for_get_data(  # noqa: C901
         self,
         pvnames,
@@ -826,7 +1018,7 @@ class ClientArchiver:
             for tst, tsp in zip(tstamps_start, tstamps_stop):  # noqa: B905
                 urls.append(
                     self._create_url(
-                        method='getData.json',
+                        method='getData.' + self._retrieval_format,
                         pv=pvn,
                         **{
                             'from': _urllib.parse.quote(tst),
@@ -844,6 +1036,139 @@ class ClientArchiver:
             return all_urls, pvn2idcs
         return all_urls
 
+    def get_request_plan_for_get_data(
+        self,
+        pvname,
+        timestamp_start,
+        timestamp_stop,
+        query_split_interval=None,
+        proc_type='',
+        proc_type_param1=None,
+        proc_type_param2=None,
+        use_cache=True,
+    ):
+        """Get plan of data request of a PV, considering cached data.
+
+        Only the sub-intervals not available in `self.cache` are requested.
+        Statistics sub-intervals are aligned to their bins, so that no bin
+        is split. Without cache, or for processing types that can not be
+        cached, the whole time intervals are requested.
+
+        Args:
+        pvname (str): name of the PV.
+        timestamp_start, timestamp_stop, query_split_interval, proc_type,
+        proc_type_param1, proc_type_param2: see `get_data`.
+        use_cache (bool): whether to use `self.cache`. Defaults to True.
+
+        Returns:
+            dict: request plan, with the list of urls to request in field
+                'urls'. Responses must be processed by
+                `process_request_of_get_data_plan`.
+        """
+        kwargs = dict(
+            query_split_interval=query_split_interval,
+            proc_type=proc_type,
+            proc_type_param1=proc_type_param1,
+            proc_type_param2=proc_type_param2,
+        )
+        cache = self._cache if use_cache else None
+        if cache is None or not cache.is_cacheable(
+                proc_type, proc_type_param1):
+            urls = self.get_request_url_for_get_data(
+                pvname, timestamp_start, timestamp_stop, **kwargs)
+            urls = [urls] if isinstance(urls, str) else urls
+            return dict(urls=urls, key=None)
+
+        if not isinstance(timestamp_start, (list, tuple)):
+            timestamp_start = [timestamp_start]
+        if not isinstance(timestamp_stop, (list, tuple)):
+            timestamp_stop = [timestamp_stop]
+        intervals = _merge_intervals(
+            (_Time(tst).timestamp(), _Time(tsp).timestamp())
+            for tst, tsp in zip(timestamp_start, timestamp_stop))  # noqa: B905
+
+        key = cache.get_key(
+            self._url, pvname, proc_type, proc_type_param1, proc_type_param2)
+        gaps = []
+        for start, stop in intervals:
+            gaps.extend(cache.get_missing_intervals(key, start, stop))
+        if proc_type:
+            bint = proc_type_param1
+            gaps = [
+                (_math.floor(ini/bint)*bint, _math.ceil(end/bint)*bint)
+                for ini, end in gaps]
+        gaps = _merge_intervals(gaps)
+
+        urls, nurls = [], []
+        for ini, end in gaps:
+            gurls = self.get_request_url_for_get_data(
+                pvname, ini, end, **kwargs)
+            gurls = [gurls] if isinstance(gurls, str) else gurls
+            urls.extend(gurls)
+            nurls.append(len(gurls))
+        info = dict(
+            server_url=self._url, pvname=pvname, proc_type=proc_type,
+            proc_type_param1=proc_type_param1,
+            proc_type_param2=proc_type_param2)
+        return dict(
+            urls=urls, key=key, gaps=gaps, nurls=nurls, intervals=intervals,
+            info=info)
+
+    def process_request_of_get_data_plan(self, plan, resps):
+        """Process responses of a plan of `get_request_plan_for_get_data`.
+
+        Data of the requested sub-intervals is stored in `self.cache` and
+        merged with data already cached. Sub-intervals with failed requests
+        are not stored, so that they are requested again next time.
+
+        Args:
+            plan (dict): request plan of a PV.
+            resps (list): responses of the urls of the plan, in order.
+
+        Returns:
+            dict: PV data, as in `process_resquest_of_get_data`.
+        """
+        if plan['key'] is None:
+            return self._decode_get_data_chunks(
+                [resp for resp in resps if resp])
+
+        cache, key = self._cache, plan['key']
+        bint = plan['info']['proc_type_param1'] \
+            if plan['info']['proc_type'] else None
+        datas = []
+        ini = 0
+        gaps = zip(plan['gaps'], plan['nurls'])  # noqa: B905
+        for (start, stop), nurls in gaps:
+            gresps = resps[ini:ini+nurls]
+            ini += nurls
+            data = self._decode_get_data_chunks(
+                [resp for resp in gresps if resp])
+            stop = min(stop, cache.get_settled_time(bint))
+            failed = any(resp is None for resp in gresps)
+            if not failed and cache.store(
+                    key, start, stop, data, info=plan['info'],
+                    bin_interval=bint):
+                # keep only recent samples, which are not cached.
+                if data['timestamp'] is None:
+                    continue
+                sel = ~cache.get_stored_selection(
+                    data['timestamp'], stop, bint)
+                if not sel.any():
+                    continue
+                data = {fld: val[sel] for fld, val in data.items()}
+            datas.append(data)
+        for start, stop in plan['intervals']:
+            datas.extend(cache.load(key, start, stop))
+        data = self._merge_get_data(datas)
+
+        # as the archiver does, return only the last sample before start.
+        tstamp = data['timestamp']
+        if tstamp is not None:
+            nprev = _np.searchsorted(tstamp, plan['intervals'][0][0])
+            if nprev > 1:
+                data = {fld: val[nprev-1:] for fld, val in data.items()}
+        return data
+
     def process_resquest_of_get_data(self, pvnames, resps, pvn2idcs):
         """Process result of `self.get_data` request.
 
@@ -854,44 +1179,75 @@ class ClientArchiver:
             pvn2idcs (dict): list of pvnames to indices in `resps`.
 
         Returns:
-            pvn2resp (dict): dictionary with PVs data.
+            pvn2resp (dict): dictionary with PVs data. Timestamps, values,
+                status and severities are numpy arrays. Values of waveform
+                PVs are 2D arrays, with one row per sample.
         """
         pvn2resp = dict()
         for pvn, idcs in pvn2idcs.items():
-            _ts, _vs = _np.array([]), list()
-            _st, _sv = _np.array([]), _np.array([])
-            for idx in idcs:
-                resp = resps[idx]
-                if not resp:
-                    continue
-                data = resp[0]['data']
-                _ts = _np.r_[
-                    _ts, [v['secs'] + v['nanos'] / 1.0e9 for v in data]
-                ]
-                for val in data:
-                    _vs.append(val['val'])
-                _st = _np.r_[_st, [v['status'] for v in data]]
-                _sv = _np.r_[_sv, [v['severity'] for v in data]]
-            if not _ts.size:
-                timestamp = value = status = severity = None
-            else:
-                _, _tsidx = _np.unique(_ts, return_index=True)
-                timestamp = _ts[_tsidx]
-                status = _st[_tsidx]
-                severity = _sv[_tsidx]
-                value = [_vs[i] for i in _tsidx]
-
-            pvn2resp[pvn] = dict(
-                timestamp=timestamp,
-                value=value,
-                status=status,
-                severity=severity,
-            )
+            chunks = [resps[idx] for idx in idcs if resps[idx]]
+            pvn2resp[pvn] = self._decode_get_data_chunks(chunks)
 
         if len(pvnames) == 1:
             return pvn2resp[pvnames[0]]
         return pvn2resp
 
+    def iter_request_of_get_data(self, pvn2urls, max_in_flight=None):
+        """Iterate over decoded responses of `get_data` urls.
+
+        Requests of all PVs are interleaved, so that all of them progress
+        together. At most `max_in_flight` responses are requested ahead of
+        the one being consumed; new requests are only made as chunks are
+        consumed, so memory usage does not depend on the number of urls.
+        Samples repeated in consecutive chunks of a PV are yielded once.
+
+        Args:
+            pvn2urls (dict): PV names to list of urls, in time order.
+            max_in_flight (int): maximum number of pending requests.
+                Defaults to `self.query_max_concurrency`.
+
+        Yields:
+            (str, dict): PV name and data of a chunk. Chunks without
+                samples are skipped.
+        """
+        window = max(int(max_in_flight or self._query_max_concurrency), 1)
+        requests = self._interleave_requests(pvn2urls)
+        session = self.session or self._run_sync_coro(
+            self._get_pool_session())
+        semaphore = self._run_sync_coro(self._create_semaphore(window))
+        pending = _deque()
+        last = dict()
+        try:
+            while True:
+                # backpressure: only request more as chunks are consumed.
+                while len(pending) < window:
+                    item = next(requests, None)
+                    if item is None:
+                        break
+                    pvn, url = item
+                    coro = self._get_request_response(url, session, semaphore)
+                    pending.append((pvn, _asyncio.run_coroutine_threadsafe(
+                        coro, self._loop)))
+                if not pending:
+                    break
+                pvn, future = pending.popleft()
+                resp = future.result()
+                data = self._decode_get_data_chunks([resp] if resp else [])
+                tstamp = data['timestamp']
+                if tstamp is None:
+                    continue
+                if pvn in last:
+                    sel = tstamp > last[pvn]
+                    if not sel.any():
+                        continue
+                    if not sel.all():
+                        data = {fld: val[sel] for fld, val in data.items()}
+                last[pvn] = data['timestamp'][-1]
+                yield pvn, data
+        finally:
+            for _, future in pending:
+                future.cancel()
+
     # ------------- General purpose methods --------------
 
     def make_request(self, url, need_login=False):
@@ -910,6 +1266,25 @@ class ClientArchiver:
         coro = self._handle_request_async(url, need_login=need_login)
         return self._run_sync_coro(coro)
 
+    def submit_request(self, url, need_login=False):
+        """Submit request without waiting for its response.
+
+        Requests submitted by several calls run concurrently in the
+        background event loop, limited by `query_max_concurrency`.
+
+        Args:
+            url (str|list|tuple): url or list of urls to request.
+            need_login (bool): whether request requires login.
+
+        Returns:
+            concurrent.futures.Future: future whose result is the
+                response, as returned by `make_request`.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError('Library is shut down')
+        coro = self._handle_request_async(url, need_login=need_login)
+        return _asyncio.run_coroutine_threadsafe(coro, self._loop)
+
     @staticmethod
     def gen_archviewer_url_link(
         pvnames,
@@ -1006,6 +1381,20 @@ class ClientArchiver:
 
     # ---------- auxiliary methods ----------
 
+    @staticmethod
+    def _interleave_requests(pvn2urls):
+        """Yield (pvname, url) pairs, alternating between PVs."""
+        iters = [
+            iter([(pvn, url) for url in urls])
+            for pvn, urls in pvn2urls.items()]
+        while iters:
+            for itr in list(iters):
+                item = next(itr, None)
+                if item is None:
+                    iters.remove(itr)
+                else:
+                    yield item
+
     @staticmethod
     def _process_url_link_args(pvnames, pvoptnrpts, pvcolors, pvusediff):
         """Process URL link arguments."""
@@ -1022,6 +1411,123 @@ class ClientArchiver:
             pvusediff = [pvusediff] * len(pvnames)
         return pvoptnrpts, pvcolors, pvusediff
 
+    @staticmethod
+    def _decode_get_data_chunks(chunks):
+        """Decode data chunks of a PV into columnar numpy arrays.
+
+        Chunks are the time ordered responses of the split queries of a
+        PV, either parsed JSON responses or columns decoded from the raw
+        format by RawDecoder. Arrays are preallocated with the total number
+        of samples and filled chunk by chunk. Samples repeated in the
+        boundaries of consecutive chunks are removed, keeping the first
+        occurrence of each timestamp, as `numpy.unique` would.
+        """
+        columns, sizes = [], []
+        for resp in chunks:
+            if isinstance(resp, dict):
+                # already decoded into columns by RawDecoder
+                cols = resp
+                size = len(cols['secs'])
+            else:
+                data = resp[0]['data']
+                cols = {
+                    key: map(_itemgetter(key), data)
+                    for key in ('secs', 'nanos', 'status', 'severity')}
+                cols['val'] = list(map(_itemgetter('val'), data))
+                size = len(data)
+            if size:
+                columns.append(cols)
+                sizes.append(size)
+        nrpts = sum(sizes)
+        if not nrpts:
+            return dict(timestamp=None, value=None, status=None, severity=None)
+
+        secs = _np.empty(nrpts, dtype=_np.int64)
+        nanos = _np.empty(nrpts, dtype=_np.int64)
+        status = _np.empty(nrpts)
+        severity = _np.empty(nrpts)
+        values = []
+        ini = 0
+        for cols, size in zip(columns, sizes):  # noqa: B905
+            end = ini + size
+            for arr, key in zip(  # noqa: B905
+                    (secs, nanos, status, severity),
+                    ('secs', 'nanos', 'status', 'severity')):
+                arr[ini:end] = _np.fromiter(
+                    cols[key], dtype=arr.dtype, count=size)
+            values.append(ClientArchiver._decode_values(cols['val']))
+            ini = end
+        timestamp = secs + nanos / 1.0e9
+        value = ClientArchiver._merge_values(values, nrpts)
+        return ClientArchiver._sort_unique_samples(
+            timestamp, value, status, severity)
+
+    @staticmethod
+    def _merge_get_data(datas):
+        """Merge data of a PV in different time intervals."""
+        datas = [
+            data for data in datas
+            if data['timestamp'] is not None and data['timestamp'].size]
+        if not datas:
+            return dict(timestamp=None, value=None, status=None, severity=None)
+        if len(datas) == 1:
+            return datas[0]
+        nrpts = sum(data['timestamp'].size for data in datas)
+        timestamp, status, severity = [
+            _np.concatenate([data[fld] for data in datas])
+            for fld in ('timestamp', 'status', 'severity')]
+        value = ClientArchiver._merge_values(
+            [data['value'] for data in datas], nrpts)
+        return ClientArchiver._sort_unique_samples(
+            timestamp, value, status, severity)
+
+    @staticmethod
+    def _sort_unique_samples(timestamp, value, status, severity):
+        """Sort samples by timestamp, keeping first of repeated ones."""
+        # chunks are usually already sorted, so that a stable sort is only
+        # needed when timestamps of consecutive chunks overlap.
+        if not _np.all(timestamp[1:] >= timestamp[:-1]):
+            idcs = _np.argsort(timestamp, kind='stable')
+            timestamp, value = timestamp[idcs], value[idcs]
+            status, severity = status[idcs], severity[idcs]
+        sel = _np.r_[True, timestamp[1:] != timestamp[:-1]]
+        if not sel.all():
+            timestamp, value = timestamp[sel], value[sel]
+            status, severity = status[sel], severity[sel]
+        return dict(
+            timestamp=timestamp, value=value, status=status, severity=severity)
+
+    @staticmethod
+    def _decode_values(vals):
+        """Return array of values, one row per sample for waveforms."""
+        if vals and isinstance(vals[0], (list, _np.ndarray)):
+            if len(set(map(len, vals))) > 1:
+                # waveforms with varying number of elements
+                arr = _np.empty(len(vals), dtype=object)
+                for i, val in enumerate(vals):
+                    arr[i] = _np.asarray(val)
+                return arr
+        return _np.asarray(vals)
+
+    @staticmethod
+    def _merge_values(values, nrpts):
+        """Fill preallocated array with values of all chunks."""
+        if len(values) == 1:
+            return values[0]
+        shapes = {val.shape[1:] for val in values}
+        if len(shapes) > 1 or any(val.dtype == object for val in values):
+            value = _np.empty(nrpts, dtype=object)
+            for i, val in enumerate(v for vals in values for v in vals):
+                value[i] = val
+            return value
+        dtype = _np.result_type(*values)
+        value = _np.empty((nrpts, ) + shapes.pop(), dtype=dtype)
+        ini = 0
+        for val in values:
+            value[ini:ini+len(val)] = val
+            ini += len(val)
+        return value
+
     def _loop_alive(self):
         """Check if thread is alive and loop is running."""
         return (
@@ -1051,7 +1557,7 @@ class ClientArchiver:
     def _create_url(self, method, **kwargs):
         """Create URL."""
         url = self._url + self.ENDPOINT
-        if method.startswith('getData.json'):
+        if method.startswith('getData.'):
             url = self._url + '/retrieval/data'
 
         url += '/' + method
@@ -1071,26 +1577,27 @@ class ClientArchiver:
 
     async def _handle_request_async(self, url, need_login=False):
         """Handle request."""
-        self._semaphore = _asyncio.Semaphore(self._query_max_concurrency)
+        # semaphore is only created again if max concurrency changes.
+        size = self._query_max_concurrency
+        if self._semaphore is None or self._semaphore_size != size:
+            self._semaphore = await self._create_semaphore(size)
+            self._semaphore_size = size
+        semaphore = self._semaphore
         if self.session is not None:
-            response = await self._get_request_response(url, self.session)
+            session = self.session
         elif need_login:
             raise _exceptions.AuthenticationError('You need to login first.')
         else:
-            # NOTE: we need to define a connector with ssl=False so that url
-            # with IP address can be requested without SSL errors.
-            async with _ClSession(connector=_TCPConn(ssl=False)) as sess:
-                response = await self._get_request_response(url, sess)
-        self._semaphore = None
-        return response
+            session = await self._get_pool_session()
+        return await self._get_request_response(url, session, semaphore)
 
-    async def _get_request_response(self, url, session):
+    async def _get_request_response(self, url, session, semaphore=None):
         """Get request response."""
         single = isinstance(url, str)
         url = [url] if single else url
         try:
             response = await _asyncio.gather(*[
-                self._fetch_url(session, u) for u in url
+                self._fetch_url(session, u, semaphore) for u in url
             ])
         except _asyncio.TimeoutError as err:
             raise _exceptions.TimeoutError(
@@ -1110,20 +1617,76 @@ class ClientArchiver:
             return response[0]
         return response
 
-    async def _fetch_url(self, session, url):
-        async with self._semaphore:
+    async def _fetch_url(self, session, url, semaphore=None):
+        async with semaphore or self._semaphore:
             _log.debug('Fetching URL: %s', url)
-            async with session.get(url, timeout=self._query_timeout) as resp:
-                if resp.status != 200:
-                    return None
+            nretries = self._query_max_retries
+            for retry in range(nretries + 1):
+                if retry:
+                    delay = self._query_retry_backoff * 2**(retry - 1)
+                    await _asyncio.sleep(delay)
                 try:
-                    return await resp.json()
-                except _aio_exceptions.ContentTypeError:
-                    # for cases where response returns html (self.connected).
-                    return await resp.text()
-                except ValueError:
-                    _log.error('Error with URL %s', resp.url)
-                    return None
+                    return await self._fetch_url_once(
+                        session, url, can_retry=retry < nretries)
+                except _asyncio.TimeoutError:
+                    raise
+                except (
+                    _aio_exceptions.ClientConnectionError,
+                    _aio_exceptions.ClientResponseError,
+                ) as err:
+                    if retry == nretries:
+                        raise
+                    _log.debug('Retrying URL %s: %s', url, err)
+
+    async def _fetch_url_once(self, session, url, can_retry=False):
+        async with session.get(url, timeout=self._query_timeout) as resp:
+            if resp.status != 200:
+                if can_retry and resp.status in self.RETRY_STATUS:
+                    resp.raise_for_status()
+                return None
+            if resp.url.path.endswith('/getData.raw'):
+                decoder = _RawDecoder()
+                async for data in resp.content.iter_any():
+                    decoder.feed(data)
+                return decoder.finish()
+            try:
+                return await resp.json()
+            except _aio_exceptions.ContentTypeError:
+                # for cases where response returns html (self.connected).
+                return await resp.text()
+            except ValueError:
+                _log.error('Error with URL %s', resp.url)
+                return None
+
+    @staticmethod
+    async def _create_semaphore(value):
+        """Create semaphore in the event loop."""
+        return _asyncio.Semaphore(value)
+
+    async def _get_pool_session(self):
+        """Return long-lived session of anonymous requests.
+
+        Its connections are kept alive and reused by all requests, so that
+        TCP/TLS handshakes and DNS lookups are not repeated.
+        """
+        if self._pool_session is None or self._pool_session.closed:
+            # NOTE: we need to define a connector with ssl=False so that url
+            # with IP address can be requested without SSL errors.
+            conn = _TCPConn(
+                ssl=False,
+                limit=0,
+                limit_per_host=self._query_max_concurrency,
+                ttl_dns_cache=self.CONN_DNS_CACHE_TTL,
+                keepalive_timeout=self.CONN_KEEPALIVE_TIMEOUT,
+            )
+            self._pool_session = _ClSession(connector=conn)
+        return self._pool_session
+
+    async def _close_pool_session(self):
+        """Close long-lived session of anonymous requests."""
+        session, self._pool_session = self._pool_session, None
+        if session is not None:
+            await session.close()
 
     async def _create_session(self, url, payload):
         """Create session and handle login."""
@@ -8,6 +8,7 @@ from mathphys.functions import get_namedtuple as _get_namedtuple
 from ..search import BPMSearch as _BPMSearch, PSSearch as _PSSearch
 from . import exceptions as _exceptions
 from .pvarch import PVDataSet as _PVDataSet
+from .resample import get_changes as _get_changes, Resampler as _Resampler
 from .time import Time as _Time
 
 
@@ -39,6 +40,8 @@ class BaseDevice(_PVDataSet):
         self._devnames, pvnames = self._get_pvnames()
         self._times = None
         self._values = None
+        self._resample_method = 'linear'
+        self._values_dtype = float
         super().__init__(pvnames, connector=connector)
         self.query_split_interval = 3600
         self.processing_type = self.ProcessingTypes.Mean
@@ -59,12 +62,69 @@ class BaseDevice(_PVDataSet):
         """Return retrieved orbit interpolated values."""
         return self._values
 
-    def update(self, query_timeout=None):
-        """Update state by retrieving data."""
-        super().update(query_timeout=query_timeout)
+    @property
+    def resample_method(self):
+        """Method to resample data onto time grid.
+
+        'linear' (default), 'previous' (sample and hold) or 'nearest'.
+        """
+        return self._resample_method
 
-        # interpolate data
-        self._times, self._values = self._interpolate_data()
+    @resample_method.setter
+    def resample_method(self, value):
+        if value not in _Resampler.METHODS:
+            raise ValueError(
+                'resample method must be one of ' + str(_Resampler.METHODS))
+        self._resample_method = value
+
+    @property
+    def values_dtype(self):
+        """Data type of interpolated values. Defaults to float."""
+        return self._values_dtype
+
+    @values_dtype.setter
+    def values_dtype(self, value):
+        self._values_dtype = _np.dtype(value)
+
+    def update(self, query_timeout=None, use_cache=True, chunked=False):
+        """Update state by retrieving data.
+
+        Args:
+            query_timeout (float): overwrites connector query timeout.
+            use_cache (bool): whether to use the connector cache, if
+                defined. Defaults to True.
+            chunked (bool): whether to interpolate data in chunks, as it
+                is retrieved. Raw data of PVs is not kept, so that long
+                intervals can be loaded with less memory. Requires
+                `processing_type_param1` and does not use the cache.
+                Defaults to False.
+        """
+        if not chunked:
+            super().update(query_timeout=query_timeout, use_cache=use_cache)
+            self._times, self._values = self._interpolate_data()
+            return
+
+        mean_sec = self.processing_type_param1
+        if mean_sec is None:
+            raise ValueError(
+                'processing_type_param1 must be defined for chunked updates.')
+        resampler = self._create_resampler(mean_sec)
+        pvn2idx = {pvn: idx for idx, pvn in enumerate(self._pvnames)}
+        for pvname, data in self.iter_data(query_timeout=query_timeout):
+            resampler.feed(pvn2idx[pvname], data['timestamp'], data['value'])
+        self._times, self._values = self._finish_resampler(resampler)
+
+    def get_changes(self):
+        """Return sparse representation of values, with only changes.
+
+        Returns:
+            rows (numpy.ndarray): indices of timestamps of changes.
+            cols (numpy.ndarray): indices of devices of changes.
+            vals (numpy.ndarray): new values.
+        """
+        if self._values is None:
+            return None
+        return _get_changes(self._values)
 
     # --- private methods ---
 
@@ -75,30 +135,33 @@ class BaseDevice(_PVDataSet):
 
     def _interpolate_data(self):
         # calc mean_sec if not passed
-        nr_pvs = len(self._pvdata)
         mean_sec = self.processing_type_param1
         if mean_sec is None:
-            mean_sec = sum(
-                map(
-                    lambda p: p.timestamp[1] - p.timestamp[0],
-                    self._pvdata.values(),
-                )
-            )
-            mean_sec /= nr_pvs
-
-        # times vector
-        t0_, t1_ = self.time_start.timestamp(), self.time_stop.timestamp()
-        times = _np.arange(t0_, t1_, mean_sec)
-
-        # builds orbit matrix using interpolation
-        values = _np.zeros((len(times), nr_pvs), dtype=float)
+            # median sampling interval is robust to gaps in the data.
+            mean_sec = _np.mean([
+                _np.median(_np.diff(pvd.timestamp))
+                for pvd in self._pvdata.values()
+                if pvd.timestamp is not None and pvd.timestamp.size > 1])
+
+        # builds values matrix using interpolation
+        resampler = self._create_resampler(mean_sec)
         for i, pvname in enumerate(self._pvnames):
             pvdata = self._pvdata[pvname]
-            values[:, i] = _np.interp(times, pvdata.timestamp, pvdata.value)
-        values *= Orbit._CONV
+            if pvdata.timestamp is not None:
+                resampler.feed(i, pvdata.timestamp, pvdata.value)
+        return self._finish_resampler(resampler)
+
+    def _create_resampler(self, mean_sec):
+        t0_, t1_ = self.time_start.timestamp(), self.time_stop.timestamp()
+        times = _np.arange(t0_, t1_, mean_sec)
+        return _Resampler(
+            times, len(self._pvnames), method=self._resample_method,
+            dtype=self._values_dtype)
 
-        # return data
-        return times, values
+    def _finish_resampler(self, resampler):
+        values = resampler.finish()
+        values *= self._CONV
+        return resampler.times, values
 
     def __getitem__(self, index):
         """Return raw timestamp and value tuple data for a given BPM."""
@@ -113,7 +176,7 @@ class BaseDevice(_PVDataSet):
             else:
                 raise _exceptions.IndexError
         pvdata = self._pvdata[pvname]
-        return pvdata.timestamp, pvdata.value * Orbit._CONV
+        return pvdata.timestamp, pvdata.value * self._CONV
 
 
 class Orbit(BaseDevice):
@@ -534,8 +534,14 @@ class PVData(_Base):
             )
         self._processing_type_param2 = new_param
 
-    def update(self, query_timeout=None):
-        """Update."""
+    def update(self, query_timeout=None, use_cache=True):
+        """Update.
+
+        Args:
+            query_timeout (float): overwrites connector query timeout.
+            use_cache (bool): whether to use the connector cache, if
+                defined. Defaults to True.
+        """
         self.connect()
 
         if query_timeout is not None:
@@ -551,6 +557,7 @@ class PVData(_Base):
                 proc_type=self.processing_type,
                 proc_type_param1=self.processing_type_param1,
                 proc_type_param2=self.processing_type_param2,
+                use_cache=use_cache,
             )
         finally:
             if query_timeout is not None:
@@ -1007,8 +1014,14 @@ class PVDataSet(_Base):
         archived = set(self._pvnames) - set(self.not_archived)
         return list(archived)
 
-    def update(self, query_timeout=None):
-        """Update."""
+    def update(self, query_timeout=None, use_cache=True):
+        """Update.
+
+        Args:
+            query_timeout (float): overwrites connector query timeout.
+            use_cache (bool): whether to use the connector cache, if
+                defined. Defaults to True.
+        """
         self.connect()
 
         if query_timeout is not None:
@@ -1016,10 +1029,10 @@ class PVDataSet(_Base):
             self.query_timeout = query_timeout
 
         all_urls = []
-        pvn2idcs = dict()
+        plans = dict()
         for pvn in self._pvnames:
             pvd = self._pvdata[pvn]
-            urls = self.connector.get_request_url_for_get_data(
+            plans[pvn] = self.connector.get_request_plan_for_get_data(
                 pvn,
                 pvd.time_start,
                 pvd.time_stop,
@@ -1027,34 +1040,71 @@ class PVDataSet(_Base):
                 proc_type=pvd.processing_type,
                 proc_type_param1=pvd.processing_type_param1,
                 proc_type_param2=pvd.processing_type_param2,
-                return_pvn2idcs_dict=False,
+                use_cache=use_cache,
             )
-            urls = [urls] if isinstance(urls, str) else urls
-            ini = len(all_urls)
-            all_urls.extend(urls)
-            end = len(all_urls)
-            pvn2idcs[pvn] = _np.arange(ini, end)
+            all_urls.extend(plans[pvn]['urls'])
 
         try:
-            resps = self.connector.make_request(all_urls)
+            resps = []
+            if all_urls:
+                resps = self.connector.make_request(all_urls)
         finally:
             if query_timeout is not None:
                 self.query_timeout = query_timeout0
 
-        if not resps:
+        if all_urls and not resps:
             return None
 
-        data = self.connector.process_resquest_of_get_data(
-            self._pvnames, resps, pvn2idcs
-        )
-
-        if not data:
-            return
-        if len(self._pvnames) == 1:
-            pvname = self._pvnames[0]
-            data = {pvname: data}
+        ini = 0
         for pvname in self._pvnames:
-            self._pvdata[pvname].set_data(**data[pvname])
+            plan = plans[pvname]
+            end = ini + len(plan['urls'])
+            data = self.connector.process_request_of_get_data_plan(
+                plan, resps[ini:end])
+            self._pvdata[pvname].set_data(**data)
+            ini = end
+
+    def iter_data(self, query_timeout=None, max_in_flight=None):
+        """Iterate over data of all PVs, in chunks.
+
+        Data is not stored in the PVData objects, so that long time
+        intervals can be processed in constant memory.
+
+        Args:
+            query_timeout (float): overwrites connector query timeout.
+            max_in_flight (int): maximum number of chunks requested but not
+                yet consumed. See `ClientArchiver.iter_request_of_get_data`.
+
+        Yields:
+            (str, dict): PV name and data of a chunk, with fields
+                'timestamp', 'value', 'status' and 'severity'. Chunks of
+                each PV are yielded in time order.
+        """
+        self.connect()
+
+        pvn2urls = dict()
+        for pvn in self._pvnames:
+            pvd = self._pvdata[pvn]
+            urls = self.connector.get_request_url_for_get_data(
+                pvn,
+                pvd.time_start,
+                pvd.time_stop,
+                query_split_interval=pvd.query_split_interval,
+                proc_type=pvd.processing_type,
+                proc_type_param1=pvd.processing_type_param1,
+                proc_type_param2=pvd.processing_type_param2,
+            )
+            pvn2urls[pvn] = [urls] if isinstance(urls, str) else urls
+
+        if query_timeout is not None:
+            query_timeout0 = self.query_timeout
+            self.query_timeout = query_timeout
+        try:
+            yield from self.connector.iter_request_of_get_data(
+                pvn2urls, max_in_flight=max_in_flight)
+        finally:
+            if query_timeout is not None:
+                self.query_timeout = query_timeout0
 
     def gen_archviewer_url_link(
         self,
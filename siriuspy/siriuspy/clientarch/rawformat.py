@@ -0,0 +1,197 @@
+"""Archiver Appliance PB/raw retrieval format decoder.
+
+The raw format is a sequence of chunks separated by empty lines. The first
+line of each chunk is a PayloadInfo protocol buffer message, with the PV
+type and the year of its samples, and each one of the following lines is
+a sample message. Messages are escaped so that they contain no newlines.
+
+See
+    https://epicsarchiver.readthedocs.io/en/latest/developer/pb_pbraw.html
+"""
+
+import struct as _struct
+from calendar import timegm as _timegm
+
+import numpy as _np
+
+_ESC_SEQS = (
+    (b'\x1b\x03', b'\r'), (b'\x1b\x02', b'\n'), (b'\x1b\x01', b'\x1b'))
+
+# PayloadInfo and sample messages fields
+_INFO_TYPE, _INFO_PVNAME, _INFO_YEAR = 1, 2, 3
+_SMPL_SECS, _SMPL_NANO, _SMPL_VAL, _SMPL_SEVR, _SMPL_STAT = 1, 2, 3, 4, 5
+
+# payload type: (decoder kind, numpy dtype of fixed size values)
+_PAYLOAD_TYPES = {
+    0: ('string', None),  # SCALAR_STRING
+    1: ('sint', None),  # SCALAR_SHORT
+    2: ('fixed', '<f4'),  # SCALAR_FLOAT
+    3: ('sint', None),  # SCALAR_ENUM
+    4: ('byte', None),  # SCALAR_BYTE
+    5: ('fixed', '<i4'),  # SCALAR_INT
+    6: ('fixed', '<f8'),  # SCALAR_DOUBLE
+    7: ('vstring', None),  # WAVEFORM_STRING
+    8: ('vsint', None),  # WAVEFORM_SHORT
+    9: ('vfixed', '<f4'),  # WAVEFORM_FLOAT
+    10: ('vsint', None),  # WAVEFORM_ENUM
+    11: ('vbyte', None),  # WAVEFORM_BYTE
+    12: ('vfixed', '<i4'),  # WAVEFORM_INT
+    13: ('vfixed', '<f8'),  # WAVEFORM_DOUBLE
+}
+
+
+def unescape(line):
+    """Return line with archiver escape sequences replaced."""
+    if b'\x1b' not in line:
+        return line
+    for seq, char in _ESC_SEQS:
+        line = line.replace(seq, char)
+    return line
+
+
+def parse_message(buf):
+    """Return dict with protocol buffer fields of a message.
+
+    Values of each field number are listed in order of appearance.
+    Varints are returned as int, all other wire types as bytes.
+    """
+    fields = dict()
+    pos, size = 0, len(buf)
+    while pos < size:
+        key = buf[pos]
+        if key < 0x80:
+            pos += 1
+        else:
+            key, pos = _read_varint(buf, pos)
+        wtype = key & 0x7
+        if wtype == 0:
+            val = buf[pos]
+            if val < 0x80:
+                pos += 1
+            else:
+                val, pos = _read_varint(buf, pos)
+        elif wtype == 1:
+            val, pos = buf[pos:pos+8], pos + 8
+        elif wtype == 2:
+            length, pos = _read_varint(buf, pos)
+            val, pos = buf[pos:pos+length], pos + length
+        elif wtype == 5:
+            val, pos = buf[pos:pos+4], pos + 4
+        else:
+            raise ValueError('Invalid protocol buffer wire type.')
+        fields.setdefault(key >> 3, []).append(val)
+    return fields
+
+
+class RawDecoder:
+    """Streaming decoder of PB/raw responses.
+
+    Data is fed as it is received and decoded line by line. Samples are
+    accumulated in columns, with the same fields as samples of the JSON
+    format: 'secs', 'nanos', 'val', 'status' and 'severity'.
+    """
+
+    def __init__(self):
+        """Init."""
+        self._buffer = bytearray()
+        self._header = True
+        self._kind = self._dtype = self._struct = None
+        self._year_secs = 0
+        self.pvname = None
+        self.columns = dict(secs=[], nanos=[], val=[], status=[], severity=[])
+
+    def feed(self, data):
+        """Decode all complete lines of data."""
+        self._buffer += data
+        if b'\n' not in data:
+            return
+        lines = self._buffer.split(b'\n')
+        self._buffer = lines.pop()
+        for line in lines:
+            self._decode_line(line)
+
+    def finish(self):
+        """Decode remaining data and return decoded columns."""
+        if self._buffer:
+            self._decode_line(self._buffer)
+            self._buffer = bytearray()
+        return self.columns
+
+    # --- private methods ---
+
+    def _decode_line(self, line):
+        if not line:
+            # empty lines separate chunks, each one with its own header.
+            self._header = True
+            return
+        fields = parse_message(unescape(line))
+        if self._header:
+            self._decode_header(fields)
+            self._header = False
+            return
+        cols = self.columns
+        cols['secs'].append(self._year_secs + fields[_SMPL_SECS][0])
+        cols['nanos'].append(fields[_SMPL_NANO][0])
+        cols['val'].append(self._decode_value(fields.get(_SMPL_VAL, [])))
+        cols['severity'].append(_to_int32(fields.get(_SMPL_SEVR, [0])[0]))
+        cols['status'].append(_to_int32(fields.get(_SMPL_STAT, [0])[0]))
+
+    def _decode_header(self, fields):
+        ptype = fields[_INFO_TYPE][0]
+        if ptype not in _PAYLOAD_TYPES:
+            raise ValueError(f'Unsupported payload type {ptype}.')
+        self._kind, self._dtype = _PAYLOAD_TYPES[ptype]
+        if self._dtype is not None:
+            self._struct = _struct.Struct('<' + _np.dtype(self._dtype).char)
+        self.pvname = fields[_INFO_PVNAME][0].decode()
+        year = fields[_INFO_YEAR][0]
+        self._year_secs = _timegm((year, 1, 1, 0, 0, 0))
+
+    def _decode_value(self, vals):
+        kind = self._kind
+        if kind == 'fixed':
+            return self._struct.unpack(vals[0])[0]
+        if kind == 'sint':
+            return _zigzag(vals[0])
+        if kind == 'string':
+            return vals[0].decode()
+        if kind == 'byte':
+            return _struct.unpack('b', vals[0][:1])[0] if vals[0] else 0
+        if kind == 'vfixed':
+            # packed and non-packed repeated values have the same layout.
+            return _np.frombuffer(b''.join(vals), dtype=self._dtype).astype(
+                float if self._dtype[1] == 'f' else int)
+        if kind == 'vsint':
+            ints = []
+            for val in vals:
+                if isinstance(val, int):
+                    ints.append(_zigzag(val))
+                    continue
+                pos = 0
+                while pos < len(val):
+                    num, pos = _read_varint(val, pos)
+                    ints.append(_zigzag(num))
+            return _np.array(ints, dtype=int)
+        if kind == 'vbyte':
+            return _np.frombuffer(b''.join(vals), dtype=_np.int8).astype(int)
+        return [val.decode() for val in vals]
+
+
+def _read_varint(buf, pos):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(num):
+    return (num >> 1) ^ -(num & 1)
+
+
+def _to_int32(num):
+    # negative int32 values are encoded as 64 bits two's complement.
+    return num - (1 << 64) if num >= 1 << 63 else num
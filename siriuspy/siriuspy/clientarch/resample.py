@@ -0,0 +1,136 @@
+"""Resampling of irregular time series onto a common time grid."""
+
+import numpy as _np
+
+
+class Resampler:
+    """Resample time series of several PVs onto a common time grid.
+
+    Values are written directly into a preallocated (grid, series) matrix,
+    one time ordered chunk of a series at a time, so that long intervals
+    can be resampled while data is retrieved, without keeping raw data of
+    all series in memory. Grid points before the first sample of a series
+    take its first value and points after its last sample take its last
+    value, as `numpy.interp` does. Points of series without samples are
+    NaN.
+
+    Methods:
+        'previous': sample and hold, value of last sample at or before
+            each grid point.
+        'linear': linear interpolation, same as `numpy.interp`.
+        'nearest': value of nearest sample. Ties take the earlier sample.
+    """
+
+    METHODS = ('previous', 'linear', 'nearest')
+
+    def __init__(self, times, nr_series, method='previous', dtype=float):
+        """Init.
+
+        Args:
+            times (numpy.ndarray): increasing grid timestamps.
+            nr_series (int): number of time series.
+            method (str): resampling method. See class docs.
+            dtype (numpy.dtype): dtype of resampled values, such as
+                numpy.float32 to halve memory usage.
+        """
+        if method not in Resampler.METHODS:
+            raise ValueError(
+                'method must be one of ' + str(Resampler.METHODS))
+        self._method = method
+        self._times = _np.asarray(times, dtype=float)
+        self._values = _np.full((self._times.size, nr_series), _np.nan, dtype)
+        # index of next grid point to fill and last sample of each series
+        self._next = _np.zeros(nr_series, dtype=int)
+        self._last = [None] * nr_series
+
+    @property
+    def method(self):
+        """Resampling method."""
+        return self._method
+
+    @property
+    def times(self):
+        """Grid timestamps."""
+        return self._times
+
+    @property
+    def values(self):
+        """Resampled values, one column per series."""
+        return self._values
+
+    def feed(self, index, timestamp, value):
+        """Resample a chunk of samples of a series.
+
+        Chunks of each series must be fed in time order. Grid points after
+        the last sample of the chunk are only filled by the next chunks or
+        by `finish`.
+
+        Args:
+            index (int): series index.
+            timestamp (numpy.ndarray): increasing sample timestamps.
+            value (numpy.ndarray): sample values.
+        """
+        timestamp = _np.asarray(timestamp, dtype=float)
+        value = _np.asarray(value)
+        if not timestamp.size:
+            return
+        last = self._last[index]
+        if last is not None:
+            # previous sample is needed to resample points between chunks.
+            timestamp = _np.r_[last[0], timestamp]
+            value = _np.r_[last[1], value]
+        ini = self._next[index]
+        end = _np.searchsorted(self._times, timestamp[-1], side='right')
+        if end > ini:
+            self._values[ini:end, index] = self._resample(
+                self._times[ini:end], timestamp, value)
+        self._next[index] = max(end, ini)
+        self._last[index] = (timestamp[-1], value[-1])
+
+    def finish(self):
+        """Fill grid points after last sample of each series."""
+        for index, last in enumerate(self._last):
+            if last is not None:
+                self._values[self._next[index]:, index] = last[1]
+                self._next[index] = self._times.size
+        return self._values
+
+    def get_changes(self):
+        """Return sparse representation with only changed values.
+
+        Returns:
+            rows (numpy.ndarray): grid indices of changes.
+            cols (numpy.ndarray): series indices of changes.
+            vals (numpy.ndarray): new values.
+            The first grid point of each series is always included and
+            triplets are sorted by grid index.
+        """
+        return get_changes(self._values)
+
+    # --- private methods ---
+
+    def _resample(self, grid, timestamp, value):
+        if self._method == 'linear':
+            return _np.interp(grid, timestamp, value)
+        idx = _np.searchsorted(timestamp, grid, side='right') - 1
+        if self._method == 'nearest':
+            nxt = _np.minimum(idx + 1, timestamp.size - 1)
+            prv = _np.maximum(idx, 0)
+            closer = (timestamp[nxt] - grid) < (grid - timestamp[prv])
+            idx = _np.where(closer | (idx < 0), nxt, prv)
+        return value[_np.maximum(idx, 0)]
+
+
+def get_changes(values):
+    """Return (rows, cols, vals) of changed values of a resampled matrix.
+
+    NaN values are considered equal to each other.
+    """
+    values = _np.asarray(values)
+    changed = _np.empty(values.shape, dtype=bool)
+    changed[:1] = True
+    cur, prev = values[1:], values[:-1]
+    _np.not_equal(cur, prev, out=changed[1:])
+    changed[1:] &= ~(_np.isnan(cur) & _np.isnan(prev))
+    rows, cols = _np.nonzero(changed)
+    return rows, cols, values[rows, cols]
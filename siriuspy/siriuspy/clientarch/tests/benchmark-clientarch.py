@@ -0,0 +1,102 @@
+#!/usr/bin/env python-sirius
+"""Benchmark of many small queries against a local mock appliance.
+
+Compares queries of ClientArchiver, which reuse the connections of its
+pooled session, with queries that open a new session for each request.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+
+from siriuspy.clientarch import ClientArchiver
+
+
+class MockAppliance:
+    """Local appliance answering PV details queries."""
+
+    def __init__(self):
+        """."""
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = None
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started, ), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        """."""
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/mgmt/bpl/getPVDetails', self._get_pv_details)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    @staticmethod
+    async def _get_pv_details(request):
+        return web.json_response([
+            dict(name='Is this a scalar:', value='Yes'),
+            dict(name='Number of elements', value='1'),
+        ])
+
+
+def benchmark_pooled(client, url, nrqueries):
+    """Time queries made with ClientArchiver pooled session."""
+    t0_ = time.time()
+    for _ in range(nrqueries):
+        client.make_request(url)
+    return time.time() - t0_
+
+
+def benchmark_new_session(client, url, nrqueries):
+    """Time queries made with a new session for each one."""
+    async def query():
+        async with ClientSession(connector=TCPConnector(ssl=False)) as sess:
+            async with sess.get(url) as resp:
+                return await resp.json()
+
+    t0_ = time.time()
+    for _ in range(nrqueries):
+        client._run_sync_coro(query())
+    return time.time() - t0_
+
+
+def run(nrqueries=1000):
+    """."""
+    appliance = MockAppliance()
+    client = ClientArchiver(server_url=appliance.url)
+    url = client.get_pv_details('SI-Glob:AP-Test-Mon', get_request_url=True)
+    try:
+        dt_pool = benchmark_pooled(client, url, nrqueries)
+        dt_new = benchmark_new_session(client, url, nrqueries)
+    finally:
+        client.shutdown()
+        appliance.stop()
+    print(f'{nrqueries:d} sequential queries:')
+    print(f'  pooled session     : {1e3*dt_pool/nrqueries:.3f} ms/query')
+    print(f'  session per request: {1e3*dt_new/nrqueries:.3f} ms/query')
+
+
+if __name__ == '__main__':
+    run(*[int(arg) for arg in sys.argv[1:]])
@@ -1,6 +1,11 @@
 """Implementation of web server data retrieval functions."""
 
+import gzip as _gzip
+import json as _json
+import os as _os
 import re as _re
+import threading as _threading
+import time as _time
 import urllib.request as _urllib_request
 
 from .. import envars as _envars
@@ -20,10 +25,133 @@ _TIMESYS_FOLDER = '/timesys/'
 _MAC_SCHEDULE_FOLDER = '/macschedule/'
 _DOC_SERV_FOLDER = '/documentation/services/'
 
+_SNAPSHOT_VERSION = 1
+# tables of loaded snapshot bundle, by url
+_snapshot = {'filename': None, 'tables': dict()}
+# tables being recorded by the current thread to create a snapshot
+_recording = _threading.local()
+
 
 def read_url(url, timeout=_TIMEOUT):
-    """Read URL from server."""
+    """Read URL from server.
+
+    Tables available in the snapshot bundle loaded with `snapshot_load` are
+    returned without requests to the server.
+    """
+    tables = getattr(_recording, 'tables', None)
+    if tables is None:
+        text = _snapshot['tables'].get(url)
+        if text is not None:
+            return text
+    text = _read_servers(url, timeout)
+    if tables is not None:
+        tables[url] = text
+    return text
+
+
+def server_online():
+    """Verify if the server, or a loaded snapshot bundle, is online."""
+    if _snapshot['tables']:
+        return True
+    try:
+        read_url('', timeout=_TIMEOUT)
+        return True
+    except Exception:
+        return False
+
+
+def snapshot_create(filename=None, timeout=_TIMEOUT):
+    """Read all tables from server and save them in a snapshot bundle.
+
+    Args:
+        filename (str): bundle file. Defaults to the file defined by the
+            SIRIUS_CONSTS_SNAPSHOT environment variable.
+        timeout (float): timeout of each request [s].
 
+    Returns:
+        int: number of tables in bundle.
+    """
+    filename = filename or _envars.FILE_CSCONSTS_SNAPSHOT
+    if not filename:
+        raise ValueError('snapshot bundle file not defined.')
+    _recording.tables = tables = dict()
+    try:
+        for func in _SNAPSHOT_READERS:
+            func(timeout=timeout)
+        for name in _get_table_names(ps_pstypes_names_read(timeout=timeout)):
+            ps_pstype_data_read(name + '.txt', timeout=timeout)
+        for name in _get_table_names(id_idtypes_names_read(timeout=timeout)):
+            id_idtype_data_read(name + '.txt', timeout=timeout)
+        text = read_url(_EXCDAT_FOLDER, timeout=timeout)
+        for fname in _get_folder_files(text, 'txt'):
+            magnets_excitation_data_read(fname, timeout=timeout)
+        text = read_url(_MAC_SCHEDULE_FOLDER, timeout=timeout)
+        for fname in _get_folder_files(text, 'txt'):
+            mac_schedule_read(fname[:-4], timeout=timeout)
+    finally:
+        del _recording.tables
+
+    bundle = {
+        'version': _SNAPSHOT_VERSION,
+        'timestamp': _time.time(),
+        'server': _envars.SRVURL_CSCONSTS,
+        'tables': tables,
+        }
+    # write to temporary file first, so that the bundle is replaced
+    # atomically and readers never see a partial file.
+    tmpname = filename + '.tmp' + str(_os.getpid())
+    with _gzip.open(tmpname, 'wt', encoding='utf-8') as fil:
+        _json.dump(bundle, fil)
+    _os.replace(tmpname, filename)
+    return len(tables)
+
+
+def snapshot_load(filename=None, refresh=True, timeout=_TIMEOUT):
+    """Load snapshot bundle, used by `read_url` instead of the server.
+
+    Args:
+        filename (str): bundle file. Defaults to the file defined by the
+            SIRIUS_CONSTS_SNAPSHOT environment variable.
+        refresh (bool): whether to create the bundle again in a background
+            thread, if the server is reachable. The loaded tables are not
+            changed, the refreshed bundle is used in the next load.
+        timeout (float): timeout of each request of refresh [s].
+
+    Returns:
+        bool: whether bundle was loaded.
+    """
+    filename = filename or _envars.FILE_CSCONSTS_SNAPSHOT
+    if not filename:
+        raise ValueError('snapshot bundle file not defined.')
+    try:
+        with _gzip.open(filename, 'rt', encoding='utf-8') as fil:
+            bundle = _json.load(fil)
+    except (OSError, ValueError):
+        bundle = None
+    loaded = bundle is not None and \
+        bundle.get('version') == _SNAPSHOT_VERSION
+    if loaded:
+        _snapshot['filename'] = filename
+        _snapshot['tables'] = bundle['tables']
+    if refresh:
+        thread = _threading.Thread(
+            target=_snapshot_refresh, args=(filename, timeout), daemon=True)
+        thread.start()
+    return loaded
+
+
+def snapshot_unload():
+    """Unload snapshot bundle, tables are read from server again."""
+    _snapshot['filename'] = None
+    _snapshot['tables'] = dict()
+
+
+def snapshot_info():
+    """Return file and number of tables of loaded snapshot bundle."""
+    return _snapshot['filename'], len(_snapshot['tables'])
+
+
+def _read_servers(url, timeout=_TIMEOUT):
     # build list with servers
     urls = [_envars.SRVURL_CSCONSTS + url, _envars.SRVURL_CSCONSTS_2 + url]
     connected = False
@@ -43,13 +171,31 @@ def read_url(url, timeout=_TIMEOUT):
     return text
 
 
-def server_online():
-    """Verify if the server is online."""
+def _snapshot_refresh(filename, timeout):
     try:
-        read_url('', timeout=_TIMEOUT)
-        return True
+        _read_servers('', timeout=timeout)
     except Exception:
-        return False
+        return
+    try:
+        snapshot_create(filename, timeout=timeout)
+    except Exception as err:
+        print('Error refreshing snapshot bundle: ' + str(err))
+
+
+def _get_table_names(text):
+    """Return first column of table."""
+    names = list()
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            names.append(line.split()[0])
+    return names
+
+
+def _get_folder_files(text, extension):
+    """Return files listed in server folder page."""
+    pat = _re.compile('"([a-zA-Z_0-9\\-\\.]*\\.' + extension + ')"')
+    return sorted(set(pat.findall(text)))
 
 
 def magnets_model_data(timeout=_TIMEOUT):
@@ -220,3 +366,32 @@ def doc_services_read(timeout=_TIMEOUT):
         text += read_url(url + file, timeout=timeout)
         text += '\n\n'
     return text
+
+
+# tables of these readers are included in snapshot bundles, in addition to
+# the tables of each pstype, idtype, excitation data and machine schedule.
+_SNAPSHOT_READERS = (
+    magnets_model_data,
+    magnets_excitation_ps_read,
+    orb_intlk_limits_read,
+    ps_pstype_setpoint_limits,
+    pu_pstype_setpoint_limits,
+    ps_psmodels_read,
+    id_idmodels_read,
+    ps_siggen_configuration_read,
+    pu_psmodels_read,
+    beaglebone_freq_mapping,
+    beaglebone_ip_list,
+    bbb_udc_mapping,
+    udc_ps_mapping,
+    crates_mapping,
+    bpms_data,
+    timing_devices_mapping,
+    high_level_triggers,
+    high_level_events,
+    bsmp_dclink_mapping,
+    doc_services_read,
+)
+
+if _envars.FILE_CSCONSTS_SNAPSHOT:
+    snapshot_load()
@@ -230,6 +230,8 @@ def get_lifetime_database():
             'scan': 0.5},
         'LifetimeHour-Mon': {
             'type': 'float', 'value': 0.0, 'prec': 4, 'unit': 'h'},
+        'LifetimeStd-Mon': {
+            'type': 'float', 'value': 0.0, 'prec': 2, 'unit': 's'},
         'BuffSize-Mon': {'type': 'int', 'value': 0},
         'BuffSizeTot-Mon': {'type': 'int', 'value': 0},
         'BufferValue-Mon': {
@@ -244,6 +246,8 @@ def get_lifetime_database():
             'scan': 0.5},
         'LifetimeBPMHour-Mon': {
             'type': 'float', 'value': 0.0, 'prec': 4, 'unit': 'h'},
+        'LifetimeBPMStd-Mon': {
+            'type': 'float', 'value': 0.0, 'prec': 2, 'unit': 's'},
         'BuffSizeBPM-Mon': {'type': 'int', 'value': 0},
         'BuffSizeTotBPM-Mon': {'type': 'int', 'value': 0},
         'BufferValueBPM-Mon': {
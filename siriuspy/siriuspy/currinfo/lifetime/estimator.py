@@ -0,0 +1,262 @@
+"""Online least squares estimator of beam lifetime."""
+
+import math as _math
+import threading as _threading
+
+import numpy as _np
+
+from ...epics import RingBuffer as _RingBuffer
+
+
+class LifetimeEstimator:
+    """Online least squares estimator of beam lifetime.
+
+    Keeps running sums of the least squares fits of the samples inside a
+    time window, updated as samples enter and leave the window, so that the
+    lifetime and its uncertainty are calculated in O(1), independently of
+    the number of samples. Sums of both linear and exponential fits are
+    kept, with times relative to a reference sample, and they are
+    recalculated from the samples after as many removals as samples, to
+    avoid accumulation of rounding errors.
+
+    Samples are decimated so that the estimator keeps only the first sample
+    of each interval of `min_interval` seconds, counted from epoch.
+    """
+
+    # indices of running sums
+    _N, _SX, _SXX = 0, 1, 2
+    _SV, _SXV, _SVV = 3, 4, 5  # values
+    _SL, _SXL, _SLL = 6, 7, 8  # logarithm of values minus offset
+    _NBAD = 9  # number of values minus offset not positive
+
+    def __init__(self, maxlen=None, offset=0.0, min_interval=0.0):
+        """Init.
+
+        Args:
+            maxlen (int, optional): maximum number of samples kept. Defaults
+                to None, which means the number is not limited.
+            offset (float, optional): offset subtracted from values.
+            min_interval (float, optional): decimation interval [s].
+        """
+        self._lock = _threading.RLock()
+        self._buffer = _RingBuffer(maxlen=maxlen)
+        self._offset = offset
+        self._min_interval = min_interval
+        self._first = -_math.inf
+        self._last = _math.inf
+        self._tref = 0.0
+        self._last_bin = None
+        self._nr_removed = 0
+        self._sums = [0.0] * 10
+
+    @property
+    def offset(self):
+        """Offset subtracted from values."""
+        return self._offset
+
+    @offset.setter
+    def offset(self, value):
+        """Set offset. Samples must be reset afterwards."""
+        self._offset = value
+
+    @property
+    def min_interval(self):
+        """Decimation interval [s]."""
+        return self._min_interval
+
+    @min_interval.setter
+    def min_interval(self, value):
+        """Set decimation interval. Samples must be reset afterwards."""
+        self._min_interval = value
+
+    @property
+    def timestamps(self):
+        """View of timestamps of samples, valid until the next change."""
+        return self._buffer.timestamps
+
+    @property
+    def values(self):
+        """View of values of samples, valid until the next change."""
+        return self._buffer.values
+
+    def get_samples(self):
+        """Return copies of timestamps and values of samples."""
+        with self._lock:
+            return self._buffer.timestamps.copy(), self._buffer.values.copy()
+
+    def __len__(self):
+        """Return number of samples."""
+        return len(self._buffer)
+
+    def set_window(self, first, last=_math.inf):
+        """Set time window of samples.
+
+        Samples older than first are discarded, with O(1) cost per sample.
+        Other changes of the window require a reset of the samples.
+
+        Returns:
+            bool: False if samples must be reset with `reset`.
+        """
+        with self._lock:
+            if last != self._last or first < self._first:
+                self._first, self._last = first, last
+                return False
+            self._first = first
+            tstamps, values = self._buffer.timestamps, self._buffer.values
+            idx = _np.searchsorted(tstamps, first, side='left')
+            for tstamp, value in zip(tstamps[:idx], values[:idx]):
+                self._update_sums(tstamp, value, -1)
+            self._buffer.trim(_np.nextafter(first, -_math.inf))
+            self._nr_removed += idx
+            if self._nr_removed > len(self._buffer):
+                self._recalc_sums()
+            return True
+
+    def reset(self, timestamps, values):
+        """Reset samples with the ones inside the window, decimated.
+
+        Args:
+            timestamps (numpy.ndarray): increasing timestamps of samples.
+            values (numpy.ndarray): values of samples.
+        """
+        tstamps = _np.asarray(timestamps, dtype=float)
+        values = _np.asarray(values, dtype=float)
+        with self._lock:
+            sel = (tstamps >= self._first) & (tstamps <= self._last)
+            tstamps, values = tstamps[sel], values[sel]
+            if self._min_interval > 0 and tstamps.size:
+                bins = _np.floor(tstamps / self._min_interval)
+                sel = _np.r_[True, bins[1:] != bins[:-1]]
+                tstamps, values = tstamps[sel], values[sel]
+            maxlen = self._buffer.maxlen
+            if maxlen is not None:
+                tstamps, values = tstamps[-maxlen:], values[-maxlen:]
+            self._buffer.clear()
+            self._buffer.extend(tstamps, values)
+            self._last_bin = None
+            if tstamps.size and self._min_interval > 0:
+                self._last_bin = _math.floor(tstamps[-1] / self._min_interval)
+            self._recalc_sums()
+
+    def add(self, timestamp, value):
+        """Add a new sample, if inside window and not decimated.
+
+        Returns:
+            bool: whether sample was added.
+        """
+        with self._lock:
+            if not self._first <= timestamp <= self._last:
+                return False
+            if self._min_interval > 0:
+                tbin = _math.floor(timestamp / self._min_interval)
+                if tbin == self._last_bin:
+                    return False
+                self._last_bin = tbin
+            if not len(self._buffer):
+                self._sums = [0.0] * 10
+                self._tref = timestamp
+            elif len(self._buffer) == self._buffer.maxlen:
+                self._update_sums(
+                    self._buffer.timestamps[0], self._buffer.values[0], -1)
+                self._nr_removed += 1
+            self._buffer.append(timestamp, value)
+            self._update_sums(timestamp, value, 1)
+            if self._nr_removed > len(self._buffer):
+                self._recalc_sums()
+            return True
+
+    def clear(self):
+        """Discard all samples."""
+        with self._lock:
+            self._buffer.clear()
+            self._last_bin = None
+            self._recalc_sums()
+
+    def get_lifetime(self, now, fit='exp'):
+        """Return lifetime and its standard deviation.
+
+        Args:
+            now (float): timestamp of the lifetime. The linear fit lifetime
+                is the time for the fitted line to reach zero from now.
+            fit (str, optional): 'exp' or 'lin'. Defaults to 'exp'.
+
+        Returns:
+            lifetime (float): lifetime [s]. It is 0.0 if the fit is not
+                possible, like if some value is not larger than offset in
+                an exponential fit.
+            std (float): standard deviation of lifetime [s], from the
+                residues of the fit.
+        """
+        with self._lock:
+            sums = list(self._sums)
+            x0_ = now - self._tref
+        nrpts, s_x, s_xx = sums[:3]
+        if nrpts < 2:
+            return 0.0, 0.0
+        if fit == 'exp':
+            if sums[self._NBAD]:
+                return 0.0, 0.0
+            s_y, s_xy, s_yy = sums[self._SL:self._SLL+1]
+        else:
+            off = self._offset
+            s_v, s_xv, s_vv = sums[self._SV:self._SVV+1]
+            s_y = s_v - nrpts*off
+            s_xy = s_xv - off*s_x
+            s_yy = s_vv - 2*off*s_v + nrpts*off*off
+
+        m_x, m_y = s_x/nrpts, s_y/nrpts
+        c_xx = s_xx - s_x*m_x
+        c_xy = s_xy - s_x*m_y
+        c_yy = s_yy - s_y*m_y
+        if c_xx <= 0:
+            return 0.0, 0.0
+        slope = c_xy / c_xx
+        if slope == 0:
+            return _math.inf, _math.inf
+        var = max(c_yy - slope*c_xy, 0) / (nrpts - 2) if nrpts > 2 else 0.0
+        var_slope = var / c_xx
+        if fit == 'exp':
+            return -1/slope, _math.sqrt(var_slope) / slope**2
+
+        # lifetime is -y0/slope, where y0 is the fitted value at now.
+        dx0 = x0_ - m_x
+        y0_ = m_y + slope*dx0
+        var_y0 = var * (1/nrpts + dx0*dx0/c_xx)
+        cov = var * dx0 / c_xx
+        var_lt = var_y0/slope**2 + y0_**2*var_slope/slope**4
+        var_lt -= 2*y0_*cov/slope**3
+        return -y0_/slope, _math.sqrt(max(var_lt, 0))
+
+    # --- private methods ---
+
+    def _update_sums(self, tstamp, value, sign):
+        sums = self._sums
+        x_ = tstamp - self._tref
+        sums[self._N] += sign
+        sums[self._SX] += sign*x_
+        sums[self._SXX] += sign*x_*x_
+        sums[self._SV] += sign*value
+        sums[self._SXV] += sign*x_*value
+        sums[self._SVV] += sign*value*value
+        val = value - self._offset
+        if val > 0:
+            lval = _math.log(val)
+            sums[self._SL] += sign*lval
+            sums[self._SXL] += sign*x_*lval
+            sums[self._SLL] += sign*lval*lval
+        else:
+            sums[self._NBAD] += sign
+
+    def _recalc_sums(self):
+        tstamps, values = self._buffer.timestamps, self._buffer.values
+        self._tref = float(tstamps[0]) if tstamps.size else 0.0
+        x_ = tstamps - self._tref
+        val = values - self._offset
+        good = val > 0
+        lval, xgood = _np.log(val[good]), x_[good]
+        self._sums = [float(v) for v in (
+            x_.size, x_.sum(), x_ @ x_,
+            values.sum(), x_ @ values, values @ values,
+            lval.sum(), xgood @ lval, lval @ lval,
+            x_.size - _np.count_nonzero(good))]
+        self._nr_removed = 0
@@ -1,15 +1,14 @@
 """Main Module of the IOC Logic."""
 
+import math as _math
 import time as _time
-import warnings
-
-import numpy as _np
 from epics import PV as _PV
 
 from ...callbacks import Callback as _Callback
 from ...envars import VACA_PREFIX as _vaca_prefix
 from ...epics import SiriusPVTimeSerie as _SiriusPVTimeSerie
 from ..csdev import Const as _Const, get_lifetime_database as _get_database
+from .estimator import LifetimeEstimator as _LifetimeEstimator
 
 _MIN_BUFFER_SIZE = 100
 _MAX_BUFFER_SIZE = 36000
@@ -43,6 +42,8 @@ class SILifetimeApp(_Callback):
         self._is_stored = 0
         self._lifetime = 0
         self._lifetime_bpm = 0
+        self._lifetime_std = 0
+        self._lifetime_bpm_std = 0
 
         self._prefix = _vaca_prefix + ('-' if _vaca_prefix else '')
         self._current_pv = _PV(
@@ -61,6 +62,8 @@ class SILifetimeApp(_Callback):
         self._bpmsum_buffer = _SiriusPVTimeSerie(
             pv=self._bpmsum_pv, mode=0, nr_max_points=_MAX_BUFFER_SIZE,
             use_pv_timestamp=False)
+        self._current_est = _LifetimeEstimator(maxlen=_MAX_BUFFER_SIZE)
+        self._bpmsum_est = _LifetimeEstimator(maxlen=_MAX_BUFFER_SIZE)
 
         self._current_pv.add_callback(self._callback_calclifetime)
         self._bpmsum_pv.add_callback(self._callback_calclifetime)
@@ -90,7 +93,6 @@ class SILifetimeApp(_Callback):
         if reason in ['Lifetime-Mon', 'LifetimeBPM-Mon']:
             is_bpm = 'BPM' in reason
             lt_type = 'BPM' if is_bpm else ''
-            lt_name = '_lifetime'+('_bpm' if is_bpm else '')
             buffer_dt = self._bpmsum_buffer if is_bpm else self._current_buffer
 
             # get first and last sample
@@ -104,11 +106,16 @@ class SILifetimeApp(_Callback):
             intvl_name = '_smpl_intvl_mon'+('_bpm' if is_bpm else '_dcct')
             intvl_smpl = getattr(self, intvl_name)
 
-            # calculate lifetime
-            ts_abs_dqorg, val_dqorg = buffer_dt.get_serie(time_absolute=True)
-            ts_dqorg = ts_abs_dqorg - now
-            ts_dq, val_dq, ts_abs_dq = self._filter_buffer(
-                ts_dqorg, val_dqorg, ts_abs_dqorg, first_smpl, last_smpl)
+            # update samples of estimator
+            ts_abs_org, _ = buffer_dt.get_serie(time_absolute=True)
+            estim = self._bpmsum_est if is_bpm else self._current_est
+            last_est = getattr(self, last_name)
+            last_est = _math.inf if last_est == -1 else last_est
+            if not estim.set_window(first_smpl, last_est):
+                estim.reset(*buffer_dt.get_serie(time_absolute=True))
+            ts_abs_dq, val_dq = estim.get_samples()
+            ts_dq = ts_abs_dq - now
+            val_dq -= self._current_offset
 
             if ts_dq.size != 0:
                 if first_smpl != ts_abs_dq[0]:
@@ -120,21 +127,15 @@ class SILifetimeApp(_Callback):
                 self.run_callbacks(
                     'SplIntvl'+lt_type+'-Mon', getattr(self, intvl_name))
 
-                val_dq -= self._current_offset
-
                 # check min number of points in buffer
                 if len(val_dq) > _MIN_BUFFER_SIZE:
-                    fit = 'lin' if self._mode == _Const.Fit.Linear else 'exp'
-                    value = self._least_squares_fit(ts_dq, val_dq, fit=fit)
-                    setattr(self, lt_name, value)
-                    lt_hour = 'Lifetime' + lt_type + 'Hour-Mon'
-                    self.run_callbacks(lt_hour, value / 3600)
+                    value = self._update_lifetime(is_bpm, now)
 
             # update pvs
             self.run_callbacks('BufferValue'+lt_type+'-Mon', val_dq)
             self.run_callbacks('BufferTimestamp'+lt_type+'-Mon', ts_dq)
             self.run_callbacks('BuffSize'+lt_type+'-Mon', len(val_dq))
-            self.run_callbacks('BuffSizeTot'+lt_type+'-Mon', len(val_dqorg))
+            self.run_callbacks('BuffSizeTot'+lt_type+'-Mon', len(ts_abs_org))
         return value
 
     def write(self, reason, value):
@@ -154,6 +155,7 @@ class SILifetimeApp(_Callback):
             if value < 0:
                 value = 0
             self._min_intvl_btw_spl = value
+            self._reset_estimators()
             self.run_callbacks('MinIntvlBtwSpl-RB', value)
             status = True
         elif reason == 'LtFitMode-Sel':
@@ -162,6 +164,7 @@ class SILifetimeApp(_Callback):
             status = True
         elif reason == 'CurrOffset-SP':
             self._current_offset = value
+            self._reset_estimators()
             self.run_callbacks('CurrOffset-RB', value)
             status = True
         elif reason == 'BuffRst-Cmd':
@@ -209,20 +212,29 @@ class SILifetimeApp(_Callback):
         if not buffer_dt.acquire():
             return
 
-        # check whether the buffer must be reset
-        self._buffautorst_check()
+        # check whether the buffer must be reset before using the new point
+        if self._buffautorst_check():
+            return
+
+        # update lifetime with the new point
+        estim = self._bpmsum_est if is_bpm else self._current_est
+        tstamp, value = buffer_dt.get_serie(time_absolute=True, copy=False)
+        if estim.add(tstamp[-1], value[-1]) and \
+                len(estim) > _MIN_BUFFER_SIZE:
+            self._update_lifetime(is_bpm, _time.time())
 
     # ---------- auxiliar methods ----------
 
     def _buffautorst_check(self):
         """Check situations to clear internal buffer.
         If BuffAutoRst == DCurrCheck, check abrupt variation of current.
+        Return whether buffer was reset.
         """
         if self._buffautorst_mode == _Const.BuffAutoRst.Off:
-            return
+            return False
 
         reset = False
-        [_, value] = self._current_buffer.serie
+        _, value = self._current_buffer.get_serie(time_absolute=True)
         if len(value) >= 2:
             deltacurr = abs(value[-1] - value[-2])
         else:
@@ -231,9 +243,16 @@ class SILifetimeApp(_Callback):
             reset = True
         if reset:
             self._reset_buff()
+        return reset
 
     def _reset_buff(self):
         now = _time.time()
+        # discard samples of estimators acquired before reset
+        for estim, buffer_dt in (
+                (self._current_est, self._current_buffer),
+                (self._bpmsum_est, self._bpmsum_buffer)):
+            if not estim.set_window(now):
+                estim.reset(*buffer_dt.get_serie(time_absolute=True))
         self._frst_smpl_ts = now
         self._last_smpl_ts = -1
         self._frst_smpl_ts_dcct = now
@@ -245,68 +264,27 @@ class SILifetimeApp(_Callback):
         self.run_callbacks('FrstSplTimeBPM-RB', self._frst_smpl_ts_bpm)
         self.run_callbacks('LastSplTimeBPM-RB', self._last_smpl_ts_bpm)
 
-    def _filter_buffer(self, timestamp, value, abs_timestamp, first, last):
-        ts_arrayorg = _np.asarray(timestamp)
-        val_arrayorg = _np.asarray(value)
-        ts_abs_arrayorg = _np.asarray(abs_timestamp)
-        if ts_abs_arrayorg.size == 0:
-            return ts_arrayorg, val_arrayorg, ts_abs_arrayorg
-
-        ind1 = ts_abs_arrayorg >= first
-        ind2 = ts_abs_arrayorg <= last
-        indices = _np.logical_and(ind1, ind2).nonzero()
-        if not indices[0].size:
-            return _np.array([]), _np.array([]), _np.array([])
-        slc = slice(indices[0][0], indices[0][-1]+1)
-
-        ts_aux_array = ts_arrayorg[slc]
-        val_aux_array = val_arrayorg[slc]
-        ts_aux_abs_array = ts_abs_arrayorg[slc]
-
-        min_intvl = self._min_intvl_btw_spl
-        if min_intvl <= 0.0:
-            return ts_aux_array, val_aux_array, ts_aux_abs_array
-
-        indices = _np.zeros(len(ts_aux_array), dtype=bool)
-        indices[0] = _np.True_
-        last_idx = 0
-        for i, _ in enumerate(ts_aux_array):
-            if abs(ts_aux_array[last_idx] - ts_aux_array[i]) > min_intvl:
-                indices[i] = _np.True_
-                last_idx = i
-
-        indices = indices.nonzero()
-        ts_array = ts_aux_array[indices]
-        val_array = val_aux_array[indices]
-        ts_abs_array = ts_aux_abs_array[indices]
-        return ts_array, val_array, ts_abs_array
-
-    @staticmethod
-    def _least_squares_fit(timestamp, value, fit='exp'):
-        if fit == 'exp':
-            with warnings.catch_warnings():
-                warnings.filterwarnings('error')
-                try:
-                    value = _np.log(value)
-                except Warning:
-                    return 0.0
-        _ns = len(timestamp)
-        _x1 = _np.sum(timestamp)
-        _y1 = _np.sum(value)
-        if timestamp.size > 10000:
-            _x2 = _np.sum(timestamp*timestamp)
-            _xy = _np.sum(timestamp*value)
-        else:
-            _x2 = _np.dot(timestamp, timestamp)
-            _xy = _np.dot(timestamp, value)
-        fit_a = (_x2*_y1 - _xy*_x1)/(_ns*_x2 - _x1*_x1)
-        fit_b = (_ns*_xy - _x1*_y1)/(_ns*_x2 - _x1*_x1)
-
-        if fit == 'exp':
-            lifetime = - 1/fit_b
-        else:
-            lifetime = - fit_a/fit_b
-        return lifetime
+    def _reset_estimators(self):
+        for estim, buffer_dt in (
+                (self._current_est, self._current_buffer),
+                (self._bpmsum_est, self._bpmsum_buffer)):
+            estim.offset = self._current_offset
+            estim.min_interval = self._min_intvl_btw_spl
+            estim.reset(*buffer_dt.get_serie(time_absolute=True))
+
+    def _update_lifetime(self, is_bpm, now):
+        """Update lifetime PVs with the current estimate."""
+        lt_type = 'BPM' if is_bpm else ''
+        lt_name = '_lifetime' + ('_bpm' if is_bpm else '')
+        estim = self._bpmsum_est if is_bpm else self._current_est
+        fit = 'lin' if self._mode == _Const.Fit.Linear else 'exp'
+        value, std = estim.get_lifetime(now, fit=fit)
+        setattr(self, lt_name, value)
+        setattr(self, lt_name + '_std', std)
+        self.run_callbacks('Lifetime' + lt_type + '-Mon', value)
+        self.run_callbacks('Lifetime' + lt_type + 'Hour-Mon', value / 3600)
+        self.run_callbacks('Lifetime' + lt_type + 'Std-Mon', std)
+        return value
 
     def _update_times(self, now, force_min_first=False):
         if self._last_ts_set == 'first':
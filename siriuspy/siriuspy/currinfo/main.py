@@ -615,9 +615,7 @@ class SICurrInfoApp(_CurrInfoApp):
             buffer = self._current_13c4_buffer
         else:
             buffer = self._current_14c4_buffer
-        timestamp_dq, value_dq = buffer.serie
-        timestamp_dq = _np.asarray(timestamp_dq)
-        value_dq = _np.asarray(value_dq)
+        timestamp_dq, value_dq = buffer.get_serie(time_absolute=True)
 
         self._injcurr = 0.0
         self._injeff = 0.0
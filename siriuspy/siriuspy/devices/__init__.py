@@ -1,97 +1,100 @@
-"""Devices subpackage."""
+"""Devices subpackage.
 
-from .afc_acq_core import AFCACQLogicalTrigger, AFCPhysicalTrigger
-from .bbb import BunchbyBunch
-from .beamline import CAXCtrl
-from .blm import BLM, FamBLMs
-from .bpm import BPM
-from .bpm_eq import EqualizeBPMs
-from .bpm_fam import FamBPMs
-from .currinfo import (
-    CurrInfoAS,
-    CurrInfoBO,
-    CurrInfoLinear,
-    CurrInfoSI,
-    CurrInfoTranspEff
-)
-from .dcct import DCCT
-from .device import Device, DeviceSet
-from .dvf import DVF, DVFImgProc
-from .egun import EGBias, EGFilament, EGHVPS, EGPulsePS, EGTriggerPS, EGun
-from .energy import Energy
-from .fofb import (
-    BPMDCC,
-    FamFastCorrs,
-    FamFOFBControllers,
-    FOFBCtrlDCC,
-    FOFBCtrlRef,
-    HLFOFB
-)
-from .fofb_acq import (
-    FamFOFBLamp,
-    FamFOFBSysId,
-    FOFBCtrlLamp,
-    FOFBCtrlSysId,
-    FOFBPSLamp,
-    FOFBPSSysId
-)
-from .fpmosc import FPMOsc
-from .gamma_monitor import FamGammaMonitors, GammaCounter, GammaMonitor
-from .ict import ICT, TranspEff
-from .idff import IDFF, IDFFCtrl, IDFFCtrlHard, IDFFCtrlSoft
-from .ids import APU, DELTA, EPU, ID, IDBase, IVU, PAPU, VPU, WIG, UE44
-from .injctrl import InjCtrl
-from .injsys import (
-    BOPSRampStandbyHandler,
-    BORFRampStandbyHandler,
-    InjSysPUModeHandler,
-    InjSysStandbyHandler,
-    LinacStandbyHandler,
-    PUMagsStandbyHandler
-)
-from .intlkctrl import ASMPSCtrl, ASPPSCtrl, BLInterlockCtrl
-from .lienergy import LIEnergy
-from .lillrf import DevLILLRF, LILLRF
-from .machshift import MachShift
-from .modltr import LIModltr
-from .orbit_interlock import (
-    BaseOrbitIntlk,
-    BPMOrbitIntlk,
-    HLOrbitInterlock,
-    OrbitInterlock
-)
-from .posang import PosAng
-from .psconv import PSProperty, StrengthConv
-from .pssofb import PSApplySOFB, PSCorrSOFB
-from .pwrsupply import (
-    PowerSupply,
-    PowerSupplyFBP,
-    PowerSupplyFC,
-    PowerSupplyPU
-)
-from .rf import (
-    ASLLRF,
-    BOLLRFPreAmp,
-    BORF300VDCAmp,
-    BORFCavMonitor,
-    BORFDCAmp,
-    RFCav,
-    RFGen,
-    RFKillBeam,
-    SILLRFPreAmp,
-    SIRFACAmp,
-    SIRFCavMonitor,
-    SIRFDCAmp
-)
-from .scraper import ScraperH, ScraperV
-from .screen import Screen
-from .sofb import SOFB
-from .syncd import DevicesSync
-from .timing import Event, EVG, HLTiming, Trigger
-from .tune import TuneFrac, SITuneProc, BOTuneProc, Tune, SITuneCorr
+Device classes are only imported on first access (PEP 562), so that using
+one device does not import the modules of all the others.
+"""
 
-del device, bpm, dcct, egun, ict, lillrf, modltr
-del pwrsupply, posang, psconv, pssofb, rf, injsys, injctrl
-del screen, tune, sofb, timing, syncd, energy
-del ids, currinfo, bbb, machshift, dvf, lienergy, intlkctrl, scraper
-del blm, beamline
+import importlib as _importlib
+
+# submodules and the public names they define
+_MODULE2NAMES = {
+    'afc_acq_core': ('AFCACQLogicalTrigger', 'AFCPhysicalTrigger'),
+    'bbb': ('BunchbyBunch',),
+    'beamline': ('CAXCtrl',),
+    'blm': ('BLM', 'FamBLMs'),
+    'bpm': ('BPM',),
+    'bpm_eq': ('EqualizeBPMs',),
+    'bpm_fam': ('FamBPMs',),
+    'currinfo': (
+        'CurrInfoAS', 'CurrInfoBO', 'CurrInfoLinear', 'CurrInfoSI',
+        'CurrInfoTranspEff',
+        ),
+    'dcct': ('DCCT',),
+    'device': ('Device', 'DeviceSet'),
+    'dvf': ('DVF', 'DVFImgProc'),
+    'egun': (
+        'EGBias', 'EGFilament', 'EGHVPS', 'EGPulsePS', 'EGTriggerPS', 'EGun',
+        ),
+    'energy': ('Energy',),
+    'fofb': (
+        'BPMDCC', 'FamFastCorrs', 'FamFOFBControllers', 'FOFBCtrlDCC',
+        'FOFBCtrlRef', 'HLFOFB',
+        ),
+    'fofb_acq': (
+        'FamFOFBLamp', 'FamFOFBSysId', 'FOFBCtrlLamp', 'FOFBCtrlSysId',
+        'FOFBPSLamp', 'FOFBPSSysId',
+        ),
+    'fpmosc': ('FPMOsc',),
+    'gamma_monitor': ('FamGammaMonitors', 'GammaCounter', 'GammaMonitor'),
+    'ict': ('ICT', 'TranspEff'),
+    'idff': ('IDFF', 'IDFFCtrl', 'IDFFCtrlHard', 'IDFFCtrlSoft'),
+    'ids': (
+        'APU', 'DELTA', 'EPU', 'ID', 'IDBase', 'IVU', 'PAPU', 'VPU', 'WIG',
+        'UE44',
+        ),
+    'injctrl': ('InjCtrl',),
+    'injsys': (
+        'BOPSRampStandbyHandler', 'BORFRampStandbyHandler',
+        'InjSysPUModeHandler', 'InjSysStandbyHandler', 'LinacStandbyHandler',
+        'PUMagsStandbyHandler',
+        ),
+    'intlkctrl': ('ASMPSCtrl', 'ASPPSCtrl', 'BLInterlockCtrl'),
+    'lienergy': ('LIEnergy',),
+    'lillrf': ('DevLILLRF', 'LILLRF'),
+    'machshift': ('MachShift',),
+    'modltr': ('LIModltr',),
+    'orbit_interlock': (
+        'BaseOrbitIntlk', 'BPMOrbitIntlk', 'HLOrbitInterlock',
+        'OrbitInterlock',
+        ),
+    'posang': ('PosAng',),
+    'psconv': ('PSProperty', 'StrengthConv'),
+    'pssofb': ('PSApplySOFB', 'PSCorrSOFB'),
+    'pwrsupply': (
+        'PowerSupply', 'PowerSupplyFBP', 'PowerSupplyFC', 'PowerSupplyPU',
+        ),
+    'rf': (
+        'ASLLRF', 'BOLLRFPreAmp', 'BORF300VDCAmp', 'BORFCavMonitor',
+        'BORFDCAmp', 'RFCav', 'RFGen', 'RFKillBeam', 'SILLRFPreAmp',
+        'SIRFACAmp', 'SIRFCavMonitor', 'SIRFDCAmp',
+        ),
+    'scraper': ('ScraperH', 'ScraperV'),
+    'screen': ('Screen',),
+    'sofb': ('SOFB',),
+    'syncd': ('DevicesSync',),
+    'timing': ('Event', 'EVG', 'HLTiming', 'Trigger'),
+    'tune': ('TuneFrac', 'SITuneProc', 'BOTuneProc', 'Tune', 'SITuneCorr'),
+}
+_NAME2MODULE = {
+    name: module for module, names in _MODULE2NAMES.items()
+    for name in names}
+
+__all__ = list(_NAME2MODULE)
+
+
+def __getattr__(name):
+    """Import public names and submodules on first access."""
+    if name in _NAME2MODULE:
+        module = _importlib.import_module(
+            '.' + _NAME2MODULE[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _MODULE2NAMES:
+        return _importlib.import_module('.' + name, __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    """Return names of module, including the ones not imported yet."""
+    return sorted(set(globals()) | set(_NAME2MODULE))
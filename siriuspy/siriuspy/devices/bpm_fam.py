@@ -326,12 +326,10 @@ class FamBPMs(_DeviceSet):
             orby (numpy.ndarray, 160): Vertical Orbit.
 
         """
-        orbx, orby = [], []
-        for bpm in self.bpms:
-            orbx.append(bpm.posx)
-            orby.append(bpm.posy)
-        orbx = _np.array(orbx)
-        orby = _np.array(orby)
+        orbx, orby = self.get_devices_propty(
+            ('PosX-Mon', 'PosY-Mon'), devices=self.bpms)
+        orbx = _np.array(orbx, dtype=float) * BPM.CONV_NM2UM
+        orby = _np.array(orby, dtype=float) * BPM.CONV_NM2UM
         return orbx, orby
 
     def get_mturn_signals(self):
@@ -376,16 +374,11 @@ class FamBPMs(_DeviceSet):
                 of the i-th bpm for the N aquired signals.
 
         """
-        tsmps = _np.zeros(
-            (len(self._mturn_signals2acq), len(self.bpms)), dtype=float
-        )
-        for i, s in enumerate(self._mturn_signals2acq):
-            for j, bpm in enumerate(self.bpms):
-                pname = self.conv_signal2pvname_format(s)
-                pvo = bpm.pv_object(f'GEN{pname}Data')
-                tv = pvo.get_timevars(timeout=self.TIMEOUT)
-                tsmps[i, j] = pvo.timestamp if tv is None else tv['timestamp']
-        return tsmps
+        propties = [
+            'GEN' + self.conv_signal2pvname_format(s) + 'Data'
+            for s in self._mturn_signals2acq]
+        return self.get_devices_timestamps(
+            propties, devices=self.bpms, timeout=self.TIMEOUT)
 
     def get_sampling_frequency(self, rf_freq: float, acq_rate='') -> float:
         """Return the sampling frequency of the acquisition.
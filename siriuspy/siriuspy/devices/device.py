@@ -2,6 +2,7 @@
 
 import math as _math
 import operator as _opr
+import threading as _threading
 import time as _time
 from functools import partial as _partial
 
@@ -15,7 +16,9 @@ from ..envars import VACA_PREFIX as _VACA_PREFIX
 from ..epics import (
     CONNECTION_TIMEOUT as _CONN_TIMEOUT,
     GET_TIMEOUT as _GET_TIMEOUT,
-    PV as _PV
+    PV as _PV,
+    get_batch as _get_batch,
+    get_timevars_batch as _get_timevars_batch
 )
 from ..namesys import SiriusPVName as _SiriusPVName
 from ..simul import SimPV as _PVSim, Simulation as _Simulation
@@ -196,28 +199,7 @@ class Device:
             isok (bool): Whether condition was met within timeout.
 
         """
-
-        def comp_(val):
-            boo = comp(self[propty], val)
-            if isinstance(boo, _np.ndarray):
-                boo = _np.all(boo)
-            return boo
-
-        if isinstance(comp, str):
-            comp = getattr(_opr, comp)
-
-        if not isinstance(timeout, str) and timeout != 'never':
-            timeout = _DEF_TIMEOUT if timeout is None else timeout
-            timeout = 0 if timeout <= 0 else timeout
-        t0_ = _time.time()
-        while not comp_(value):
-            if isinstance(timeout, str) and timeout == 'never':
-                pass
-            else:
-                if _time.time() - t0_ > timeout:
-                    return False
-            _time.sleep(_TINY_INTERVAL)
-        return True
+        return self.wait_several({propty: value}, timeout=timeout, comp=comp)
 
     def wait_float(
         self, propty, value, rel_tol=0.0, abs_tol=0.1, timeout=None
@@ -248,9 +230,10 @@ class Device:
         Args:
             props_values (dict): Dictionary with property names and values,
                 respectively.
-            timeout (float, optional): Timeout of operation.
+            timeout (float|str, optional): Timeout of operation.
                 Defaults to the module variable `_DEF_TIMEOUT`, which is 10s.
-                It also accepts None, which is the same as the default.
+                It also accepts None, which is the same as the default and the
+                string `'never'`.
             comp (str, optional): Type of comparison to make. Can be any
                 operator of module `operator` or any callable that accepts two
                 entries and return a boolean. Defaults to 'eq'.
@@ -259,15 +242,10 @@ class Device:
             bool: Whether or not timeout was reached before all conditions are
                 met.
         """
-        timeout = _DEF_TIMEOUT if timeout is None else timeout
-        t0_ = _time.time()
-        for propty, value in props_values.items():
-            timeout_left = max(0, timeout - (_time.time() - t0_))
-            if timeout_left == 0:
-                return False
-            if not self.wait(propty, value, timeout=timeout_left, comp=comp):
-                return False
-        return True
+        conds = [
+            self._get_wait_condition(propty, value, comp)
+            for propty, value in props_values.items()]
+        return not _WAIT_REGISTRY.wait(conds, timeout=timeout)
 
     @property
     def hosts(self):
@@ -308,6 +286,23 @@ class Device:
             print('Could not set value of {}'.format(pvobj.pvname))
 
     # --- private methods ---
+    def _get_wait_condition(self, propty, value, comp='eq'):
+        """Return (PV object, function) condition of wait registry."""
+        if isinstance(comp, str):
+            comp = getattr(_opr, comp)
+
+        def func():
+            boo = comp(self[propty], value)
+            if isinstance(boo, _np.ndarray):
+                boo = _np.all(boo)
+            return boo
+
+        if propty not in self._pvs:
+            _ = self[propty]  # create PV object of property, if needed.
+        # properties not in self._pvs, like the ones of subclasses that map
+        # property names or delegate them to other devices, are polled.
+        return self._pvs.get(propty), func
+
     def _create_pv(self, propty):
         pvname = self._get_pvname(propty)
         auto_monitor = self._auto_monitor
@@ -414,9 +409,18 @@ class DeviceSet:
         return dic_
 
     def update(self):
-        """Update device properties."""
+        """Update device properties.
+
+        Properties of devices that do not override `Device.update` are read
+        at once, with `siriuspy.epics.get_batch`.
+        """
+        pvobjs = []
         for dev in self._devices:
-            dev.update()
+            if type(dev).update is Device.update:
+                pvobjs.extend(dev._pvs.values())
+            else:
+                dev.update()
+        _get_batch(pvobjs)
 
     def pv_attribute_values(self, attribute):
         """Return property-value dict of a given attribute for all PVs."""
@@ -478,6 +482,63 @@ class DeviceSet:
                 if wait_between_devs > 0:
                     _time.sleep(wait_between_devs)
 
+    def get_devices_propty(self, propty, devices=None, timeout=None):
+        """Get devices property at once.
+
+        Get requests of all devices are sent before waiting for any reply,
+        instead of one round trip per device.
+
+        Args:
+            propty (str|list|tuple): Name of the property to get. Must be a
+                valid property for all devices. If a list of names, all
+                properties are read in the same batch.
+            devices (list, optional): list of devices to get the given
+                propty. Defaults to None, which means all devices of self.
+            timeout (float, optional): Timeout of operation. Defaults to
+                None, which means `Device.GET_TIMEOUT`.
+
+        Returns:
+            numpy.ndarray: values of the devices, with object dtype if values
+                have different shapes or if some get failed, in which case
+                the value is None. If propty is a list, a list of arrays is
+                returned, one for each property.
+        """
+        propties = [propty] if isinstance(propty, str) else propty
+        pvobjs, ndev = self._get_pvobjs(propties, devices)
+        timeout = Device.GET_TIMEOUT if timeout is None else timeout
+        vals = _get_batch(pvobjs, timeout=timeout)
+        vals = [
+            self._get_array(vals[i*ndev:(i+1)*ndev])
+            for i in range(len(propties))]
+        return vals[0] if isinstance(propty, str) else vals
+
+    def get_devices_timestamps(self, propty, devices=None, timeout=None):
+        """Get timestamps of devices property at once.
+
+        Args:
+            propty (str|list|tuple): Name of the property. Must be a valid
+                property for all devices. If a list of names, timestamps of
+                all properties are read in the same batch.
+            devices (list, optional): list of devices. Defaults to None,
+                which means all devices of self.
+            timeout (float, optional): Timeout of operation. Defaults to
+                None, which means `Device.GET_TIMEOUT`.
+
+        Returns:
+            numpy.ndarray: timestamps of the devices. If the get of a
+                timestamp fails, the timestamp of the last PV update is used.
+                If propty is a list, a (len(propty), len(devices)) array.
+        """
+        propties = [propty] if isinstance(propty, str) else propty
+        pvobjs, ndev = self._get_pvobjs(propties, devices)
+        timeout = Device.GET_TIMEOUT if timeout is None else timeout
+        tvs = _get_timevars_batch(pvobjs, timeout=timeout)
+        tsmps = _np.array([
+            pvo.timestamp if tvr is None else tvr['timestamp']
+            for pvo, tvr in zip(pvobjs, tvs)], dtype=float)
+        tsmps = tsmps.reshape(len(propties), ndev)
+        return tsmps[0] if isinstance(propty, str) else tsmps
+
     def wait_devices_propty(
         self,
         propty,
@@ -506,6 +567,45 @@ class DeviceSet:
             return_prob (bool, optional): Whether to return list of PV names
                 for which comparison failed. Defaults to False.
 
+        Returns:
+            allok (bool): Whether all conditions were met within timeout.
+            probs (list[str]): list of PV names for which comparison failed.
+                Only returned if return_prob is True.
+        """
+        return self.wait_all(
+            {propty: values}, devices=devices, comp=comp, timeout=timeout,
+            return_prob=return_prob)
+
+    def wait_all(
+        self,
+        props_values,
+        devices=None,
+        comp='eq',
+        timeout=None,
+        return_prob=False,
+    ):
+        """Wait for properties of all devices to reach value(s).
+
+        All comparisons are registered at once and only the ones of PVs
+        that were updated are evaluated again, so that the method returns
+        as soon as the last device satisfies its conditions.
+
+        Args:
+            props_values (dict): Dictionary with property names and values.
+                Values may be a list of the same size as devices, one value
+                for each device, else all devices are compared to the same
+                value.
+            devices (list, optional): list of devices to wait. Defaults to
+                None, which means all devices of self.
+            comp (str, optional): Type of comparison to make. Can be any
+                operator of module `operator` or any callable that accepts two
+                entries and return a boolean. Defaults to 'eq'.
+            timeout (float|str, optional): Timeout of operation. Defaults to
+                None, which means the module variable `_DEF_TIMEOUT`. It also
+                accepts the string `'never'`.
+            return_prob (bool, optional): Whether to return list of PV names
+                for which comparison failed. Defaults to False.
+
         Returns:
             allok (bool): Whether all conditions were met within timeout.
             probs (list[str]): list of PV names for which comparison failed.
@@ -514,36 +614,42 @@ class DeviceSet:
         if devices is None:
             devices = self._devices
 
-        if isinstance(comp, str):
-            comp = getattr(_opr, comp)
-        dev2val = self._get_dev_2_val(devices, values)
+        keys, conds = [], []
+        for propty, values in props_values.items():
+            dev2val = self._get_dev_2_val(devices, values)
+            for dev, val in dev2val.items():
+                keys.append((dev, propty))
+                conds.append(dev._get_wait_condition(propty, val, comp))
+        probs = _WAIT_REGISTRY.wait(conds, timeout=timeout)
 
-        timeout = _DEF_TIMEOUT if timeout is None else timeout
-        tini = _time.time()
-        for _ in range(int(timeout / _TINY_INTERVAL)):
-            okdevs = set()
-            for k, v in dev2val.items():
-                boo = comp(k[propty], v)
-                if isinstance(boo, _np.ndarray):
-                    boo = _np.all(boo)
-                if boo:
-                    okdevs.add(k)
-                if _time.time() - tini > timeout:
-                    break
-            list(map(dev2val.__delitem__, okdevs))
-            if not dev2val:
-                break
-            if _time.time() - tini > timeout:
-                break
-            _time.sleep(_TINY_INTERVAL)
-
-        allok = not dev2val
+        allok = not probs
         if return_prob:
-            return allok, [dev.pv_object(propty).pvname for dev in dev2val]
+            return allok, [
+                keys[idx][0].pv_object(keys[idx][1]).pvname
+                for idx in sorted(probs)]
         return allok
 
     # --- private methods ---
 
+    def _get_pvobjs(self, propties, devices):
+        if devices is None:
+            devices = self._devices
+        elif not isinstance(devices, (tuple, list)):
+            devices = [devices]
+        pvobjs = [dev.pv_object(ppt) for ppt in propties for dev in devices]
+        return pvobjs, len(devices)
+
+    @staticmethod
+    def _get_array(values):
+        shapes = {None if val is None else _np.shape(val) for val in values}
+        if len(shapes) <= 1 and None not in shapes:
+            return _np.array(values)
+        # missing values or values with different shapes
+        arr = _np.empty(len(values), dtype=object)
+        for i, val in enumerate(values):
+            arr[i] = val
+        return arr
+
     def _get_dev_2_val(self, devices, values):
         """Get devices to values dict."""
         # always use an iterable object
@@ -557,3 +663,132 @@ class DeviceSet:
     def __getitem__(self, devidx):
         """Return device."""
         return self._devices[devidx]
+
+
+class _Waiter:
+    """Condition variable and updated conditions of a waiting thread."""
+
+    def __init__(self, lock):
+        self.cond = _threading.Condition(lock)
+        self.updated = set()
+        self.key2idcs = dict()
+
+
+class _WaitRegistry:
+    """Registry of threads waiting for conditions on PV values.
+
+    Waiters are woken by the monitor callbacks of the PVs of their
+    conditions. Each waiter has its own condition variable, sharing the
+    registry lock, so that a PV update only wakes the waiters of that PV,
+    which then evaluate again only the conditions of the PVs updated.
+    Conditions of PVs that are not monitored are polled.
+    """
+
+    # interval to evaluate all pending conditions, in case of updates that
+    # do not run monitor callbacks, like disconnections.
+    RECHECK_INTERVAL = 1  # s
+
+    def __init__(self):
+        """."""
+        self._lock = _threading.Lock()
+        # id of PV object -> [PV object, callback index, set of waiters]
+        self._pvs = dict()
+
+    def wait(self, conditions, timeout=None):
+        """Wait until all conditions are met.
+
+        Args:
+            conditions (list): list of (pvobj, func) tuples. func returns
+                whether the condition is met and pvobj is the PV object whose
+                updates may change it. If pvobj is None, func is polled.
+            timeout (float|str, optional): Timeout of operation. Defaults to
+                None, which means `_DEF_TIMEOUT`. It also accepts the string
+                `'never'`.
+
+        Returns:
+            set: indices of conditions not met within timeout.
+        """
+        if timeout is None:
+            timeout = _DEF_TIMEOUT
+        elif not isinstance(timeout, str):
+            timeout = max(timeout, 0)
+        waiter = _Waiter(self._lock)
+        polled = set()
+        pvobjs = dict()
+        for idx, (pvobj, _) in enumerate(conditions):
+            if pvobj is None or not pvobj.auto_monitor:
+                polled.add(idx)
+                continue
+            pvobjs[id(pvobj)] = pvobj
+            waiter.key2idcs.setdefault(id(pvobj), []).append(idx)
+
+        self._register(waiter, pvobjs)
+        try:
+            return self._wait(waiter, conditions, polled, timeout)
+        finally:
+            self._unregister(waiter)
+
+    # --- private methods ---
+
+    def _wait(self, waiter, conditions, polled, timeout):
+        pending = set(range(len(conditions)))
+        tocheck = set(pending)
+        t0_ = _time.time()
+        tpoll = t0_ + _TINY_INTERVAL
+        trecheck = t0_ + self.RECHECK_INTERVAL
+        tend = _math.inf if timeout == 'never' else t0_ + timeout
+        while True:
+            pending -= {idx for idx in tocheck if conditions[idx][1]()}
+            if not pending or _time.time() >= tend:
+                return pending
+            tnext = min(tend, trecheck)
+            if polled & pending:
+                tnext = min(tnext, tpoll)
+            with self._lock:
+                if not waiter.updated:
+                    waiter.cond.wait(max(tnext - _time.time(), 0))
+                tocheck = waiter.updated & pending
+                waiter.updated.clear()
+            now = _time.time()
+            if now >= tpoll:
+                tocheck |= polled & pending
+                tpoll = now + _TINY_INTERVAL
+            if now >= trecheck:
+                tocheck |= pending
+                trecheck = now + self.RECHECK_INTERVAL
+
+    def _register(self, waiter, pvobjs):
+        with self._lock:
+            for key, pvobj in pvobjs.items():
+                if key not in self._pvs:
+                    idx = pvobj.add_callback(
+                        self._callback, with_ctrlvars=False, waitkey=key)
+                    self._pvs[key] = [pvobj, idx, set()]
+                self._pvs[key][2].add(waiter)
+
+    def _unregister(self, waiter):
+        toremove = []
+        with self._lock:
+            for key in waiter.key2idcs:
+                pvobj, idx, waiters = self._pvs[key]
+                waiters.discard(waiter)
+                if not waiters:
+                    toremove.append((pvobj, idx))
+                    del self._pvs[key]
+        # remove_callback polls CA, which may run callbacks that take the
+        # lock, so it is called after releasing it.
+        for pvobj, idx in toremove:
+            pvobj.remove_callback(idx)
+
+    def _callback(self, waitkey=None, **kwargs):
+        _ = kwargs
+        with self._lock:
+            item = self._pvs.get(waitkey)
+            if item is None:
+                return
+            for waiter in item[2]:
+                waiter.updated.update(waiter.key2idcs[waitkey])
+                waiter.cond.notify()
+
+
+_WAIT_REGISTRY = _WaitRegistry()
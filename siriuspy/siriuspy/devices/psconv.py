@@ -102,6 +102,11 @@ class StrengthConv(_DeviceSet):
         # call base class constructor
         super().__init__(devices, devname=devname)
 
+    @property
+    def normalizer(self):
+        """Return magnet normalizer used in conversions."""
+        return self._norm_mag
+
     @property
     def dipole_strength(self):
         """Return dipole strength."""
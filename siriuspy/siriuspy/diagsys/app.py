@@ -4,9 +4,11 @@
 import time as _time
 from threading import Thread as _Thread
 
+from pcaspy import Alarm as _Alarm, Severity as _Severity
+
 from ..envars import VACA_PREFIX as _VACA_PREFIX
 from ..callbacks import Callback as _Callback
-from ..thread import LoopQueueThread as _LoopQueueThread
+from .pvs import ComputedPVEngine as _ComputedPVEngine
 
 
 class App(_Callback):
@@ -18,9 +20,10 @@ class App(_Callback):
         """Create Computed PVs."""
         super().__init__()
         self._prefix = _VACA_PREFIX
-        self._queue = _LoopQueueThread()
-        self._queue.start()
+        self._engine = _ComputedPVEngine()
+        self._engine.start()
         self.pvs = list()
+        self._pvs_connected = dict()
         self.scanning = False
         self.quit = False
         self._create_computed_pvs(*args)
@@ -44,7 +47,26 @@ class App(_Callback):
         raise NotImplementedError
 
     def _update_pvs(self):
-        raise NotImplementedError
+        # computed PVs are evaluated in batches and then published.
+        self._engine.evaluate(self.pvs)
+        for pvo in self.pvs:
+            value = pvo.get(update=False)
+            if not pvo.connected:
+                if self._pvs_connected[pvo]:
+                    self.run_callbacks(
+                        pvo.pvname, alarm=_Alarm.TIMEOUT_ALARM,
+                        severity=_Severity.INVALID_ALARM,
+                        field='status')
+                self._pvs_connected[pvo] = False
+                if 'DiagStatus' in pvo.pvname:
+                    self.run_callbacks(pvo.pvname, value=value)
+            else:
+                if not self._pvs_connected[pvo]:
+                    self.run_callbacks(
+                        pvo.pvname, alarm=_Alarm.NO_ALARM,
+                        severity=_Severity.NO_ALARM, field='status')
+                self._pvs_connected[pvo] = True
+                self.run_callbacks(pvo.pvname, value=value)
 
     def scan(self):
         """Run as a thread scanning PVs."""
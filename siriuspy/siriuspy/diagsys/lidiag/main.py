@@ -1,8 +1,6 @@
 #!/usr/local/bin/python-sirius
 """Driver module."""
 
-from pcaspy import Alarm as _Alarm, Severity as _Severity
-
 from ...namesys import SiriusPVName
 from ..app import App as _App
 from ..pvs import ComputedPV as _ComputedPV
@@ -34,7 +32,7 @@ class LIDiagApp(_App):
             pvs[_LIScalarDiffPV.RB] = prefliname + ':GET_AMP'
             pvo = _ComputedPV(
                 devname + ':DiagAmpDiff-Mon', _LIScalarDiffPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagPhaseDiff-Mon
@@ -43,7 +41,7 @@ class LIDiagApp(_App):
             pvs[_LIScalarDiffPV.RB] = prefliname + ':GET_PHASE'
             pvo = _ComputedPV(
                 devname + ':DiagPhaseDiff-Mon', _LIScalarDiffPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagIxQDiff-Mon
@@ -54,7 +52,7 @@ class LIDiagApp(_App):
             pvs[_LIVecDiffPV.Q_DATA] = prefliname + ':GET_CH1_Q'
             pvo = _ComputedPV(
                 devname + ':DiagIxQDiff-Mon', _LIVecDiffPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagStatus-Mon
@@ -69,7 +67,7 @@ class LIDiagApp(_App):
             pvs[_LIRFStatusPV.PV_IXQDIF] = prefname + ':DiagIxQDiff-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagStatus-Mon', _LIRFStatusPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
         # # PU devices
@@ -83,7 +81,7 @@ class LIDiagApp(_App):
             pvs[_LIScalarDiffPV.RB] = prefliname + ':READV'
             pvo = _ComputedPV(
                 devname + ':DiagVoltageDiff-Mon', _LIScalarDiffPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagCurrentDiff-Mon
@@ -92,7 +90,7 @@ class LIDiagApp(_App):
             pvs[_LIScalarDiffPV.RB] = prefliname + ':READI'
             pvo = _ComputedPV(
                 devname + ':DiagCurrentDiff-Mon', _LIScalarDiffPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagStatus-Mon
@@ -118,7 +116,7 @@ class LIDiagApp(_App):
             pvs[_LIPUStatusPV.PV.CRRDIFF] = prefliname + ':DiagCurrentDiff-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagStatus-Mon', _LIPUStatusPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
         # # Egun devices
@@ -132,7 +130,7 @@ class LIDiagApp(_App):
         pvs[_LIScalarDiffPV.RB] = prefliname + ':voltinsoft'
         pvo = _ComputedPV(
             devname + ':DiagVoltDiff-Mon', _LIScalarDiffPV(),
-            self._queue, pvs, monitor=False)
+            self._engine, pvs, monitor=False)
         self.pvs.append(pvo)
         # DiagStatus-Mon
         pvs = [None]*3
@@ -141,7 +139,7 @@ class LIDiagApp(_App):
         pvs[_LIEGHVStatusPV.PV_VLTDIF] = prefname + ':DiagVoltDiff-Mon'
         pvo = _ComputedPV(
             devname + ':DiagStatus-Mon', _LIEGHVStatusPV(),
-            self._queue, pvs, monitor=False)
+            self._engine, pvs, monitor=False)
         self.pvs.append(pvo)
 
         # FilaPS
@@ -154,7 +152,7 @@ class LIDiagApp(_App):
         pvs[_LIScalarDiffPV.RB] = prefliname + ':currentinsoft'
         pvo = _ComputedPV(
             devname + ':DiagCurrentDiff-Mon', _LIScalarDiffPV(),
-            self._queue, pvs, monitor=False)
+            self._engine, pvs, monitor=False)
         self.pvs.append(pvo)
         # DiagStatus-Mon
         pvs = [None]*2
@@ -162,26 +160,7 @@ class LIDiagApp(_App):
         pvs[_LIFilaPSStatusPV.PV_CURDIF] = prefname + ':DiagCurrentDiff-Mon'
         pvo = _ComputedPV(
             devname + ':DiagStatus-Mon', _LIFilaPSStatusPV(),
-            self._queue, pvs, monitor=False)
+            self._engine, pvs, monitor=False)
         self.pvs.append(pvo)
 
         self._pvs_connected = {pv: False for pv in self.pvs}
-
-    def _update_pvs(self):
-        for pvo in self.pvs:
-            if not pvo.connected:
-                if self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.TIMEOUT_ALARM,
-                        severity=_Severity.INVALID_ALARM,
-                        field='status')
-                self._pvs_connected[pvo] = False
-                if 'DiagStatus' in pvo.pvname:
-                    self.run_callbacks(pvo.pvname, value=pvo.value)
-            else:
-                if not self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.NO_ALARM,
-                        severity=_Severity.NO_ALARM, field='status')
-                self._pvs_connected[pvo] = True
-                self.run_callbacks(pvo.pvname, value=pvo.value)
@@ -4,6 +4,7 @@
 import numpy as _np
 
 from ...util import update_bit as _update_bit
+from ..pvs import compute_diff_updates as _compute_diff_updates
 from .csdev import Const as _Const
 
 
@@ -25,6 +26,13 @@ class LIScalarDiffPV:
         diff = value_rb - value_sp
         return {'value': diff}
 
+    @staticmethod
+    def compute_update_batch(computed_pvs):
+        """Compute differences of several computed PVs at once."""
+        return _compute_diff_updates([
+            (cpv.pvs[LIScalarDiffPV.SP], cpv.pvs[LIScalarDiffPV.RB])
+            for cpv in computed_pvs])
+
 
 class LIVecDiffPV:
     """Diff of a LI setpoint and a readback PVs."""
@@ -1,8 +1,6 @@
 #!/usr/local/bin/python-sirius
 """Driver module."""
 
-from pcaspy import Alarm as _Alarm, Severity as _Severity
-
 from ...namesys import SiriusPVName
 from ...pwrsupply.csdev import get_ps_interlocks as _get_ps_interlocks
 from ..app import App as _App
@@ -27,7 +25,7 @@ class PSDiagApp(_App):
                 pvs[_PSDiffPV.CURRT_REF] = devname + ':CurrentRef-Mon'
                 pvs[_PSDiffPV.OPMODESTS] = devname + ':OpMode-Sts'
             pvo = _ComputedPV(
-                psname + ':DiagCurrentDiff-Mon', _PSDiffPV(), self._queue,
+                psname + ':DiagCurrentDiff-Mon', _PSDiffPV(), self._engine,
                 pvs, monitor=False)
             self.pvs.append(pvo)
 
@@ -82,26 +80,7 @@ class PSDiagApp(_App):
                 pvs[_PSStatusPV.CONNCTD_LI] = devname + ':Connected-Mon'
 
             pvo = _ComputedPV(
-                psname + ':DiagStatus-Mon', computer, self._queue,
+                psname + ':DiagStatus-Mon', computer, self._engine,
                 pvs, monitor=False)
             self.pvs.append(pvo)
         self._pvs_connected = {pvo: False for pvo in self.pvs}
-
-    def _update_pvs(self):
-        for pvo in self.pvs:
-            if not pvo.connected:
-                if self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.TIMEOUT_ALARM,
-                        severity=_Severity.INVALID_ALARM,
-                        field='status')
-                self._pvs_connected[pvo] = False
-                if 'DiagStatus' in pvo.pvname:
-                    self.run_callbacks(pvo.pvname, value=pvo.value)
-            else:
-                if not self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.NO_ALARM,
-                        severity=_Severity.NO_ALARM, field='status')
-                self._pvs_connected[pvo] = True
-                self.run_callbacks(pvo.pvname, value=pvo.value)
@@ -8,6 +8,7 @@ from ...namesys import SiriusPVName as _PVName
 from ...search import PSSearch as _PSSearch
 from ...pwrsupply.csdev import Const as _PSConst, ETypes as _ETypes, \
     PS_LI_INTLK_THRS as _PS_LI_INTLK_THRS
+from ..pvs import compute_diff_updates as _compute_diff_updates
 
 
 class PSDiffPV:
@@ -41,6 +42,26 @@ class PSDiffPV:
 
         return {'value': diff}
 
+    @staticmethod
+    def compute_update_batch(computed_pvs):
+        """Compute differences of several computed PVs at once."""
+        pairs = list()
+        for computed_pv in computed_pvs:
+            pvs = computed_pv.pvs
+            sp_pv = pvs[PSDiffPV.CURRT_SP]
+            psname = _PVName(pvs[0].pvname).device_name
+            if psname.dev in ['FCH', 'FCV']:
+                ref_pv = pvs[PSDiffPV.CURRT_REF]
+                opm_pv = pvs[PSDiffPV.OPMODESTS]
+                if not sp_pv.connected or not ref_pv.connected or \
+                        not opm_pv.connected:
+                    pairs.append(None)
+                    continue
+                if opm_pv.value == _PSConst.OpModeFOFBSts.fofb:
+                    sp_pv = ref_pv
+            pairs.append((sp_pv, pvs[PSDiffPV.CURRT_MON]))
+        return _compute_diff_updates(pairs)
+
 
 class PSStatusPV:
     """Power Supply Status PV."""
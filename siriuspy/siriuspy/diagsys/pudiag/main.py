@@ -1,8 +1,6 @@
 #!/usr/local/bin/python-sirius
 """Driver module."""
 
-from pcaspy import Alarm as _Alarm, Severity as _Severity
-
 from ...namesys import SiriusPVName
 from ..app import App as _App
 from ..pvs import ComputedPV as _ComputedPV
@@ -22,7 +20,7 @@ class PUDiagApp(_App):
             pvs[_PUDiffPV.VOLTAGE_SP] = devname + ':Voltage-SP'
             pvs[_PUDiffPV.VOLTAGE_MON] = devname + ':Voltage-Mon'
             pv = _ComputedPV(
-                puname + ':DiagVoltageDiff-Mon', _PUDiffPV(), self._queue,
+                puname + ':DiagVoltageDiff-Mon', _PUDiffPV(), self._engine,
                 pvs, monitor=False)
             self.pvs.append(pv)
 
@@ -42,26 +40,7 @@ class PUDiagApp(_App):
             if 'Sept' not in puname:
                 pvs[_PUStatusPV.INTRLCK_8] = devname + ':Intlk8-Mon'
             pv = _ComputedPV(
-                puname + ':DiagStatus-Mon', _PUStatusPV(), self._queue,
+                puname + ':DiagStatus-Mon', _PUStatusPV(), self._engine,
                 pvs, monitor=False)
             self.pvs.append(pv)
         self._pvs_connected = {pv: False for pv in self.pvs}
-
-    def _update_pvs(self):
-        for pvo in self.pvs:
-            if not pvo.connected:
-                if self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.TIMEOUT_ALARM,
-                        severity=_Severity.INVALID_ALARM,
-                        field='status')
-                self._pvs_connected[pvo] = False
-                if 'DiagStatus' in pvo.pvname:
-                    self.run_callbacks(pvo.pvname, value=pvo.value)
-            else:
-                if not self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.NO_ALARM,
-                        severity=_Severity.NO_ALARM, field='status')
-                self._pvs_connected[pvo] = True
-                self.run_callbacks(pvo.pvname, value=pvo.value)
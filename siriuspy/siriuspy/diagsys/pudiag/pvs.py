@@ -3,6 +3,7 @@
 
 from ...namesys import SiriusPVName as _PVName
 from ...pwrsupply.csdev import Const as _PSConst
+from ..pvs import compute_diff_updates as _compute_diff_updates
 
 
 class PUDiffPV:
@@ -24,6 +25,13 @@ class PUDiffPV:
         diff = value_rb - value_sp
         return {'value': diff}
 
+    @staticmethod
+    def compute_update_batch(computed_pvs):
+        """Compute differences of several computed PVs at once."""
+        return _compute_diff_updates([
+            (cpv.pvs[PUDiffPV.VOLTAGE_SP], cpv.pvs[PUDiffPV.VOLTAGE_MON])
+            for cpv in computed_pvs])
+
 
 class PUStatusPV:
     """Pulsed Power Supply Status PV."""
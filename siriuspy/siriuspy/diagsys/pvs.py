@@ -1,9 +1,49 @@
 #!/usr/local/bin/python-sirius
 """Computed PV."""
 
+import logging as _log
+import time as _time
+from threading import Thread as _Thread, Event as _Event, Lock as _Lock
+
 import numpy as _np
 
-from ..epics import PV as _PV, CONNECTION_TIMEOUT as _CONN_TIMEOUT
+from ..epics import PV as _PV, CONNECTION_TIMEOUT as _CONN_TIMEOUT, \
+    CAThread as _CAThread
+
+
+def compute_diff_updates(pairs):
+    """Return updates of differences between readback and setpoint PVs.
+
+    It is used by computers of differences of scalar PVs to evaluate them
+    in batches, with a single vectorized subtraction.
+
+    Args:
+        pairs (list): tuples (setpoint PV, readback PV), one for each
+            computed PV, or None for computed PVs which can not be updated.
+
+    Returns:
+        list: updates of computed PVs, as returned by `compute_update`.
+            They are None for pairs with disconnected PVs.
+    """
+    updates = [None] * len(pairs)
+    idcs, sps, rbs = list(), list(), list()
+    for idx, pair in enumerate(pairs):
+        if pair is None:
+            continue
+        sp_pv, rb_pv = pair
+        if not sp_pv.connected or not rb_pv.connected:
+            continue
+        value_sp, value_rb = sp_pv.value, rb_pv.value
+        if value_sp is None or value_rb is None:
+            continue
+        idcs.append(idx)
+        sps.append(value_sp)
+        rbs.append(value_rb)
+    if idcs:
+        diffs = _np.subtract(rbs, sps).tolist()
+        for idx, diff in zip(idcs, diffs):
+            updates[idx] = {'value': diff}
+    return updates
 
 
 class ComputedPV:
@@ -13,13 +53,17 @@ class ComputedPV:
     computed from other primary process variables. magnet strengths which
     are derived from power supply currents are typical examples of such
     computed process variables.
+
+    The `queue` may be a LoopQueueThread, which computes the value once for
+    each primary PV update, or a ComputedPVEngine, which coalesces updates
+    and evaluates computed PVs in batches.
     """
 
     def __init__(self, pvname, computer, queue, pvs, monitor=True):
         """Initialize PVs."""
         # print('compute_pv: ', pvname, pvs)
 
-        # starts computer_pvs queue, if not started yet
+        # starts computer_pvs queue or engine, if not started yet
         self._queue = queue
         self._queue.start()
 
@@ -73,11 +117,14 @@ class ComputedPV:
         return self.get()
         # return self._value
 
-    def get(self):
-        """Return current value of computed PV."""
-        if self._monitor:
-            pass
-        else:
+    def get(self, update=True):
+        """Return current value of computed PV.
+
+        Values of computed PVs which are not monitored are computed on each
+        call, unless `update` is False, in which case the last computed
+        value is returned.
+        """
+        if not self._monitor and update:
             self._update_value()
         return self._value
 
@@ -165,7 +212,9 @@ class ComputedPV:
     def _update_value(self, pvname=None, value=None):
         # Get dict with pv props that changed
         kwargs = self.computer.compute_update(self, pvname, value)
+        self._apply_update(kwargs)
 
+    def _apply_update(self, kwargs):
         if kwargs is None:
             return None
 
@@ -190,9 +239,184 @@ class ComputedPV:
     def _value_update_callback(self, pvname, value, **kwargs):
         # if 'Current-Mon' not in pvname:
         #     print(pvname, value)
-        if self.connected:
+        if not self.connected:
+            return
+        if isinstance(self._queue, ComputedPVEngine):
+            self._queue.set_dirty(self)
+        else:
             self._queue.put((self._update_value, (pvname, value)), block=False)
 
     def _issue_callback(self, **kwargs):
         for callback in self._callbacks.values():
             callback(**kwargs)
+
+
+class ComputedPVEngine:
+    """Batched evaluation engine of computed PVs.
+
+    Computed PVs flagged as dirty by updates of their primary PVs are
+    coalesced during `window` seconds and then evaluated together by a
+    single thread. Computed PVs are grouped by type of computer and each
+    group is evaluated with one call of the `compute_update_batch` static
+    or class method of the computer type, when it is defined, which takes
+    a list of computed PVs and returns a list with their updates. Computers
+    without it are evaluated with `compute_update`, one computed PV at a
+    time, and so are the computed PVs of a group whose batch evaluation
+    raises. Computed PVs whose evaluation raises are not updated and the
+    exceptions are logged. Callbacks of computed PVs are issued after all
+    groups are evaluated.
+
+    Counters of the evaluations are returned by `stats`.
+    """
+
+    DEF_WINDOW = 0.05  # [s]
+
+    def __init__(self, window=DEF_WINDOW, is_cathread=False):
+        """Init."""
+        self.window = window
+        self.is_cathread = is_cathread
+        self._lock = _Lock()
+        self._dirty = dict()  # used as an ordered set
+        self._time_dirty = None
+        self._evt_dirty = _Event()
+        self._evt_stop = _Event()
+        self._th = None
+        self.reset_stats()
+
+    @property
+    def is_running(self):
+        """."""
+        return self._th is not None and self._th.is_alive()
+
+    @property
+    def stats(self):
+        """Return counters of evaluations.
+
+        Returns:
+            dict: with keys
+                'nr_requests': updates requested, either by dirty flags or
+                    by calls of `evaluate`.
+                'nr_evaluations': evaluations of computed PVs.
+                'nr_calls': calls of computers.
+                'nr_cycles': evaluation cycles, one for each batch.
+                'nr_errors': calls of computers which raised exceptions.
+                'coalescing_ratio': requests per evaluation.
+                'batching_ratio': evaluations per call of computers.
+                'latency_avg', 'latency_max': time from the first request of
+                    a cycle until its callbacks are issued [s].
+                'evaltime_avg', 'evaltime_max': time spent evaluating a
+                    cycle, including callbacks [s].
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        nrcyc = max(stats['nr_cycles'], 1)
+        stats['coalescing_ratio'] = \
+            stats['nr_requests'] / max(stats['nr_evaluations'], 1)
+        stats['batching_ratio'] = \
+            stats['nr_evaluations'] / max(stats['nr_calls'], 1)
+        stats['latency_avg'] = stats.pop('latency_sum') / nrcyc
+        stats['evaltime_avg'] = stats.pop('evaltime_sum') / nrcyc
+        return stats
+
+    def reset_stats(self):
+        """Reset counters of evaluations."""
+        with self._lock:
+            self._stats = {
+                'nr_requests': 0, 'nr_evaluations': 0, 'nr_calls': 0,
+                'nr_cycles': 0, 'nr_errors': 0,
+                'latency_sum': 0.0, 'latency_max': 0.0,
+                'evaltime_sum': 0.0, 'evaltime_max': 0.0}
+
+    def start(self):
+        """Start evaluation thread, if not running yet."""
+        self._evt_stop.clear()
+        if self.is_running:
+            return
+        th_cls = _CAThread if self.is_cathread else _Thread
+        self._th = th_cls(target=self._loop, daemon=True)
+        self._th.start()
+
+    def stop(self):
+        """Stop evaluation thread."""
+        self._evt_stop.set()
+
+    def set_dirty(self, computed_pv):
+        """Flag computed PV to be evaluated in the next batch."""
+        with self._lock:
+            self._stats['nr_requests'] += 1
+            if not self._dirty:
+                self._time_dirty = _time.time()
+            self._dirty[computed_pv] = None
+        self._evt_dirty.set()
+
+    def evaluate(self, computed_pvs):
+        """Evaluate computed PVs in batches and issue their callbacks."""
+        computed_pvs = list(computed_pvs)
+        with self._lock:
+            self._stats['nr_requests'] += len(computed_pvs)
+        self._evaluate(computed_pvs, _time.time())
+
+    # --- private methods ---
+
+    def _loop(self):
+        while not self._evt_stop.is_set():
+            if not self._evt_dirty.wait(timeout=1):
+                continue
+            # coalesce updates arriving within the window.
+            if self._evt_stop.wait(self.window):
+                break
+            with self._lock:
+                computed_pvs = list(self._dirty)
+                time_dirty = self._time_dirty
+                self._dirty.clear()
+                self._evt_dirty.clear()
+            self._evaluate(computed_pvs, time_dirty)
+
+    def _evaluate(self, computed_pvs, time_request):
+        tini = _time.time()
+        groups = dict()
+        for cpv in computed_pvs:
+            groups.setdefault(type(cpv.computer), list()).append(cpv)
+
+        updates, nr_calls, nr_errors = list(), 0, 0
+        for ctype, cpvs in groups.items():
+            batch = getattr(ctype, 'compute_update_batch', None)
+            if batch is not None:
+                nr_calls += 1
+                try:
+                    updates.extend(zip(cpvs, batch(cpvs)))
+                    continue
+                except Exception:
+                    nr_errors += 1
+                    _log.exception(
+                        'Batch evaluation of %s failed, evaluating its '
+                        'computed PVs one at a time.', ctype.__name__)
+            # computed PVs whose computers raise are not updated.
+            for cpv in cpvs:
+                nr_calls += 1
+                try:
+                    kwargs = cpv.computer.compute_update(cpv, None, None)
+                except Exception:
+                    nr_errors += 1
+                    kwargs = None
+                    _log.exception('Evaluation of %s failed.', cpv.pvname)
+                updates.append((cpv, kwargs))
+
+        for cpv, kwargs in updates:
+            try:
+                cpv._apply_update(kwargs)
+            except Exception:
+                nr_errors += 1
+                _log.exception('Callbacks of %s failed.', cpv.pvname)
+
+        tend = _time.time()
+        with self._lock:
+            stats = self._stats
+            stats['nr_evaluations'] += len(computed_pvs)
+            stats['nr_calls'] += nr_calls
+            stats['nr_errors'] += nr_errors
+            stats['nr_cycles'] += 1
+            stats['latency_sum'] += tend - time_request
+            stats['latency_max'] = max(stats['latency_max'], tend-time_request)
+            stats['evaltime_sum'] += tend - tini
+            stats['evaltime_max'] = max(stats['evaltime_max'], tend - tini)
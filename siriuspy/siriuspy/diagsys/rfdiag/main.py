@@ -1,8 +1,6 @@
 #!/usr/local/bin/python-sirius
 """Driver module."""
 
-from pcaspy import Alarm as _Alarm, Severity as _Severity
-
 from ...namesys import SiriusPVName
 from ..app import App as _App
 from ..pvs import ComputedPV as _ComputedPV
@@ -35,7 +33,7 @@ class RFDiagApp(_App):
         pvs[_BORFStatusPV.PV_RMP_READY] = pref+bollrf_prefix+':RmpReady-Mon'
         pvo = _ComputedPV(
             devname + ':DiagStatus-Mon', _BORFStatusPV(),
-            self._queue, pvs, monitor=False)
+            self._engine, pvs, monitor=False)
         self.pvs.append(pvo)
 
         # SI
@@ -52,7 +50,7 @@ class RFDiagApp(_App):
             pvs[_SICheckAmpErrPV.PV_ERR] = pref+sillrf_prefix+':SLErrorAmp-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagAmpErrSts-Mon', _SICheckAmpErrPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagPhsErrSts-Mon
@@ -60,7 +58,7 @@ class RFDiagApp(_App):
             pvs[_SICheckPhsErrPV.PV_ERR] = pref+sillrf_prefix+':SLErrorPhs-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagPhsErrSts-Mon', _SICheckPhsErrPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagDTuneErrSts-Mon
@@ -68,7 +66,7 @@ class RFDiagApp(_App):
             pvs[_SICheckDTuneErrPV.PV_ERR] = pref+sillrf_prefix+':TuneDephs-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagDTuneErrSts-Mon', _SICheckDTuneErrPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
             # DiagStatus-Mon
@@ -80,26 +78,7 @@ class RFDiagApp(_App):
             pvs[_SIRFStatusPV.PV_DTUN_ERR] = prefname + ':DiagDTuneErrSts-Mon'
             pvo = _ComputedPV(
                 devname + ':DiagStatus-Mon', _SIRFStatusPV(),
-                self._queue, pvs, monitor=False)
+                self._engine, pvs, monitor=False)
             self.pvs.append(pvo)
 
         self._pvs_connected = {pv: False for pv in self.pvs}
-
-    def _update_pvs(self):
-        for pvo in self.pvs:
-            if not pvo.connected:
-                if self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.TIMEOUT_ALARM,
-                        severity=_Severity.INVALID_ALARM,
-                        field='status')
-                self._pvs_connected[pvo] = False
-                if 'DiagStatus' in pvo.pvname:
-                    self.run_callbacks(pvo.pvname, value=pvo.value)
-            else:
-                if not self._pvs_connected[pvo]:
-                    self.run_callbacks(
-                        pvo.pvname, alarm=_Alarm.NO_ALARM,
-                        severity=_Severity.NO_ALARM, field='status')
-                self._pvs_connected[pvo] = True
-                self.run_callbacks(pvo.pvname, value=pvo.value)
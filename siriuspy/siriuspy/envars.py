@@ -67,3 +67,9 @@ SRVURL_ARCHIVER_VIEWER = _os.environ.get(
     default='http://archiver-viewer.lnls.br')
 
 VACA_PREFIX = _os.environ.get('VACA_PREFIX', default='')
+
+# --- files ---
+
+# snapshot bundle of the control system constants web server tables
+FILE_CSCONSTS_SNAPSHOT = _os.environ.get(
+    'SIRIUS_CONSTS_SNAPSHOT', default='')
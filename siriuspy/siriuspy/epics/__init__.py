@@ -4,7 +4,7 @@
 CONNECTION_TIMEOUT = 0.050  # [s]
 GET_TIMEOUT = 5.0  # [s]
 
-from .pv import PV
+from .pv import PV, get_batch, get_timevars_batch
 from .pv_time_serie import *
 from .properties import *
 from .multiproc import CAProcessSpawn
@@ -1,7 +1,11 @@
 """Sirius PV class."""
 
+import time as _time
 
 import epics as _epics
+from epics import ca as _ca
+
+from . import GET_TIMEOUT as _GET_TIMEOUT
 
 
 class PV(_epics.pv.PV):
@@ -10,3 +14,95 @@ class PV(_epics.pv.PV):
     def set_auto_monitor(self, value):
         """Set auto_monitor property."""
         self.auto_monitor = value
+
+
+def get_batch(pvobjs, timeout=_GET_TIMEOUT):
+    """Get values of several PVs at once.
+
+    Get requests of all PVs that are not monitored are sent before waiting
+    for any reply, so that all PVs are read in about a single round trip,
+    instead of one round trip per PV. PVs that are not channel access PVs,
+    like simulated ones, are read one by one. As in `PV.get`, values read
+    are also stored in the PV objects.
+
+    Args:
+        pvobjs (list): PV objects.
+        timeout (float, optional): timeout of whole operation [s].
+
+    Returns:
+        list: values of PVs. None for PVs disconnected or whose get failed.
+    """
+    return [
+        None if mdt is None else mdt['value']
+        for mdt in _get_metadata_batch(pvobjs, False, timeout)]
+
+
+def get_timevars_batch(pvobjs, timeout=_GET_TIMEOUT):
+    """Get time variables of several PVs at once.
+
+    Same as `PV.get_timevars`, but with requests of all PVs sent before
+    waiting for any reply. Only the first element of waveforms is
+    transferred.
+
+    Args:
+        pvobjs (list): PV objects.
+        timeout (float, optional): timeout of whole operation [s].
+
+    Returns:
+        list: dicts with 'status', 'severity' and 'timestamp' keys. None for
+            PVs disconnected or whose get failed.
+    """
+    return _get_metadata_batch(pvobjs, True, timeout)
+
+
+def _get_metadata_batch(pvobjs, timevars, timeout):
+    data = [None] * len(pvobjs)
+    requests = dict()
+    for idx, pvobj in enumerate(pvobjs):
+        if not isinstance(pvobj, _epics.pv.PV):
+            data[idx] = _get_metadata(pvobj, timevars, timeout)
+        elif not pvobj.connected:
+            continue
+        elif not timevars and pvobj.auto_monitor:
+            # monitored values are already available locally.
+            data[idx] = _get_metadata(pvobj, timevars, timeout)
+        else:
+            if _ca.current_context() is None:
+                _ca.use_initial_context()
+            if timevars:
+                ftype = _ca.promote_type(pvobj.chid, use_time=True)
+                count = 1
+            else:
+                ftype, count = pvobj.ftype, 0
+            _ca.get_with_metadata(
+                pvobj.chid, ftype=ftype, count=count, wait=False)
+            requests[idx] = ftype, count
+    if not requests:
+        return data
+
+    _ca.flush_io()
+    tend = _time.time() + timeout
+    for idx, (ftype, count) in requests.items():
+        chid = pvobjs[idx].chid
+        tout = max(tend - _time.time(), 0.001)
+        try:
+            mdt = _ca.get_complete_with_metadata(
+                chid, ftype=ftype, count=count, timeout=tout)
+        except _ca.ChannelAccessGetFailure:
+            mdt = None
+        if mdt is None:
+            pass
+        elif timevars:
+            mdt.pop('value', None)
+        else:
+            # store reply in PV object, as PV.get does.
+            pvobjs[idx]._args.update(**mdt)
+        data[idx] = mdt
+    return data
+
+
+def _get_metadata(pvobj, timevars, timeout):
+    if timevars:
+        return pvobj.get_timevars(timeout=timeout)
+    value = pvobj.get(timeout=timeout)
+    return None if value is None else {'value': value}
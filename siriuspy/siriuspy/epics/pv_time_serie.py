@@ -1,11 +1,164 @@
 """SiriusPVTimeSerie Class."""
 
-import collections as _collections
 import time as _time
 import threading as _threading
 import numpy as _np
 
 
+class RingBuffer:
+    """Circular buffer of timestamps and values backed by numpy arrays.
+
+    Samples are kept contiguous in arrays with room for at least twice
+    the number of samples, so that appends are O(1) amortized and readers
+    get views of the samples, without copies. When the end of the arrays
+    is reached, the samples are moved to their beginning or, if more than
+    half of the arrays are in use and the buffer is not full, the arrays
+    are reallocated with twice the size.
+
+    Values may be scalars or arrays of fixed shape, like the ones of
+    waveform PVs. Shape and dtype of values are defined by the first
+    sample. Integer and boolean values are stored as floats.
+    """
+
+    _MIN_SIZE = 1024
+
+    def __init__(self, maxlen=None):
+        """Init.
+
+        Args:
+            maxlen (int, optional): maximum number of samples. The oldest
+                samples are discarded when it is reached. Defaults to None,
+                which means the buffer is not bounded.
+        """
+        self._maxlen = maxlen
+        self._tstamps = None
+        self._values = None
+        self._start = 0
+        self._end = 0
+
+    @property
+    def maxlen(self):
+        """Maximum number of samples."""
+        return self._maxlen
+
+    @property
+    def value_shape(self):
+        """Shape of values. None if buffer storage is not allocated yet."""
+        return None if self._values is None else self._values.shape[1:]
+
+    @property
+    def timestamps(self):
+        """View of sample timestamps.
+
+        It is only valid until the next change of the buffer.
+        """
+        if self._tstamps is None:
+            return _np.array([])
+        return self._tstamps[self._start:self._end]
+
+    @property
+    def values(self):
+        """View of sample values, one row for each sample.
+
+        It is only valid until the next change of the buffer.
+        """
+        if self._values is None:
+            return _np.array([])
+        return self._values[self._start:self._end]
+
+    def append(self, timestamp, value):
+        """Append a sample."""
+        if self._values is None:
+            if self._maxlen == 0:
+                return
+            self._allocate(_np.asarray(value))
+        elif self._values.ndim > 1:
+            # avoid broadcast of values with other shapes
+            value = _np.asarray(value)
+            if value.shape != self._values.shape[1:]:
+                raise ValueError('Value shape differs from buffer shape.')
+        if self._end - self._start == self._maxlen:
+            self._start += 1
+        if self._end == self._tstamps.size:
+            self._make_room()
+        self._tstamps[self._end] = timestamp
+        self._values[self._end] = value
+        self._end += 1
+
+    def extend(self, timestamps, values):
+        """Append several samples."""
+        for tstamp, value in zip(timestamps, values):
+            self.append(tstamp, value)
+
+    def trim(self, min_timestamp):
+        """Discard samples with timestamps up to min_timestamp.
+
+        Timestamps are assumed to be increasing.
+        """
+        idx = _np.searchsorted(self.timestamps, min_timestamp, side='right')
+        self._start += idx
+        if self._start == self._end:
+            self.clear()
+
+    def keep(self, indices):
+        """Keep only samples of given indices or boolean mask."""
+        tstamps = self.timestamps[indices]
+        values = self.values[indices]
+        self.clear()
+        self.extend(tstamps, values)
+
+    def clear(self):
+        """Discard all samples, but keep buffer storage."""
+        self._start = self._end = 0
+
+    def resize(self, maxlen):
+        """Change maximum number of samples, keeping the newest ones."""
+        tstamps, values = self.timestamps, self.values
+        if maxlen is not None:
+            ini = max(len(self) - maxlen, 0)
+            tstamps, values = tstamps[ini:].copy(), values[ini:].copy()
+        self._maxlen = maxlen
+        self._tstamps = self._values = None
+        self._start = self._end = 0
+        self.extend(tstamps, values)
+
+    def __len__(self):
+        """Return number of samples."""
+        return self._end - self._start
+
+    # --- private methods ---
+
+    def _allocate(self, value):
+        dtype = value.dtype
+        if dtype.kind in 'biu':
+            dtype = _np.dtype(float)
+        elif dtype.kind not in 'fc':
+            dtype = _np.dtype(object)
+        size = self._MIN_SIZE
+        if self._maxlen is not None:
+            size = min(size, 2*max(self._maxlen, 1))
+        self._tstamps = _np.empty(size, dtype=float)
+        self._values = _np.empty((size, ) + value.shape, dtype=dtype)
+        self._start = self._end = 0
+
+    def _make_room(self):
+        size = self._tstamps.size
+        nrpts = len(self)
+        maxsize = None if self._maxlen is None else 2*self._maxlen
+        if 2*nrpts > size and (maxsize is None or size < maxsize):
+            size = 2*size if maxsize is None else min(2*size, maxsize)
+            tstamps = _np.empty(size, dtype=float)
+            values = _np.empty(
+                (size, ) + self._values.shape[1:], dtype=self._values.dtype)
+        else:
+            tstamps, values = self._tstamps, self._values
+        # numpy handles overlapping slices of the same array.
+        tstamps[:nrpts] = self._tstamps[self._start:self._end]
+        values[:nrpts] = self._values[self._start:self._end]
+        self._tstamps, self._values = tstamps, values
+        self._start, self._end = 0, nrpts
+
+
 class SiriusPVTimeSerie:
     """Class to handle time series from pv monitoring."""
 
@@ -27,16 +180,12 @@ class SiriusPVTimeSerie:
         self._time_min_interval = time_min_interval
         self._nr_max_points = nr_max_points
         self._use_pv_timestamp = use_pv_timestamp
-        if timestamp_init_data:
-            if not value_init_data:
+        self._lock = _threading.RLock()
+        self._buffer = RingBuffer(maxlen=nr_max_points)
+        if timestamp_init_data is not None and len(timestamp_init_data):
+            if value_init_data is None or not len(value_init_data):
                 raise ValueError("Provide 'value_init_data' input!")
-            self._timestamp_deque = _collections.deque(
-                timestamp_init_data, maxlen=nr_max_points)
-            self._value_deque = _collections.deque(
-                value_init_data, maxlen=nr_max_points)
-        else:
-            self._timestamp_deque = _collections.deque(maxlen=nr_max_points)
-            self._value_deque = _collections.deque(maxlen=nr_max_points)
+            self._buffer.extend(timestamp_init_data, value_init_data)
         self._mode = mode
         if self._mode == 1:
             self._th_auto_acquire = _threading.Thread(
@@ -55,7 +204,8 @@ class SiriusPVTimeSerie:
     def time_window(self, value):
         self._time_window = value
         timestamp = _time.time()
-        self._update(timestamp)
+        with self._lock:
+            self._update(timestamp)
 
     @property
     def time_min_interval(self):
@@ -66,31 +216,20 @@ class SiriusPVTimeSerie:
     def time_min_interval(self, value):
         self._time_min_interval = value
 
-        if self._timestamp_deque:
-            old_timestamp_deque = _collections.deque(
-                self._timestamp_deque, maxlen=self._nr_max_points)
-            old_value_deque = _collections.deque(
-                self._value_deque, maxlen=self._nr_max_points)
-            self._timestamp_deque = _collections.deque(
-                maxlen=self._nr_max_points)
-            self._value_deque = _collections.deque(
-                maxlen=self._nr_max_points)
-
-            aux = old_timestamp_deque.pop()
-            self._timestamp_deque.appendleft(aux)
-            aux = old_value_deque.pop()
-            self._value_deque.appendleft(aux)
-
-            while old_timestamp_deque:
-                if self._time_min_interval < (
-                        self._timestamp_deque[0] - old_timestamp_deque[-1]):
-                    aux = old_timestamp_deque.pop()
-                    self._timestamp_deque.appendleft(aux)
-                    aux = old_value_deque.pop()
-                    self._value_deque.appendleft(aux)
-                else:
-                    old_timestamp_deque.pop()
-                    old_value_deque.pop()
+        with self._lock:
+            tstamps = self._buffer.timestamps
+            if not tstamps.size:
+                return
+            # keep newest datapoint and, going backwards, the ones
+            # separated by more than the interval from the last kept.
+            keep = _np.zeros(tstamps.size, dtype=bool)
+            keep[-1] = True
+            first = tstamps[-1]
+            for idx in range(tstamps.size-2, -1, -1):
+                if self._time_min_interval < first - tstamps[idx]:
+                    keep[idx] = True
+                    first = tstamps[idx]
+            self._buffer.keep(keep)
 
     @property
     def nr_max_points(self):
@@ -100,10 +239,8 @@ class SiriusPVTimeSerie:
     @nr_max_points.setter
     def nr_max_points(self, value):
         self._nr_max_points = value
-        self._timestamp_deque = _collections.deque(
-            self._timestamp_deque, maxlen=self._nr_max_points)
-        self._value_deque = _collections.deque(
-            self._value_deque, maxlen=self._nr_max_points)
+        with self._lock:
+            self._buffer.resize(value)
 
     @property
     def mode(self):
@@ -127,14 +264,37 @@ class SiriusPVTimeSerie:
         """PV time series, as two separate lists: timestamp and value."""
         return self.get_serie()
 
-    def get_serie(self, time_absolute=False):
-        """Return series, as two separate numpy arrays: timestamp and value."""
+    def get_serie(self, time_absolute=False, copy=True):
+        """Return series, as two separate numpy arrays: timestamp and value.
+
+        Args:
+            time_absolute (bool, optional): whether to return absolute
+                timestamps or relative to now. Defaults to False.
+            copy (bool, optional): whether to return copies of the series.
+                If False, read-only views of the internal buffer are returned,
+                which are only valid until the next datapoint is acquired.
+                Relative timestamps are always a new array. Defaults to True.
+
+        Returns:
+            timestamp (numpy.ndarray): timestamps of datapoints.
+            value (numpy.ndarray): values of datapoints. For waveform PVs,
+                each row is a datapoint.
+        """
         timestamp = _time.time()
-        self._update(timestamp)
-        timestamp_array = _np.array(self._timestamp_deque)
+        with self._lock:
+            self._update(timestamp)
+            timestamp_array = self._buffer.timestamps
+            value_array = self._buffer.values
+            if copy:
+                timestamp_array = timestamp_array.copy()
+                value_array = value_array.copy()
+            else:
+                timestamp_array = timestamp_array.view()
+                value_array = value_array.view()
+                timestamp_array.flags.writeable = False
+                value_array.flags.writeable = False
         if not time_absolute:
-            timestamp_array -= timestamp
-        value_array = _np.array(self._value_deque)
+            timestamp_array = timestamp_array - timestamp
         return timestamp_array, value_array
 
     def acquire(self):
@@ -142,53 +302,48 @@ class SiriusPVTimeSerie:
 
         Returns True if datapoint was acquired and False otherwise.
         """
-        minintv = self._time_min_interval
         # check if pv is connected
-        if self.connected():
-            timestamp = _time.time()
-            if self._use_pv_timestamp:
-                pv_timestamp, pv_value = \
-                    self._pvobj.timestamp, self._pvobj.value
-            else:
-                pv_timestamp, pv_value = timestamp, self._pvobj.value
+        if not self.connected():
+            # print('not acquired: pv not connected')
+            return False
+        timestamp = _time.time()
+        if self._use_pv_timestamp:
+            pv_timestamp, pv_value = \
+                self._pvobj.timestamp, self._pvobj.value
+        else:
+            pv_timestamp, pv_value = timestamp, self._pvobj.value
 
+        with self._lock:
+            tstamps = self._buffer.timestamps
             # check if it is a new datapoint
-            if not self._timestamp_deque or \
-                    pv_timestamp != self._timestamp_deque[-1]:
-                # check if there is a limiting time_window
-                if self._time_window is None:
-                    # check if there is a limiting time_min_interval
-                    if not self._timestamp_deque or \
-                            minintv <= timestamp-self._timestamp_deque[-1]:
-                        self._timestamp_deque.append(pv_timestamp)
-                        self._value_deque.append(pv_value)
-                        return True
-                    else:
-                        # print('not acquired: time interval not sufficient')
-                        return False
-                else:
-                    # Check if the datapoints in the deques are yet valid
-                    # to the limiting time_window
-                    self._update(timestamp)
-                    # check if the new point is within the limiting time_window
-                    if pv_timestamp >= timestamp - self._time_window:
-                        if not self._timestamp_deque or \
-                                minintv <= timestamp-self._timestamp_deque[-1]:
-                            self._timestamp_deque.append(pv_timestamp)
-                            self._value_deque.append(pv_value)
-                            return True
-                        else:
-                            # print('not acquired: not enough time interval')
-                            return False
-                    else:
-                        # print('not acquired: not within time_window')
-                        return False
-            else:
-                # print('not acquired: item already in deque')
+            if tstamps.size and pv_timestamp == tstamps[-1]:
+                # print('not acquired: item already in buffer')
                 return False
-        else:
-            # print('not acquired: pv not connected')
-            return False
+            # check if there is a limiting time_window
+            if self._time_window is not None:
+                # Check if the datapoints in the buffer are yet valid
+                # to the limiting time_window
+                self._update(timestamp)
+                # check if the new point is within the limiting time_window
+                if pv_timestamp < timestamp - self._time_window:
+                    # print('not acquired: not within time_window')
+                    return False
+                tstamps = self._buffer.timestamps
+            # check if there is a limiting time_min_interval
+            if tstamps.size and \
+                    self._time_min_interval > timestamp - tstamps[-1]:
+                # print('not acquired: not enough time interval')
+                return False
+            self._append(pv_timestamp, pv_value)
+            return True
+
+    def _append(self, timestamp, value):
+        value = _np.asarray(value)
+        shape = self._buffer.value_shape
+        if shape is not None and value.shape != shape:
+            # waveform size changed: restart serie with the new size.
+            self._buffer = RingBuffer(maxlen=self._nr_max_points)
+        self._buffer.append(timestamp, value)
 
     def _auto_acquire(self):
         while not self._stop_auto_acquire:
@@ -197,39 +352,14 @@ class SiriusPVTimeSerie:
 
     def _update(self, timestamp):
         """Update time serie according to current timestamp."""
-        if not self._timestamp_deque or self._time_window is None:
+        if self._time_window is None:
             return
-
-        min_timestamp = timestamp - self._time_window
-        if self._timestamp_deque[-1] <= min_timestamp:
-            self.clearserie()
-        elif self._timestamp_deque[0] >= min_timestamp:
-            pass
-        else:
-            low_interval_end = 0
-            high_interval_end = len(self._timestamp_deque)-1
-            search_index = (high_interval_end - low_interval_end)//2
-
-            while low_interval_end != search_index:
-                if self._timestamp_deque[search_index] <= min_timestamp:
-                    low_interval_end = search_index
-                    search_index = (
-                        (high_interval_end - low_interval_end)//2 +
-                        low_interval_end)
-                else:
-                    high_interval_end = search_index
-                    search_index = (
-                        (high_interval_end - low_interval_end)//2 +
-                        low_interval_end)
-
-            for _ in range(search_index + 1):
-                self._timestamp_deque.popleft()
-                self._value_deque.popleft()
+        self._buffer.trim(timestamp - self._time_window)
 
     def clearserie(self):
         """Clear time serie."""
-        self._timestamp_deque.clear()
-        self._value_deque.clear()
+        with self._lock:
+            self._buffer.clear()
 
     def connected(self):
         """Check PV connection."""
@@ -0,0 +1,99 @@
+#!/usr/bin/env python-sirius
+"""Benchmark of PV time serie buffers of 10^5 to 10^6 samples.
+
+Compares the numpy ring buffer of SiriusPVTimeSerie with the deques it
+used before, for appends, readouts and trims of the time window.
+"""
+
+import collections
+import sys
+import time
+
+import numpy as np
+
+from siriuspy.epics.pv_time_serie import RingBuffer
+
+
+class DequeBuffer:
+    """Buffer of timestamps and values stored in two deques."""
+
+    def __init__(self, maxlen):
+        """."""
+        self.tstamps = collections.deque(maxlen=maxlen)
+        self.values = collections.deque(maxlen=maxlen)
+
+    def append(self, tstamp, value):
+        """."""
+        self.tstamps.append(tstamp)
+        self.values.append(value)
+
+    def get_serie(self):
+        """."""
+        return np.array(self.tstamps), np.array(self.values)
+
+    def trim(self, min_tstamp):
+        """."""
+        while self.tstamps and self.tstamps[0] <= min_tstamp:
+            self.tstamps.popleft()
+            self.values.popleft()
+
+
+class NumpyBuffer(RingBuffer):
+    """RingBuffer with the readout of SiriusPVTimeSerie."""
+
+    def get_serie(self, copy=True):
+        """."""
+        if copy:
+            return self.timestamps.copy(), self.values.copy()
+        return self.timestamps, self.values
+
+
+def benchmark(buf, nrpts, wfmsize=None, nrreads=20):
+    """Return times per operation [us] of a buffer."""
+    value = 1.0 if wfmsize is None else np.ones(wfmsize)
+    t0_ = time.time()
+    for i in range(nrpts):
+        buf.append(float(i), value)
+    dt_app = (time.time() - t0_) / nrpts
+
+    t0_ = time.time()
+    for _ in range(nrreads):
+        buf.get_serie()
+    dt_read = (time.time() - t0_) / nrreads
+
+    # discard 10% of the samples in 10 trims
+    t0_ = time.time()
+    for i in range(10):
+        buf.trim(nrpts * (i + 1) / 100)
+    dt_trim = (time.time() - t0_) / 10
+    return 1e6*dt_app, 1e6*dt_read, 1e6*dt_trim
+
+
+def run(nrpts_list=(100000, 300000, 1000000)):
+    """."""
+    print(f'{"samples":>8s} {"buffer":>8s} {"wfm":>4s} {"append":>10s} '
+          f'{"get_serie":>12s} {"trim":>10s}  [us]')
+    for nrpts in nrpts_list:
+        for wfmsize in (None, 10):
+            nrp = nrpts if wfmsize is None else nrpts // 10
+            for name, cls in (('deque', DequeBuffer), ('numpy', NumpyBuffer)):
+                res = benchmark(cls(nrp), nrp, wfmsize)
+                wfm = '-' if wfmsize is None else str(wfmsize)
+                print(f'{nrp:8d} {name:>8s} {wfm:>4s} {res[0]:10.3f} '
+                      f'{res[1]:12.1f} {res[2]:10.1f}')
+            nrp_view = NumpyBuffer(nrp)
+            value = 1.0 if wfmsize is None else np.ones(wfmsize)
+            for i in range(nrp):
+                nrp_view.append(float(i), value)
+            t0_ = time.time()
+            for _ in range(1000):
+                nrp_view.get_serie(copy=False)
+            dt_view = (time.time() - t0_) / 1000 * 1e6
+            print(f'{"":8s} {"view":>8s} {wfm:>4s} {"":10s} {dt_view:12.1f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run([int(arg) for arg in sys.argv[1:]])
+    else:
+        run()
@@ -3,6 +3,7 @@
 import sys as _sys
 import time as _time
 import logging as _log
+from concurrent.futures import as_completed as _as_completed
 
 import numpy as _np
 try:
@@ -247,6 +248,7 @@ class MacReport:
     THOLD_STOREDBEAM = 0.008  # [mA]
     THOLD_FACTOR_USERSSBEAM = 0.5  # 50%
     QUERY_AVG_TIME = 60  # [s]
+    INCREMENTAL_OVERLAP = 60 * 60  # [s]
 
     SHIFTS = [
         'Injection',
@@ -285,6 +287,7 @@ class MacReport:
         # query data
         self._time_start = _Time.now()
         self._time_stop = self._time_start
+        self._queried_interval = None
 
         # user shift stats
         self._usershift_progmd_time = None
@@ -421,6 +424,11 @@ class MacReport:
         self._failures_users = None
         self._distortions_users = None
 
+        # intermediate arrays reused in incremental updates
+        self._intermediates = dict()
+        self._reuse_until = None
+        self._reuse_npts = 0
+
     @property
     def connector(self):
         """Client archiver connector."""
@@ -1014,11 +1022,33 @@ class MacReport:
         """Shift data and failures details."""
         return self._raw_data
 
-    def update(self):
-        """Update."""
+    def update(self, incremental=True):
+        """Update.
+
+        Queries of all PVs are made concurrently in the archiver client
+        event loop, with per-PV progress logs.
+
+        Args:
+            incremental (bool): if only `time_stop` was extended since last
+                update, query just the new data and reuse the previously
+                computed intermediate arrays. Defaults to True.
+        """
         if self._time_start >= self._time_stop:
             raise ValueError('Invalid time interval.')
 
+        query_start = self._time_start
+        self._reuse_until = None
+        if incremental and self._queried_interval is not None:
+            tstart, tstop = self._queried_interval
+            if tstart == self._time_start and \
+                    tstart < tstop <= self._time_stop:
+                # data before the last queried hour is kept
+                avgt = MacReport.QUERY_AVG_TIME
+                ext = tstop.timestamp() - MacReport.INCREMENTAL_OVERLAP
+                ext = max(ext // avgt * avgt, tstart.timestamp())
+                query_start = _Time(timestamp=ext)
+                self._reuse_until = ext
+
         for pvn in self._pvnames:
             self._pvdata[pvn].time_start = self._time_start
             self._pvdata[pvn].time_stop = self._time_stop
@@ -1028,42 +1058,26 @@ class MacReport:
 
         self._update_log(
             'Collecting archiver data '
-            f'({self.time_start.get_iso8601()} to'
+            f'({query_start.get_iso8601()} to'
             f' {self.time_stop.get_iso8601()})...')
 
-        log_msg = 'Query for {0} in archiver took {1:.3f}s'
-
         # current
-        _t0 = _time.time()
         pvd = self._pvdata[self._current_pv]
         pvd.query_split_interval = 60 * 60 * 6
         pvd.processing_type = pvd.ProcessingTypes.Mean
         pvd.processing_type_param1 = MacReport.QUERY_AVG_TIME
-        pvd.update()
 
-        self._update_log(log_msg.format(self._current_pv, _time.time()-_t0))
+        # macshift, interlock and stability indicators and ps.
+        # Set query_split_interval for the rest of PVs to 0 to
+        # avoid multiple queries and speed up the process.
+        for pvn, pvd in self._pvdata.items():
+            if pvn != self._current_pv:
+                pvd.query_split_interval = 0
+        for pvds in self._pvdataset.values():
+            pvds.query_split_interval = 0
 
-        # macshift, interlock and stability indicators
-        for pvn in self._pvnames:
-            if pvn == self._current_pv:
-                continue
-            _t0 = _time.time()
-            # Set query_split_interval for the rest of PVs to 0 to
-            # avoid multiple queries and speed up the process.
-            self._pvdata[pvn].query_split_interval = 0
-            self._pvdata[pvn].update()
-            self._update_log(log_msg.format(pvn, _time.time()-_t0))
-
-        # ps
-        for group, pvdataset in self._pvdataset.items():
-            _t0 = _time.time()
-            # Set query_split_interval for the rest of PVs to 0 to
-            # avoid multiple queries and speed up the process.
-            pvdataset.query_split_interval = 0
-            pvdataset.update()
-            self._update_log(log_msg.format(
-                'SI PS '+group.capitalize(), _time.time()-_t0)
-            )
+        self._query_data(query_start)
+        self._queried_interval = (self._time_start, self._time_stop)
 
         self._compute_stats()
 
@@ -1321,12 +1335,99 @@ class MacReport:
                 self._pv2default[pvn] = 0.0
                 self._pv2tstart[pvn] = _Time(2021, 1, 1, 0, 0)
 
+    def _query_data(self, query_start):
+        conn = self._connector
+        log_msg = 'Query for {0} in archiver took {1:.3f}s ({2}/{3})'
+
+        # submit requests of all PVs at once, the client limits the
+        # number of concurrent requests.
+        _t0 = _time.time()
+        plans, futures = dict(), dict()
+        for pvn, pvd in self._pvdata.items():
+            plans[pvn] = conn.get_request_plan_for_get_data(
+                pvn, query_start, self._time_stop,
+                query_split_interval=pvd.query_split_interval,
+                proc_type=pvd.processing_type,
+                proc_type_param1=pvd.processing_type_param1,
+                proc_type_param2=pvd.processing_type_param2)
+            if plans[pvn]['urls']:
+                futures[conn.submit_request(plans[pvn]['urls'])] = pvn
+
+        nrpvs = len(plans)
+        nrdone = 0
+        for pvn in set(plans) - set(futures.values()):
+            self._set_pv_data(pvn, conn.process_request_of_get_data_plan(
+                plans[pvn], []), query_start)
+            nrdone += 1
+        try:
+            for future in _as_completed(futures):
+                pvn = futures[future]
+                data = conn.process_request_of_get_data_plan(
+                    plans[pvn], future.result())
+                self._set_pv_data(pvn, data, query_start)
+                nrdone += 1
+                self._update_log(log_msg.format(
+                    pvn, _time.time()-_t0, nrdone, nrpvs))
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _set_pv_data(self, pvname, data, query_start):
+        pvd = self._pvdata[pvname]
+        if query_start != self._time_start and pvd.timestamp is not None:
+            # incremental update: keep previous data before query start
+            tstart = query_start.timestamp()
+            keep = _np.asarray(pvd.timestamp) < tstart
+            new = slice(None)
+            if data['timestamp'] is not None:
+                new = _np.asarray(data['timestamp']) >= tstart
+            for fld in ('timestamp', 'value', 'status', 'severity'):
+                old = _np.asarray(getattr(pvd, fld))[keep]
+                if data[fld] is not None:
+                    old = _np.r_[old, _np.asarray(data[fld])[new]]
+                data[fld] = old
+            if not data['timestamp'].size:
+                data['timestamp'] = None
+        pvd.set_data(**data)
+
+    def _reuse(self, key, func):
+        """Return intermediate array in current timestamp base.
+
+        Values of the first `self._reuse_npts` points are taken from the
+        array of the previous update, `func` is only evaluated for the
+        remaining timestamps.
+        """
+        npts = self._reuse_npts
+        prev = self._intermediates.get(key)
+        if prev is None or len(prev) < npts:
+            npts = 0
+        if npts == len(self._curr_times):
+            value = prev[:npts]
+        else:
+            value = func(self._curr_times[npts:])
+            if npts:
+                value = _np.concatenate([prev[:npts], value])
+        self._intermediates[key] = value
+        return value
+
     def _compute_stats(self):
         # will populate the following dict
         self._raw_data = dict()
 
         # get current data and timestamp base
+        prev_times = self._curr_times
         self._curr_times, self._curr_values = self._get_current_data()
+
+        # in incremental updates, intermediate arrays of timestamps before
+        # the extension are reused if the timestamp base did not change.
+        self._reuse_npts = 0
+        if self._reuse_until is not None and prev_times is not None:
+            npts = _np.searchsorted(prev_times, self._reuse_until)
+            npts = min(npts, len(self._curr_times))
+            if _np.array_equal(prev_times[:npts], self._curr_times[:npts]):
+                self._reuse_npts = npts
+        else:
+            self._intermediates.clear()
         self._raw_data['Timestamp'] = self._curr_times
         self._raw_data['Current'] = self._curr_values
 
@@ -1381,16 +1482,14 @@ class MacReport:
             1 * ((self._users_shift_progmd_values -
                   self._users_shift_values) > 0)
         ignore_wrong_shift = _np.zeros(wrong_shift.shape)
-        for i, val in enumerate(wrong_shift):
-            # do not ignore errors in first 60s
-            if i < 12:
-                continue
-            # fix problems until last 60s
-            if i >= len(wrong_shift) - 12:
-                break
-            # properly ignore errors in shift setpoints with duration of 60s
-            if val == 1 and not _np.sum(wrong_shift[(i-12):(i+12)]) >= 12:
-                ignore_wrong_shift[i] = 1
+        # do not ignore errors in first 60s and fix problems until last 60s
+        idcs = _np.arange(12, len(wrong_shift) - 12)
+        # properly ignore errors in shift setpoints with duration of 60s,
+        # using cumulative sums to get the sums over the 24 points windows
+        cumsum = _np.r_[0, _np.cumsum(wrong_shift)]
+        winsum = cumsum[idcs+12] - cumsum[idcs-12]
+        ignore = (wrong_shift[idcs] == 1) & (winsum < 12)
+        ignore_wrong_shift[idcs[ignore]] = 1
         consider_wrong_shift = wrong_shift - ignore_wrong_shift
         self._raw_data['Failures']['WrongShift'] = consider_wrong_shift
 
@@ -1442,14 +1541,14 @@ class MacReport:
     def _get_egunmode_data(self):
         # single/multi bunch mode data
         # get EVG injection data and oversample considering current data
-        inj_ts, inj_vs = self._get_pv_data(self._injevt_pv)
-        inj_vs = _interp1d_previous(inj_ts, inj_vs, self._curr_times)
+        inj_vs = self._reuse(
+            self._injevt_pv, self._get_pv_data_previous(self._injevt_pv))
         # get egun trigger data and oversample considering current data
-        trig_ts, trig_vs = self._get_pv_data(self._egtrgen_pv)
-        trig_vs = _interp1d_previous(trig_ts, trig_vs, self._curr_times)
+        trig_vs = self._reuse(
+            self._egtrgen_pv, self._get_pv_data_previous(self._egtrgen_pv))
         # get single bunch data and oversample considering current data
-        sb_ts, sb_vs = self._get_pv_data(self._egpusel_pv)
-        sb_vs = _interp1d_previous(sb_ts, sb_vs, self._curr_times)
+        sb_vs = self._reuse(
+            self._egpusel_pv, self._get_pv_data_previous(self._egpusel_pv))
         # find points where the injection was with single bunch mode,
         # store 1 for single bunch
         idcs1 = _np.where(inj_vs*trig_vs*sb_vs)[0]
@@ -1477,32 +1576,30 @@ class MacReport:
 
     def _get_subsystems_status_data(self):
         # ps status data
-        psfail_all = [0] * len(self._curr_times)
-        for psnames in self._psgroup2psname.values():
-            for psn in psnames:
-                psfail_times, psfail_values = \
-                    self._get_pv_data(psn+':DiagStatus-Mon')
-                psfail_values = _np.bitwise_and(  # disregard alarms
-                    psfail_values.astype(int), 0b1101111)
-
-                psfail = 1 * (_interp1d_previous(
-                    psfail_times, psfail_values, self._curr_times) > 0)
-
-                psfail_all = _np.logical_or(psfail_all, psfail)
-        ps_fail_vals = 1 * psfail_all
+        def get_ps_fail(times):
+            psfail_all = _np.zeros(len(times), dtype=bool)
+            for psnames in self._psgroup2psname.values():
+                for psn in psnames:
+                    psfail_times, psfail_values = \
+                        self._get_pv_data(psn+':DiagStatus-Mon')
+                    psfail_values = _np.bitwise_and(  # disregard alarms
+                        psfail_values.astype(int), 0b1101111)
+                    psfail_all |= _interp1d_previous(
+                        psfail_times, psfail_values, times) > 0
+            return 1 * psfail_all
+
+        ps_fail_vals = self._reuse('PSFail', get_ps_fail)
 
         # rf and mps status data
-        siintlk_times, siintlk_values = self._get_pv_data(self._siintlk_pv)
-        mps_fail_vals = _interp1d_previous(
-            siintlk_times, siintlk_values, self._curr_times)
+        mps_fail_vals = self._reuse(
+            self._siintlk_pv, self._get_pv_data_previous(self._siintlk_pv))
 
         return ps_fail_vals, mps_fail_vals
 
     def _get_gammashutter_data(self):
-        gamma_times, gamma_values = self._get_pv_data(self._gammashutt_pv)
-        gamma_fail_vals = _interp1d_previous(
-            gamma_times, gamma_values, self._curr_times)
-        return gamma_fail_vals
+        return self._reuse(
+            self._gammashutt_pv,
+            self._get_pv_data_previous(self._gammashutt_pv))
 
     def _get_storedebeam_data(self):
         is_stored_total = self._curr_values > MacReport.THOLD_STOREDBEAM
@@ -1518,7 +1615,9 @@ class MacReport:
         for shift in MacReport.SHIFTS:
             sid = getattr(_Cte.MachShift, shift)
             value = _np.array([1*(v == sid) for v in shift_values])
-            value = _interp1d_previous(shift_times, value, self._curr_times)
+            value = self._reuse(
+                shift, lambda tims, val=value: _interp1d_previous(
+                    shift_times, val, tims))
             shifts_data.append(value)
         return shifts_data
 
@@ -1527,15 +1626,17 @@ class MacReport:
         sofb_times, sofb_values = self._get_pv_data(self._sisofbloop_pv)
         sofb_fail_rawvalues = _np.array(
             [1*(v == _SOFBCte.LoopState.Open) for v in sofb_values])
-        sofb_fail_values = _interp1d_previous(
-            sofb_times, sofb_fail_rawvalues, self._curr_times)
+        sofb_fail_values = self._reuse(
+            self._sisofbloop_pv, lambda tims: _interp1d_previous(
+                sofb_times, sofb_fail_rawvalues, tims))
 
         # fofb
         fofb_times, fofb_values = self._get_pv_data(self._sifofbloop_pv)
         fofb_fail_rawvalues = _np.array(
             [1*(v == _FOFBCte.LoopState.Open) for v in fofb_values])
-        fofb_fail_values = _interp1d_previous(
-            fofb_times, fofb_fail_rawvalues, self._curr_times)
+        fofb_fail_values = self._reuse(
+            self._sifofbloop_pv, lambda tims: _interp1d_previous(
+                fofb_times, fofb_fail_rawvalues, tims))
 
         return sofb_fail_values, fofb_fail_values
 
@@ -1547,8 +1648,9 @@ class MacReport:
             times, values = self._get_pv_data(pvname)
             rawvalues = _np.array(
                 [1*(v == _StabCte.StabUnstab.Unstable) for v in values])
-            failvalues = _interp1d_previous(
-                times, rawvalues, self._curr_times)
+            failvalues = self._reuse(
+                pvname, lambda tims, tsp=times, val=rawvalues:
+                _interp1d_previous(tsp, val, tims))
             bbbdata[axis] = failvalues
         return bbbdata
 
@@ -1799,6 +1901,11 @@ class MacReport:
             values[idcsdefv] = defv
         return times, values
 
+    def _get_pv_data_previous(self, pvname):
+        """Return function to resample PV data to previous values."""
+        times, values = self._get_pv_data(pvname)
+        return lambda tims: _interp1d_previous(times, values, tims)
+
     def _get_man_annotated_fails_data(self):
         # get all annotated failures
         t2vs = _np.array([[], []])
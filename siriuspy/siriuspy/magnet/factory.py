@@ -1,7 +1,7 @@
 """Definition of factories.
 
 NormalizerFactory
-    used to create magnet normalizers
+    used to create magnet normalizers and batch normalizers
 """
 
 from ..search import MASearch as _MASearch, PSSearch as _PSSearch
@@ -37,3 +37,10 @@ class NormalizerFactory:
         # all other cases
         kwargs['magnet_conv_sign'] = -1.0
         return _norm.MagnetNormalizer(maname, **kwargs)
+
+    @staticmethod
+    def create_batch(manames, **kwargs):
+        """Return batch normalizer for a list of magnets."""
+        normalizers = [
+            NormalizerFactory.create(maname, **kwargs) for maname in manames]
+        return _norm.BatchNormalizer(normalizers)
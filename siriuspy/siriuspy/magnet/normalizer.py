@@ -542,3 +542,187 @@ class IDNormalizer:
             intfields_s = _np.array(intfields_s)
         strengths = _KCOEFF * _np.sqrt(intfields_n**2 + intfields_s**2)
         return strengths
+
+
+class BatchNormalizer:
+    """Convert currents of many magnets to strengths and vice versa.
+
+    The main harmonic excitation tables of all magnets are packed into
+    contiguous arrays, so that a vector with one value for each magnet is
+    converted with a single vectorized linear interpolation, instead of
+    one call to the normalizer of each magnet. Results are identical to
+    those of the individual normalizers.
+
+    Values may also be arrays of shape (..., N), N being the number of
+    magnets. Optional 'strengths_dipole' and 'strengths_family' arguments
+    are broadcast to the same shape.
+    """
+
+    TYPE = 'BatchNormalizer'
+
+    _BRHO_ERR = (
+        "Missing input 'strengths_dipole' and no default value is "
+        "set in attribute 'default_strengths_dipole'.")
+
+    def __init__(self, normalizers):
+        """Init.
+
+        normalizers -- DipoleNormalizer, MagnetNormalizer or TrimNormalizer
+            objects, one for each magnet.
+        """
+        self._normalizers = tuple(normalizers)
+        for norm in self._normalizers:
+            if not isinstance(norm, _MagnetNormalizer):
+                raise ValueError(
+                    'Invalid normalizer type: {}'.format(type(norm)))
+        self._init_tables()
+        self._init_coefs()
+
+    @property
+    def manames(self):
+        """Return magnet names."""
+        return tuple(norm.maname for norm in self._normalizers)
+
+    @property
+    def normalizers(self):
+        """Return magnet normalizers."""
+        return self._normalizers
+
+    # --- normalizer interface ---
+
+    def conv_current_2_strength(
+            self, currents, strengths_dipole=None, strengths_family=None):
+        """Convert currents to strengths."""
+        currents = _np.asarray(currents, dtype=float)
+        intfields = BatchNormalizer._interpolate(
+            currents, self._curr, self._mult, self._size)
+        brho = self._get_brho(strengths_dipole, intfields.shape)
+        sfam = self._get_strengths_family(strengths_family, intfields.shape)
+        isdip = self._isdip
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            strengths = _np.where(
+                isdip,
+                -self._sign * ((self._dip_e2b * -intfields) / self._dip_ang),
+                self._sign * intfields / brho + sfam)
+        strengths[(brho == 0) & ~isdip] = 0.0
+        return self._coef_def2edb * strengths
+
+    def conv_strength_2_current(
+            self, strengths, strengths_dipole=None, strengths_family=None):
+        """Convert strengths to currents."""
+        strengths = self._coef_edb2def * _np.asarray(strengths, dtype=float)
+        brho = self._get_brho(strengths_dipole, strengths.shape)
+        sfam = self._get_strengths_family(strengths_family, strengths.shape)
+        intfields = _np.where(
+            self._isdip,
+            self._dip_b2e * strengths,
+            self._sign * brho * (strengths - sfam))
+        return BatchNormalizer._interpolate(
+            intfields, self._mult_inv, self._curr_inv, self._size)
+
+    # --- private methods ---
+
+    def _init_tables(self):
+        # excitation tables are padded with +inf, so that comparisons
+        # with tabulated currents or multipoles locate interpolation
+        # intervals of all magnets at once.
+        size = [len(norm._excdata.currents) for norm in self._normalizers]
+        self._size = _np.array(size, dtype=int)
+        shape = (len(size), max(size, default=2))
+        self._curr = _np.full(shape, _np.inf)
+        self._mult = _np.zeros(shape)
+        self._mult_inv = _np.full(shape, _np.inf)
+        self._curr_inv = _np.zeros(shape)
+        for i, norm in enumerate(self._normalizers):
+            excdata, mft = norm._excdata, norm._main_func_mult
+            curr = excdata.currents
+            mpole = excdata.multipoles[mft['type']][mft['harmonic']]
+            self._curr[i, :size[i]] = curr
+            self._mult[i, :size[i]] = mpole
+            # same ordering as in ExcitationData.interp_mult2curr
+            if mpole[-1] <= mpole[0]:
+                mpole, curr = mpole[::-1], curr[::-1]
+            self._mult_inv[i, :size[i]] = mpole
+            self._curr_inv[i, :size[i]] = curr
+
+    def _init_coefs(self):
+        nrmags = len(self._normalizers)
+        self._isdip = _np.zeros(nrmags, dtype=bool)
+        self._istrim = _np.zeros(nrmags, dtype=bool)
+        self._sign = _np.ones(nrmags)
+        self._coef_def2edb = _np.ones(nrmags)
+        self._coef_edb2def = _np.ones(nrmags)
+        self._brho_default = _np.full(nrmags, _np.nan)
+        # NOTE: dipole coefficients assume _BETA_APPROXIMATION.
+        self._dip_e2b = _np.ones(nrmags)
+        self._dip_b2e = _np.ones(nrmags)
+        self._dip_ang = _np.ones(nrmags)
+        for i, norm in enumerate(self._normalizers):
+            self._sign[i] = norm._magnet_conv_sign
+            self._coef_def2edb[i] = norm._coef_def2edb
+            self._coef_edb2def[i] = 1.0 / norm._coef_def2edb
+            if norm._brho is not None:
+                self._brho_default[i] = norm._brho
+            if isinstance(norm, DipoleNormalizer):
+                self._isdip[i] = True
+                self._dip_e2b[i] = norm._ref_energy / norm._ref_brho
+                self._dip_b2e[i] = \
+                    -norm._ref_angle * (norm._ref_brho / norm._ref_energy)
+                self._dip_ang[i] = norm._ref_angle
+            elif isinstance(norm, TrimNormalizer):
+                self._istrim[i] = True
+
+    def _get_brho(self, strengths_dipole, shape):
+        if strengths_dipole is None:
+            if _np.isnan(self._brho_default[~self._isdip]).any():
+                raise ValueError(BatchNormalizer._BRHO_ERR)
+            return _np.broadcast_to(self._brho_default, shape)
+        energies = _np.broadcast_to(
+            _np.asarray(strengths_dipole, dtype=float), shape)
+        # rigidities are calculated once for each distinct dipole strength
+        # with the same scalar code path used by individual normalizers.
+        values, inverse = _np.unique(energies, return_inverse=True)
+        brhos = _np.array([_util.beam_rigidity(val)[0] for val in values])
+        return brhos[inverse].reshape(shape)
+
+    def _get_strengths_family(self, strengths_family, shape):
+        if strengths_family is None:
+            if self._istrim.any():
+                raise ValueError("Missing input 'strengths_family'.")
+            return _np.zeros(shape)
+        sfam = _np.broadcast_to(
+            _np.asarray(strengths_family, dtype=float), shape)
+        return _np.where(self._istrim, sfam, 0.0)
+
+    @staticmethod
+    def _interpolate(xvals, xtab, ytab, size):
+        """Interpolate each column of xvals in corresponding table row.
+
+        Reproduces magnet.util.linear_interpolation, that is, numpy.interp
+        within tables and linear extrapolation outside them.
+        """
+        rows = _np.arange(xtab.shape[0])
+        last = size - 1
+        idx = (xvals[..., None] >= xtab).sum(axis=-1) - 1
+        jdx = _np.clip(idx, 0, last - 1)
+        x1, x2 = xtab[rows, jdx], xtab[rows, jdx + 1]
+        y1, y2 = ytab[rows, jdx], ytab[rows, jdx + 1]
+        xfst, xsnd = xtab[:, 0], xtab[:, 1]
+        yfst, ysnd = ytab[:, 0], ytab[:, 1]
+        xlst, xpen = xtab[rows, last], xtab[rows, last - 1]
+        ylst, ypen = ytab[rows, last], ytab[rows, last - 1]
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            interp = (y2 - y1) / (x2 - x1) * (xvals - x1) + y1
+            interp = _np.where(xvals == x1, y1, interp)
+            interp = _np.where(idx == last, ylst, interp)
+            left = yfst + (ysnd - yfst) * (xvals - xfst) / (xsnd - xfst)
+            left = _np.where(
+                xsnd != xfst, left,
+                _np.where(abs(yfst) <= abs(ysnd), yfst, ysnd))
+            right = ylst + (ypen - ylst) * (xvals - xlst) / (xpen - xlst)
+            right = _np.where(
+                xpen != xlst, right,
+                _np.where(abs(ylst) <= abs(ypen), ylst, ypen))
+        interp = _np.where(idx < 0, left, interp)
+        interp = _np.where(xvals > xlst, right, interp)
+        return interp
@@ -2,6 +2,7 @@
 
 import types as _types
 import re as _re
+from functools import lru_cache as _lru_cache
 
 
 _ATTRS = (
@@ -22,6 +23,10 @@ _ATTRS = (
 )
 
 
+# maximum number of distinct names with cached split attributes
+_NAMES_CACHE_SIZE = 2**16
+
+
 def get_siriuspvname_attrs():
     """Return SiriusPVName attributes."""
     return [attr for attr in _ATTRS]
@@ -178,6 +183,28 @@ def split_name(pvname, elements=None):
     return dic_
 
 
+@_lru_cache(maxsize=_NAMES_CACHE_SIZE)
+def _get_siriuspvname_dict(pv_name, elements=None):
+    """Return attributes of SiriusPVName objects, cached by name."""
+    name = split_name(pv_name, elements)
+    return {
+        'channel_type': name['channel_type'],
+        'prefix': name['prefix'],
+        'sec': name['sec'],
+        'sub': name['sub'],
+        'area_name': name['area_name'],
+        'dis': name['dis'],
+        'dev': name['dev'],
+        'idx': name['idx'],
+        '_device_name': name['device_name'],
+        'propty_name': name['propty_name'],
+        'propty_suffix': name['propty_suffix'],
+        'propty': name['propty'],
+        'device_propty': name['device_propty'],
+        'field': name['field'],
+        }
+
+
 def get_pair_sprb(pv_propty):
     """Return the equivalent [setpoint, readback] SiriusPVName property pair.
 
@@ -202,22 +229,9 @@ class SiriusPVName(str):
 
     def __new__(cls, pv_name, elements=None):
         """Implement new method."""
-        name = split_name(pv_name, elements)
         obj = super().__new__(cls, pv_name)
-        obj.channel_type = name['channel_type']
-        obj.prefix = name['prefix']
-        obj.sec = name['sec']
-        obj.sub = name['sub']
-        obj.area_name = name['area_name']
-        obj.dis = name['dis']
-        obj.dev = name['dev']
-        obj.idx = name['idx']
-        obj._device_name = name['device_name']
-        obj.propty_name = name['propty_name']
-        obj.propty_suffix = name['propty_suffix']
-        obj.propty = name['propty']
-        obj.device_propty = name['device_propty']
-        obj.field = name['field']
+        # names are split only once, attributes are copied from cache.
+        obj.__dict__.update(_get_siriuspvname_dict(str(pv_name), elements))
         return obj
 
     @property
@@ -478,32 +492,120 @@ class Filter:
         fs = []
         for fil in filters:
             if 'sec' not in fil or fil['sec'] is None:
-                fil['sec'] = '[A-Z]{2,4}'
+                fil['sec'] = _NameIndex.DEFAULTS['sec']
             if 'sub' not in fil or fil['sub'] is None:
-                fil['sub'] = '\w{2,16}'
+                fil['sub'] = _NameIndex.DEFAULTS['sub']
             if 'dis' not in fil or fil['dis'] is None:
-                fil['dis'] = '[A-Z]{2,6}'
+                fil['dis'] = _NameIndex.DEFAULTS['dis']
             if 'dev' not in fil or fil['dev'] is None:
-                fil['dev'] = '.+'
-            pattern = (fil['sec'] + '-' + fil['sub'] + ':' +
-                       fil['dis'] + '-' + fil['dev'])
-            if 'idx' in fil:
-                pattern += '-' + fil['idx']
-            if 'propty_name' in fil:
-                pattern += fil['propty_name']
-            regexp = _re.compile(pattern)
-            fs.append(regexp)
-
-        # filter list
-        filtered_list = list()
-        for pvname in pvnames:
-            for pattern in fs:
-                if pattern.match(pvname):
-                    filtered_list.append(pvname)
-                    break
+                fil['dev'] = _NameIndex.DEFAULTS['dev']
+            fs.append(tuple(
+                fil.get(key) for key in _NameIndex.FILTER_KEYS))
+
+        # filter list, with index of names and results cached. names equal
+        # to the ones of the index may have other types, like SiriusPVName
+        # and str, so the returned names are taken from pvnames.
+        pvnames = list(pvnames)
+        index = _get_name_index(tuple(pvnames))
+        filtered_list = [pvnames[i] for i in index.process_filters(tuple(fs))]
 
         if sorting is None:
             sorted_filtered_list = filtered_list
         elif sorting == 'length':
             raise NotImplementedError
         return sorted_filtered_list
+
+
+class _NameIndex:
+    """Columnar index of names, with their sec, sub, dis, dev and idx.
+
+    Filters are evaluated once for each index, their results are cached.
+    Names are preselected using the name parts of the index when the
+    filter patterns of these parts are literals, the patterns are then
+    only matched against the preselected names.
+    """
+
+    COLUMNS = ('sec', 'sub', 'dis', 'dev', 'idx')
+    FILTER_KEYS = ('sec', 'sub', 'dis', 'dev', 'idx', 'propty_name')
+    DEFAULTS = {
+        'sec': '[A-Z]{2,4}',
+        'sub': '\\w{2,16}',
+        'dis': '[A-Z]{2,6}',
+        'dev': '.+',
+    }
+    _LITERAL = _re.compile('\\w+')
+
+    def __init__(self, names):
+        self.names = tuple(str(name) for name in names)
+        self.columns = {col: [] for col in _NameIndex.COLUMNS}
+        # names that can not be preselected by their parts
+        self.others = set()
+        for i, name in enumerate(self.names):
+            attrs = _get_siriuspvname_dict(name, None)
+            for col, values in self.columns.items():
+                values.append(attrs[col])
+            devname = '{sec}-{sub}:{dis}-{dev}'.format(**attrs)
+            if attrs['prefix'] or attrs['channel_type'] or \
+                    not name.startswith(devname):
+                self.others.add(i)
+        # indices of names by value of each part
+        self.inverted = {col: dict() for col in _NameIndex.COLUMNS}
+        for col, values in self.columns.items():
+            for i, value in enumerate(values):
+                self.inverted[col].setdefault(value, []).append(i)
+        self._results = dict()
+
+    def process_filters(self, filters):
+        """Return indices of names matching any filter, in order."""
+        idcs = self._results.get(filters)
+        if idcs is None:
+            idcs = set()
+            for fil in filters:
+                idcs.update(self._match(fil))
+            idcs = sorted(idcs)
+            self._results[filters] = idcs
+        return idcs
+
+    def _match(self, fil):
+        sec, sub, dis, dev, idx, propty_name = fil
+        pattern = sec + '-' + sub + ':' + dis + '-' + dev
+        if idx is not None:
+            pattern += '-' + idx
+        if propty_name is not None:
+            pattern += propty_name
+        regexp = _compile(pattern)
+        names = self.names
+        return [i for i in self._preselect(fil) if regexp.match(names[i])]
+
+    def _preselect(self, fil):
+        # sec, sub and dis parts of names in the index do not contain
+        # separators, so a name matches a literal pattern of one of these
+        # parts only if its part is equal to it, as long as the patterns
+        # of previous parts do not match separators either, and the dev
+        # part of the name must start with a literal dev pattern.
+        cands = None
+        for col, pat in zip(('sec', 'sub', 'dis', 'dev'), fil):
+            if self._LITERAL.fullmatch(pat):
+                inverted = self.inverted[col]
+                if col == 'dev':
+                    sel = {
+                        i for value, idcs in inverted.items()
+                        if value.startswith(pat) for i in idcs}
+                else:
+                    sel = set(inverted.get(pat, ()))
+                cands = sel if cands is None else cands & sel
+            elif pat != _NameIndex.DEFAULTS[col]:
+                break
+        if cands is None:
+            return range(len(self.names))
+        return sorted(cands | self.others)
+
+
+@_lru_cache(maxsize=64)
+def _get_name_index(names):
+    return _NameIndex(names)
+
+
+@_lru_cache(maxsize=1024)
+def _compile(pattern):
+    return _re.compile(pattern)
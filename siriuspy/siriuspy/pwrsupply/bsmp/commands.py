@@ -153,6 +153,13 @@ class PSBSMP(_BSMP):
 
         return response
 
+    @staticmethod
+    def read_group_of_variables_batch(
+            bsmps, group_id, timeout=_timeout_read_group_of_variables):
+        """."""
+        return _BSMP.read_group_of_variables_batch(
+            bsmps, group_id=group_id, timeout=timeout)
+
     def query_list_of_group_of_variables(
             self, timeout=_timeout_query_list_of_group_of_variables):
         """."""
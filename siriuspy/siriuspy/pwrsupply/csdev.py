@@ -27,6 +27,11 @@ DEFAULT_WFM_FBP = _np.zeros(DEF_WFMSIZE_FBP, dtype=float)
 # --- SOFBCurrent ---
 PSSOFB_MAX_NR_UDC = 2
 
+# --- PRUController statistics ---
+PRUC_STATS_SERIES_SIZE = 100
+PRUC_ROUNDTRIP_HIST_EDGES = (
+    0.5, 1.0, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 50.0, 100.0)  # [ms]
+
 # --- SigGen ---
 DEFAULT_SIGGEN_CONFIG = _DEF_SIGG_CONF
 
@@ -1046,6 +1051,21 @@ def _get_ps_common_propty_database():
                                  'unit': 'count',
                                  'low': -1, 'lolo': -1,
                                  'high': 50, 'hihi': 50},
+        'PRUCtrlQueueSizeSeries-Mon': {
+            'type': 'int', 'count': PRUC_STATS_SERIES_SIZE,
+            'value': [0, ] * PRUC_STATS_SERIES_SIZE, 'unit': 'count'},
+        'PRUCtrlScanOverruns-Mon': {'type': 'int', 'value': 0,
+                                    'unit': 'count'},
+        'PRUCtrlScanLatencyP50-Mon': {'type': 'float', 'value': 0.0,
+                                      'prec': 3, 'unit': 'ms'},
+        'PRUCtrlScanLatencyP99-Mon': {'type': 'float', 'value': 0.0,
+                                      'prec': 3, 'unit': 'ms'},
+        'PRUCtrlScanLatencyMax-Mon': {'type': 'float', 'value': 0.0,
+                                      'prec': 3, 'unit': 'ms'},
+        'PRUCtrlRoundTripHist-Mon': {
+            'type': 'int', 'count': len(PRUC_ROUNDTRIP_HIST_EDGES) + 1,
+            'value': [0, ] * (len(PRUC_ROUNDTRIP_HIST_EDGES) + 1),
+            'unit': 'count'},
         # Interlocks
         'IntlkSoft-Mon': {'type': 'int', 'value': 0, 'unit': 'interlock'},
         'IntlkHard-Mon': {'type': 'int', 'value': 0, 'unit': 'interlock'},
@@ -1,7 +1,8 @@
 """Module implementing PRU elements."""
 import time as _time
 
-from siriuspy.bsmp import IOInterface as _IOInterface
+from siriuspy.bsmp import IOInterface as _IOInterface, \
+    bytes_to_stream as _bytes_to_stream, stream_to_bytes as _stream_to_bytes
 
 from ... import csdev as _csdev
 
@@ -9,11 +10,15 @@ from ... import csdev as _csdev
 class PRUInterface(_IOInterface):
     """Interface class for programmable real-time units."""
 
+    # streams exchanged with BSMP channels are bytes-like objects.
+    BYTES_STREAM = True
+
     def __init__(self):
         """Init method."""
         self._timestamp_write = _time.time()
         self._timestamp_read = self._timestamp_write
         self._wr_duration = 0.0
+        self._roundtrip_stats = None
 
     # --- public interface ---
 
@@ -34,6 +39,16 @@ class PRUInterface(_IOInterface):
         """Reset write/read accumulated duration."""
         self._wr_duration = 0.0
 
+    @property
+    def roundtrip_stats(self):
+        """Return RoundTripStats object recording requests, if any."""
+        return self._roundtrip_stats
+
+    @roundtrip_stats.setter
+    def roundtrip_stats(self, value):
+        """Set RoundTripStats object recording requests."""
+        self._roundtrip_stats = value
+
     def UART_write(self, stream, timeout):
         """Write stream to serial port."""
         self._timestamp_write = _time.time()
@@ -51,6 +66,9 @@ class PRUInterface(_IOInterface):
         """Write stream to serial port then read."""
         self._timestamp_write = _time.time()
         ret = self._UART_request(stream, timeout=timeout)
+        if self._roundtrip_stats is not None:
+            self._roundtrip_stats.add_stream(
+                stream, _time.time() - self._timestamp_write)
         return ret
 
     # --- pure virtual methods ---
@@ -102,18 +120,18 @@ class PRU(PRUInterface):
 
     def _UART_write(self, stream, timeout):
         # this method send streams through UART to the RS-485 line.
-        ret = self._ethbridge.write(stream, timeout)
+        ret = self._ethbridge.write(_bytes_to_stream(stream), timeout)
         return ret
 
     def _UART_read(self):
         # this method send streams through UART to the RS-485 line.
         value = self._ethbridge.read()
-        return value
+        return _stream_to_bytes(value) if value else value
 
     def _UART_request(self, stream, timeout):
         # this method send streams through UART to the RS-485 line.
-        ret = self._ethbridge.request(stream, timeout)
-        return ret
+        ret = self._ethbridge.request(_bytes_to_stream(stream), timeout)
+        return _stream_to_bytes(ret) if ret else ret
 
     def _close(self):
         # self._ethbridge.close()
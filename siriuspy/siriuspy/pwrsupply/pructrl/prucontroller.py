@@ -14,6 +14,8 @@ from ...bsmp import SerialError as _SerialError
 from ...util import get_timestamp as _get_timestamp
 from ..bsmp.constants import __version__ as _firmware_version_siriuspy, \
     _const_bsmp, ConstPSBSMP as _const_psbsmp
+from .prucstats import RoundTripStats as _RoundTripStats, \
+    ScanStats as _ScanStats
 from .psdevstate import PSDevState as _PSDevState
 from .udc import UDC as _UDC
 
@@ -64,6 +66,12 @@ class PRUController:
         # PRU communication object
         self._pru = pru
 
+        # communication statistics. round trip statistics are shared by all
+        # PRUControllers using the same PRU.
+        if pru.roundtrip_stats is None:
+            pru.roundtrip_stats = _RoundTripStats()
+        self._scan_stats = _ScanStats()
+
         # store power supply model
         self._psmodel = psmodel
 
@@ -96,6 +104,7 @@ class PRUController:
         # starts communications
         self._dev_idx_last_scanned = None
         self._thread_scan = None
+        self._running = False
         if init:
             self.bsmp_init_communication()
 
@@ -135,6 +144,39 @@ class PRUController:
         """Store number of operations currently in the queue."""
         return self._queue.qsize()
 
+    @property
+    def scan_stats(self):
+        """Return scan statistics."""
+        return self._scan_stats
+
+    @property
+    def roundtrip_stats(self):
+        """Return BSMP request round trip statistics."""
+        return self._pru.roundtrip_stats
+
+    def get_stats(self, stat, device_id=None):
+        """Return statistic value.
+
+        Parameters
+        ----------
+        stat : str
+            One of 'scan_overruns', 'scan_latency_p50', 'scan_latency_p99',
+            'scan_latency_max' (latencies in ms), 'queue_length_series' or
+            'roundtrip_hist'.
+        device_id : int, optional
+            BSMP device id, used by 'roundtrip_hist'.
+        """
+        if stat == 'scan_overruns':
+            return self._scan_stats.overruns
+        if stat.startswith('scan_latency_'):
+            percentile = {'p50': 50, 'p99': 99, 'max': 100}[stat[13:]]
+            return self._scan_stats.get_latency_percentiles((percentile, ))[0]
+        if stat == 'queue_length_series':
+            return self._scan_stats.get_queue_length_series()
+        if stat == 'roundtrip_hist':
+            return self._pru.roundtrip_stats.get_histogram(device_id)
+        raise ValueError('Invalid statistic "{}"'.format(stat))
+
     @property
     def params(self):
         """Return PRUController parameters."""
@@ -358,8 +400,8 @@ class PRUController:
             self._queue.put(operation, block=False)
         else:
             # do not append if last operation is the same as last one
-            # operation appended to queue
-            pass
+            # operation appended to queue: previous scan is still pending.
+            self._scan_stats.add_overrun()
 
     def bsmp_init_communication(self):
         """."""
@@ -476,6 +518,9 @@ class PRUController:
             # update timestamp
             self._timestamp_update = _time()
 
+            # sample queue length
+            self._scan_stats.add_queue_length(self._queue.qsize())
+
     def _get_scan_interval(self):
         if self._parms.FREQ_SCAN == 0:
             return 0
@@ -540,6 +585,7 @@ class PRUController:
 
     def bsmp_update(self):
         """."""
+        t0_ = _time()
         try:
             # update variables
             self.bsmp_update_variables()
@@ -554,24 +600,35 @@ class PRUController:
         except _socket_timeout:
             print('!!! {} : socket timeout !!!'.format(_get_timestamp()))
 
+        self._scan_stats.add_latency(_time() - t0_)
+
     def bsmp_update_variables(self, dev_id=None):
         """."""
         if dev_id is None:
-            psupplies = self._psupplies.values()
-        else:
-            psupplies = (self._psupplies[dev_id], )
-
-        for psupply in psupplies:
-            try:
-                t0_ = _time()
-                psupply.update_variables(interval=0.0)
-            except _SerialError as err:
+            # all devices of the UDC are read in a single batch
+            t0_ = _time()
+            errors = _PSDevState.update_variables_batch(
+                self._psupplies.values(), interval=0.0)
+            dt_ = _time() - t0_
+            for err in errors.values():
                 # no serial connection !
-                dt_ = _time() - t0_
                 print(
                     f'!!! {_get_timestamp()}: {err}. '
                     f'it took {dt_*1000:.3f} ms in bsmp_update_variables.'
                 )
+            return
+
+        psupply = self._psupplies[dev_id]
+        try:
+            t0_ = _time()
+            psupply.update_variables(interval=0.0)
+        except _SerialError as err:
+            # no serial connection !
+            dt_ = _time() - t0_
+            print(
+                f'!!! {_get_timestamp()}: {err}. '
+                f'it took {dt_*1000:.3f} ms in bsmp_update_variables.'
+            )
 
     def bsmp_update_wfm(self, device_id):
         """Read curve from devices."""
@@ -0,0 +1,136 @@
+"""PRUController instrumentation.
+
+Statistics collected while PRUControllers communicate with power supply
+controllers, cheap enough to be always enabled in production IOCs.
+"""
+
+from bisect import bisect_right as _bisect_right
+from threading import Lock as _Lock
+
+import numpy as _np
+
+from ..csdev import PRUC_ROUNDTRIP_HIST_EDGES as _HIST_EDGES, \
+    PRUC_STATS_SERIES_SIZE as _SERIES_SIZE
+
+
+class RoundTripStats:
+    """Histograms of BSMP request round trip times.
+
+    One histogram is kept for each (device id, BSMP command) pair. Bin
+    edges are PRUC_ROUNDTRIP_HIST_EDGES, in ms; the first bin counts
+    round trips shorter than the first edge and the last one those
+    longer than the last edge.
+    """
+
+    EDGES = _HIST_EDGES  # [ms]
+
+    def __init__(self):
+        """Init."""
+        self._hists = dict()
+
+    @property
+    def keys(self):
+        """Return (device id, command) pairs with recorded round trips."""
+        return tuple(self._hists.keys())
+
+    def add(self, device_id, cmd, duration):
+        """Add round trip duration [s] of a command sent to a device."""
+        key = (device_id, cmd)
+        hist = self._hists.get(key)
+        if hist is None:
+            hist = _np.zeros(len(self.EDGES) + 1, dtype=int)
+            self._hists[key] = hist
+        hist[_bisect_right(self.EDGES, 1000*duration)] += 1
+
+    def add_stream(self, stream, duration):
+        """Add round trip duration [s] of a BSMP package stream."""
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            device_id, cmd = stream[0], stream[1]
+        else:
+            device_id, cmd = ord(stream[0]), ord(stream[1])
+        self.add(device_id, cmd, duration)
+
+    def get_histogram(self, device_id, cmd=None):
+        """Return round trip histogram of device.
+
+        If cmd is None histograms of all commands are summed up.
+        """
+        hist = _np.zeros(len(self.EDGES) + 1, dtype=int)
+        for (dev_id, cmd_), hist_ in tuple(self._hists.items()):
+            if dev_id == device_id and cmd in (None, cmd_):
+                hist += hist_
+        return hist
+
+    def reset(self):
+        """Reset histograms."""
+        self._hists = dict()
+
+
+class ScanStats:
+    """Scan statistics of a PRUController.
+
+    Keep the number of scan overruns, that is, scan periods whose update
+    operation could not be queued because the previous one was still
+    pending, the latencies of the last update operations and the queue
+    length sampled at each scan.
+    """
+
+    SERIES_SIZE = _SERIES_SIZE
+
+    def __init__(self):
+        """Init."""
+        self._lock = _Lock()
+        self._overruns = 0
+        self._latencies = _np.zeros(self.SERIES_SIZE)
+        self._latencies_cnt = 0
+        self._queue_lengths = _np.zeros(self.SERIES_SIZE, dtype=int)
+        self._queue_lengths_cnt = 0
+
+    @property
+    def overruns(self):
+        """Return number of scan overruns."""
+        return self._overruns
+
+    def add_overrun(self):
+        """Count scan overrun."""
+        self._overruns += 1
+
+    def add_latency(self, latency):
+        """Add latency [s] of update operation."""
+        with self._lock:
+            idx = self._latencies_cnt % self.SERIES_SIZE
+            self._latencies[idx] = latency
+            self._latencies_cnt += 1
+
+    def add_queue_length(self, length):
+        """Add queue length sample."""
+        with self._lock:
+            idx = self._queue_lengths_cnt % self.SERIES_SIZE
+            self._queue_lengths[idx] = length
+            self._queue_lengths_cnt += 1
+
+    def get_latency_percentiles(self, percentiles=(50, 99, 100)):
+        """Return percentiles [ms] of last update latencies."""
+        with self._lock:
+            cnt = min(self._latencies_cnt, self.SERIES_SIZE)
+            lats = self._latencies[:cnt].copy()
+        if not cnt:
+            return _np.zeros(len(percentiles))
+        return 1000 * _np.percentile(lats, percentiles)
+
+    def get_queue_length_series(self):
+        """Return queue length samples in chronological order."""
+        with self._lock:
+            cnt = self._queue_lengths_cnt
+            series = _np.roll(
+                self._queue_lengths, -(cnt % self.SERIES_SIZE))
+        if cnt < self.SERIES_SIZE:
+            series[:self.SERIES_SIZE - cnt] = 0
+        return series
+
+    def reset(self):
+        """Reset statistics."""
+        with self._lock:
+            self._overruns = 0
+            self._latencies_cnt = 0
+            self._queue_lengths_cnt = 0
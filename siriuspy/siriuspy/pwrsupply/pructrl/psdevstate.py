@@ -190,21 +190,42 @@ class PSDevState:
             group_id = self._psbsmp.CONST.G_ALL
             ack, values = self._psbsmp.read_group_of_variables(
                 group_id=group_id)
-            if ack == self.psbsmp.CONST_BSMP.ACK_OK:
-                # update _variables with data read from device
-                if group_id not in self._groups:
-                    return False
-                var_ids = self._groups[group_id]
-                for var_id, value in zip(var_ids, values):
-                    self._variables[var_id] = value
-                # NOTE: test line for benchmarking
-                # self._variables[27] += 0.001 * (_random.random() - 0.5)
-                # update timestamp
-                self._timestamp_update_variables = now
-            else:
-                return False
+            return self._update_variables_values(group_id, ack, values, now)
         return True
 
+    @staticmethod
+    def update_variables_batch(psupplies, interval=None):
+        """Update all variables of power supplies sharing a PRU.
+
+        Group reads of all power supplies are sent in a single batch.
+        A failure in one power supply does not affect the others. Return
+        a dict with the SerialError of each failed power supply.
+        """
+        if interval is None:
+            interval = PSDevState.DEFAULT_UPDATE_INTERVAL_VARIABLES
+        now = _time.time()
+        psupplies = [
+            psupply for psupply in psupplies if
+            psupply._timestamp_update_variables is None or
+            (now - psupply._timestamp_update_variables) >= interval]
+        if not psupplies:
+            return dict()
+
+        psbsmp = psupplies[0].psbsmp
+        group_id = psbsmp.CONST.G_ALL
+        resps = psbsmp.read_group_of_variables_batch(
+            [psupply.psbsmp for psupply in psupplies], group_id=group_id)
+
+        errors = dict()
+        for psupply, resp in zip(psupplies, resps):
+            if isinstance(resp, _SerialError):
+                psupply._connected = False
+                errors[psupply] = resp
+                continue
+            psupply._connected = True
+            psupply._update_variables_values(group_id, *resp, now)
+        return errors
+
     @_psupply_update_connected
     def update_wfm(self, interval=None):
         """Update wfmref."""
@@ -275,6 +296,20 @@ class PSDevState:
 
     # --- private methods ---
 
+    def _update_variables_values(self, group_id, ack, values, now):
+        if ack == self.psbsmp.CONST_BSMP.ACK_OK:
+            # update _variables with data read from device
+            if group_id not in self._groups:
+                return False
+            var_ids = self._groups[group_id]
+            self._variables.update(zip(var_ids, values))
+            # NOTE: test line for benchmarking
+            # self._variables[27] += 0.001 * (_random.random() - 0.5)
+            # update timestamp
+            self._timestamp_update_variables = now
+            return True
+        return False
+
     @staticmethod
     def _init_groups():
         # NOTE: template to be expanded, if necessary.
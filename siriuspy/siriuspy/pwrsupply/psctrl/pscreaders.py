@@ -123,6 +123,20 @@ class PRUCProperty:
         return getattr(self.pru_controller, self.property)
 
 
+class PRUCStats:
+    """Read a PRU controller statistic."""
+
+    def __init__(self, pru_controller, device_id, stat):
+        """Init properties."""
+        self.pru_controller = pru_controller
+        self.device_id = device_id
+        self.stat = stat
+
+    def read(self):
+        """Read statistic."""
+        return self.pru_controller.get_stats(self.stat, self.device_id)
+
+
 class PwrState:
     """Variable decorator."""
 
@@ -53,6 +53,15 @@ class _PSModel:
         # Epics to PRUController property
         'PRUCtrlQueueSize-Mon': 'queue_length',
         }
+    _e2s = {
+        # Epics to PRUController statistic
+        'PRUCtrlQueueSizeSeries-Mon': 'queue_length_series',
+        'PRUCtrlScanOverruns-Mon': 'scan_overruns',
+        'PRUCtrlScanLatencyP50-Mon': 'scan_latency_p50',
+        'PRUCtrlScanLatencyP99-Mon': 'scan_latency_p99',
+        'PRUCtrlScanLatencyMax-Mon': 'scan_latency_max',
+        'PRUCtrlRoundTripHist-Mon': 'roundtrip_hist',
+        }
     _e2o = {
         # Epics to reader object;
         'TimestampUpdate-Mon': _readers.TimestampUpdate,
@@ -205,6 +214,9 @@ class _PSModel:
         if epics_field in self._e2c:
             attr = self._e2c[epics_field]
             return _readers.PRUCProperty(pru_controller, attr)
+        if epics_field in self._e2s:
+            stat = self._e2s[epics_field]
+            return _readers.PRUCStats(pru_controller, device_id, stat)
         if epics_field in self._e2o:
             reader = self._e2o[epics_field]
             return reader(pru_controller, device_id)
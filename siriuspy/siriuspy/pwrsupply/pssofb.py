@@ -1,7 +1,7 @@
 """PSSOFB class."""
 from copy import deepcopy as _dcopy
-from collections.abc import Iterable
 import logging as _log
+import time as _time
 import multiprocessing as _mp
 from multiprocessing import sharedctypes as _shm
 
@@ -15,6 +15,7 @@ from ..search import IDSearch as _IDSearch
 from ..bsmp import SerialError as _SerialError
 from ..bsmp import constants as _const_bsmp
 from ..devices import StrengthConv as _StrengthConv
+from ..magnet.normalizer import BatchNormalizer as _BatchNormalizer
 from ..epics import CAProcessSpawn as _Process
 
 from .bsmp.constants import ConstFBP as _const_fbp
@@ -98,6 +99,7 @@ class UnitConverter:
         self.psnames = psnames
         self._dipoleoff = dipoleoff
         self._pstype_2_index, self._pstype_2_sconv = self._init_strenconv()
+        self._normalizer = self._init_normalizer()
 
     def _init_strenconv(self):
         # 1. create pstype to StrengthConv dictionary.
@@ -126,40 +128,48 @@ class UnitConverter:
 
         return pstype_2_index, pstype_2_sconv
 
+    def _init_normalizer(self):
+        # correctors of the same pstype share the normalizer of their
+        # StrengthConv object.
+        normalizers = [None] * len(self.psnames)
+        for pstype, index in self._pstype_2_index.items():
+            norm = self._pstype_2_sconv[pstype].normalizer
+            for idx in index:
+                normalizers[idx] = norm
+        return _BatchNormalizer(normalizers)
+
+    def _get_kwargs(self):
+        # NOTE: strengths of pstypes whose dipole or family strengths are
+        # not available are converted to NaN.
+        if self._dipoleoff:
+            stren_dip = _np.full(len(self.psnames), 3.0)
+        else:
+            stren_dip = _np.full(len(self.psnames), _np.nan)
+        stren_fam = _np.zeros(len(self.psnames))
+        for pstype, index in self._pstype_2_index.items():
+            sconv = self._pstype_2_sconv[pstype]
+            if not self._dipoleoff and sconv.dipole_strength is not None:
+                stren_dip[index] = sconv.dipole_strength
+            if sconv.family_strength is not None:
+                stren_fam[index] = sconv.family_strength
+        return {'strengths_dipole': stren_dip, 'strengths_family': stren_fam}
+
     def conv_curr2stren(self, current):
         """."""
         # benchmarks:
         # 0.163 ms (normalizer)
         # 0.277 ms (sconv)
-        strength = _np.zeros(len(current))
-        for pstype, index in self._pstype_2_index.items():
-            sconv = self._pstype_2_sconv[pstype]
-            value = current[index]
-            if self._dipoleoff:
-                stren = sconv.conv_current_2_strength(
-                    currents=value, strengths_dipole=3.0)
-            else:
-                stren = sconv.conv_current_2_strength(currents=value)
-
-            strength[index] = stren
-        return strength
+        # all correctors are converted at once by a batch normalizer.
+        return self._normalizer.conv_current_2_strength(
+            current, **self._get_kwargs())
 
     def conv_stren2curr(self, strength):
         """."""
         # benchmarks:
         # 0.112 ms (normalizer)
         # 0.189 ms (sconv)
-        current = _np.full(len(strength), _np.nan, dtype=float)
-        for pstype, index in self._pstype_2_index.items():
-            sconv = self._pstype_2_sconv[pstype]
-            value = strength[index]
-            if self._dipoleoff:
-                curr = sconv.conv_strength_2_current(
-                    strengths=value, strengths_dipole=3.0)
-            else:
-                curr = sconv.conv_strength_2_current(strengths=value)
-            current[index] = curr
-        return current
+        return self._normalizer.conv_strength_2_current(
+            strength, **self._get_kwargs())
 
 
 class PSConnSOFB:
@@ -264,7 +274,8 @@ class PSConnSOFB:
 
     def bsmp_sofb_current_set_update(self, current):
         """Send current sofb setpoint to power supplies and update."""
-        self._parallel_execution(self._bsmp_current_setpoint_update, current)
+        self._parallel_execution(
+            self._bsmp_current_setpoint_update, (current, ))
 
     def bsmp_sofb_kick_set_update(self, kick):
         """Send kick sofb setpoint to power supplies and update."""
@@ -706,6 +717,26 @@ class PSSOFB:
         )
     BBB2DEVS = dict()
 
+    # Commands are sent to the worker processes through a ring buffer in
+    # shared memory. Each slot holds the command index in COMMANDS and the
+    # index of the setpoint buffer used by the command (-1 if not used).
+    CMD_RING_SIZE = 16
+    CMD_SHUTDOWN = -1
+    # time for worker processes to execute commands before they are
+    # considered hung [s] and interval of checks of their liveness [s].
+    WAIT_TIMEOUT = 10
+    ALIVE_CHECK_INTERVAL = 0.5
+    COMMANDS = (
+        'bsmp_sofb_current_set',
+        'bsmp_sofb_current_set_update',
+        'bsmp_update_sofb',
+        'bsmp_update_state',
+        'bsmp_pwrstate_on',
+        'bsmp_pwrstate_off',
+        'bsmp_slowref',
+        'bsmp_slowrefsync',
+        )
+
     def __init__(
             self, ethbridgeclnt_class, nr_procs=8, asynchronous=False,
             sofb_update_iocs=False, dipoleoff=False):
@@ -714,6 +745,7 @@ class PSSOFB:
         self._acc = 'SI'
         self._async = asynchronous
         self._sofb_update_iocs = sofb_update_iocs
+        self.wait_timeout = PSSOFB.WAIT_TIMEOUT
 
         self._sofb_psnames = \
             PSNamesSOFB.get_psnames_ch(self._acc) + \
@@ -734,8 +766,18 @@ class PSSOFB:
         self._ethbridge_cls = ethbridgeclnt_class
         self._nr_procs = nr_procs
         self._doneevts = []
+        self._cmdevts = []
         self._procs = []
-        self._pipes = []
+
+        # shared memory command ring, sequence counters and setpoints:
+        # _cmd_cnts[0] is the number of commands posted and
+        # _cmd_cnts[1+i] the number of commands executed by process i.
+        self._cmd_ring = None
+        self._cmd_cnts = None
+        self._cmd_seq = 0
+        self._setpoints = None
+        self._setpoint_idx = 0
+        self._setpoint_seq = [0, 0]
 
     # --- General class properties ---
 
@@ -749,17 +791,23 @@ class PSSOFB:
         self._async = bool(val)
 
     def wait(self, timeout=None):
-        """."""
-        for i, doneevt in enumerate(self._doneevts):
-            if not doneevt.wait(timeout=timeout):
-                _log.error('Wait Done timed out for process '+str(i))
+        """Wait processes to execute all posted commands.
+
+        Return False if timeout expires or if some process is dead.
+        """
+        for i, proc in enumerate(self._procs):
+            if not self._wait_process(i, self._cmd_seq, timeout=timeout):
+                if proc.is_alive():
+                    _log.error('Wait Done timed out for process '+str(i))
+                else:
+                    _log.error('Wait Done: process '+str(i)+' is dead')
                 return False
         return True
 
     def is_ready(self):
         """."""
-        for i, doneevt in enumerate(self._doneevts):
-            if not doneevt.is_set():
+        for i in range(len(self._procs)):
+            if self._cmd_cnts[1+i] < self._cmd_seq:
                 _log.error('Ready: not done for process '+str(i))
                 return False
         return True
@@ -786,6 +834,22 @@ class PSSOFB:
         self._sofb_func_return = _np.ndarray(
             arr.shape, dtype=_np.int32, buffer=memoryview(fret))
 
+        # double buffered setpoints:
+        setp = _shm.Array(_shm.ctypes.c_double, 2*arr.size, lock=False)
+        self._setpoints = _np.ndarray(
+            (2, ) + arr.shape, dtype=float, buffer=memoryview(setp))
+        self._setpoints = [self._setpoints[0], self._setpoints[1]]
+
+        # command ring and sequence counters:
+        cmds = _shm.Array(
+            _shm.ctypes.c_int64, 2*PSSOFB.CMD_RING_SIZE, lock=False)
+        self._cmd_ring = _np.ndarray(
+            (PSSOFB.CMD_RING_SIZE, 2), dtype=_np.int64,
+            buffer=memoryview(cmds))
+        cnts = _shm.Array(_shm.ctypes.c_int64, 1+self._nr_procs, lock=False)
+        self._cmd_cnts = _np.ndarray(
+            1+self._nr_procs, dtype=_np.int64, buffer=memoryview(cnts))
+
         # Unit converter.
         self.converter = UnitConverter(
             self._sofb_psnames, dipoleoff=self._dipoleoff)
@@ -801,31 +865,56 @@ class PSSOFB:
             # context, otherwise it will fail for 'spawn' start method.
             doneevt = spw.Event()
             doneevt.set()
-            theirs, mine = spw.Pipe(duplex=False)
+            cmdevt = spw.Event()
             proc = _Process(
-                target=PSSOFB._run_process,
-                args=(self._ethbridge_cls, bbbnames, theirs, doneevt,
-                      arr.shape, rbref, ref, fret, self._sofb_update_iocs,
-                      self._dipoleoff),
+                target=type(self)._run_process,
+                args=(self._ethbridge_cls, bbbnames, i, cmdevt, doneevt,
+                      arr.shape, rbref, ref, fret, setp, cmds, cnts,
+                      self._sofb_update_iocs, self._dipoleoff),
                 daemon=True)
             proc.start()
             self._procs.append(proc)
             self._doneevts.append(doneevt)
-            self._pipes.append(mine)
+            self._cmdevts.append(cmdevt)
 
     def processes_shutdown(self):
         """."""
-        for pipe in self._pipes:
-            pipe.send(None)
-            pipe.close()
+        if self._procs:
+            try:
+                self._post_command(PSSOFB.CMD_SHUTDOWN)
+            except (TimeoutError, RuntimeError):
+                # error already logged; processes are terminated below.
+                pass
         for proc in self._procs:
-            proc.join()
+            proc.join(timeout=self.wait_timeout)
+            if proc.is_alive():
+                _log.error('Shutdown: terminating process '+proc.name)
+                proc.terminate()
+                proc.join()
+        self._procs, self._doneevts, self._cmdevts = [], [], []
+
+    def get_setpoint_buffer(self):
+        """Return shared memory buffer for next current setpoint.
+
+        The buffer can be filled in place and passed to
+        bsmp_sofb_current_set or bsmp_sofb_current_set_update, which will
+        then not copy it. This method blocks until the worker processes
+        are done with the commands which used this buffer previously.
+
+        Raises TimeoutError if processes do not execute these commands
+        within wait_timeout and RuntimeError if some process is dead.
+        """
+        if self._setpoints is None:
+            return _np.zeros(len(self._sofb_psnames), dtype=float)
+        idx = self._setpoint_idx
+        self._wait_processes(self._setpoint_seq[idx])
+        return self._setpoints[idx]
 
     # --- bspm communication methods ---
 
     def bsmp_sofb_current_set(self, current):
         """Send current sofb setpoint to power supplies."""
-        self._parallel_execution('bsmp_sofb_current_set', (current, ))
+        self._setpoint_execution('bsmp_sofb_current_set', current)
 
     def bsmp_sofb_kick_set(self, kick):
         """Send kick sofb setpoint to power supplies."""
@@ -834,7 +923,7 @@ class PSSOFB:
 
     def bsmp_sofb_current_set_update(self, current):
         """Send current sofb setpoint to power supplies and update."""
-        self._parallel_execution('bsmp_sofb_current_set_update', (current, ))
+        self._setpoint_execution('bsmp_sofb_current_set_update', current)
 
     def bsmp_sofb_kick_set_update(self, kick):
         """Send kick sofb setpoint to power supplies and update."""
@@ -911,41 +1000,135 @@ class PSSOFB:
         """."""
         return self._sofb_psnames.index(psname)
 
-    @staticmethod
+    @classmethod
     def _run_process(
-            ethbridgeclnt_class, bbbnames, pipe, doneevt,
-            shape, rbref, ref, fret, sofb_update_iocs, dipoleoff):
+            cls, ethbridgeclnt_class, bbbnames, index, cmdevt, doneevt,
+            shape, rbref, ref, fret, setp, cmds, cnts,
+            sofb_update_iocs, dipoleoff):
         """."""
         mproc = {
             'rbref': _np.ndarray(shape, dtype=float, buffer=memoryview(rbref)),
             'ref': _np.ndarray(shape, dtype=float, buffer=memoryview(ref)),
             'fret': _np.ndarray(
                 shape, dtype=_np.int32, buffer=memoryview(fret))}
-        psconnsofb = PSConnSOFB(
+        setpoints = _np.ndarray(
+            (2, ) + shape, dtype=float, buffer=memoryview(setp))
+        ring = _np.ndarray(
+            (PSSOFB.CMD_RING_SIZE, 2), dtype=_np.int64,
+            buffer=memoryview(cmds))
+        cnts = _np.ndarray(
+            len(cnts), dtype=_np.int64, buffer=memoryview(cnts))
+        psconnsofb = cls._create_connector(
             ethbridgeclnt_class, bbbnames, mproc=mproc,
             sofb_update_iocs=sofb_update_iocs, dipoleoff=dipoleoff)
+        PSSOFB._process_commands(
+            psconnsofb, index, cmdevt, doneevt, setpoints, ring, cnts)
+        psconnsofb.threads_shutdown()
 
+    @staticmethod
+    def _create_connector(ethbridgeclnt_class, bbbnames, **kwargs):
+        """Create connector used by a process to execute commands."""
+        return PSConnSOFB(ethbridgeclnt_class, bbbnames, **kwargs)
+
+    @staticmethod
+    def _process_commands(
+            psconnsofb, index, cmdevt, doneevt, setpoints, ring, cnts):
+        """Execute commands of the ring until shutdown."""
+        seq = 0
         while True:
-            rec = pipe.recv()
-            if not rec:
+            # NOTE: the event must be cleared before checking the counter
+            # to not lose commands posted in between.
+            cmdevt.clear()
+            if seq >= cnts[0]:
+                cmdevt.wait()
+                continue
+            cmd, bufidx = (int(val) for val in ring[seq % len(ring)])
+            if cmd == PSSOFB.CMD_SHUTDOWN:
                 break
-            meth, args = rec
-            if isinstance(meth, str):
-                if isinstance(args, Iterable):
-                    getattr(psconnsofb, meth)(*args)
-                else:
-                    getattr(psconnsofb, meth)()
+            meth = getattr(psconnsofb, PSSOFB.COMMANDS[cmd])
+            if bufidx >= 0:
+                meth(setpoints[bufidx])
+            else:
+                meth()
+            seq += 1
+            cnts[1+index] = seq
             doneevt.set()
-        psconnsofb.threads_shutdown()
-        pipe.close()
 
     # --- private methods: get properties ---
 
-    def _parallel_execution(self, target_name, args=None):
-        """Execute 'method' in parallel."""
-        for pipe, doneevt in zip(self._pipes, self._doneevts):
+    def _wait_process(self, index, seq, timeout=None):
+        """Wait process to execute commands up to seq.
+
+        Return False if timeout expires or if the process is dead.
+        """
+        doneevt = self._doneevts[index]
+        proc = self._procs[index]
+        tout = None if timeout is None else _time.time() + timeout
+        while True:
+            # NOTE: the event must be cleared before checking the counter
+            # to not lose notifications sent in between.
             doneevt.clear()
-            pipe.send((target_name, args))
+            if self._cmd_cnts[1+index] >= seq:
+                return True
+            if not proc.is_alive():
+                return False
+            dtime = PSSOFB.ALIVE_CHECK_INTERVAL
+            if tout is not None:
+                if tout <= _time.time():
+                    return False
+                dtime = min(dtime, tout - _time.time())
+            doneevt.wait(timeout=dtime)
+
+    def _wait_processes(self, seq):
+        """Wait processes to execute commands up to seq, within timeout."""
+        tout = _time.time() + self.wait_timeout
+        for i, proc in enumerate(self._procs):
+            dtime = max(tout - _time.time(), 0)
+            if self._wait_process(i, seq, timeout=dtime):
+                continue
+            if proc.is_alive():
+                msg = 'Process {} did not execute commands in {} s'.format(
+                    i, self.wait_timeout)
+                _log.error(msg)
+                raise TimeoutError(msg)
+            msg = 'Process {} is dead, with exit code {}'.format(
+                i, proc.exitcode)
+            _log.error(msg)
+            raise RuntimeError(msg)
+
+    def _post_command(self, cmd, bufidx=-1):
+        """Post command in the shared memory ring.
+
+        Raises TimeoutError if no slot of the ring is freed within
+        wait_timeout and RuntimeError if some process is dead.
+        """
+        seq = self._cmd_seq
+        # wait for a free slot in the ring:
+        self._wait_processes(seq + 1 - PSSOFB.CMD_RING_SIZE)
+        self._cmd_ring[seq % PSSOFB.CMD_RING_SIZE] = (cmd, bufidx)
+        # only make the command visible after its slot is filled:
+        self._cmd_seq = seq + 1
+        self._cmd_cnts[0] = self._cmd_seq
+        for cmdevt in self._cmdevts:
+            cmdevt.set()
+
+    def _setpoint_execution(self, target_name, current):
+        """Execute 'method' in parallel with setpoint buffer as argument."""
+        if not self._procs:
+            return
+        idx = self._setpoint_idx
+        buffer = self.get_setpoint_buffer()
+        if current is not buffer:
+            buffer[:] = current
+        self._parallel_execution(target_name, bufidx=idx)
+        self._setpoint_seq[idx] = self._cmd_seq
+        self._setpoint_idx = 1 - idx
+
+    def _parallel_execution(self, target_name, bufidx=-1):
+        """Execute 'method' in parallel."""
+        if not self._procs:
+            return
+        self._post_command(PSSOFB.COMMANDS.index(target_name), bufidx)
 
         if not self._async:
-            self.wait()
+            self.wait(self.wait_timeout)
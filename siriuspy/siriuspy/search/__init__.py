@@ -1,25 +1,44 @@
-"""."""
-
-from .blm_search import BLMSearch
-from .bpms_search import BPMSearch
-from .gamma_monitor_search import GammaMonitorSearch
-from .hl_time_search import HLTimeSearch
-from .id_search import IDSearch
-from .ioc_search import IOCSearch
-from .ll_time_search import LLTimeSearch
-from .ma_search import MASearch
-from .orb_intlk_search import OrbIntlkSearch
-from .ps_search import PSSearch
-from .rabpm_search import RaBPMSearch
-
-del blm_search
-del bpms_search
-del gamma_monitor_search
-del hl_time_search
-del id_search
-del ioc_search
-del ll_time_search
-del ma_search
-del orb_intlk_search
-del ps_search
-del rabpm_search
+"""Search subpackage.
+
+Search classes are only imported on first access (PEP 562).
+"""
+
+import importlib as _importlib
+
+# submodules and the public names they define
+_MODULE2NAMES = {
+    'blm_search': ('BLMSearch',),
+    'bpms_search': ('BPMSearch',),
+    'gamma_monitor_search': ('GammaMonitorSearch',),
+    'hl_time_search': ('HLTimeSearch',),
+    'id_search': ('IDSearch',),
+    'ioc_search': ('IOCSearch',),
+    'll_time_search': ('LLTimeSearch',),
+    'ma_search': ('MASearch',),
+    'orb_intlk_search': ('OrbIntlkSearch',),
+    'ps_search': ('PSSearch',),
+    'rabpm_search': ('RaBPMSearch',),
+}
+_NAME2MODULE = {
+    name: module for module, names in _MODULE2NAMES.items()
+    for name in names}
+
+__all__ = list(_NAME2MODULE)
+
+
+def __getattr__(name):
+    """Import public names and submodules on first access."""
+    if name in _NAME2MODULE:
+        module = _importlib.import_module(
+            '.' + _NAME2MODULE[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _MODULE2NAMES:
+        return _importlib.import_module('.' + name, __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    """Return names of module, including the ones not imported yet."""
+    return sorted(set(globals()) | set(_NAME2MODULE))
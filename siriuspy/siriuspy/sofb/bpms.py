@@ -23,6 +23,7 @@ class BPM(_BaseTimingConfig):
 
         self._name = name
         self._orb_conv_unit = self._csorb.ORBIT_CONVERSION_UNIT
+        self._poly_horner = dict()
         pvpref = LL_PREF + ("-" if LL_PREF else "") + self._name + ":"
         opt = {"connection_timeout": TIMEOUT, "auto_monitor": False}
         self._pvs['poskx'] = _PV(pvpref + "PosKx-RB", **opt)
@@ -622,69 +623,21 @@ class BPM(_BaseTimingConfig):
         if self.put_enable and pvobj.connected:
             pvobj.put(val, wait=False)
 
+    @property
+    def polyx_horner(self):
+        """Horner form of the polynomial calibration of the X plane."""
+        return self._get_poly_horner("x")
+
+    @property
+    def polyy_horner(self):
+        """Horner form of the polynomial calibration of the Y plane."""
+        return self._get_poly_horner("y")
+
     def calc_sp_multiturn_pos(self, **kwargs):
         """."""
-        nturns = kwargs.get("nturns", 1)
-        refx = kwargs.get("refx", 0.0)
-        refy = kwargs.get("refy", 0.0)
-        refsum = kwargs.get("refsum", 0.0)
-        maskbeg = kwargs.get("maskbeg", 0)
-        maskend = kwargs.get("maskend", 0)
-
-        wsize = self.tbtrate
-        maskbeg = min(maskbeg, wsize - 2)
-        maskend = min(maskend, wsize - maskbeg - 2)
-        mask = slice(maskbeg, wsize - maskend)
-
-        # NOTE: I have to invert array B with C here because of the way
-        # the ADCSWAP rate works. Fixed in 2020/07/01 after talking to
-        # Daniel Tavares.
-        vals = {
-            "A": self.arraya,
-            "C": self.arrayb,
-            "B": self.arrayc,
-            "D": self.arrayd,
-        }
-        siz = None
-        for _, val in vals.items():
-            if val is None or val.size == 0:
-                siz = 0
-                break
-            nzrs = val.size
-            siz = nzrs if siz is None else min(siz, nzrs)
-
-        x_cal = _np.full(nturns, refx)
-        y_cal = _np.full(nturns, refy)
-        s_cal = _np.full(nturns, refsum)
-
-        # handle cases where length read is smaller than required.
-        rnts = min(siz // wsize, nturns)
-        if not (siz and rnts):
-            return x_cal, y_cal, s_cal
-
-        for key, val in vals.items():
-            val = val[: (rnts * wsize)]
-            val = val.reshape(-1, wsize)[:, mask]
-            vals[key] = _np.std(val, axis=1)
-
-        sum1, sum2 = vals["A"] + vals["C"], vals["D"] + vals["B"]
-        not_zero = _np.logical_not(_np.isclose(sum1, 0.0))
-        not_zero &= _np.logical_not(_np.isclose(sum2, 0.0))
-        diff1 = (vals["A"][not_zero] - vals["C"][not_zero]) / sum1[not_zero]
-        diff2 = (vals["D"][not_zero] - vals["B"][not_zero]) / sum2[not_zero]
-        x_raw = (diff1 + diff2) / 2
-        y_raw = (diff1 - diff2) / 2
-        if self._config_ok_vals["XYPosCal"] == _CSBPM.DsblEnbl.enabled:
-            x_raw, y_raw = self._apply_polyxy(x_raw, y_raw)
-
-        x_cal[:rnts][not_zero] = x_raw * self.poskx
-        y_cal[:rnts][not_zero] = y_raw * self.posky
-        x_cal[:rnts][not_zero] *= self._orb_conv_unit
-        y_cal[:rnts][not_zero] *= self._orb_conv_unit
-        x_cal[:rnts][not_zero] -= self.offsetx or 0.0
-        y_cal[:rnts][not_zero] -= self.offsety or 0.0
-        s_cal[:rnts] = (sum1 + sum2) * self.ksum
-        return x_cal, y_cal, s_cal
+        return tuple(
+            val[0] for val in calc_sp_multiturn_pos([self], **kwargs)
+        )
 
     def _apply_polyxy(self, x_raw, y_raw):
         """."""
@@ -694,31 +647,15 @@ class BPM(_BaseTimingConfig):
 
     def _calc_poly(self, th1, ot1, plane="x"):
         """."""
-        ot2 = ot1 * ot1
-        ot4 = ot2 * ot2
-        ot6 = ot4 * ot2
-        ot8 = ot4 * ot4
-        th2 = th1 * th1
-        th3 = th2 * th1
-        th5 = th3 * th2
-        th7 = th5 * th2
-        th9 = th7 * th2
-        pol = self.polyx if plane == "x" else self.polyy
+        return calc_poly_horner(self._get_poly_horner(plane), th1, ot1)
 
-        return (
-            th1
-            * (
-                pol[0]
-                + ot2 * pol[1]
-                + ot4 * pol[2]
-                + ot6 * pol[3]
-                + ot8 * pol[4]
-            )
-            + th3 * (pol[5] + ot2 * pol[6] + ot4 * pol[7] + ot6 * pol[8])
-            + th5 * (pol[9] + ot2 * pol[10] + ot4 * pol[11])
-            + th7 * (pol[12] + ot2 * pol[13])
-            + th9 * pol[14]
-        )
+    def _get_poly_horner(self, plane="x"):
+        pol = self.polyx if plane == "x" else self.polyy
+        pol_old, coefs = self._poly_horner.get(plane, (None, None))
+        if pol_old is None or not _np.array_equal(pol, pol_old):
+            coefs = get_poly_horner_coeffs(pol)
+            self._poly_horner[plane] = (_np.array(pol), coefs)
+        return coefs
 
     def _reset_has_news(self, *args, **kwargs):
         _ = args, kwargs
@@ -800,3 +737,164 @@ class TimingConfig(_BaseTimingConfig):
         """."""
         pvobj = self._config_pvs_rb["TotalDelay"]
         return pvobj.value if pvobj.connected else None
+
+
+# Indices of the polynomial coefficients of the BPMs position calibration
+# organized as (power of the plane, power of the other plane):
+_POLY_IDCS = _np.array([
+    [0, 1, 2, 3, 4],
+    [5, 6, 7, 8, -1],
+    [9, 10, 11, -1, -1],
+    [12, 13, -1, -1, -1],
+    [14, -1, -1, -1, -1],
+])
+
+
+def get_poly_horner_coeffs(pol):
+    """Return Horner form of BPMs polynomial calibration coefficients.
+
+    The BPM polynomial calibration is given by:
+
+        p(t, o) = sum_{i, j} C_ij t^(2i+1) o^(2j),  with i + j <= 4,
+
+    where t is the position of the plane being calibrated, o is the
+    position of the other plane and C_ij are the 15 coefficients of pol.
+
+    Args:
+        pol (numpy.ndarray, (..., 15)): polynomial coefficients. Leading
+            dimensions may be used to represent several BPMs.
+
+    Returns:
+        numpy.ndarray, (..., 5, 5): C_ij matrix, with zeros for i + j > 4,
+            to be used in calc_poly_horner.
+
+    """
+    pol = _np.asarray(pol, dtype=float)
+    coefs = pol[..., _POLY_IDCS]
+    coefs[..., _POLY_IDCS < 0] = 0.0
+    return coefs
+
+
+def calc_poly_horner(coefs, th1, ot1):
+    """Evaluate BPMs polynomial calibration using its Horner form.
+
+    Args:
+        coefs (numpy.ndarray, (..., 5, 5)): output of get_poly_horner_coeffs.
+        th1 (numpy.ndarray, (..., N)): position of the calibrated plane.
+        ot1 (numpy.ndarray, (..., N)): position of the other plane.
+
+    Returns:
+        numpy.ndarray, (..., N): calibrated positions.
+
+    """
+    th2 = th1 * th1
+    ot2 = ot1 * ot1
+    res = 0.0
+    for i in range(4, -1, -1):
+        coef = 0.0
+        for j in range(4 - i, -1, -1):
+            coef = coef * ot2 + coefs[..., i, j, None]
+        res = res * th2 + coef
+    return th1 * res
+
+
+def calc_sp_multiturn_pos(bpms, **kwargs):
+    """Calculate single pass positions of several BPMs at once.
+
+    This is a vectorized version of BPM.calc_sp_multiturn_pos: the
+    antennas data of all BPMs are stacked in a (nbpm, 4, nturns, tbtrate)
+    array so that standard deviations, positions and calibrations are
+    calculated in a few numpy calls.
+
+    Args:
+        bpms (list): list of BPM objects.
+        nturns (int, optional): number of turns to calculate. Default 1.
+        refx, refy, refsum (float or numpy.ndarray, (nbpm, ), optional):
+            values used when the position can't be calculated. Default 0.
+        maskbeg, maskend (int, optional): number of samples to ignore in
+            the beginning and end of each turn. Default 0.
+
+    Returns:
+        x_cal (numpy.ndarray, (nbpm, nturns)): horizontal positions.
+        y_cal (numpy.ndarray, (nbpm, nturns)): vertical positions.
+        s_cal (numpy.ndarray, (nbpm, nturns)): sum signals.
+
+    """
+    nbpm = len(bpms)
+    nturns = kwargs.get("nturns", 1)
+    refs = []
+    for key in ("refx", "refy", "refsum"):
+        ref = _np.asarray(kwargs.get(key, 0.0), dtype=float)
+        ref = _np.broadcast_to(ref, (nbpm, ))
+        refs.append(_np.repeat(ref[:, None], nturns, axis=1))
+    x_cal, y_cal, s_cal = refs
+
+    wsizes = _np.array([bpm.tbtrate for bpm in bpms], dtype=int)
+    for wsize in _np.unique(wsizes):
+        idcs = (wsizes == wsize).nonzero()[0]
+        x_cal[idcs], y_cal[idcs], s_cal[idcs] = _calc_sp_multiturn_pos_group(
+            [bpms[i] for i in idcs], wsize, nturns,
+            kwargs.get("maskbeg", 0), kwargs.get("maskend", 0),
+            x_cal[idcs], y_cal[idcs], s_cal[idcs])
+    return x_cal, y_cal, s_cal
+
+
+def _calc_sp_multiturn_pos_group(
+        bpms, wsize, nturns, maskbeg, maskend, x_cal, y_cal, s_cal):
+    """Calculate positions of BPMs with the same TbT rate."""
+    nbpm = len(bpms)
+    maskbeg = min(maskbeg, wsize - 2)
+    maskend = min(maskend, wsize - maskbeg - 2)
+
+    # NOTE: I have to invert array B with C here because of the way
+    # the ADCSWAP rate works. Fixed in 2020/07/01 after talking to
+    # Daniel Tavares.
+    adcs = _np.zeros((nbpm, 4, nturns * wsize), dtype=float)
+    rnts = _np.zeros(nbpm, dtype=int)
+    for i, bpm in enumerate(bpms):
+        vals = (bpm.arraya, bpm.arrayc, bpm.arrayb, bpm.arrayd)
+        if any(val is None or val.size == 0 for val in vals):
+            continue
+        # handle cases where length read is smaller than required.
+        rnts[i] = min(min(val.size for val in vals) // wsize, nturns)
+        siz = rnts[i] * wsize
+        for j, val in enumerate(vals):
+            adcs[i, j, :siz] = val[:siz]
+
+    adcs = adcs.reshape(nbpm, 4, nturns, wsize)[..., maskbeg:wsize - maskend]
+    vala, valb, valc, vald = _np.std(adcs, axis=-1).swapaxes(0, 1)
+
+    sum1, sum2 = vala + valc, vald + valb
+    valid = _np.arange(nturns)[None, :] < rnts[:, None]
+    not_zero = valid & ~_np.isclose(sum1, 0.0) & ~_np.isclose(sum2, 0.0)
+    diff1 = _np.divide(vala - valc, sum1, out=_np.zeros_like(sum1),
+                       where=not_zero)
+    diff2 = _np.divide(vald - valb, sum2, out=_np.zeros_like(sum2),
+                       where=not_zero)
+    x_raw = (diff1 + diff2) / 2
+    y_raw = (diff1 - diff2) / 2
+
+    polcal = _np.array([
+        bpm._config_ok_vals["XYPosCal"] == _CSBPM.DsblEnbl.enabled
+        for bpm in bpms])
+    if polcal.any():
+        bpms_cal = [bpm for bpm, cal in zip(bpms, polcal) if cal]
+        coefx = _np.array([bpm.polyx_horner for bpm in bpms_cal])
+        coefy = _np.array([bpm.polyy_horner for bpm in bpms_cal])
+        xcal, ycal = x_raw[polcal], y_raw[polcal]
+        x_raw[polcal] = calc_poly_horner(coefx, xcal, ycal)
+        y_raw[polcal] = calc_poly_horner(coefy, ycal, xcal)
+
+    poskx = _np.array([bpm.poskx for bpm in bpms], dtype=float)
+    posky = _np.array([bpm.posky for bpm in bpms], dtype=float)
+    ksum = _np.array([bpm.ksum for bpm in bpms], dtype=float)
+    offx = _np.array([bpm.offsetx or 0.0 for bpm in bpms], dtype=float)
+    offy = _np.array([bpm.offsety or 0.0 for bpm in bpms], dtype=float)
+    conv = bpms[0]._orb_conv_unit
+
+    x_pos = x_raw * poskx[:, None] * conv - offx[:, None]
+    y_pos = y_raw * posky[:, None] * conv - offy[:, None]
+    x_cal = _np.where(not_zero, x_pos, x_cal)
+    y_cal = _np.where(not_zero, y_pos, y_cal)
+    s_cal = _np.where(valid, (sum1 + sum2) * ksum[:, None], s_cal)
+    return x_cal, y_cal, s_cal
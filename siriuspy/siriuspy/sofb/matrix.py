@@ -2,6 +2,7 @@
 
 import logging as _log
 import os as _os
+from collections import OrderedDict as _OrderedDict
 from functools import partial as _part
 
 import numpy as _np
@@ -16,6 +17,12 @@ class BaseMatrix(_BaseClass):
 class EpicsMatrix(BaseMatrix):
     """Class of the Response Matrix."""
 
+    # Maximum number of SVD decompositions kept in the cache:
+    SVD_CACHE_SIZE = 10
+    # Maximum number of successive rank-one updates of the SVD before a
+    # full decomposition is calculated again, to avoid loss of accuracy:
+    SVD_MAX_NR_UPDATES = 10
+
     def __init__(self, acc, prefix="", callback=None):
         """Initialize the instance."""
         super().__init__(acc, prefix=prefix, callback=callback)
@@ -43,6 +50,8 @@ class EpicsMatrix(BaseMatrix):
         )
         self.inv_respmat = self.respmat.copy().T
         self.respmat_processed = self.respmat.copy().T
+        self._respmat_hash = hash(self.respmat.tobytes())
+        self._svd_cache = _OrderedDict()
         self._load_respmat()
 
     @property
@@ -108,17 +117,20 @@ class EpicsMatrix(BaseMatrix):
         self._update_log(msg)
         _log.info(msg)
         if mat is None:
-            self.run_callbacks("RespMat-SP", list(self.respmat.ravel()))
+            self.run_callbacks("RespMat-SP", self.respmat.ravel())
             return False
         mat = _np.reshape(mat, [-1, self._csorb.nr_corrs])
         old_ = self.respmat.copy()
+        oldhash = self._respmat_hash
         self.respmat = mat
+        self._respmat_hash = hash(mat.tobytes())
         if not self._calc_matrices():
             self.respmat = old_
-            self.run_callbacks("RespMat-SP", list(self.respmat.ravel()))
+            self._respmat_hash = oldhash
+            self.run_callbacks("RespMat-SP", self.respmat.ravel())
             return False
         self._save_respmat(mat)
-        self.run_callbacks("RespMat-RB", list(self.respmat.ravel()))
+        self.run_callbacks("RespMat-RB", self.respmat.ravel())
         return True
 
     def set_enbllist(self, key, val):
@@ -229,24 +241,9 @@ class EpicsMatrix(BaseMatrix):
         sel_mat = selecbpm[:, None] * seleccor[None, :]
         if sel_mat.size != self.respmat.size:
             return False
-        mat = self.respmat.copy()
-        nr_bpms = self._csorb.nr_bpms
-        nr_ch = self._csorb.nr_ch
-        nr_chcv = self._csorb.nr_chcv
-        if self._respmat_mode != self._csorb.RespMatMode.Full:
-            mat[:nr_bpms, nr_ch:nr_chcv] = 0
-            mat[nr_bpms:, :nr_ch] = 0
-            mat[nr_bpms:, nr_chcv:] = 0
-        if self._respmat_mode == self._csorb.RespMatMode.Mxx:
-            mat[nr_bpms:] = 0
-        elif self._respmat_mode == self._csorb.RespMatMode.Myy:
-            mat[:nr_bpms] = 0
-
-        mat = mat[sel_mat]
-        mat = _np.reshape(mat, [sum(selecbpm), sum(seleccor)])
         try:
-            uuu, sing, vvv = _np.linalg.svd(mat, full_matrices=False)
-        except _np.linalg.LinAlgError():
+            uuu, sing, vvv = self._get_svd(selecbpm, seleccor)
+        except _np.linalg.LinAlgError:
             msg = "ERR: Could not calculate SVD"
             self._update_log(msg)
             _log.error(msg[5:])
@@ -287,15 +284,101 @@ class EpicsMatrix(BaseMatrix):
         self.run_callbacks("NrSingValues-Mon", nr_sv)
         self.inv_respmat = _np.zeros(self.respmat.shape, dtype=float).T
         self.inv_respmat[sel_mat.T] = inv_mat.ravel()
-        self.run_callbacks("InvRespMat-Mon", list(self.inv_respmat.ravel()))
+        self.run_callbacks("InvRespMat-Mon", self.inv_respmat.ravel())
         self.respmat_processed = _np.zeros(self.respmat.shape, dtype=float)
         self.respmat_processed[sel_mat] = _np.dot(uuu * singp, vvv).ravel()
-        self.run_callbacks("RespMat-Mon", list(self.respmat_processed.ravel()))
+        self.run_callbacks("RespMat-Mon", self.respmat_processed.ravel())
         msg = "Ok!"
         self._update_log(msg)
         _log.info(msg)
         return True
 
+    def _get_respmat_mode(self):
+        """Return response matrix with respmat mode applied."""
+        mat = self.respmat.copy()
+        nr_bpms = self._csorb.nr_bpms
+        nr_ch = self._csorb.nr_ch
+        nr_chcv = self._csorb.nr_chcv
+        if self._respmat_mode != self._csorb.RespMatMode.Full:
+            mat[:nr_bpms, nr_ch:nr_chcv] = 0
+            mat[nr_bpms:, :nr_ch] = 0
+            mat[nr_bpms:, nr_chcv:] = 0
+        if self._respmat_mode == self._csorb.RespMatMode.Mxx:
+            mat[nr_bpms:] = 0
+        elif self._respmat_mode == self._csorb.RespMatMode.Myy:
+            mat[:nr_bpms] = 0
+        return mat
+
+    def _get_svd(self, selecbpm, seleccor):
+        """Return SVD of the selected response matrix.
+
+        Decompositions are cached by response matrix, respmat mode and
+        enable lists. When only one BPM or corrector changed in relation
+        to a cached decomposition, the new one is obtained with a rank-one
+        update of the cached one instead of a full SVD.
+        """
+        mask = _np.hstack([selecbpm, seleccor])
+        key = (self._respmat_hash, self._respmat_mode, mask.tobytes())
+        cache = self._svd_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key][:3]
+
+        mat = self._get_respmat_mode()
+        svd = None
+        for okey in reversed(cache):
+            if okey[:2] != key[:2]:
+                continue
+            omask = _np.frombuffer(okey[2], dtype=bool)
+            diff = (omask != mask).nonzero()[0]
+            if diff.size != 1 or cache[okey][3] >= self.SVD_MAX_NR_UPDATES:
+                continue
+            svd = self._update_svd(
+                cache[okey], omask, diff[0], mat, selecbpm.size)
+            break
+
+        if svd is None:
+            mat = mat[selecbpm][:, seleccor]
+            svd = _np.linalg.svd(mat, full_matrices=False) + (0, )
+
+        cache[key] = svd
+        while len(cache) > self.SVD_CACHE_SIZE:
+            cache.popitem(last=False)
+        return svd[:3]
+
+    @staticmethod
+    def _update_svd(svd, omask, idx, mat, nr_bpms):
+        """Update SVD when one BPM or corrector is (de)selected."""
+        uuu, sing, vvv, nr_upd = svd
+        selrow, selcol = omask[:nr_bpms], omask[nr_bpms:]
+        istrans = idx >= nr_bpms
+        if istrans:
+            # use the transpose to treat correctors as BPMs:
+            uuu, vvv, mat = vvv.T, uuu.T, mat.T
+            selrow, selcol = selcol, selrow
+            idx -= nr_bpms
+
+        pos = _np.sum(selrow[:idx])
+        row = mat[idx, selcol]
+        if selrow[idx]:
+            # remove row by zeroing it and then deleting it from U:
+            avec = _np.zeros(uuu.shape[0], dtype=float)
+            avec[pos] = -1
+            uuu, sing, vvv = svd_rank_one_update(uuu, sing, vvv, avec, row)
+            uuu = _np.delete(uuu, pos, axis=0)
+        else:
+            # insert a zero row in U and then set its value:
+            uuu = _np.insert(uuu, pos, 0.0, axis=0)
+            avec = _np.zeros(uuu.shape[0], dtype=float)
+            avec[pos] = 1
+            uuu, sing, vvv = svd_rank_one_update(uuu, sing, vvv, avec, row)
+
+        nsv = min(uuu.shape[0], vvv.shape[1])
+        uuu, sing, vvv = uuu[:, :nsv], sing[:nsv], vvv[:nsv]
+        if istrans:
+            uuu, vvv = vvv.T, uuu.T
+        return uuu, sing, vvv, nr_upd + 1
+
     def _load_respmat(self):
         filename = self._csorb.respmat_fname
         boo = False
@@ -312,3 +395,48 @@ class EpicsMatrix(BaseMatrix):
         path = _os.path.split(self._csorb.respmat_fname)[0]
         _os.makedirs(path, exist_ok=True)
         _np.savetxt(self._csorb.respmat_fname, mat)
+
+
+def svd_rank_one_update(uuu, sing, vvv, avec, bvec):
+    """Return thin SVD of (M + a b^T) given the thin SVD of M.
+
+    Implements the rank-one modification of the SVD described in:
+        M. Brand, "Fast low-rank modifications of the thin singular value
+        decomposition", Linear Algebra and its Applications 415 (2006).
+
+    Args:
+        uuu (numpy.ndarray, (m, k)): left singular vectors of M.
+        sing (numpy.ndarray, (k, )): singular values of M.
+        vvv (numpy.ndarray, (k, n)): right singular vectors of M.
+        avec (numpy.ndarray, (m, )): left vector of the modification.
+        bvec (numpy.ndarray, (n, )): right vector of the modification.
+
+    Returns:
+        uuu (numpy.ndarray, (m, k+1)): new left singular vectors.
+        sing (numpy.ndarray, (k+1, )): new singular values.
+        vvv (numpy.ndarray, (k+1, n)): new right singular vectors.
+
+    """
+    umv = uuu.T @ avec
+    pvec = avec - uuu @ umv
+    pnorm = _np.linalg.norm(pvec)
+    if pnorm > 1e-12 * max(1, _np.linalg.norm(avec)):
+        pvec /= pnorm
+    else:
+        pvec[:], pnorm = 0, 0
+
+    vmv = vvv @ bvec
+    qvec = bvec - vvv.T @ vmv
+    qnorm = _np.linalg.norm(qvec)
+    if qnorm > 1e-12 * max(1, _np.linalg.norm(bvec)):
+        qvec /= qnorm
+    else:
+        qvec[:], qnorm = 0, 0
+
+    kmat = _np.zeros((sing.size + 1, sing.size + 1), dtype=float)
+    kmat[:-1, :-1] = _np.diag(sing)
+    kmat += _np.outer(_np.r_[umv, pnorm], _np.r_[vmv, qnorm])
+    ukk, sing, vkk = _np.linalg.svd(kmat)
+    uuu = _np.hstack([uuu, pvec[:, None]]) @ ukk
+    vvv = vkk @ _np.vstack([vvv, qvec[None, :]])
+    return uuu, sing, vvv
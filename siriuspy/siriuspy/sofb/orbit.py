@@ -14,7 +14,10 @@ from ..diagbeam.bpm.csdev import Const as _CSBPM
 from ..epics import CAThread as _Thread, PV as _PV
 from ..thread import RepeaterThread as _Repeat
 from .base_class import BaseClass as _BaseClass
-from .bpms import BPM, TimingConfig
+from .bpms import (
+    BPM, TimingConfig, calc_sp_multiturn_pos as _calc_sp_multiturn_pos
+)
+from .utils import SmoothBuffer as _SmoothBuffer
 
 
 class BaseOrbit(_BaseClass):
@@ -38,15 +41,15 @@ class EpicsOrbit(BaseOrbit):
             "Y": _np.zeros(self._csorb.nr_bpms),
         }
         self._load_ref_orbs()
-        self.raw_orbs = {"X": [], "Y": []}
-        self.raw_sporbs = {"X": [], "Y": [], "Sum": []}
-        self.raw_mtorbs = {"X": [], "Y": [], "Sum": []}
+        self._smooth_npts = 1
+        self._smooth_meth = self._csorb.SmoothMeth.Average
+        self.raw_orbs = {pln: _SmoothBuffer() for pln in ("X", "Y")}
+        self.raw_sporbs = {pln: _SmoothBuffer() for pln in ("X", "Y", "Sum")}
+        self.raw_mtorbs = {pln: _SmoothBuffer() for pln in ("X", "Y", "Sum")}
         self._lock_raw_orbs = Lock()
         self.smooth_orb = {"X": None, "Y": None}
         self.smooth_sporb = {"X": None, "Y": None, "Sum": None}
         self.smooth_mtorb = {"X": None, "Y": None, "Sum": None}
-        self._smooth_npts = 1
-        self._smooth_meth = self._csorb.SmoothMeth.Average
         self._spass_mask = [0, 0]
         self._spass_average = 1
         self._acqtrignrsamplespre = 0
@@ -66,6 +69,7 @@ class EpicsOrbit(BaseOrbit):
                 auto_monitor=True,
             )
             self._smooth_npts = 20
+        self._config_smooth_buffers()
         self._timestamp_last_news = 0  # [s] timestamp in epoch
         self._last_num_news = 0
         self._orbit_thread = _Repeat(
@@ -226,8 +230,10 @@ class EpicsOrbit(BaseOrbit):
             with self._lock_raw_orbs:
                 isempty = orbs["X"] is None or orbs["Y"] is None
                 if not isempty and len(raws["X"]) >= self._smooth_npts:
+                    # smoothed orbits are views of the buffers, so the
+                    # difference must be taken while holding the lock:
                     orbx, orby = getorb(orbs)
-                    break
+                    return _np.hstack([orbx - refx, orby - refy])
             msg = "DEB: Trying to get: "
             msg += f'empty={str(isempty):s}, smooth={len(raws["X"]):02d}.'
             _log.debug(msg)
@@ -254,13 +260,17 @@ class EpicsOrbit(BaseOrbit):
 
     def set_smooth_npts(self, num):
         """."""
-        self._smooth_npts = num
+        with self._lock_raw_orbs:
+            self._smooth_npts = num
+            self._config_smooth_buffers()
         self.run_callbacks("SmoothNrPts-RB", num)
         return True
 
     def set_smooth_method(self, meth):
         """."""
-        self._smooth_meth = meth
+        with self._lock_raw_orbs:
+            self._smooth_meth = meth
+            self._config_smooth_buffers()
         self.run_callbacks("SmoothMethod-Sts", meth)
         return True
 
@@ -676,20 +686,24 @@ class EpicsOrbit(BaseOrbit):
 
     def _reset_orbs(self):
         """."""
-        raw = self.raw_orbs
-        smt = self.smooth_orb
-        raw["X"], raw["Y"] = [], []
-        smt["X"], smt["Y"] = None, None
-        raw = self.raw_sporbs
-        smt = self.smooth_sporb
-        raw["X"], raw["Y"], raw["Sum"] = [], [], []
-        smt["X"], smt["Y"], smt["Sum"] = None, None, None
-        raw = self.raw_mtorbs
-        smt = self.smooth_mtorb
-        raw["X"], raw["Y"], raw["Sum"] = [], [], []
-        smt["X"], smt["Y"], smt["Sum"] = None, None, None
+        raws = (self.raw_orbs, self.raw_sporbs, self.raw_mtorbs)
+        smts = (self.smooth_orb, self.smooth_sporb, self.smooth_mtorb)
+        for raw, smt in zip(raws, smts):
+            for pln, buf in raw.items():
+                buf.reset()
+                smt[pln] = None
         self.run_callbacks("BufferCount-Mon", 0)
 
+    def _config_smooth_buffers(self):
+        """."""
+        meth = _SmoothBuffer.AVERAGE
+        if self._smooth_meth != self._csorb.SmoothMeth.Average:
+            meth = _SmoothBuffer.MEDIAN
+        for raw in (self.raw_orbs, self.raw_sporbs, self.raw_mtorbs):
+            for buf in raw.values():
+                buf.maxlen = self._smooth_npts
+                buf.method = meth
+
     def _update_orbits(self):
         """."""
         try:
@@ -729,22 +743,17 @@ class EpicsOrbit(BaseOrbit):
 
         for plane in ("X", "Y"):
             with self._lock_raw_orbs:
-                raws = self.raw_orbs
-                raws[plane].append(orbs[plane])
-                raws[plane] = raws[plane][-self._smooth_npts:]
-                if not raws[plane]:
-                    return
-                if self._smooth_meth == self._csorb.SmoothMeth.Average:
-                    orb = _np.mean(raws[plane], axis=0)
-                else:
-                    orb = _np.median(raws[plane], axis=0)
-                self.smooth_orb[plane] = orb
+                raw = self.raw_orbs[plane]
+                raw.append(orbs[plane])
+                self.smooth_orb[plane] = raw.smooth
         self.new_orbit.set()
 
         for plane in ("X", "Y"):
-            orb = self.smooth_orb[plane]
-            if orb is None:
-                return
+            with self._lock_raw_orbs:
+                orb = self.smooth_orb[plane]
+                if orb is None:
+                    return
+                orb = orb.copy()
             dorb = orb - self.ref_orbs[plane]
             self.run_callbacks(f"SlowOrb{plane:s}-Mon", _np.array(orb))
             self.run_callbacks(f"DeltaOrb{plane:s}Avg-Mon", _bn.nanmean(dorb))
@@ -785,7 +794,6 @@ class EpicsOrbit(BaseOrbit):
                 return
             samp *= self._acqtrignrshots
             orbsz = self._csorb.nr_bpms
-            nr_pts = self._smooth_npts
             isdiff = False  # only update orbit if some BPM updated
             for i, bpm in enumerate(self.bpms):
                 if not leng or bpm.has_news:
@@ -797,7 +805,7 @@ class EpicsOrbit(BaseOrbit):
                     )
                     psum = self._get_pos(bpm.mtsum, 0, samp)
                     thisdiff = not leng or not _np.array_equal(
-                        posx, self.raw_mtorbs["X"][-1][:, i]
+                        posx, self.raw_mtorbs["X"].last[:, i]
                     )
                     # if it got here, then for sure the new data will be used
                     # and we can reset the flag:
@@ -805,9 +813,9 @@ class EpicsOrbit(BaseOrbit):
                         bpm.has_news = False
                     isdiff |= thisdiff
                 else:
-                    posx = self.raw_mtorbs["X"][-1][:, i].copy()
-                    posy = self.raw_mtorbs["Y"][-1][:, i].copy()
-                    psum = self.raw_mtorbs["Sum"][-1][:, i].copy()
+                    posx = self.raw_mtorbs["X"].last[:, i].copy()
+                    posy = self.raw_mtorbs["Y"].last[:, i].copy()
+                    psum = self.raw_mtorbs["Sum"].last[:, i].copy()
                 orbs["X"].append(posx)
                 orbs["Y"].append(posy)
                 orbs["Sum"].append(psum)
@@ -821,13 +829,7 @@ class EpicsOrbit(BaseOrbit):
                 norb = _np.array(orbs[pln], dtype=float)  # bpms x turns
                 norb = norb.T.reshape(-1, orbsz)  # turns/rz x rz*bpms
                 raw.append(norb)
-                del raw[:-nr_pts]
-                if not raw:
-                    return
-                if self._smooth_meth == self._csorb.SmoothMeth.Average:
-                    orb = _np.mean(raw, axis=0)
-                else:
-                    orb = _np.median(raw, axis=0)
+                orb = raw.smooth
                 if down > 1:
                     orb = _np.mean(orb.reshape(-1, down, orbsz), axis=1)
                 self.smooth_mtorb[pln] = orb
@@ -835,9 +837,12 @@ class EpicsOrbit(BaseOrbit):
         self._update_multiturn_orbit_pvs()
 
     def _update_multiturn_orbit_pvs(self):
-        for pln, orb in self.smooth_mtorb.items():
-            if orb is None:
-                continue
+        for pln in self.smooth_mtorb:
+            with self._lock_raw_orbs:
+                orb = self.smooth_mtorb[pln]
+                if orb is None:
+                    continue
+                orb = orb.copy()
             idx = min(self._multiturnidx, orb.shape[0])
             name = ("Orb" if pln != "Sum" else "") + pln
             self.run_callbacks("MTurn" + name + "-Mon", orb.ravel())
@@ -878,41 +883,45 @@ class EpicsOrbit(BaseOrbit):
         if not hasnews and not timeout and len(self.raw_sporbs["X"]):
             return
 
-        orbs = {"X": [], "Y": [], "Sum": []}
         down = self._spass_average
+        nbpm = len(self.bpms)
         with self._lock_raw_orbs:  # Lock needed here to ensure consistency
             leng = len(self.raw_sporbs["X"])
-            dic = {
-                "maskbeg": self._spass_mask[0],
-                "maskend": self._spass_mask[1],
-                "nturns": down,
-            }
-            nr_pts = self._smooth_npts
-            isdiff = False  # only update orbit if some BPM updated
-            for i, bpm in enumerate(self.bpms):
-                if not leng or bpm.has_news:
-                    dic.update(
-                        {
-                            "refx": self.ref_orbs["X"][i],
-                            "refy": self.ref_orbs["Y"][i],
-                        }
-                    )
-                    orbx, orby, summ = bpm.calc_sp_multiturn_pos(**dic)
-                    thisdiff = not leng or not _np.array_equal(
-                        orbx, self.raw_sporbs["X"][-1][i]
-                    )
-                    # if it got here, then for sure the new data will be used
-                    # and we can reset the flag:
-                    if thisdiff:
-                        bpm.has_news = False
-                    isdiff |= thisdiff
-                else:
-                    orbx = self.raw_sporbs["X"][-1][i].copy()
-                    orby = self.raw_sporbs["Y"][-1][i].copy()
-                    summ = self.raw_sporbs["Sum"][-1][i].copy()
-                orbs["X"].append(orbx)
-                orbs["Y"].append(orby)
-                orbs["Sum"].append(summ)
+            if leng and self.raw_sporbs["X"].last.size != nbpm * down:
+                leng = 0
+            if leng:  # previous orbits as bpms x turns
+                orbs = {
+                    pln: raw.last.reshape(-1, nbpm).T.copy()
+                    for pln, raw in self.raw_sporbs.items()
+                }
+                news = _np.array([bpm.has_news for bpm in self.bpms])
+            else:
+                orbs = {
+                    pln: _np.zeros((nbpm, down)) for pln in self.raw_sporbs
+                }
+                news = _np.ones(nbpm, dtype=bool)
+            idcs = news.nonzero()[0]
+
+            orbx, orby, summ = _calc_sp_multiturn_pos(
+                [self.bpms[i] for i in idcs],
+                nturns=down,
+                refx=self.ref_orbs["X"][idcs],
+                refy=self.ref_orbs["Y"][idcs],
+                maskbeg=self._spass_mask[0],
+                maskend=self._spass_mask[1],
+            )
+            # only update orbit if some BPM updated:
+            diff = _np.ones(idcs.size, dtype=bool)
+            if leng:
+                diff = ~(orbx == orbs["X"][idcs]).all(axis=1)
+            # if it got here, then for sure the new data will be used
+            # and we can reset the flag:
+            for i in idcs[diff]:
+                self.bpms[i].has_news = False
+            isdiff = diff.any()
+            orbs["X"][idcs] = orbx
+            orbs["Y"][idcs] = orby
+            orbs["Sum"][idcs] = summ
 
             if not isdiff:
                 return
@@ -920,21 +929,17 @@ class EpicsOrbit(BaseOrbit):
             self._last_num_news = 0
 
             for pln, raw in self.raw_sporbs.items():
-                norb = _np.array(orbs[pln], dtype=float).T  # turns x bpms
-                norb = norb.reshape(-1)
+                norb = orbs[pln].T.reshape(-1)  # turns x bpms
                 raw.append(norb)
-                del raw[:-nr_pts]
-                if not raw:
-                    return
-                if self._smooth_meth == self._csorb.SmoothMeth.Average:
-                    orb = _np.mean(raw, axis=0)
-                else:
-                    orb = _np.median(raw, axis=0)
+                orb = raw.smooth
                 if down > 1:
                     orb = _np.mean(orb.reshape(down, -1), axis=0)
                 self.smooth_sporb[pln] = orb
+            sporbs = {
+                pln: orb.copy() for pln, orb in self.smooth_sporb.items()
+            }
 
-        for pln, orb in self.smooth_sporb.items():
+        for pln, orb in sporbs.items():
             name = ("Orb" if pln != "Sum" else "") + pln
             self.run_callbacks("SPass" + name + "-Mon", orb)
 
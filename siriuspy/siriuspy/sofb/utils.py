@@ -74,3 +74,237 @@ def si_calculate_bump(
     orby[bpm1] += pos_bpm[2]
     orby[bpm2] += pos_bpm[3]
     return orbx, orby
+
+
+class SmoothBuffer:
+    """Preallocated ring buffer to smooth orbits along acquisitions.
+
+    Samples are stored in a (maxlen, *shape) array. A running sum of the
+    finite values and a count of non-finite values are kept for the
+    average method and a sorted window is kept for the median method, so
+    that the smoothed orbit can be updated without converting lists to
+    arrays or reducing the whole buffer on every new sample.
+    """
+
+    AVERAGE = 0
+    MEDIAN = 1
+
+    def __init__(self, maxlen=1, method=AVERAGE):
+        """."""
+        self._maxlen = max(int(maxlen), 1)
+        self._method = method
+        self._shape = None
+        self._buffer = None
+        self._sorted = None
+        self._sum = None
+        self._nbad = None
+        self._smooth = None
+        self._out = None
+        self._idx = 0
+        self._count = 0
+
+    @property
+    def maxlen(self):
+        """Maximum number of samples used in the smoothing."""
+        return self._maxlen
+
+    @maxlen.setter
+    def maxlen(self, value):
+        value = max(int(value), 1)
+        if value == self._maxlen:
+            return
+        data = self.get_samples()
+        self._maxlen = value
+        self._shape = None
+        for sample in data[-value:]:
+            self.append(sample)
+
+    @property
+    def method(self):
+        """Smoothing method. Either AVERAGE or MEDIAN."""
+        return self._method
+
+    @method.setter
+    def method(self, value):
+        if value == self._method:
+            return
+        self._method = value
+        if self._count:
+            self._rebuild()
+
+    @property
+    def shape(self):
+        """Shape of each sample."""
+        return self._shape
+
+    @property
+    def count(self):
+        """Number of samples in the buffer."""
+        return self._count
+
+    def __len__(self):
+        """."""
+        return self._count
+
+    @property
+    def smooth(self):
+        """Smoothed sample.
+
+        This is a view of an internal array, which is updated in place by
+        the next call to append. Copy it if it must be kept.
+        """
+        return self._smooth
+
+    @property
+    def last(self):
+        """View of the last sample appended to the buffer."""
+        if not self._count:
+            return None
+        return self._buffer[self._idx - 1]
+
+    def get_samples(self):
+        """Return a copy of the samples in chronological order."""
+        if not self._count:
+            return _np.array([])
+        if self._count < self._maxlen:
+            return self._buffer[: self._count].copy()
+        return _np.roll(self._buffer, -self._idx, axis=0)
+
+    def reset(self):
+        """Discard all samples."""
+        self._idx = 0
+        self._count = 0
+        self._smooth = None
+        if self._sum is not None:
+            self._sum[...] = 0.0
+            self._nbad[...] = 0
+
+    def append(self, sample):
+        """Add new sample and update the smoothed value."""
+        sample = _np.asarray(sample, dtype=float)
+        if sample.shape != self._shape:
+            self._allocate(sample.shape)
+
+        full = self._count == self._maxlen
+        old = self._buffer[self._idx]
+        if self._method == self.MEDIAN:
+            self._replace_sorted(old if full else None, sample)
+        else:
+            if full:
+                self._add_to_sum(old, sign=-1)
+            self._add_to_sum(sample)
+        old[...] = sample
+
+        self._idx = (self._idx + 1) % self._maxlen
+        self._count += not full
+        # recalculate the sum once in a while to avoid accumulating
+        # round-off errors:
+        if self._method == self.AVERAGE and not self._idx:
+            self._recalc_sum()
+        self._update_smooth()
+
+    # ---------------------- helper methods -----------------------
+    def _allocate(self, shape):
+        self._shape = shape
+        self._buffer = _np.zeros((self._maxlen,) + shape, dtype=float)
+        self._sorted = _np.zeros((self._maxlen,) + shape, dtype=float)
+        self._sum = _np.zeros(shape, dtype=float)
+        self._nbad = _np.zeros(shape, dtype=int)
+        self._out = _np.zeros(shape, dtype=float)
+        self.reset()
+
+    def _rebuild(self):
+        data = self._buffer[: self._count]
+        if self._method == self.MEDIAN:
+            self._sorted[: self._count] = _np.sort(data, axis=0)
+        else:
+            self._recalc_sum()
+        self._update_smooth()
+
+    def _recalc_sum(self):
+        data = self._buffer[: self._count]
+        fin = _np.isfinite(data)
+        _np.sum(data, axis=0, out=self._sum, where=fin)
+        _np.sum(~fin, axis=0, out=self._nbad)
+
+    def _add_to_sum(self, sample, sign=1):
+        fin = _np.isfinite(sample)
+        if fin.all():
+            if sign > 0:
+                self._sum += sample
+            else:
+                self._sum -= sample
+            return
+        self._sum[fin] += sign * sample[fin]
+        self._nbad += sign * ~fin
+
+    def _update_smooth(self):
+        cnt = self._count
+        if self._method == self.MEDIAN:
+            srt = self._sorted
+            mid = (cnt - 1) // 2
+            if cnt % 2:
+                self._out[...] = srt[mid]
+            else:
+                _np.add(srt[mid], srt[mid + 1], out=self._out)
+                self._out *= 0.5
+            # NaNs are sorted to the end. Keep numpy median behavior:
+            self._out[_np.isnan(srt[cnt - 1])] = _np.nan
+        else:
+            _np.divide(self._sum, cnt, out=self._out)
+            # only entries with non-finite values are summed again, so
+            # that NaNs and infinities propagate as in numpy mean:
+            if self._nbad.any():
+                bad = self._nbad > 0
+                self._out[bad] = self._buffer[:cnt, bad].sum(axis=0) / cnt
+        self._smooth = self._out
+
+    def _search_sorted(self, value, cnt):
+        """Return leftmost position of value in columns of sorted window.
+
+        Vectorized binary search over the first cnt rows of each column.
+        NaNs are considered greater than any other value.
+        """
+        srt = self._sorted.reshape(self._maxlen, -1)
+        cols = _np.arange(srt.shape[1])
+        nan = _np.isnan(value)
+        low = _np.zeros(cols.size, dtype=int)
+        high = _np.full(cols.size, cnt)
+        for _ in range(int(cnt).bit_length()):
+            mid = _np.minimum((low + high) // 2, cnt - 1)
+            val = srt[mid, cols]
+            less = (val < value) | (nan & ~_np.isnan(val))
+            act = low < high
+            low = _np.where(act & less, mid + 1, low)
+            high = _np.where(act & ~less, mid, high)
+        return low
+
+    def _replace_sorted(self, old, new):
+        """Replace old by new in each column of the sorted window.
+
+        If old is None, new is inserted in a window which is not full.
+        Only entries between the positions of old and new are moved.
+        """
+        cnt = self._count
+        new = new.ravel()
+        ncol = new.size
+        ins = self._search_sorted(new, cnt)
+        if old is None:
+            pos = _np.full(ncol, cnt)
+        else:
+            pos = self._search_sorted(old.ravel(), cnt)
+
+        # entries in [ins, pos) move up, entries in (pos, ins) move down.
+        # Work on flat indices of the (maxlen, ncol) sorted window:
+        srt = self._sorted.reshape(-1)
+        cols = _np.arange(ncol)
+        upw = ins <= pos
+        ini = _np.where(upw, ins, pos + 1)*ncol + cols
+        size = _np.where(upw, pos - ins, ins - pos - 1)
+        total = size.sum()
+        if total:
+            idcs = _np.repeat(ini - (_np.cumsum(size) - size)*ncol, size)
+            idcs += _np.arange(total)*ncol
+            step = _np.where(upw, ncol, -ncol)
+            srt[idcs + _np.repeat(step, size)] = srt[idcs]
+        srt[_np.where(upw, ins, ins - 1)*ncol + cols] = new
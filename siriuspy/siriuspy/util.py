@@ -15,7 +15,6 @@ except:
     _epics = None
 
 
-from mathphys import beam_optics as _beam
 from siriuspy import envars as _envars
 
 
@@ -138,6 +137,8 @@ def configure_log_file(stream=None, filename=None, debug=False):
 
 def beam_rigidity(energy):
     """Return beam rigidity, beta amd game, given its energy [GeV]."""
+    # imported here since mathphys imports matplotlib, which is slow.
+    from mathphys import beam_optics as _beam
     brho, _, beta, gamma, _ = _beam.beam_rigidity(energy=energy)
     return brho, beta, gamma
 
@@ -243,7 +244,11 @@ def check_public_interface_namespace(namespace, valid_interface,
     This function checks only static public interface symbols. It does not
     check those symbols that are created within class methods.
     """
-    for name in namespace.__dict__:
+    symbols = namespace.__dict__
+    if '__getattr__' in symbols and '__all__' in symbols:
+        # lazily loaded module (PEP 562), names may not be imported yet.
+        symbols = symbols['__all__']
+    for name in symbols:
         if checkdoc_flag:
             doc = getattr(name, '__doc__')
             if doc is None or len(doc) < 5:
@@ -255,7 +260,7 @@ def check_public_interface_namespace(namespace, valid_interface,
                 print('Invalid symbol: ', name)
             return False
     for name in valid_interface:
-        if name not in namespace.__dict__:
+        if name not in symbols:
             if print_flag:
                 print('Missing symbol: ', name)
             return False
@@ -8,10 +8,12 @@ from unittest.mock import Mock
 
 from siriuspy.bsmp import (
     BSMP,
+    Channel,
     Function,
     Message,
     Package,
     SerialAnomResp,
+    SerialError,
     Types,
     Variable,
     VariablesGroup,
@@ -34,6 +36,7 @@ class TestBSMPAPI(TestCase):
         'query_list_of_functions',
         'read_variable',
         'read_group_of_variables',
+        'read_group_of_variables_batch',
         'write_variable',
         'write_group_of_variables',
         'binoperation_variable',
@@ -220,6 +223,60 @@ class TestBSMP0x1(TestCase):
         response = self.bsmp.read_group_of_variables(0, timeout=100)
         self.assertEqual(response, (0xE3, None))
 
+    def test_read_group_of_variables_batch(self):
+        """Test read_group_of_variables_batch isolates failures."""
+        load = list(map(chr, struct.pack('<h', 1020)))
+        load.extend(list(map(chr, struct.pack('<f', 1.5))))
+        load.extend(list(map(chr, struct.pack('<f', 2.5))))
+        load.extend(list(map(chr, struct.pack('<f', 3.5))))
+        load.extend([chr(0)] * 64)
+        resp_ok = Package.package(0, Message.message(0x13, payload=load))
+        resp_err = Package.package(0, Message.message(0xE3))
+
+        responses = [resp_ok.stream, TimeoutError(), resp_err.stream]
+        self.serial.PIPELINED_BATCH = True
+        self.serial.UART_request_batch.return_value = responses
+        bsmps = [BSMP(self.serial, i, self.entities) for i in range(1, 4)]
+        resps = BSMP.read_group_of_variables_batch(bsmps, 0, timeout=100)
+
+        streams, = self.serial.UART_request_batch.call_args[0]
+        self.assertEqual(len(streams), 3)
+        self.assertEqual([stream[0] for stream in streams],
+                         [chr(1), chr(2), chr(3)])
+        self.assertEqual(resps[0][0], 0xE0)
+        self.assertEqual(resps[0][1][:3], [1020, 1.5, [2.5, 3.5]])
+        self.assertIsInstance(resps[1], SerialError)
+        self.assertEqual(resps[2], (0xE3, None))
+
+    def test_read_group_of_variables_sequential(self):
+        """Test batch of interface without pipelining releases lock."""
+        resp = Package.package(0, Message.message(0xE3))
+        locked = []
+
+        def request(stream, timeout):
+            locked.append(Channel.LOCK.locked())
+            if stream[0] == chr(2):
+                raise TimeoutError()
+            return resp.stream
+
+        self.serial.PIPELINED_BATCH = False
+        self.serial.UART_request.side_effect = request
+        bsmps = [BSMP(self.serial, i, self.entities) for i in range(1, 4)]
+        lock = Channel.LOCK
+        Channel.create_lock()
+        try:
+            resps = BSMP.read_group_of_variables_batch(
+                bsmps, 0, timeout=100)
+            # lock is held for each request and released between them.
+            self.assertEqual(locked, [True, True, True])
+            self.assertFalse(Channel.LOCK.locked())
+        finally:
+            Channel.LOCK = lock
+        self.serial.UART_request_batch.assert_not_called()
+        self.assertEqual(resps[0], (0xE3, None))
+        self.assertIsInstance(resps[1], SerialError)
+        self.assertEqual(resps[2], (0xE3, None))
+
     def test_read_group_variable_fail(self):
         """Test read variable returns error code."""
         pck = Package.package(0, Message.message(0xFF))
@@ -352,10 +409,18 @@ class TestBSMP0x4(TestCase):
     #     with self.assertRaises(NotImplementedError):
     #         self.bsmp.curve_block(1, 2, [], timeout=100)
 
-    # def test_recalculate_curve_checksum(self):
-    #     """Test recalculate_curve_checksum."""
-    #     with self.assertRaises(NotImplementedError):
-    #         self.bsmp.recalculate_curve_checksum(1)
+    def test_recalculate_curve_checksum(self):
+        """Test recalculate_curve_checksum returns payload bytes."""
+        p = Package.package(
+            0, Message.message(0x0B, payload=[chr(1), chr(2), chr(3)]))
+        # view of a receive buffer which is reused
+        buffer = bytearray(map(ord, p.stream))
+        self.serial.UART_request.return_value = memoryview(buffer)
+        ack, payload = self.bsmp.recalculate_curve_checksum(1, timeout=100)
+        self.assertEqual(ack, 0x0B)
+        self.assertIs(type(payload), bytes)
+        buffer[:] = bytes(len(buffer))
+        self.assertEqual(payload, b'\x01\x02\x03')
 
 
 class TestBSMP0x5(TestCase):
@@ -120,6 +120,8 @@ class TestBSMPVariablesGroup(TestCase):
         'ALL',
         'READ_ONLY',
         'WRITEABLE',
+        'decode',
+        'encode',
         'load_to_value',
         'value_to_load',
         'variables_size',
@@ -161,6 +163,34 @@ class TestBSMPVariablesGroup(TestCase):
             self.assertAlmostEqual(f, expected_value[4][i])
         self.assertEqual(value[-1], expected_value[-1])
 
+    def test_load_to_value_bytes(self):
+        """Test bytes load decodes as the equivalent char load."""
+        c = self._conv_value
+        string = ['t', 'e', 's', 't', 'e', chr(0), chr(0), chr(0)]
+        load = c('<b', 5) + c('<h', 15) + c('<i', 25) + c('<f', 1.5) + \
+            c('<f', 1.6) + c('<f', 1.7) + c('<f', 1.8) + c('<f', 1.9) + \
+            string
+        bload = bytes(map(ord, load))
+        self.assertEqual(
+            self.group.load_to_value(bload), self.group.load_to_value(load))
+        self.assertEqual(
+            self.group.load_to_value(memoryview(bload)),
+            self.group.load_to_value(load))
+
+    def test_decode(self):
+        """Test decoding of group load in one call."""
+        value = [5, 15, 25, 1.5, [1.6, 1.7, 1.8, 1.9], 'teste']
+        load = self.group.encode(value)
+        self.assertEqual(len(load), self.group.variables_size())
+        flat = self.group.decode(load)
+        self.assertEqual(len(flat), 4 + 4 + 8)
+        self.assertEqual(flat[:4], (5, 15, 25, 1.5))
+        self.assertEqual(b''.join(flat[8:]), b'teste\x00\x00\x00')
+        rec = self.group.decode(load, record=True)
+        self.assertEqual(rec['v2'], 25)
+        self.assertEqual(list(rec['v4']), list(flat[4:8]))
+        self.assertEqual(rec['v5'].tobytes(), b'teste\x00\x00\x00')
+
     def test_value_to_load(self):
         """Test value conversion to load."""
         c = self._conv_value
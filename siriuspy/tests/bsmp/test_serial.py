@@ -163,6 +163,27 @@ class TestBSMPPackage(TestCase):
             stream += [chr(checksum + 1)]
             self.assertFalse(Package.verify_checksum(stream))
 
+    def test_bytes_stream(self):
+        """Test bytes streams are equivalent to char streams."""
+        for d in self.data:
+            payload = bytes(map(ord, d[2]))
+            p = Package.package(d[0], Message.message(d[1], payload=payload))
+            self.assertEqual(p.stream, bytes(map(ord, d[3])))
+            self.assertEqual(p.checksum, d[4])
+            p = Package(bytearray(p.stream))
+            self.assertEqual(p.address, d[0])
+            self.assertEqual(p.message.cmd, d[1])
+            self.assertEqual(p.message.size, len(d[2]))
+            self.assertEqual(bytes(p.message.payload), payload)
+
+    def test_verify_bytes_checksum(self):
+        """Verify checksum of bytes streams."""
+        for d in self.data:
+            stream = bytearray(map(ord, d[3]))
+            self.assertTrue(Package.verify_checksum(stream))
+            stream[-1] = (stream[-1] + 1) & 0xFF
+            self.assertFalse(Package.verify_checksum(stream))
+
 
 class TestBSMPChannel(TestCase):
     """Test Channel class of BSMP package."""
@@ -177,6 +198,7 @@ class TestBSMPChannel(TestCase):
         'write',
         'request_',
         'request',
+        'request_batch',
         'create_lock',
     )
 
@@ -219,6 +241,29 @@ class TestBSMPChannel(TestCase):
         self.assertEqual(recv.cmd, response.cmd)
         self.assertEqual(recv.payload, response.payload)
 
+    def test_request_bytes(self):
+        """Test request with bytes streams."""
+        message = Message.message(0x01, payload=bytes((1, )))
+        response = Message.message(0x11, payload=[chr(10)])
+        stream = Package.package(0x01, response).stream
+
+        # list streams are handed to legacy interfaces
+        self.serial.UART_request.return_value = stream
+        recv = self.channel.request(message, timeout=1)
+        self.serial.UART_request.assert_called_with(
+            ['\x01', '\x01', '\x00', '\x01', '\x01', chr(252)], timeout=1)
+        self.assertEqual(recv.payload, response.payload)
+
+        # bytes streams are handed to interfaces supporting them
+        self.serial.BYTES_STREAM = True
+        channel = Channel(self.serial, 1)
+        self.serial.UART_request.return_value = bytes(map(ord, stream))
+        recv = channel.request(message, timeout=1)
+        self.serial.UART_request.assert_called_with(
+            bytes((1, 1, 0, 1, 1, 252)), timeout=1)
+        self.assertEqual(recv.cmd, response.cmd)
+        self.assertEqual(bytes(recv.payload), bytes((10, )))
+
     def test_request_fail(self):
         """Test exception is raised when serial fails."""
         self.serial.UART_request.return_value = None
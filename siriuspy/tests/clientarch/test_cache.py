@@ -0,0 +1,296 @@
+#!/usr/bin/env python-sirius
+
+"""Test persistent cache of archiver data."""
+
+import asyncio
+import multiprocessing
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+from aiohttp import web
+
+from siriuspy.clientarch import ArchiverCache, ClientArchiver, PVDataSet
+from siriuspy.clientarch.cache import merge_intervals, subtract_intervals
+
+_TSTART = datetime.fromisoformat('2024-01-01T00:00:00+00:00').timestamp()
+_PERIOD = 10  # [s]
+
+
+class _ArchiverStandIn:
+    """Local server with synthetic data, one sample every _PERIOD seconds."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = None
+        self.requests = []
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started, ), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/retrieval/data/getData.json', self._get_data)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    async def _get_data(self, request):
+        start = datetime.fromisoformat(request.query['from']).timestamp()
+        stop = datetime.fromisoformat(request.query['to']).timestamp()
+        self.requests.append((start, stop))
+        # as the archiver, include last sample before start.
+        secs = np.arange(
+            np.floor(start/_PERIOD)*_PERIOD, stop + _PERIOD/2, _PERIOD)
+        secs = secs[secs <= stop].astype(int)
+        data = [
+            dict(secs=int(sec), nanos=0, val=float(sec - _TSTART),
+                 status=0, severity=0)
+            for sec in secs]
+        return web.json_response([dict(meta=dict(), data=data)])
+
+
+class TestIntervals(TestCase):
+    """Test interval arithmetic."""
+
+    def test_merge_intervals(self):
+        """Test merge of intervals."""
+        self.assertEqual(
+            merge_intervals([(5, 6), (1, 3), (2, 4), (4, 4.5)]),
+            [(1, 4.5), (5, 6)])
+        self.assertEqual(merge_intervals([]), [])
+
+    def test_subtract_intervals(self):
+        """Test subtraction of intervals."""
+        intvls = [(1, 3), (2, 4), (6, 7), (9, 12)]
+        self.assertEqual(
+            subtract_intervals(0, 10, intvls), [(0, 1), (4, 6), (7, 9)])
+        self.assertEqual(subtract_intervals(0, 10, []), [(0, 10)])
+        self.assertEqual(subtract_intervals(0, 10, [(-1, 11)]), [])
+        self.assertEqual(subtract_intervals(3, 3, []), [(3, 3)])
+        self.assertEqual(subtract_intervals(3, 3, [(1, 3)]), [])
+
+
+class TestArchiverCache(TestCase):
+    """Test storage of data segments."""
+
+    def setUp(self):
+        """Create cache in temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.cache = ArchiverCache(directory=self.directory)
+        self.key = ArchiverCache.get_key('url', 'SI-Glob:AP-Test-Mon')
+
+    def tearDown(self):
+        """Remove temporary directory."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _data(start, stop):
+        tstamp = np.arange(start, stop + 1, 10, dtype=float)
+        return dict(
+            timestamp=tstamp, value=tstamp*2, status=np.zeros(tstamp.size),
+            severity=np.zeros(tstamp.size))
+
+    def test_is_cacheable(self):
+        """Test cacheable processing types."""
+        self.assertTrue(ArchiverCache.is_cacheable(''))
+        self.assertTrue(ArchiverCache.is_cacheable('mean', 60))
+        self.assertFalse(ArchiverCache.is_cacheable('mean'))
+        self.assertFalse(ArchiverCache.is_cacheable('optimized', 1000))
+
+    def test_store_load(self):
+        """Test store and load of segments."""
+        self.assertTrue(
+            self.cache.store(self.key, 100, 200, self._data(100, 200)))
+        self.assertTrue(
+            self.cache.store(self.key, 300, 400, self._data(300, 400)))
+        self.assertEqual(
+            self.cache.get_intervals(self.key), [(100, 200), (300, 400)])
+        self.assertEqual(
+            self.cache.get_missing_intervals(self.key, 150, 350),
+            [(200, 300)])
+        datas = self.cache.load(self.key, 155, 350)
+        tstamp = np.concatenate([data['timestamp'] for data in datas])
+        np.testing.assert_array_equal(
+            np.sort(tstamp), [150, 160, 170, 180, 190, 200, 300, 310, 320,
+                              330, 340, 350])
+
+    def test_store_recent_data(self):
+        """Test data more recent than settled time is not stored."""
+        now = self.cache.get_settled_time() + ArchiverCache.SETTLE_TIME
+        self.assertFalse(
+            self.cache.store(self.key, now - 10, now, self._data(0, 1)))
+        self.assertTrue(self.cache.store(
+            self.key, now - 2*ArchiverCache.SETTLE_TIME, now,
+            self._data(0, 1)))
+        stop = self.cache.get_intervals(self.key)[0][1]
+        self.assertLess(stop, now - ArchiverCache.SETTLE_TIME + 1)
+
+    def test_store_recent_bins(self):
+        """Test bins of statistics after settled time are not stored."""
+        bint = 3600
+        now = self.cache.get_settled_time() + ArchiverCache.SETTLE_TIME
+        ini = (now // bint - 3) * bint
+        data = self._data(ini, now)
+        data['timestamp'] = np.arange(ini, now, bint, dtype=float)
+        for fld in ('value', 'status', 'severity'):
+            data[fld] = data[fld][:data['timestamp'].size]
+        self.assertTrue(self.cache.store(
+            self.key, ini, now, data, bin_interval=bint))
+        settled = self.cache.get_settled_time(bint)
+        self.assertEqual(settled % bint, 0)
+        self.assertEqual(self.cache.get_intervals(self.key), [(ini, settled)])
+        tstamp = self.cache.load(self.key, ini, now)[0]['timestamp']
+        self.assertTrue(np.all(tstamp + bint <= settled))
+        np.testing.assert_array_equal(
+            ArchiverCache.get_stored_selection(
+                data['timestamp'], settled, bint),
+            np.isin(data['timestamp'], tstamp))
+
+    def test_processes(self):
+        """Test processes storing the same key keep all segments."""
+        ctx = multiprocessing.get_context('fork')
+        procs = [
+            ctx.Process(target=_store_segments, args=(
+                self.directory, self.key, ini))
+            for ini in range(0, 4000, 1000)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+            self.assertEqual(proc.exitcode, 0)
+        self.assertEqual(self.cache.get_intervals(self.key), [(0, 4000)])
+        self.assertEqual(
+            len(self.cache._read_index(self.key)['segments']), 40)
+
+    def test_evict(self):
+        """Test eviction by size."""
+        for ini in range(0, 1000, 100):
+            self.cache.store(self.key, ini, ini + 100, self._data(ini, ini+99))
+        self.cache.load(self.key, 0, 100)
+        self.cache.max_size = self.cache.size // 2
+        self.cache.evict()
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
+        # least recently used segments are removed first.
+        self.assertEqual(
+            self.cache.get_missing_intervals(self.key, 0, 100), [])
+        self.cache.clear()
+        self.assertEqual(self.cache.size, 0)
+
+
+def _store_segments(directory, key, ini):
+    cache = ArchiverCache(directory=directory)
+    for start in range(ini, ini + 1000, 100):
+        tstamp = np.arange(start, start + 100, 10, dtype=float)
+        cache.store(key, start, start + 100, dict(
+            timestamp=tstamp, value=tstamp, status=tstamp*0,
+            severity=tstamp*0))
+
+
+class TestClientCache(TestCase):
+    """Test client requests only data missing in cache."""
+
+    pvname = 'SI-Glob:AP-Test-Mon'
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ArchiverStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Create client with cache."""
+        self.directory = tempfile.mkdtemp()
+        self.client = ClientArchiver(
+            server_url=self.server.url, cache=self.directory)
+        self.server.requests.clear()
+
+    def tearDown(self):
+        """Stop client and remove cache."""
+        self.client.shutdown()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _get_data(self, start, stop, **kwargs):
+        return self.client.get_data(
+            self.pvname, _TSTART + start, _TSTART + stop,
+            query_split_interval=0, **kwargs)
+
+    def test_cache_property(self):
+        """Test cache property."""
+        self.assertIsInstance(self.client.cache, ArchiverCache)
+        self.client.cache = None
+        self.assertIsNone(self.client.cache)
+        with self.assertRaises(TypeError):
+            self.client.cache = 1
+
+    def test_missing_intervals(self):
+        """Test only missing intervals are requested."""
+        ref = self._get_data(1000, 2000, use_cache=False)
+        self._get_data(1000, 1500)
+        self.server.requests.clear()
+        data = self._get_data(1000, 2000)
+        self.assertEqual(
+            self.server.requests, [(_TSTART + 1500, _TSTART + 2000)])
+        for fld, val in ref.items():
+            np.testing.assert_array_equal(data[fld], val)
+
+        self.server.requests.clear()
+        data = self._get_data(1205, 1800)
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(data['timestamp'][0], _TSTART + 1200)
+        np.testing.assert_array_equal(
+            data['value'], np.arange(1200, 1801, _PERIOD))
+
+    def test_bypass(self):
+        """Test cache bypass."""
+        self._get_data(1000, 2000)
+        self.server.requests.clear()
+        self._get_data(1000, 2000, use_cache=False)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_statistics_bins(self):
+        """Test sub-intervals of statistics are aligned to bins."""
+        self._get_data(0, 600, proc_type='mean', proc_type_param1=60)
+        self.server.requests.clear()
+        self._get_data(0, 1000, proc_type='mean', proc_type_param1=60)
+        self.assertEqual(
+            self.server.requests, [(_TSTART + 600, _TSTART + 1020)])
+
+    def test_pvdataset(self):
+        """Test PVDataSet update with cache."""
+        pvds = PVDataSet([self.pvname], connector=self.client)
+        pvds.time_start = _TSTART + 1000
+        pvds.time_stop = _TSTART + 2000
+        pvds.query_split_interval = 0
+        pvds.update()
+        self.server.requests.clear()
+        pvds.update()
+        self.assertEqual(self.server.requests, [])
+        np.testing.assert_array_equal(
+            pvds[0].value, np.arange(1000, 2001, _PERIOD))
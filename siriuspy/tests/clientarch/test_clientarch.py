@@ -6,6 +6,9 @@ import datetime
 import traceback
 from unittest import TestCase
 
+import numpy as np
+
+from siriuspy.clientarch import ClientArchiver
 from siriuspy.clientarch.time import get_time_intervals, Time
 
 
@@ -155,3 +158,77 @@ class TestClientArchTime(TestCase):
         )
         self.assertEqual(tst, time_start)
         self.assertEqual(tsp, time_stop)
+
+
+class TestClientArchGetData(TestCase):
+    """Test decoding of get_data responses."""
+
+    @staticmethod
+    def _create_resp(secs, vals):
+        data = [
+            dict(secs=sec, nanos=500000000, val=val, status=0, severity=sec)
+            for sec, val in zip(secs, vals)]
+        return [dict(meta=dict(), data=data)]
+
+    def setUp(self):
+        """Create client."""
+        self.client = ClientArchiver()
+
+    def tearDown(self):
+        """Stop client event loop."""
+        self.client.shutdown()
+
+    def test_process_scalar(self):
+        """Test chunks of scalar PV with overlapping boundaries."""
+        resps = [
+            self._create_resp([1, 2, 3], [1.0, 2.0, 3.0]),
+            None,
+            self._create_resp([3, 4], [3.0, 4.0]),
+            self._create_resp([4, 5, 6], [4.0, 5.0, 6.0]),
+            ]
+        pvn2idcs = {'PV': np.arange(len(resps))}
+        data = self.client.process_resquest_of_get_data(
+            ['PV'], resps, pvn2idcs)
+        np.testing.assert_array_equal(
+            data['timestamp'], np.arange(1, 7) + 0.5)
+        np.testing.assert_array_equal(data['value'], np.arange(1.0, 7))
+        np.testing.assert_array_equal(data['severity'], np.arange(1, 7))
+        self.assertIsInstance(data['value'], np.ndarray)
+
+    def test_process_unsorted(self):
+        """Test chunks whose timestamps are not in order."""
+        resps = [
+            self._create_resp([3, 4], [3.0, 4.0]),
+            self._create_resp([1, 2, 3], [1.0, 2.0, 30.0]),
+            ]
+        pvn2idcs = {'PV': np.arange(len(resps))}
+        data = self.client.process_resquest_of_get_data(
+            ['PV'], resps, pvn2idcs)
+        np.testing.assert_array_equal(
+            data['value'], np.array([1.0, 2.0, 3.0, 4.0]))
+
+    def test_process_waveform(self):
+        """Test chunks of waveform PV."""
+        resps = [
+            self._create_resp([1, 2], [[1, 2], [3, 4]]),
+            self._create_resp([2, 3], [[3, 4], [5, 6]]),
+            ]
+        pvn2idcs = {'PV1': np.array([0]), 'PV2': np.array([1])}
+        data = self.client.process_resquest_of_get_data(
+            ['PV1', 'PV2'], resps, pvn2idcs)
+        self.assertEqual(data['PV1']['value'].shape, (2, 2))
+
+        pvn2idcs = {'PV': np.arange(len(resps))}
+        data = self.client.process_resquest_of_get_data(
+            ['PV'], resps, pvn2idcs)
+        np.testing.assert_array_equal(
+            data['value'], np.arange(1, 7).reshape(3, 2))
+
+    def test_process_empty(self):
+        """Test PV without data."""
+        resps = [None, self._create_resp([], [])]
+        pvn2idcs = {'PV': np.arange(len(resps))}
+        data = self.client.process_resquest_of_get_data(
+            ['PV'], resps, pvn2idcs)
+        self.assertIsNone(data['timestamp'])
+        self.assertIsNone(data['value'])
@@ -0,0 +1,76 @@
+#!/usr/bin/env python-sirius
+
+"""Test streaming of archiver data in chunks."""
+
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.clientarch import ClientArchiver, PVDataSet
+
+from .test_cache import _ArchiverStandIn, _TSTART
+
+
+class TestIterData(TestCase):
+    """Test iteration over data chunks."""
+
+    pvnames = ['SI-Glob:AP-Test-Mon', 'SI-Glob:AP-Test2-Mon']
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ArchiverStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Create client."""
+        self.client = ClientArchiver(server_url=self.server.url)
+        self.server.requests.clear()
+
+    def tearDown(self):
+        """Stop client."""
+        self.client.shutdown()
+
+    def _iter_data(self, **kwargs):
+        return self.client.iter_data(
+            self.pvnames, _TSTART, _TSTART + 5000, query_split_interval=600,
+            **kwargs)
+
+    def test_same_data(self):
+        """Test chunks have the same data as get_data."""
+        ref = self.client.get_data(
+            self.pvnames, _TSTART, _TSTART + 5000, query_split_interval=600)
+        pvn2chunks = {pvn: [] for pvn in self.pvnames}
+        for pvn, data in self._iter_data(max_in_flight=3):
+            pvn2chunks[pvn].append(data)
+        for pvn, chunks in pvn2chunks.items():
+            self.assertGreater(len(chunks), 1)
+            for fld in ('timestamp', 'value', 'status', 'severity'):
+                np.testing.assert_array_equal(
+                    np.concatenate([chk[fld] for chk in chunks]),
+                    ref[pvn][fld])
+
+    def test_backpressure(self):
+        """Test requests are only made as chunks are consumed."""
+        itr = self._iter_data(max_in_flight=2)
+        next(itr)
+        time.sleep(0.1)
+        self.assertLessEqual(len(self.server.requests), 2)
+        itr.close()
+
+    def test_pvdataset(self):
+        """Test PVDataSet chunks."""
+        pvds = PVDataSet(self.pvnames, connector=self.client)
+        pvds.time_start = _TSTART
+        pvds.time_stop = _TSTART + 2000
+        pvds.query_split_interval = 600
+        sizes = {pvn: 0 for pvn in self.pvnames}
+        for pvn, data in pvds.iter_data():
+            sizes[pvn] += data['timestamp'].size
+        self.assertEqual(sizes, {pvn: 201 for pvn in self.pvnames})
+        self.assertIsNone(pvds[0].timestamp)
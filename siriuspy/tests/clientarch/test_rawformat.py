@@ -0,0 +1,140 @@
+#!/usr/bin/env python-sirius
+
+"""Test raw retrieval format of the archiver client."""
+
+import asyncio
+import os
+import threading
+from unittest import TestCase
+
+import numpy as np
+from aiohttp import web
+
+from siriuspy.clientarch import ClientArchiver
+from siriuspy.clientarch.rawformat import RawDecoder, unescape
+
+
+_PATH = os.path.join(
+    os.path.abspath(os.path.dirname(__file__)), '..', 'test_data',
+    'clientarch')
+_PV2FILE = {
+    'SI-Glob:AP-Test-Mon': 'scalar',
+    'SI-Glob:AP-TestWfm-Mon': 'waveform',
+}
+
+
+class _ArchiverStandIn:
+    """Local server answering get data requests with recorded payloads."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = None
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started, ), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/retrieval/data/getData.{fmt}', self._get_data)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    @staticmethod
+    async def _get_data(request):
+        fmt = request.match_info['fmt']
+        fname = _PV2FILE.get(request.query['pv'])
+        if fname is None:
+            return web.Response(status=404)
+        with open(os.path.join(_PATH, fname + '.' + fmt), 'rb') as fil:
+            body = fil.read()
+        ctype = 'application/json' if fmt == 'json' else \
+            'application/x-protobuf'
+        return web.Response(body=body, content_type=ctype)
+
+
+class TestRawFormat(TestCase):
+    """Test raw format retrieval against JSON retrieval."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ArchiverStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Create client."""
+        self.client = ClientArchiver(server_url=self.server.url)
+
+    def tearDown(self):
+        """Stop client."""
+        self.client.shutdown()
+
+    def _get_data(self, pvnames, fmt):
+        self.client.retrieval_format = fmt
+        return self.client.get_data(
+            pvnames, '2024-12-31T00:00:00Z', '2025-01-01T12:00:00Z',
+            query_split_interval=0)
+
+    def test_retrieval_format(self):
+        """Test retrieval format selection."""
+        self.assertEqual(self.client.retrieval_format, 'json')
+        with self.assertRaises(ValueError):
+            self.client.retrieval_format = 'pb'
+        self.client.retrieval_format = 'raw'
+        url = self.client.get_request_url_for_get_data(
+            'SI-Glob:AP-Test-Mon', 0, 1)
+        self.assertIn('/retrieval/data/getData.raw?', url)
+
+    def test_unescape(self):
+        """Test escape sequences."""
+        line = b'a\x1b\x01\x02b\x1b\x02c\x1b\x03'
+        self.assertEqual(unescape(line), b'a\x1b\x02b\nc\r')
+
+    def test_decoder_feed(self):
+        """Test decoding of data split at arbitrary positions."""
+        with open(os.path.join(_PATH, 'waveform.raw'), 'rb') as fil:
+            body = fil.read()
+        whole = RawDecoder()
+        whole.feed(body)
+        whole = whole.finish()
+        split = RawDecoder()
+        for ini in range(0, len(body), 1000):
+            split.feed(body[ini:ini+1000])
+        split = split.finish()
+        self.assertEqual(split['secs'], whole['secs'])
+        np.testing.assert_array_equal(split['val'], whole['val'])
+
+    def test_same_data(self):
+        """Test raw and JSON formats give same data."""
+        pvnames = list(_PV2FILE)
+        data_json = self._get_data(pvnames, 'json')
+        data_raw = self._get_data(pvnames, 'raw')
+        for pvname in pvnames:
+            for key, val in data_json[pvname].items():
+                np.testing.assert_array_equal(data_raw[pvname][key], val)
+        self.assertEqual(
+            data_raw['SI-Glob:AP-TestWfm-Mon']['value'].shape, (100, 32))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python-sirius
+
+"""Test resampling of time series onto a common time grid."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.clientarch import ClientArchiver, Orbit
+from siriuspy.clientarch.resample import get_changes, Resampler
+
+from .test_cache import _ArchiverStandIn, _TSTART
+
+
+class TestResampler(TestCase):
+    """Test Resampler methods."""
+
+    def setUp(self):
+        """Create random irregular series."""
+        rng = np.random.default_rng(7)
+        self.times = np.arange(0, 1000, 0.7)
+        self.series = []
+        for _ in range(5):
+            tstamp = np.cumsum(rng.exponential(3, 400)) - 10
+            self.series.append((tstamp, rng.normal(size=tstamp.size)))
+
+    def _resample(self, method, nrchunks=1, dtype=float):
+        resampler = Resampler(
+            self.times, len(self.series), method=method, dtype=dtype)
+        for i, (tstamp, value) in enumerate(self.series):
+            for idcs in np.array_split(np.arange(tstamp.size), nrchunks):
+                resampler.feed(i, tstamp[idcs], value[idcs])
+        return resampler.finish()
+
+    def test_linear(self):
+        """Test linear method is equal to numpy.interp."""
+        ref = np.array([
+            np.interp(self.times, tstamp, value)
+            for tstamp, value in self.series]).T
+        np.testing.assert_array_equal(self._resample('linear'), ref)
+        np.testing.assert_array_equal(self._resample('linear', 17), ref)
+
+    def test_previous_nearest(self):
+        """Test sample and hold and nearest methods."""
+        prev = self._resample('previous', 13)
+        near = self._resample('nearest', 13)
+        for i, (tstamp, value) in enumerate(self.series):
+            for j, tim in enumerate(self.times):
+                idx = max(np.sum(tstamp <= tim) - 1, 0)
+                self.assertEqual(prev[j, i], value[idx])
+                idx = np.argmin(np.abs(tstamp - tim))
+                self.assertEqual(near[j, i], value[idx])
+
+    def test_float32(self):
+        """Test single precision values."""
+        vals = self._resample('linear', 5, dtype=np.float32)
+        self.assertEqual(vals.dtype, np.float32)
+        np.testing.assert_allclose(vals, self._resample('linear'), rtol=1e-6)
+
+    def test_missing_series(self):
+        """Test series without samples are NaN."""
+        resampler = Resampler(self.times, 2)
+        resampler.feed(0, *self.series[0])
+        vals = resampler.finish()
+        self.assertFalse(np.isnan(vals[:, 0]).any())
+        self.assertTrue(np.isnan(vals[:, 1]).all())
+
+    def test_invalid_method(self):
+        """Test invalid resampling method."""
+        with self.assertRaises(ValueError):
+            Resampler(self.times, 1, method='cubic')
+
+    def test_changes(self):
+        """Test sparse representation of changes."""
+        vals = self._resample('previous', 3)
+        rows, cols, chgs = get_changes(vals)
+        self.assertLess(rows.size, vals.size)
+        rebuilt = np.full(vals.shape, np.nan)
+        rebuilt[rows, cols] = chgs
+        for col in range(vals.shape[1]):
+            filled = rebuilt[:, col]
+            idcs = np.nonzero(~np.isnan(filled))[0]
+            filled[:] = filled[idcs][np.searchsorted(
+                idcs, np.arange(filled.size), side='right') - 1]
+        np.testing.assert_array_equal(rebuilt, vals)
+
+
+class TestOrbit(TestCase):
+    """Test orbit matrix built in chunks."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ArchiverStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def test_chunked_update(self):
+        """Test chunked update gives the same orbit matrix."""
+        client = ClientArchiver(server_url=self.server.url)
+        try:
+            orbit = Orbit(connector=client)
+            orbit.time_start = _TSTART
+            orbit.time_stop = _TSTART + 1500
+            orbit.query_split_interval = 600
+            orbit.update()
+            ref = orbit.values
+            orbit.update(chunked=True)
+        finally:
+            client.shutdown()
+        self.assertEqual(ref.shape, (1500, len(orbit.devnames)))
+        np.testing.assert_array_equal(orbit.values, ref)
+        np.testing.assert_allclose(ref[:, 0], np.arange(1500) / 1000)
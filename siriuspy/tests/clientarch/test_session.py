@@ -0,0 +1,142 @@
+#!/usr/bin/env python-sirius
+
+"""Test pooled session and retries of anonymous archiver queries."""
+
+import asyncio
+import threading
+from unittest import TestCase
+
+from aiohttp import web
+
+from siriuspy.clientarch import ClientArchiver
+
+
+class _ApplianceStandIn:
+    """Local management server, failing the first queries if requested."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = None
+        self.nr_failures = 0
+        self.delay = 0
+        self.requests = []
+        self.inflight = self.max_inflight = 0
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started, ), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/mgmt/bpl/getPVStatus', self._get_pv_status)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    async def _get_pv_status(self, request):
+        # client port identifies the connection used by the request.
+        self.requests.append(request.transport.get_extra_info('peername'))
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        await asyncio.sleep(self.delay)
+        self.inflight -= 1
+        if self.nr_failures:
+            self.nr_failures -= 1
+            return web.Response(status=503)
+        pvname = request.query['pv']
+        return web.json_response(
+            [dict(pvName=pvname, status='Being archived')])
+
+
+class TestSession(TestCase):
+    """Test connection reuse and retries."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ApplianceStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Create client."""
+        self.client = ClientArchiver(server_url=self.server.url)
+        self.client.query_retry_backoff = 0.01
+        self.server.requests.clear()
+        self.server.nr_failures = 0
+        self.server.delay = 0
+        self.server.max_inflight = 0
+
+    def tearDown(self):
+        """Stop client."""
+        self.client.shutdown()
+
+    def test_connection_reuse(self):
+        """Test sequential queries reuse the same connection."""
+        for _ in range(10):
+            self.assertIsNotNone(self.client.get_pvs_info('SI-Glob:AP-*'))
+        self.assertEqual(len(self.server.requests), 10)
+        self.assertEqual(len(set(self.server.requests)), 1)
+
+    def test_retries(self):
+        """Test retries of queries when server is unavailable."""
+        self.server.nr_failures = 2
+        resp = self.client.get_pvs_info('SI-Glob:AP-Test-Mon')
+        self.assertEqual(resp[0]['pvName'], 'SI-Glob:AP-Test-Mon')
+        self.assertEqual(len(self.server.requests), 3)
+
+        self.server.requests.clear()
+        self.server.nr_failures = 1
+        self.client.query_max_retries = 0
+        self.assertIsNone(self.client.get_pvs_info('SI-Glob:AP-Test-Mon'))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_restart(self):
+        """Test queries after client is shut down and connected again."""
+        self.assertIsNotNone(self.client.get_pvs_info('SI-Glob:AP-*'))
+        self.client.shutdown()
+        self.client.connect()
+        self.assertIsNotNone(self.client.get_pvs_info('SI-Glob:AP-*'))
+
+    def test_max_concurrency(self):
+        """Test pooled connections follow query_max_concurrency."""
+        self.assertIsNotNone(self.client.get_pvs_info('SI-Glob:AP-*'))
+        nrqueries = ClientArchiver.DEF_QUERY_MAX_CONCURRENCY + 20
+        self.client.query_max_concurrency = nrqueries
+        self.server.delay = 0.2
+        urls = [
+            self.client._create_url(method='getPVStatus', pv=f'PV{i}')
+            for i in range(nrqueries)]
+        resps = self.client.make_request(urls)
+        self.assertEqual(len(resps), nrqueries)
+        self.assertEqual(self.server.max_inflight, nrqueries)
+
+    def test_properties(self):
+        """Test retries properties."""
+        with self.assertRaises(TypeError):
+            self.client.query_max_retries = '1'
+        self.client.query_max_retries = -1
+        self.assertEqual(self.client.query_max_retries, 0)
+        self.client.query_retry_backoff = 0.5
+        self.assertEqual(self.client.query_retry_backoff, 0.5)
@@ -1,6 +1,9 @@
 #!/usr/bin/env python-sirius
 """Test webserver implementation module."""
 
+import os
+import shutil
+import tempfile
 from unittest import TestCase, mock
 from urllib.request import URLError
 
@@ -8,6 +11,9 @@ from siriuspy.clientweb import implementation
 import siriuspy.util as util
 
 _TIMEOUT = implementation._TIMEOUT
+_SERVWEB = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'test_data', 'servweb')
 # Dependencies
 # _envars.SRVURL_CSCONSTS
 # _urllib_request.urlopen
@@ -92,6 +98,10 @@ class TestClientWeb(TestCase):
         'bsmp_dclink_mapping',
         'mac_schedule_read',
         'doc_services_read',
+        'snapshot_create',
+        'snapshot_load',
+        'snapshot_unload',
+        'snapshot_info',
     }
 
     def test_public_interface(self, mock_read):
@@ -308,3 +318,75 @@ class TestClientWeb(TestCase):
             mock.call(url, timeout=_TIMEOUT),
             mock.call(url, timeout=2 * _TIMEOUT),
         ])
+
+
+def _read_test_servers(url, timeout=_TIMEOUT):
+    """Read tables from test data, as the web server would."""
+    path = os.path.join(_SERVWEB, url.strip('/'))
+    if os.path.isdir(path):
+        return ''.join(
+            '<a href="' + fname + '">' for fname in os.listdir(path))
+    if not os.path.isfile(path):
+        return '# table not in test data\n'
+    with open(path) as fil:
+        return fil.read()
+
+
+class TestSnapshot(TestCase):
+    """Test snapshot bundle."""
+
+    def setUp(self):
+        """Create temporary folder and mock web server."""
+        self.folder = tempfile.mkdtemp()
+        self.fname = os.path.join(self.folder, 'snapshot.json.gz')
+        patcher = mock.patch.object(
+            implementation, '_read_servers', autospec=True,
+            side_effect=_read_test_servers)
+        self.addCleanup(patcher.stop)
+        self.read_mock = patcher.start()
+
+    def tearDown(self):
+        """Unload bundle and remove temporary folder."""
+        implementation.snapshot_unload()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_create_load(self):
+        """Test tables are read from bundle, without server."""
+        nrtables = implementation.snapshot_create(self.fname)
+        self.assertGreater(nrtables, 100)
+        self.assertEqual(implementation.snapshot_info(), (None, 0))
+
+        self.read_mock.side_effect = URLError('offline')
+        self.assertFalse(implementation.server_online())
+        self.assertTrue(
+            implementation.snapshot_load(self.fname, refresh=False))
+        self.assertEqual(
+            implementation.snapshot_info(), (self.fname, nrtables))
+        self.assertTrue(implementation.server_online())
+        self.assertEqual(
+            implementation.ps_pstypes_names_read(),
+            _read_test_servers('/pwrsupply/pstypes-names.txt'))
+        fname = 'si-quadrupole-q14-fam.txt'
+        self.assertEqual(
+            implementation.magnets_excitation_data_read(fname),
+            _read_test_servers('/magnet/excitation-data/' + fname))
+
+        # tables are requested to the server again
+        implementation.snapshot_unload()
+        with self.assertRaises(URLError):
+            implementation.ps_pstypes_names_read()
+
+    def test_refresh(self):
+        """Test bundle refresh."""
+        self.assertFalse(
+            implementation.snapshot_load(self.fname, refresh=False))
+        implementation._snapshot_refresh(self.fname, _TIMEOUT)
+        self.assertTrue(
+            implementation.snapshot_load(self.fname, refresh=False))
+
+        url = '/pwrsupply/psmodels.txt'
+        self.read_mock.side_effect = lambda url, timeout: 'NewTable'
+        self.assertNotEqual(implementation.read_url(url), 'NewTable')
+        implementation._snapshot_refresh(self.fname, _TIMEOUT)
+        implementation.snapshot_load(self.fname, refresh=False)
+        self.assertEqual(implementation.read_url(url), 'NewTable')
@@ -0,0 +1,93 @@
+#!/usr/bin/env python-sirius
+
+"""Test online lifetime estimator."""
+
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.currinfo.lifetime.estimator import LifetimeEstimator
+
+
+class TestLifetimeEstimator(TestCase):
+    """Test LifetimeEstimator."""
+
+    def setUp(self):
+        """Create decaying current samples."""
+        rng = np.random.default_rng(3)
+        self.tini = 1.7e9
+        self.tstamps = self.tini + np.cumsum(rng.uniform(0.05, 0.15, 20000))
+        self.values = 100 * np.exp(-(self.tstamps - self.tini) / 36000)
+        self.values += rng.normal(0, 1e-3, self.tstamps.size)
+        self.now = self.tstamps[-1] + 0.3
+
+    @staticmethod
+    def _fit(tstamps, values, now, fit):
+        """Reference fit with numpy.polyfit."""
+        if fit == 'exp':
+            slope, _ = np.polyfit(tstamps - now, np.log(values), 1)
+            return -1 / slope
+        slope, intercept = np.polyfit(tstamps - now, values, 1)
+        return -intercept / slope
+
+    def test_fit(self):
+        """Test lifetimes are equal to least squares fits."""
+        estim = LifetimeEstimator()
+        for tstamp, value in zip(self.tstamps, self.values):
+            estim.add(tstamp, value)
+        for fit in ('exp', 'lin'):
+            ltime, std = estim.get_lifetime(self.now, fit=fit)
+            ref = self._fit(self.tstamps, self.values, self.now, fit)
+            self.assertAlmostEqual(ltime / ref, 1, places=8)
+            self.assertGreater(std, 0)
+            self.assertLess(std, 0.01 * ltime)
+
+    def test_window(self):
+        """Test samples leaving window are removed from the fit."""
+        estim = LifetimeEstimator(maxlen=5000)
+        first = self.tstamps[0]
+        for i, (tstamp, value) in enumerate(zip(self.tstamps, self.values)):
+            estim.add(tstamp, value)
+            if not i % 100:
+                first = max(first, tstamp - 300)
+                self.assertTrue(estim.set_window(first))
+        sel = self.tstamps >= first
+        sel[:-5000] = False
+        ref = self._fit(
+            self.tstamps[sel], self.values[sel], self.now, 'exp')
+        ltime, _ = estim.get_lifetime(self.now)
+        self.assertAlmostEqual(ltime / ref, 1, places=6)
+        np.testing.assert_array_equal(estim.timestamps, self.tstamps[sel])
+
+    def test_decimation(self):
+        """Test online decimation is equal to the one of reset."""
+        online = LifetimeEstimator(min_interval=1.0, offset=0.5)
+        online.set_window(self.tini + 100, self.tini + 1500)
+        for tstamp, value in zip(self.tstamps, self.values):
+            online.add(tstamp, value)
+        reset = LifetimeEstimator(min_interval=1.0, offset=0.5)
+        self.assertFalse(reset.set_window(self.tini + 100, self.tini + 1500))
+        reset.reset(self.tstamps, self.values)
+        np.testing.assert_array_equal(online.timestamps, reset.timestamps)
+        self.assertLess(len(online), 1401)
+        self.assertTrue(np.all(np.diff(np.floor(online.timestamps)) > 0))
+        for fit in ('exp', 'lin'):
+            self.assertAlmostEqual(
+                online.get_lifetime(self.now, fit)[0] /
+                reset.get_lifetime(self.now, fit)[0], 1, places=9)
+
+    def test_invalid(self):
+        """Test fits that are not possible."""
+        estim = LifetimeEstimator(offset=1.0)
+        self.assertEqual(estim.get_lifetime(self.now), (0.0, 0.0))
+        estim.add(1.0, 0.5)
+        estim.add(2.0, 2.0)
+        estim.add(3.0, 3.0)
+        self.assertEqual(estim.get_lifetime(4.0, 'exp'), (0.0, 0.0))
+        self.assertAlmostEqual(estim.get_lifetime(4.0, 'lin')[0], -8/3)
+        estim.clear()
+        estim.add(1.0, 2.0)
+        estim.add(2.0, 2.0)
+        self.assertEqual(
+            estim.get_lifetime(4.0, 'lin'), (math.inf, math.inf))
@@ -2,8 +2,12 @@
 
 """Module to test CurrInfo Lifetime Soft IOC main module."""
 
+import time
 import unittest
 from unittest import mock
+
+import numpy as np
+
 import siriuspy.util as util
 from siriuspy.currinfo import SILifetimeApp
 
@@ -60,6 +64,39 @@ class TestASAPCurrInfoLifetimeMain(unittest.TestCase):
         self.app.write('CurrOffset-SP', 1)
         self.assertEqual(self.app._current_offset, 1)
 
+    def _fill_estimators(self):
+        now = time.time()
+        tstamps = now - np.arange(200, 0, -1)
+        values = 100 * np.exp(-(tstamps - now) / 36000)
+        for estim in (self.app._current_est, self.app._bpmsum_est):
+            estim.reset(tstamps, values)
+            self.assertEqual(len(estim), 200)
+        return tstamps, values
+
+    def test_write_BuffRst(self):
+        """Test write BuffRst-Cmd discards samples of estimators."""
+        self._fill_estimators()
+        self.app.write('BuffRst-Cmd', 0)
+        self.assertEqual(len(self.app._current_est), 0)
+        self.assertEqual(len(self.app._bpmsum_est), 0)
+
+    def test_auto_reset(self):
+        """Test lifetime is not updated with samples of auto reset."""
+        tstamps, values = self._fill_estimators()
+        # abrupt variation of current in the last sample.
+        values[-1] -= 1
+        buffer = mock.Mock()
+        buffer.acquire.return_value = True
+        buffer.get_serie.return_value = (tstamps, values)
+        self.app._current_buffer = buffer
+        self.app._is_stored = 1
+        with mock.patch.object(self.app, 'run_callbacks') as run_callbacks:
+            self.app._callback_calclifetime(
+                'SI-Glob:AP-CurrInfo:Current-Mon', tstamps[-1])
+        self.assertEqual(len(self.app._current_est), 0)
+        reasons = [args[0] for args, _ in run_callbacks.call_args_list]
+        self.assertNotIn('Lifetime-Mon', reasons)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -116,12 +116,14 @@ class TestCurrInfoCSDevice(TestCase):
         self.assertTrue('LastSplTimeBPM-RB' in dbase)
         self.assertTrue('Lifetime-Mon' in dbase)
         self.assertTrue('LifetimeHour-Mon' in dbase)
+        self.assertTrue('LifetimeStd-Mon' in dbase)
         self.assertTrue('BuffSize-Mon' in dbase)
         self.assertTrue('BuffSizeTot-Mon' in dbase)
         self.assertTrue('BufferValue-Mon' in dbase)
         self.assertTrue('BufferTimestamp-Mon' in dbase)
         self.assertTrue('LifetimeBPM-Mon' in dbase)
         self.assertTrue('LifetimeBPMHour-Mon' in dbase)
+        self.assertTrue('LifetimeBPMStd-Mon' in dbase)
         self.assertTrue('BuffSizeBPM-Mon' in dbase)
         self.assertTrue('BuffSizeTotBPM-Mon' in dbase)
         self.assertTrue('BufferValueBPM-Mon' in dbase)
@@ -146,5 +148,7 @@ class TestCurrInfoCSDevice(TestCase):
         self.assertEqual(dbase['LastSplTimeBPM-RB']['unit'], 's')
         self.assertEqual(dbase['Lifetime-Mon']['unit'], 's')
         self.assertEqual(dbase['LifetimeHour-Mon']['unit'], 'h')
+        self.assertEqual(dbase['LifetimeStd-Mon']['unit'], 's')
         self.assertEqual(dbase['LifetimeBPM-Mon']['unit'], 's')
         self.assertEqual(dbase['LifetimeBPMHour-Mon']['unit'], 'h')
+        self.assertEqual(dbase['LifetimeBPMStd-Mon']['unit'], 's')
@@ -0,0 +1,237 @@
+#!/usr/bin/env python-sirius
+
+"""Test waiting and bulk get of Device and DeviceSet."""
+
+import re
+import threading
+import time
+from unittest import TestCase, mock
+
+import epics
+import numpy as np
+
+from siriuspy.devices.device import Device, DeviceSet, _WAIT_REGISTRY, \
+    _WaitRegistry
+from siriuspy.simul import Simulation, Simulator
+
+
+class _SimWait(Simulator):
+    """Simulator of test PVs."""
+
+    def callback_pv_dbase(self):
+        """."""
+        return {re.compile('TEST-WAIT.*'): {'type': 'float', 'value': 0.0}}
+
+    def callback_pv_add(self, pvname):
+        """."""
+
+    def callback_pv_get(self, pvname, **kwargs):
+        """."""
+
+    def callback_pv_put(self, pvname, value, **kwargs):
+        """."""
+        return True
+
+    def callback_update(self, **kwargs):
+        """."""
+
+
+class _PollingPV:
+    """PV whose remove_callback runs callbacks of all PVs, as ca.poll."""
+
+    auto_monitor = True
+    pvobjs = []
+
+    def __init__(self):
+        """."""
+        self.callbacks = dict()
+        self.pvobjs.append(self)
+
+    def add_callback(self, callback, **kwargs):
+        """."""
+        index = len(self.callbacks) + 1
+        self.callbacks[index] = (callback, kwargs)
+        return index
+
+    def remove_callback(self, index):
+        """."""
+        self.callbacks.pop(index)
+        for pvobj in self.pvobjs:
+            for callback, kwargs in list(pvobj.callbacks.values()):
+                callback(**kwargs)
+
+
+def _put_later(pairs, delay=0.1):
+    """Put values of (device, propty, value) after delay, in a thread."""
+    def _put():
+        for dev, propty, value in pairs:
+            time.sleep(delay)
+            dev[propty] = value
+    thread = threading.Thread(target=_put, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestWait(TestCase):
+    """Test waiting methods."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Register simulator."""
+        cls.simulator = _SimWait()
+        Simulation.simulator_register(cls.simulator)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unregister simulator."""
+        Simulation.simulator_unregister(cls.simulator)
+
+    def setUp(self):
+        """Create devices."""
+        props = ('Val-SP', 'Val-RB')
+        self.devs = [
+            Device('TEST-WAIT{}'.format(i), props2init=props)
+            for i in range(5)]
+        for dev in self.devs:
+            dev['Val-SP'] = 0.0
+            dev['Val-RB'] = 0.0
+
+    def test_wait(self):
+        """Test wait returns on update and times out."""
+        dev = self.devs[0]
+        thread = _put_later([(dev, 'Val-RB', 1.0)])
+        t0_ = time.time()
+        self.assertTrue(dev.wait('Val-RB', 1.0, timeout=5))
+        self.assertLess(time.time() - t0_, 1)
+        thread.join()
+        self.assertFalse(dev.wait('Val-RB', 2.0, timeout=0.2))
+        self.assertTrue(dev.wait('Val-RB', 0.5, timeout=0, comp='gt'))
+        self.assertTrue(dev.wait_float('Val-RB', 1.05, timeout=0))
+        self.assertFalse(_WAIT_REGISTRY._pvs)
+
+    def test_wait_several(self):
+        """Test waiting several properties."""
+        dev = self.devs[1]
+        _put_later([(dev, 'Val-SP', 2.0), (dev, 'Val-RB', 3.0)]).join()
+        self.assertTrue(
+            dev.wait_several({'Val-SP': 2.0, 'Val-RB': 3.0}, timeout=0))
+        thread = _put_later([(dev, 'Val-RB', 4.0)])
+        self.assertFalse(
+            dev.wait_several({'Val-SP': 3.0, 'Val-RB': 4.0}, timeout=0.5))
+        thread.join()
+
+    def test_wait_all(self):
+        """Test DeviceSet returns when last device is updated."""
+        devset = DeviceSet(self.devs)
+        pairs = [(dev, 'Val-RB', i + 1.0) for i, dev in enumerate(self.devs)]
+        thread = _put_later(pairs, delay=0.05)
+        t0_ = time.time()
+        allok = devset.wait_devices_propty(
+            'Val-RB', [i + 1.0 for i in range(5)], timeout=5)
+        self.assertTrue(allok)
+        self.assertLess(time.time() - t0_, 1)
+        thread.join()
+
+        allok, probs = devset.wait_all(
+            {'Val-RB': 3.0, 'Val-SP': 0.0}, comp='le', timeout=0.2,
+            return_prob=True)
+        self.assertFalse(allok)
+        self.assertEqual(probs, ['TEST-WAIT3:Val-RB', 'TEST-WAIT4:Val-RB'])
+
+    def test_unregister_polling(self):
+        """Test callbacks run while removing a callback do not deadlock."""
+        registry = _WaitRegistry()
+        pvobjs = [_PollingPV(), _PollingPV()]
+        self.addCleanup(_PollingPV.pvobjs.clear)
+        conds = [(pvobj, lambda: True) for pvobj in pvobjs]
+        thread = threading.Thread(
+            target=registry.wait, args=(conds, ), daemon=True)
+        thread.start()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(registry._pvs)
+        for pvobj in pvobjs:
+            self.assertFalse(pvobj.callbacks)
+
+    def test_not_monitored(self):
+        """Test conditions of PVs not monitored are polled."""
+        dev = Device('TEST-WAIT-NoMon', props2init=('Val-SP', ))
+        dev.pv_object('Val-SP').auto_monitor = False
+        thread = _put_later([(dev, 'Val-SP', 1.0)])
+        self.assertTrue(dev.wait('Val-SP', 1.0, timeout=5))
+        thread.join()
+
+
+class TestBatch(TestCase):
+    """Test bulk get of DeviceSet properties."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Register simulator."""
+        cls.simulator = _SimWait()
+        Simulation.simulator_register(cls.simulator)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unregister simulator."""
+        Simulation.simulator_unregister(cls.simulator)
+
+    def setUp(self):
+        """Create device set."""
+        props = ('Val-SP', 'Val-RB')
+        devs = [
+            Device('TEST-WAIT-Batch{}'.format(i), props2init=props)
+            for i in range(4)]
+        for i, dev in enumerate(devs):
+            dev['Val-SP'] = float(i)
+            dev['Val-RB'] = 10.0 * i
+        self.devset = DeviceSet(devs)
+
+    def test_get(self):
+        """Test values are in the order of devices."""
+        vals = self.devset.get_devices_propty('Val-SP')
+        np.testing.assert_array_equal(vals, [0, 1, 2, 3])
+        vsp, vrb = self.devset.get_devices_propty(
+            ['Val-SP', 'Val-RB'], devices=self.devset.devices[2:])
+        np.testing.assert_array_equal(vsp, [2, 3])
+        np.testing.assert_array_equal(vrb, [20, 30])
+
+    def test_timestamps(self):
+        """Test timestamps of properties."""
+        devs = self.devset.devices
+        tsmps = self.devset.get_devices_timestamps(['Val-SP', 'Val-RB'])
+        self.assertEqual(tsmps.shape, (2, 4))
+        self.assertEqual(tsmps[1, 3], devs[3].pv_object('Val-RB').timestamp)
+        self.assertEqual(
+            self.devset.get_devices_timestamps([]).shape, (0, 4))
+
+    def test_update_not_monitored(self):
+        """Test update refreshes values of PVs not monitored."""
+        dev = Device('TEST-CA-NoMon', props2init=())
+        pvobj = epics.PV('TEST-CA-NoMon:Val-RB', auto_monitor=False)
+        pvobj.connected = True
+        dev._pvs['Val-RB'] = pvobj
+        reply = {'value': 3.0, 'timestamp': 10.0}
+        with mock.patch.object(epics.ca, 'get_with_metadata'), \
+                mock.patch.object(epics.ca, 'flush_io'), \
+                mock.patch.object(
+                    epics.ca, 'get_complete_with_metadata',
+                    return_value=reply) as get_complete:
+            DeviceSet([dev]).update()
+        get_complete.assert_called_once()
+        self.assertEqual(pvobj._args['value'], 3.0)
+        self.assertEqual(pvobj._args['timestamp'], 10.0)
+
+    def test_array(self):
+        """Test arrays of values with different shapes."""
+        vals = DeviceSet._get_array([np.zeros(3), None, np.ones(2)])
+        self.assertEqual(vals.dtype, object)
+        self.assertIsNone(vals[1])
+        vals = DeviceSet._get_array([np.zeros(3), np.ones(3)])
+        self.assertEqual(vals.shape, (2, 3))
+        vals = DeviceSet._get_array([np.zeros(2), np.ones(2), None])
+        self.assertEqual(vals.shape, (3, ))
+        self.assertEqual(vals[0].shape, (2, ))
+        vals = DeviceSet._get_array([np.zeros(2), 1.0])
+        self.assertEqual(vals.dtype, object)
+        self.assertEqual(vals[1], 1.0)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python-sirius
+
+"""Test batched evaluation of computed PVs."""
+
+import time
+from unittest import TestCase
+
+from siriuspy.diagsys.pvs import ComputedPV, ComputedPVEngine, \
+    compute_diff_updates
+from siriuspy.diagsys.psdiag.pvs import PSDiffPV
+from siriuspy.pwrsupply.csdev import Const as PSConst
+
+
+class _PrimaryPV:
+    """Primary PV with settable value that runs callbacks on put."""
+
+    def __init__(self, pvname, value=None):
+        """."""
+        self.pvname = pvname
+        self.value = value
+        self.connected = False
+        self._callbacks = list()
+
+    def add_callback(self, func):
+        """."""
+        self._callbacks.append(func)
+
+    def run_callbacks(self):
+        """."""
+        for func in self._callbacks:
+            func(pvname=self.pvname, value=self.value)
+
+    def put(self, value):
+        """."""
+        self.value = value
+        self.run_callbacks()
+
+
+class _Counter:
+    """Computer without batch evaluation, which counts its calls."""
+
+    def __init__(self):
+        """."""
+        self.nr_calls = 0
+
+    def compute_update(self, computed_pv, updated_pv_name, value):
+        """."""
+        self.nr_calls += 1
+        return {'value': computed_pv.pvs[0].value}
+
+
+class _Faulty:
+    """Computer which raises exceptions for negative values."""
+
+    @staticmethod
+    def compute_update_batch(computed_pvs):
+        """."""
+        return [
+            _Faulty.compute_update(None, cpv, None, None)
+            for cpv in computed_pvs]
+
+    def compute_update(self, computed_pv, updated_pv_name, value):
+        """."""
+        value = computed_pv.pvs[0].value
+        if value < 0:
+            raise ValueError('faulty computer')
+        return {'value': value}
+
+
+def _create_diff_pv(engine, psname, monitor=False):
+    pvs = [None]*4
+    for idx, propty in zip(
+            [PSDiffPV.CURRT_SP, PSDiffPV.CURRT_MON, PSDiffPV.CURRT_REF,
+             PSDiffPV.OPMODESTS],
+            ['Current-SP', 'Current-Mon', 'CurrentRef-Mon', 'OpMode-Sts']):
+        pvs[idx] = _PrimaryPV(psname + ':' + propty, 0)
+    cpv = ComputedPV(
+        psname + ':DiagCurrentDiff-Mon', PSDiffPV(), engine, pvs,
+        monitor=monitor)
+    for pvobj in pvs:
+        pvobj.connected = True
+    return cpv
+
+
+class TestComputeDiff(TestCase):
+    """Test batched computation of differences."""
+
+    def test_diff_updates(self):
+        """Test differences and disconnected PVs."""
+        pvs = [_PrimaryPV('A', 1.0), _PrimaryPV('B', 3.5), _PrimaryPV('C')]
+        for pvobj in pvs:
+            pvobj.connected = True
+        pvd = _PrimaryPV('D', 2.0)
+        updates = compute_diff_updates(
+            [(pvs[0], pvs[1]), None, (pvs[0], pvs[2]), (pvs[0], pvd)])
+        self.assertEqual(updates, [{'value': 2.5}, None, None, None])
+
+    def test_ps_diff(self):
+        """Test batch of PSDiffPV equals its evaluation one at a time."""
+        engine = ComputedPVEngine()
+        cpvs = [
+            _create_diff_pv(engine, 'SI-Fam:PS-QFA'),
+            _create_diff_pv(engine, 'SI-01M1:PS-FCH'),
+            _create_diff_pv(engine, 'SI-01M2:PS-FCH')]
+        for idx, cpv in enumerate(cpvs):
+            cpv.pvs[PSDiffPV.CURRT_SP].value = 1.0
+            cpv.pvs[PSDiffPV.CURRT_MON].value = 1.5 + idx
+            cpv.pvs[PSDiffPV.CURRT_REF].value = 1.25
+        cpvs[2].pvs[PSDiffPV.OPMODESTS].value = PSConst.OpModeFOFBSts.fofb
+        updates = PSDiffPV.compute_update_batch(cpvs)
+        expected = [
+            cpv.computer.compute_update(cpv, None, None) for cpv in cpvs]
+        self.assertEqual(updates, expected)
+        self.assertEqual(updates[2], {'value': 2.25})
+
+        cpvs[1].pvs[PSDiffPV.CURRT_REF].connected = False
+        self.assertIsNone(PSDiffPV.compute_update_batch(cpvs)[1])
+
+
+class TestComputedPVEngine(TestCase):
+    """Test ComputedPVEngine."""
+
+    def test_evaluate(self):
+        """Test computed PVs are evaluated with one call for each type."""
+        engine = ComputedPVEngine()
+        cpvs = [_create_diff_pv(engine, f'SI-Fam:PS-Q{i}') for i in range(5)]
+        counter = _Counter()
+        pvobj = _PrimaryPV('Cnt', 3)
+        cpvs.append(ComputedPV('Cnt-Mon', counter, engine, [pvobj], False))
+        cpvs.append(ComputedPV('Cnt2-Mon', counter, engine, [pvobj], False))
+        pvobj.connected = True
+        for idx, cpv in enumerate(cpvs[:5]):
+            cpv.pvs[PSDiffPV.CURRT_MON].value = idx
+        values = list()
+        cpvs[0].add_callback(lambda **kws: values.append(kws['value']))
+
+        engine.evaluate(cpvs)
+        self.assertEqual(
+            [cpv.get(update=False) for cpv in cpvs], [0, 1, 2, 3, 4, 3, 3])
+        self.assertEqual(counter.nr_calls, 2)
+        self.assertEqual(values, [0])
+        stats = engine.stats
+        self.assertEqual(stats['nr_requests'], 7)
+        self.assertEqual(stats['nr_evaluations'], 7)
+        self.assertEqual(stats['nr_calls'], 3)
+        self.assertEqual(stats['nr_cycles'], 1)
+        self.assertAlmostEqual(stats['batching_ratio'], 7/3)
+        self.assertGreaterEqual(stats['latency_max'], stats['evaltime_max'])
+
+        # callbacks are issued only for changed values.
+        engine.evaluate(cpvs)
+        self.assertEqual(values, [0])
+        engine.reset_stats()
+        self.assertEqual(engine.stats['nr_requests'], 0)
+
+    def test_errors(self):
+        """Test exceptions of computers only affect their computed PVs."""
+        engine = ComputedPVEngine()
+        pvbad, pvgood = _PrimaryPV('Bad', -1), _PrimaryPV('Good', 1)
+        cpvs = [
+            ComputedPV('Bad-Mon', _Faulty(), engine, [pvbad], False),
+            ComputedPV('Good-Mon', _Faulty(), engine, [pvgood], False),
+            ComputedPV('Cnt-Mon', _Counter(), engine, [pvbad], False)]
+        with self.assertLogs(level='ERROR') as logs:
+            engine.evaluate(cpvs)
+        self.assertEqual(
+            [cpv.get(update=False) for cpv in cpvs], [None, 1, -1])
+        # batch evaluation and then evaluation of Bad-Mon raised.
+        self.assertEqual(engine.stats['nr_errors'], 2)
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('Bad-Mon', logs.output[1])
+
+    def test_coalescing(self):
+        """Test updates of primary PVs are coalesced in the window."""
+        engine = ComputedPVEngine(window=0.2)
+        cpv = _create_diff_pv(engine, 'SI-Fam:PS-QFA', monitor=True)
+        values = list()
+        cpv.add_callback(lambda **kws: values.append(kws['value']))
+        # monitor computed PVs are updated by their first primary PV.
+        pvobj = cpv.pvs[PSDiffPV.CURRT_SP]
+        for idx in range(10):
+            pvobj.put(float(idx))
+        time.sleep(0.6)
+        try:
+            self.assertEqual(values, [-9.0])
+            stats = engine.stats
+            self.assertEqual(stats['nr_requests'], 10)
+            self.assertEqual(stats['nr_evaluations'], 1)
+            self.assertEqual(stats['coalescing_ratio'], 10)
+            self.assertGreaterEqual(stats['latency_max'], 0.2)
+        finally:
+            engine.stop()
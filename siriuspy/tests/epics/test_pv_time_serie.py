@@ -0,0 +1,138 @@
+#!/usr/bin/env python-sirius
+
+"""Test ring buffer of PV time series."""
+
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.epics.pv_time_serie import RingBuffer, SiriusPVTimeSerie
+
+
+class _PVStandIn:
+    """PV with settable value and timestamp."""
+
+    connected = True
+
+    def __init__(self):
+        """."""
+        self.value = 0.0
+        self.timestamp = 0.0
+
+
+class TestRingBuffer(TestCase):
+    """Test RingBuffer."""
+
+    def test_bounded(self):
+        """Test buffer keeps newest samples, as a deque."""
+        buf = RingBuffer(maxlen=1500)
+        for i in range(10000):
+            buf.append(i, 2*i)
+        np.testing.assert_array_equal(buf.timestamps, np.arange(8500, 10000))
+        np.testing.assert_array_equal(buf.values, 2*buf.timestamps)
+        self.assertLessEqual(buf.timestamps.base.size, 3000)
+
+    def test_unbounded(self):
+        """Test buffer grows without losing samples."""
+        buf = RingBuffer()
+        buf.extend(range(5000), range(5000))
+        self.assertEqual(len(buf), 5000)
+        np.testing.assert_array_equal(buf.values, np.arange(5000))
+
+    def test_trim(self):
+        """Test trim of old samples."""
+        buf = RingBuffer()
+        buf.extend(np.arange(10.0), np.arange(10.0))
+        buf.trim(3.5)
+        np.testing.assert_array_equal(buf.timestamps, np.arange(4, 10))
+        buf.trim(4)
+        self.assertEqual(buf.timestamps[0], 5)
+        buf.trim(9)
+        self.assertEqual(len(buf), 0)
+
+    def test_waveform(self):
+        """Test waveform values."""
+        buf = RingBuffer(maxlen=3)
+        for i in range(5):
+            buf.append(i, np.full(4, i, dtype=int))
+        self.assertEqual(buf.values.shape, (3, 4))
+        self.assertEqual(buf.values.dtype, float)
+        np.testing.assert_array_equal(buf.values[:, 0], [2, 3, 4])
+        with self.assertRaises(ValueError):
+            buf.append(5, np.zeros(3))
+
+    def test_resize_keep(self):
+        """Test resize and selection of samples."""
+        buf = RingBuffer()
+        buf.extend(range(10), range(10))
+        buf.resize(4)
+        np.testing.assert_array_equal(buf.values, [6, 7, 8, 9])
+        buf.keep([True, False, True, False])
+        np.testing.assert_array_equal(buf.values, [6, 8])
+        buf.resize(0)
+        self.assertEqual(len(buf), 0)
+
+
+class TestSiriusPVTimeSerie(TestCase):
+    """Test SiriusPVTimeSerie."""
+
+    def setUp(self):
+        """Create time serie."""
+        self.pvobj = _PVStandIn()
+        self.serie = SiriusPVTimeSerie(self.pvobj, nr_max_points=5)
+
+    def _acquire(self, nrpts, ini=0):
+        now = time.time()
+        for i in range(ini, ini + nrpts):
+            self.pvobj.timestamp = now - 10 + i
+            self.pvobj.value = float(i)
+            self.serie.acquire()
+
+    def test_acquire(self):
+        """Test acquisition of new datapoints only."""
+        self._acquire(8)
+        self.assertFalse(self.serie.acquire())
+        tstamp, value = self.serie.serie
+        np.testing.assert_array_equal(value, [3, 4, 5, 6, 7])
+        np.testing.assert_allclose(tstamp, [-7, -6, -5, -4, -3], atol=0.1)
+
+    def test_time_window(self):
+        """Test datapoints out of time window are discarded."""
+        self._acquire(8)
+        self.serie.time_window = 5.5
+        _, value = self.serie.get_serie(time_absolute=True)
+        np.testing.assert_array_equal(value, [5, 6, 7])
+
+    def test_views(self):
+        """Test views of series are read-only."""
+        self._acquire(3)
+        tstamp, value = self.serie.get_serie(time_absolute=True, copy=False)
+        self.assertEqual(tstamp[-1], self.pvobj.timestamp)
+        with self.assertRaises(ValueError):
+            value[0] = 1
+        _, value = self.serie.get_serie(time_absolute=True)
+        value[0] = 1
+        self.assertEqual(self.serie.serie[1][0], 0)
+
+    def test_time_min_interval(self):
+        """Test datapoints are filtered by new minimum interval."""
+        self.serie.nr_max_points = None
+        self._acquire(10)
+        self.serie.time_min_interval = 2.5
+        _, value = self.serie.serie
+        np.testing.assert_array_equal(value, [0, 3, 6, 9])
+
+    def test_waveform(self):
+        """Test waveform datapoints and change of waveform size."""
+        now = time.time() - 10
+        for i in range(3):
+            self.pvobj.timestamp = now + i
+            self.pvobj.value = np.arange(4) + i
+            self.serie.acquire()
+        _, value = self.serie.serie
+        self.assertEqual(value.shape, (3, 4))
+        self.pvobj.timestamp = now + 3
+        self.pvobj.value = np.arange(2)
+        self.assertTrue(self.serie.acquire())
+        self.assertEqual(self.serie.serie[1].shape, (1, 2))
@@ -0,0 +1,219 @@
+#!/usr/bin/env python-sirius
+
+"""Test full and incremental updates of machine reports."""
+
+import asyncio
+import threading
+from datetime import datetime
+from unittest import TestCase, mock
+
+import numpy as np
+from aiohttp import web
+
+from siriuspy.clientarch import ClientArchiver, Time
+from siriuspy.machshift import macschedule
+from siriuspy.machshift.csdev import Const
+from siriuspy.machshift.macreport import MacReport
+from siriuspy.sofb.csdev import ConstTLines as SOFBConst
+
+_TSTART = Time(2024, 3, 4, 6, 0).timestamp()
+_HOUR = 60 * 60
+_SHIFT = Const.MachShift
+_MAC_SCHEDULE = """
+1 1
+3 4 08h00-B-200.0
+3 5 08h00-E
+"""
+
+
+def _events(pvname):
+    """Return times and values of synthetic raw data of a PV."""
+    times = [_TSTART - 24*_HOUR]
+    values = [_SHIFT.Commissioning if 'MachShift' in pvname else 0]
+    if pvname == 'AS-Glob:AP-MachShift:Mode-Sts':
+        # users shift starting before programmed, with wrong shifts of
+        # 30s, 55s, 60s and 30min.
+        times += [_TSTART + 1.9*_HOUR]
+        values += [_SHIFT.Users]
+        for ini, dur in ((3, 30), (6, 55), (6.5, 60), (9, 0.5*_HOUR)):
+            times += [_TSTART + ini*_HOUR, _TSTART + ini*_HOUR + dur]
+            values += [_SHIFT.MachineStudy, _SHIFT.Users]
+    elif pvname == 'SI-Glob:AP-SOFB:LoopState-Sts':
+        times += [5*_HOUR + _TSTART, 5.3*_HOUR + _TSTART]
+        values = [
+            SOFBConst.LoopState.Closed, SOFBConst.LoopState.Open,
+            SOFBConst.LoopState.Closed]
+    elif pvname.startswith('SI-Fam:PS-B1B2-1:'):
+        times += [10*_HOUR + _TSTART, 10.1*_HOUR + _TSTART]
+        values += [1, 0]
+    return np.array(times), np.array(values)
+
+
+def _current(times):
+    """Return synthetic stored current, with two beam dumps."""
+    value = 200 * np.exp(-(times - _TSTART)/(20*_HOUR))
+    for ini, end in ((4, 4.2), (9.7, 9.8)):
+        sel = (times >= _TSTART + ini*_HOUR) & (times < _TSTART + end*_HOUR)
+        value[sel] = 0
+    return value
+
+
+class _ArchiverStandIn:
+    """Local server with synthetic data of machine report PVs."""
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.url = None
+        self.requests = []
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(started, ), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start())
+        started.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get('/retrieval/data/getData.json', self._get_data)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f'http://127.0.0.1:{port}'
+
+    async def _get_data(self, request):
+        pvname = request.query['pv']
+        start = datetime.fromisoformat(request.query['from']).timestamp()
+        stop = datetime.fromisoformat(request.query['to']).timestamp()
+        self.requests.append((pvname, start, stop))
+        if pvname.startswith('mean_60('):
+            secs = np.arange(start // 60 * 60, stop + 1, 60)
+            values = _current(secs)
+        else:
+            secs, values = _events(pvname)
+            # as the archiver, include last sample before start.
+            ini = max(np.searchsorted(secs, start, side='right') - 1, 0)
+            sel = slice(ini, np.searchsorted(secs, stop, side='right'))
+            secs, values = secs[sel], values[sel]
+        data = [
+            dict(secs=int(sec), nanos=0, val=float(val), status=0,
+                 severity=0)
+            for sec, val in zip(secs, values)]
+        return web.json_response([dict(meta=dict(), data=data)])
+
+
+class TestMacReport(TestCase):
+    """Test machine report updates."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start stand-in server."""
+        cls.server = _ArchiverStandIn()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop stand-in server."""
+        cls.server.stop()
+
+    def setUp(self):
+        """Mock machine schedule and create client."""
+        web_ = mock.patch.object(macschedule, '_web', autospec=True)
+        self.addCleanup(web_.stop)
+        web_ = web_.start()
+        web_.server_online.return_value = True
+        web_.mac_schedule_read.return_value = _MAC_SCHEDULE
+        sched = macschedule.MacScheduleData
+        for data in (
+                sched._mac_schedule_sdata,
+                sched._mac_schedule_ndata_byshift,
+                sched._mac_schedule_ndata_byday,
+                sched._mac_schedule_ndata_inicurr):
+            patch = mock.patch.dict(data, clear=True)
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.client = ClientArchiver(server_url=self.server.url)
+        self.addCleanup(self.client.shutdown)
+        self.server.requests.clear()
+
+    def _create_report(self, duration):
+        report = MacReport(connector=self.client)
+        report.time_start = Time(timestamp=_TSTART)
+        report.time_stop = Time(timestamp=_TSTART + duration)
+        return report
+
+    @staticmethod
+    def _get_stats(report):
+        prefixes = ('_usershift_', '_lsusage_', '_current_')
+        return {
+            key: val for key, val in vars(report).items()
+            if key.startswith(prefixes) and key != '_current_pv'}
+
+    def test_incremental_update(self):
+        """Test incremental update over extended stop gives full update."""
+        full = self._create_report(12*_HOUR)
+        full.update()
+
+        incr = self._create_report(8*_HOUR)
+        incr.update()
+        self.server.requests.clear()
+        incr.time_stop = Time(timestamp=_TSTART + 12*_HOUR)
+        incr.update()
+
+        # only data of the last queried hour and extension is requested
+        overlap = 8*_HOUR - MacReport.INCREMENTAL_OVERLAP
+        self.assertTrue(self.server.requests)
+        self.assertGreaterEqual(
+            min(start for _, start, _ in self.server.requests),
+            _TSTART + overlap)
+        self.assertGreater(incr._reuse_npts, 0)
+
+        np.testing.assert_equal(incr.raw_data, full.raw_data)
+        stats = self._get_stats(full)
+        self.assertGreater(len(stats), 50)
+        np.testing.assert_equal(self._get_stats(incr), stats)
+        # beam dumps, PS failure and wrong shifts not shorter than 60s
+        self.assertEqual(full.usershift_failures_count, 5)
+
+    def test_wrong_shift(self):
+        """Test wrong shifts shorter than 60s are ignored."""
+        report = self._create_report(12*_HOUR)
+        report.update()
+        raw = report.raw_data
+        tstamp = raw['Timestamp']
+        wrong_shift = 1 * (
+            (raw['UserShiftProgmd'] - raw['Shift']['Users']) > 0)
+
+        # per point loop replaced by cumulative sums
+        expected = wrong_shift.astype(float)
+        for i, val in enumerate(wrong_shift):
+            if i < 12:
+                continue
+            if i >= len(wrong_shift) - 12:
+                break
+            if val == 1 and not np.sum(wrong_shift[(i-12):(i+12)]) >= 12:
+                expected[i] = 0
+        np.testing.assert_array_equal(
+            raw['Failures']['WrongShift'], expected)
+
+        for ini, dur, ignored in (
+                (3, 30, True), (6, 55, True), (6.5, 60, False),
+                (9, 0.5*_HOUR, False)):
+            sel = (tstamp >= _TSTART + ini*_HOUR) & \
+                (tstamp < _TSTART + ini*_HOUR + dur)
+            self.assertTrue(wrong_shift[sel].all())
+            self.assertEqual(
+                raw['Failures']['WrongShift'][sel].any(), not ignored)
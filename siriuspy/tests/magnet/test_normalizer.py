@@ -0,0 +1,97 @@
+#!/usr/bin/env python-sirius
+
+"""Test BatchNormalizer."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.magnet.factory import NormalizerFactory
+from siriuspy.magnet.normalizer import BatchNormalizer
+
+
+class BatchNormalizerTest(TestCase):
+    """Test batch conversion of current/strength against normalizers."""
+
+    manames = (
+        'SI-01M2:MA-CH', 'SI-01C1:MA-CV', 'SI-Fam:MA-QDA', 'SI-01M1:MA-QDA',
+        'SI-Fam:MA-SDA0', 'SI-01C2:MA-QS', 'BO-Fam:MA-QF', 'TS-01:MA-QF1A',
+        'BO-Fam:MA-B', 'SI-Fam:MA-B1B2',
+    )
+
+    def setUp(self):
+        """Create batch normalizer."""
+        self.batch = NormalizerFactory.create_batch(self.manames)
+        self.norms = self.batch.normalizers
+        self.rng = np.random.default_rng(42)
+        currs = [norm._excdata.currents for norm in self.norms]
+        self.curr_tab = np.array([(curr[0], curr[-1]) for curr in currs])
+        self.mid_points = np.array([curr[len(curr)//2] for curr in currs])
+
+    def _random_currents(self):
+        # includes values outside of excitation tables limits
+        span = self.curr_tab[:, 1] - self.curr_tab[:, 0]
+        return self.curr_tab[:, 0] + span * self.rng.uniform(
+            -0.2, 1.2, len(self.norms))
+
+    def _assert_match(self, currents, strengths_dipole, strengths_family):
+        kwargs = {
+            'strengths_dipole': strengths_dipole,
+            'strengths_family': strengths_family}
+        stren = self.batch.conv_current_2_strength(currents, **kwargs)
+        curr = self.batch.conv_strength_2_current(stren, **kwargs)
+        sdips = np.broadcast_to(strengths_dipole, currents.shape)
+        for i, norm in enumerate(self.norms):
+            kws = {
+                'strengths_dipole': sdips[i],
+                'strengths_family': strengths_family[i]}
+            self.assertEqual(
+                stren[i], norm.conv_current_2_strength(currents[i], **kws))
+            self.assertEqual(
+                curr[i], norm.conv_strength_2_current(stren[i], **kws))
+
+    def test_manames(self):
+        """Test magnet names."""
+        self.assertEqual(self.batch.manames, self.manames)
+
+    def test_invalid_normalizer(self):
+        """Test creation with invalid normalizer."""
+        with self.assertRaises(ValueError):
+            BatchNormalizer([object()])
+
+    def test_exact_match(self):
+        """Test conversions match those of individual normalizers."""
+        sfam = self.rng.uniform(-1, 1, len(self.norms))
+        for _ in range(10):
+            currents = self._random_currents()
+            sdip = self.rng.uniform(0.1, 3.0, len(self.norms))
+            self._assert_match(currents, sdip, sfam)
+            self._assert_match(currents, 3.0, sfam)
+
+    def test_table_points(self):
+        """Test conversions of tabulated currents."""
+        sfam = np.zeros(len(self.norms))
+        for currents in (self.mid_points, *self.curr_tab.T):
+            self._assert_match(currents, 3.0, sfam)
+
+    def test_multidimensional(self):
+        """Test conversions of arrays of current vectors."""
+        currents = np.array([self._random_currents() for _ in range(5)])
+        sfam = self.rng.uniform(-1, 1, len(self.norms))
+        stren = self.batch.conv_current_2_strength(
+            currents, strengths_dipole=3.0, strengths_family=sfam)
+        self.assertEqual(stren.shape, currents.shape)
+        for curr, strn in zip(currents, stren):
+            np.testing.assert_array_equal(
+                strn, self.batch.conv_current_2_strength(
+                    curr, strengths_dipole=3.0, strengths_family=sfam))
+
+    def test_missing_arguments(self):
+        """Test missing dipole and family strengths."""
+        currents = self._random_currents()
+        with self.assertRaises(ValueError):
+            self.batch.conv_current_2_strength(
+                currents, strengths_family=np.zeros(len(self.norms)))
+        with self.assertRaises(ValueError):
+            self.batch.conv_current_2_strength(
+                currents, strengths_dipole=3.0)
@@ -136,3 +136,56 @@ class TestSiriusPVName(TestCase):
         """Test string."""
         n = namesys.SiriusPVName('ca://PREFIX-SI-Fam:PS-B1B2-1:Current-SP.AVG')
         self.assertIsInstance(n, str)
+
+
+class TestFilter(TestCase):
+    """Test Filter class."""
+
+    names = [
+        'SI-Fam:PS-B1B2-1', 'SI-Fam:PS-QDA', 'SI-01M1:PS-CH',
+        'SI-01M1:PS-QS', 'SI-01M2:PS-CV-1', 'BO-01U:PS-CH',
+        'BO-Fam:PS-B-1', 'TEST-SI-01M1:PS-CH', 'SI-01M1:PS-CH:Current-SP',
+        'SI-01M1',
+    ]
+
+    def test_process_filters(self):
+        """Test process_filters."""
+        filt = namesys.Filter.process_filters
+        self.assertIs(filt(self.names), self.names)
+        self.assertEqual(
+            filt(self.names, {'sec': 'SI', 'dev': 'CH'}),
+            ['SI-01M1:PS-CH', 'SI-01M1:PS-CH:Current-SP'])
+        self.assertEqual(
+            filt(self.names, {'sub': 'Fam', 'dev': 'B'}),
+            ['SI-Fam:PS-B1B2-1', 'BO-Fam:PS-B-1'])
+        self.assertEqual(
+            filt(self.names, {'sub': '(01|Fam).*', 'dev': 'Q'}),
+            ['SI-Fam:PS-QDA', 'SI-01M1:PS-QS'])
+        self.assertEqual(
+            filt(self.names, [{'sec': 'BO'}, {'sub': '01M2'}]),
+            ['SI-01M2:PS-CV-1', 'BO-01U:PS-CH', 'BO-Fam:PS-B-1'])
+        self.assertEqual(
+            filt(self.names, {'dev': 'C.*', 'idx': '1'}),
+            ['SI-01M2:PS-CV-1'])
+        self.assertEqual(filt(self.names, {'sec': 'TEST'}), [])
+
+    def test_cached_results(self):
+        """Test results of repeated filters are new lists."""
+        filt = namesys.Filter.process_filters
+        res = filt(self.names, {'sec': 'SI', 'sub': 'Fam'})
+        res.remove('SI-Fam:PS-QDA')
+        self.assertEqual(
+            filt(self.names, {'sec': 'SI', 'sub': 'Fam'}),
+            ['SI-Fam:PS-B1B2-1', 'SI-Fam:PS-QDA'])
+
+    def test_name_types(self):
+        """Test returned names are the given ones, not cached ones."""
+        filt = namesys.Filter.process_filters
+        fil = {'sec': 'SI', 'dev': 'CH'}
+        filt(self.names, fil)
+        names = [namesys.SiriusPVName(name) for name in self.names]
+        res = filt(names, fil)
+        self.assertEqual(res, ['SI-01M1:PS-CH', 'SI-01M1:PS-CH:Current-SP'])
+        for name in res:
+            self.assertIsInstance(name, namesys.SiriusPVName)
+        self.assertEqual(res[0].dev, 'CH')
@@ -28,6 +28,7 @@ class TestPRUInterface(TestCase):
     """Test PRUInterface API."""
 
     PUB_INTERFACE = (
+        'BYTES_STREAM',
         'open',
         'close',
         'UART_write',
@@ -35,6 +36,7 @@ class TestPRUInterface(TestCase):
         'UART_request',
         'wr_duration',
         'wr_duration_reset',
+        'roundtrip_stats',
     )
 
     def test_public_interface(self):
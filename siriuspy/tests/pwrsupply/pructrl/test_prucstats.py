@@ -0,0 +1,59 @@
+#!/usr/bin/env python-sirius
+
+"""Test prucstats module."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.pwrsupply.pructrl.prucstats import RoundTripStats, ScanStats
+
+
+class TestRoundTripStats(TestCase):
+    """Test RoundTripStats."""
+
+    def test_histogram(self):
+        """Test histograms per device and command."""
+        stats = RoundTripStats()
+        stats.add_stream(bytes((1, 0x12, 0, 1, 0, 0)), 0.0001)
+        stats.add_stream(bytes((1, 0x50, 0, 1, 0, 0)), 0.0012)
+        stats.add_stream(['\x02', '\x12'], 1.0)
+        nbins = len(RoundTripStats.EDGES) + 1
+        hist = stats.get_histogram(1, 0x12)
+        self.assertEqual(hist.size, nbins)
+        self.assertEqual(hist[0], 1)
+        self.assertEqual(stats.get_histogram(1).sum(), 2)
+        self.assertEqual(stats.get_histogram(1)[2], 1)
+        self.assertEqual(stats.get_histogram(2)[-1], 1)
+        self.assertEqual(stats.get_histogram(3).sum(), 0)
+
+
+class TestScanStats(TestCase):
+    """Test ScanStats."""
+
+    def test_latencies(self):
+        """Test latency percentiles over last samples."""
+        stats = ScanStats()
+        self.assertTrue(np.all(stats.get_latency_percentiles() == 0))
+        lats = np.arange(2*ScanStats.SERIES_SIZE) * 1e-3
+        for lat in lats:
+            stats.add_latency(lat)
+        last = 1e3 * lats[-ScanStats.SERIES_SIZE:]
+        np.testing.assert_allclose(
+            stats.get_latency_percentiles((50, 99, 100)),
+            np.percentile(last, (50, 99, 100)))
+
+    def test_queue_length_series(self):
+        """Test queue length series is chronological."""
+        stats = ScanStats()
+        for i in range(1, 4):
+            stats.add_queue_length(i)
+        series = stats.get_queue_length_series()
+        self.assertEqual(list(series[-3:]), [1, 2, 3])
+        self.assertEqual(series[:-3].sum(), 0)
+        for i in range(ScanStats.SERIES_SIZE):
+            stats.add_queue_length(i)
+        series = stats.get_queue_length_series()
+        self.assertEqual(list(series), list(range(ScanStats.SERIES_SIZE)))
+        stats.add_overrun()
+        self.assertEqual(stats.overruns, 1)
@@ -22,6 +22,8 @@ PUB_INTERFACE = (
     'DEFAULT_WFM_OFFSET',
     'DEFAULT_WFM',
     'PSSOFB_MAX_NR_UDC',
+    'PRUC_STATS_SERIES_SIZE',
+    'PRUC_ROUNDTRIP_HIST_EDGES',
     'DEFAULT_SIGGEN_CONFIG',
     'PS_CURRENT_PRECISION',
     'PU_VOLTAGE_PRECISION',
@@ -0,0 +1,147 @@
+#!/usr/bin/env python-sirius
+
+"""Test command ring of PSSOFB worker processes."""
+
+import os
+import time
+from unittest import TestCase, mock
+
+import numpy as np
+
+from siriuspy.pwrsupply import pssofb
+from siriuspy.pwrsupply.pssofb import PSSOFB, PSNamesSOFB
+
+_NR_CORRS = len(PSSOFB.BBBNAMES)
+
+
+class _ConnStandIn:
+    """Connector which accumulates setpoints instead of sending them.
+
+    Each worker process owns the correctors of indices of its BeagleBones.
+    """
+
+    def __init__(self, bbbnames, mproc):
+        """."""
+        self._idcs = [PSSOFB.BBBNAMES.index(bbb) for bbb in bbbnames]
+        self._rbref = mproc['rbref']
+        self._ref = mproc['ref']
+
+    def bsmp_sofb_current_set(self, current):
+        """Accumulate setpoint, after a short delay."""
+        time.sleep(0.001)
+        self._rbref[self._idcs] += current[self._idcs]
+
+    def bsmp_sofb_current_set_update(self, current):
+        """Accumulate setpoint, after a long delay."""
+        time.sleep(0.1)
+        self._rbref[self._idcs] += current[self._idcs]
+
+    def bsmp_update_sofb(self):
+        """Count updates."""
+        self._ref[self._idcs] += 1
+
+    def bsmp_pwrstate_off(self):
+        """Die."""
+        os._exit(1)
+
+    def bsmp_slowref(self):
+        """Hang."""
+        time.sleep(60)
+
+    def threads_shutdown(self):
+        """."""
+
+
+class _PSSOFBStandIn(PSSOFB):
+    """PSSOFB whose processes use _ConnStandIn."""
+
+    @staticmethod
+    def _create_connector(ethbridgeclnt_class, bbbnames, **kwargs):
+        return _ConnStandIn(bbbnames, kwargs['mproc'])
+
+
+class TestPSSOFB(TestCase):
+    """Test PSSOFB command ring, setpoint buffers and processes."""
+
+    def setUp(self):
+        """Start processes."""
+        psnames = ['SI-01M1:PS-CH-{}'.format(i) for i in range(_NR_CORRS)]
+        patches = [
+            mock.patch.object(pssofb, 'UnitConverter'),
+            mock.patch.object(
+                PSNamesSOFB, 'get_psnames_ch', return_value=psnames),
+            mock.patch.object(PSNamesSOFB, 'get_psnames_cv', return_value=[]),
+            ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.pssofb = _PSSOFBStandIn(None, nr_procs=2, asynchronous=True)
+        self.pssofb.wait_timeout = 2
+        self.pssofb.processes_start()
+        self.addCleanup(self.pssofb.processes_shutdown)
+
+    def test_ring_wrap_around(self):
+        """Test commands are executed once, in order, after wrap-around."""
+        nr_cmds = 3*PSSOFB.CMD_RING_SIZE + 1
+        total = 0.0
+        for i in range(nr_cmds):
+            if i % 2:
+                buffer = self.pssofb.get_setpoint_buffer()
+                buffer[:] = i
+                self.pssofb.bsmp_sofb_current_set(buffer)
+            else:
+                self.pssofb.bsmp_sofb_current_set(np.full(_NR_CORRS, i))
+            self.pssofb.bsmp_update_sofb()
+            total += i
+        self.assertTrue(self.pssofb.wait(5))
+        self.assertTrue(self.pssofb.is_ready())
+        np.testing.assert_array_equal(
+            self.pssofb.sofb_current_readback_ref, total)
+        np.testing.assert_array_equal(
+            self.pssofb.sofb_current_refmon, nr_cmds)
+
+    def test_setpoint_buffer_reuse(self):
+        """Test buffers are only reused after commands using them."""
+        buf0 = self.pssofb.get_setpoint_buffer()
+        buf0[:] = 1
+        self.pssofb.bsmp_sofb_current_set_update(buf0)
+        buf1 = self.pssofb.get_setpoint_buffer()
+        self.assertFalse(np.shares_memory(buf0, buf1))
+        buf1[:] = 2
+        self.pssofb.bsmp_sofb_current_set_update(buf1)
+        # first buffer is returned once its command is done.
+        buf2 = self.pssofb.get_setpoint_buffer()
+        self.assertTrue(np.shares_memory(buf0, buf2))
+        self.assertTrue(np.all(self.pssofb._cmd_cnts[1:] >= 1))
+        buf2[:] = 4
+        self.pssofb.bsmp_sofb_current_set(buf2)
+        self.assertTrue(self.pssofb.wait(5))
+        np.testing.assert_array_equal(
+            self.pssofb.sofb_current_readback_ref, 7)
+
+    def test_process_death(self):
+        """Test commands to dead processes raise instead of blocking."""
+        self.pssofb.bsmp_pwrstate_off()
+        t0_ = time.time()
+        with self.assertLogs(level='ERROR'):
+            self.assertFalse(self.pssofb.wait(5))
+        with self.assertRaises(RuntimeError), self.assertLogs(level='ERROR'):
+            for _ in range(PSSOFB.CMD_RING_SIZE):
+                self.pssofb.bsmp_update_sofb()
+        self.assertLess(time.time() - t0_, 2)
+
+    def test_process_hang(self):
+        """Test commands to hung processes raise after timeout."""
+        self.pssofb.wait_timeout = 0.5
+        self.pssofb.asynchronous = False
+        with self.assertLogs(level='ERROR'):
+            self.pssofb.bsmp_slowref()
+        self.pssofb.asynchronous = True
+        zeros = np.zeros(_NR_CORRS)
+        self.pssofb.bsmp_sofb_current_set(zeros)
+        self.pssofb.bsmp_sofb_current_set(zeros)
+        with self.assertRaises(TimeoutError), self.assertLogs(level='ERROR'):
+            self.pssofb.get_setpoint_buffer()
+        with self.assertRaises(TimeoutError), self.assertLogs(level='ERROR'):
+            for _ in range(PSSOFB.CMD_RING_SIZE):
+                self.pssofb.bsmp_update_sofb()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python-sirius
+
+"""Test sofb bpms module."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.diagbeam.bpm.csdev import Const as _CSBPM
+from siriuspy.sofb.bpms import calc_poly_horner, calc_sp_multiturn_pos, \
+    get_poly_horner_coeffs
+
+
+def _calc_poly(pol, th1, ot1):
+    """Explicit form of the BPMs polynomial calibration."""
+    ot2, th2 = ot1 * ot1, th1 * th1
+    ot4, th3 = ot2 * ot2, th2 * th1
+    ot6, th5 = ot4 * ot2, th3 * th2
+    ot8, th7 = ot4 * ot4, th5 * th2
+    th9 = th7 * th2
+    return (
+        th1 * (pol[0] + ot2*pol[1] + ot4*pol[2] + ot6*pol[3] + ot8*pol[4])
+        + th3 * (pol[5] + ot2*pol[6] + ot4*pol[7] + ot6*pol[8])
+        + th5 * (pol[9] + ot2*pol[10] + ot4*pol[11])
+        + th7 * (pol[12] + ot2*pol[13])
+        + th9 * pol[14])
+
+
+class _FakeBPM:
+    """BPM with the attributes used in the position calculation."""
+
+    def __init__(self, rng, size, polcal=True):
+        self.tbtrate = 10
+        self.arraya, self.arrayb, self.arrayc, self.arrayd = \
+            rng.normal(size=(4, size)) if size else 4*[None]
+        self.polyx = rng.normal(size=15) * 1e-2
+        self.polyy = rng.normal(size=15) * 1e-2
+        self.polyx[0] = self.polyy[0] = 1
+        self.polyx_horner = get_poly_horner_coeffs(self.polyx)
+        self.polyy_horner = get_poly_horner_coeffs(self.polyy)
+        self.poskx, self.posky, self.ksum = rng.normal(size=3)
+        self.offsetx, self.offsety = rng.normal(size=2)
+        self._orb_conv_unit = 1e9
+        enbl = _CSBPM.DsblEnbl.enabled if polcal else \
+            _CSBPM.DsblEnbl.disabled
+        self._config_ok_vals = {"XYPosCal": enbl}
+
+    def calc_pos(self, nturns, refx, refy, maskbeg, maskend):
+        """Single BPM reference implementation."""
+        wsize = self.tbtrate
+        mask = slice(maskbeg, wsize - maskend)
+        vals = {
+            "A": self.arraya, "C": self.arrayb,
+            "B": self.arrayc, "D": self.arrayd}
+        x_cal = np.full(nturns, refx)
+        y_cal = np.full(nturns, refy)
+        s_cal = np.full(nturns, 0.0)
+        if self.arraya is None:
+            return x_cal, y_cal, s_cal
+        rnts = min(self.arraya.size // wsize, nturns)
+        if not rnts:
+            return x_cal, y_cal, s_cal
+        for key, val in vals.items():
+            val = val[:(rnts * wsize)].reshape(-1, wsize)[:, mask]
+            vals[key] = np.std(val, axis=1)
+        sum1, sum2 = vals["A"] + vals["C"], vals["D"] + vals["B"]
+        diff1 = (vals["A"] - vals["C"]) / sum1
+        diff2 = (vals["D"] - vals["B"]) / sum2
+        x_raw = (diff1 + diff2) / 2
+        y_raw = (diff1 - diff2) / 2
+        if self._config_ok_vals["XYPosCal"] == _CSBPM.DsblEnbl.enabled:
+            x_raw, y_raw = (
+                _calc_poly(self.polyx, x_raw, y_raw),
+                _calc_poly(self.polyy, y_raw, x_raw))
+        conv = self._orb_conv_unit
+        x_cal[:rnts] = x_raw * self.poskx * conv - self.offsetx
+        y_cal[:rnts] = y_raw * self.posky * conv - self.offsety
+        s_cal[:rnts] = (sum1 + sum2) * self.ksum
+        return x_cal, y_cal, s_cal
+
+
+class TestSOFBBPMs(TestCase):
+    """Test single pass position calculation."""
+
+    def test_poly_horner(self):
+        """Test Horner form of the polynomial calibration."""
+        rng = np.random.default_rng(0)
+        pols = rng.normal(size=(3, 15))
+        th1, ot1 = rng.normal(size=(2, 3, 8)) * 0.5
+        coefs = get_poly_horner_coeffs(pols)
+        self.assertEqual(coefs.shape, (3, 5, 5))
+        val = calc_poly_horner(coefs, th1, ot1)
+        for pol, th_, ot_, vl_ in zip(pols, th1, ot1, val):
+            np.testing.assert_allclose(vl_, _calc_poly(pol, th_, ot_))
+            np.testing.assert_allclose(
+                calc_poly_horner(get_poly_horner_coeffs(pol), th_, ot_),
+                _calc_poly(pol, th_, ot_))
+
+    def test_calc_sp_multiturn_pos(self):
+        """Test vectorized calculation against single BPM one."""
+        rng = np.random.default_rng(0)
+        sizes = [30, 40, 15, 0, 5, 40]
+        bpms = [
+            _FakeBPM(rng, siz, polcal=bool(i % 2))
+            for i, siz in enumerate(sizes)]
+        bpms[-1].tbtrate = 8
+        refx, refy = rng.normal(size=(2, len(bpms)))
+        opts = dict(nturns=3, maskbeg=1, maskend=2)
+        posx, posy, psum = calc_sp_multiturn_pos(
+            bpms, refx=refx, refy=refy, **opts)
+        self.assertEqual(posx.shape, (len(bpms), 3))
+        for i, bpm in enumerate(bpms):
+            expx, expy, exps = bpm.calc_pos(
+                refx=refx[i], refy=refy[i], **opts)
+            np.testing.assert_allclose(posx[i], expx)
+            np.testing.assert_allclose(posy[i], expy)
+            np.testing.assert_allclose(psum[i], exps)
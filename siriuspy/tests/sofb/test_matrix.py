@@ -0,0 +1,46 @@
+#!/usr/bin/env python-sirius
+
+"""Test sofb matrix module."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.sofb.matrix import EpicsMatrix, svd_rank_one_update
+
+
+class TestSOFBMatrix(TestCase):
+    """Test SVD updates of the response matrix."""
+
+    def test_svd_rank_one_update(self):
+        """Test rank-one modification of the SVD."""
+        rng = np.random.default_rng(0)
+        mat = rng.normal(size=(12, 7))
+        avec, bvec = rng.normal(size=12), rng.normal(size=7)
+        uuu, sing, vvv = np.linalg.svd(mat, full_matrices=False)
+        uuu, sing, vvv = svd_rank_one_update(uuu, sing, vvv, avec, bvec)
+        new = mat + np.outer(avec, bvec)
+        np.testing.assert_allclose((uuu * sing) @ vvv, new, atol=1e-12)
+        np.testing.assert_allclose(
+            sing[:7], np.linalg.svd(new, compute_uv=False))
+
+    def test_update_svd(self):
+        """Test (de)selection of BPMs and correctors in the SVD."""
+        rng = np.random.default_rng(0)
+        nr_bpms, nr_corrs = 10, 6
+        mat = rng.normal(size=(nr_bpms, nr_corrs))
+        mask = np.ones(nr_bpms + nr_corrs, dtype=bool)
+        mask[[2, 12]] = False
+        svd = np.linalg.svd(
+            mat[mask[:nr_bpms]][:, mask[nr_bpms:]], full_matrices=False)
+        svd += (0, )
+        for idx in (2, 5, 12, 14, 0, 15):
+            svd = EpicsMatrix._update_svd(svd, mask, idx, mat, nr_bpms)
+            mask[idx] = not mask[idx]
+            sub = mat[mask[:nr_bpms]][:, mask[nr_bpms:]]
+            uuu, sing, vvv, _ = svd
+            self.assertEqual(sing.size, min(sub.shape))
+            np.testing.assert_allclose((uuu * sing) @ vvv, sub, atol=1e-12)
+            np.testing.assert_allclose(
+                sing, np.linalg.svd(sub, compute_uv=False))
+        self.assertEqual(svd[3], 6)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python-sirius
+
+"""Test sofb utils module."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.sofb.utils import SmoothBuffer
+
+
+class TestSmoothBuffer(TestCase):
+    """Test SmoothBuffer class."""
+
+    def _check(self, method, func, shape, maxlen=5, nsamples=23):
+        rng = np.random.default_rng(0)
+        buf = SmoothBuffer(maxlen=maxlen, method=method)
+        samples = []
+        for i in range(nsamples):
+            samp = rng.normal(size=shape)
+            if maxlen > 5:
+                # repeated values
+                samp = np.round(samp, 1)
+            if i in (3, 4, 11):
+                samp.flat[2] = np.nan
+            if i in (6, 7, 9):
+                samp.flat[1] = np.inf
+            if i in (7, 15):
+                samp.flat[3] = -np.inf
+            if i % 4 == 0:
+                samp.flat[0] = samples[-1].flat[0] if samples else 1.0
+            samples.append(samp)
+            buf.append(samp)
+            expected = func(samples[-maxlen:], axis=0)
+            self.assertEqual(len(buf), min(i + 1, maxlen))
+            np.testing.assert_allclose(buf.smooth, expected, atol=1e-12)
+            np.testing.assert_array_equal(buf.last, samp)
+        np.testing.assert_array_equal(buf.get_samples(), samples[-maxlen:])
+
+    def test_average(self):
+        """Test running average against numpy."""
+        self._check(SmoothBuffer.AVERAGE, np.mean, (7, ))
+        self._check(SmoothBuffer.AVERAGE, np.mean, (4, 7))
+        self._check(SmoothBuffer.AVERAGE, np.mean, (40, ), 30, 200)
+
+    def test_median(self):
+        """Test windowed median against numpy."""
+        self._check(SmoothBuffer.MEDIAN, np.median, (7, ))
+        self._check(SmoothBuffer.MEDIAN, np.median, (4, 7))
+        self._check(SmoothBuffer.MEDIAN, np.median, (40, ), 30, 200)
+
+    def test_reconfigure(self):
+        """Test changes of maxlen, method and reset."""
+        rng = np.random.default_rng(1)
+        samples = rng.normal(size=(10, 6))
+        buf = SmoothBuffer(maxlen=8)
+        for samp in samples:
+            buf.append(samp)
+        buf.method = SmoothBuffer.MEDIAN
+        np.testing.assert_allclose(
+            buf.smooth, np.median(samples[-8:], axis=0))
+        buf.maxlen = 3
+        self.assertEqual(len(buf), 3)
+        np.testing.assert_allclose(
+            buf.smooth, np.median(samples[-3:], axis=0))
+        buf.method = SmoothBuffer.AVERAGE
+        np.testing.assert_allclose(buf.smooth, np.mean(samples[-3:], axis=0))
+        buf.append(samples[0])
+        np.testing.assert_allclose(
+            buf.smooth, np.mean(np.r_[samples[-2:], samples[:1]], axis=0))
+        buf.reset()
+        self.assertEqual(len(buf), 0)
+        self.assertIsNone(buf.smooth)
+        buf.append(np.ones(3))
+        np.testing.assert_allclose(buf.smooth, np.ones(3))
@@ -32,7 +32,8 @@ SRVURLS = (
     'SRVURL_ARCHIVER_OFFLINE_DATA',
     'SRVURL_ARCHIVER_VIEWER',
     )
-PUB_INTERFACE = DIRS + SRVURLS + ('VACA_PREFIX', )
+FILES = ('FILE_CSCONSTS_SNAPSHOT', )
+PUB_INTERFACE = DIRS + SRVURLS + FILES + ('VACA_PREFIX', )
 
 
 class TestEnvars(TestCase):
@@ -57,6 +58,13 @@ class TestEnvars(TestCase):
             value = getattr(envars, server)
             self.assertIsInstance(value, str)
 
+    def test_files(self):
+        """Test file names."""
+        for fname in FILES:
+            self.assertIn(fname, envars.__dict__)
+            value = getattr(envars, fname)
+            self.assertIsInstance(value, str)
+
     def test_vaca(self):
         """VACA prefix string."""
         self.assertIn('VACA_PREFIX', envars.__dict__)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python-sirius
+
+"""Test imports of subpackages with lazy loading."""
+
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import siriuspy.devices as devices
+import siriuspy.clientarch as clientarch
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that must not be imported just to import lazy subpackages
+_HEAVY_MODULES = ('numpy', 'scipy', 'matplotlib', 'epics', 'aiohttp')
+
+
+def _run(statement):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = _ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=_ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def get_imported_modules(statement):
+    """Return all modules imported by statement run in a new interpreter.
+
+    It includes the modules imported with importlib.
+    """
+    proc = _run(statement + '; import sys; print(*sys.modules)')
+    return set(proc.stdout.split())
+
+
+def get_import_times(statement, module):
+    """Return import times of statement run in a new interpreter.
+
+    Returns:
+        cumulative (int): cumulative import time of module [us], from
+            `-X importtime`.
+        total (int): cumulative import time of module and of all imports
+            after it [us], which includes the ones done with importlib.
+    """
+    cumulative = total = None
+    for line in _run(statement).stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cum, name = line.split('|')
+        if cumulative is None and name.strip() == module:
+            cumulative, total = int(cum), 0
+        # top level imports are not indented
+        if total is not None and not name.startswith('  ', 1):
+            total += int(cum)
+    return cumulative, total
+
+
+class TestImports(TestCase):
+    """Test lazy subpackages do not import their submodules."""
+
+    # siriuspy modules imported by each lazy subpackage
+    packages = {
+        'siriuspy.devices': {'siriuspy', 'siriuspy.devices'},
+        'siriuspy.search': {'siriuspy', 'siriuspy.search'},
+        'siriuspy.clientarch': {
+            'siriuspy', 'siriuspy.clientarch', 'siriuspy.envars'},
+        }
+
+    def test_lazy_packages(self):
+        """Test import of lazy subpackages."""
+        for pkg, expected in self.packages.items():
+            modules = get_imported_modules('import ' + pkg)
+            siriuspy_modules = {
+                mod for mod in modules if mod.split('.')[0] == 'siriuspy'}
+            self.assertEqual(siriuspy_modules, expected, pkg)
+            for mod in _HEAVY_MODULES:
+                self.assertNotIn(mod, modules, pkg)
+
+    def test_import_time(self):
+        """Test import time of lazy subpackages against eager import."""
+        for pkg in self.packages:
+            lazy, _ = get_import_times('import ' + pkg, pkg)
+            _, eager = get_import_times(
+                'import {} as pkg; [getattr(pkg, n) for n in pkg.__all__]'
+                .format(pkg), pkg)
+            msg = '{}: lazy {} us, eager {} us'.format(pkg, lazy, eager)
+            self.assertLess(lazy, eager / 10, msg)
+
+    def test_lazy_access(self):
+        """Test access of a name only imports its submodule."""
+        modules = get_imported_modules('from siriuspy.search import PSSearch')
+        self.assertIn('siriuspy.search.ps_search', modules)
+        self.assertNotIn('siriuspy.search.id_search', modules)
+        self.assertNotIn('matplotlib', modules)
+
+        modules = get_imported_modules(
+            'from siriuspy.clientarch import exceptions')
+        self.assertIn('siriuspy.clientarch.exceptions', modules)
+        self.assertNotIn('siriuspy.clientarch.client', modules)
+
+
+class TestLazyNames(TestCase):
+    """Test public names of lazy subpackages."""
+
+    def test_names(self):
+        """Test names are the ones of their submodules."""
+        from siriuspy.devices.pwrsupply import PowerSupply
+        self.assertIs(devices.PowerSupply, PowerSupply)
+        self.assertIn('PowerSupply', dir(devices))
+        self.assertIn('BunchbyBunch', devices.__all__)
+        with self.assertRaises(AttributeError):
+            devices.NotADevice
+
+    def test_all(self):
+        """Test names in __all__ are defined without import errors."""
+        for pkg in (devices, clientarch):
+            for name in pkg.__all__:
+                self.assertTrue(hasattr(pkg, name), name)